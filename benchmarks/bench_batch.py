@@ -0,0 +1,47 @@
+"""
+Benchmark : statistiques et routage en colonnes (EventBatch) vs boucles
+Python sur des listes de BaseEvent.
+"""
+
+from collections import Counter
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.batch import EventBatch
+from nexus.core.events import Priority, create_events
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Compare comptage, filtrage et regroupement sur 100k événements."""
+    count = scaled(100_000, scale)
+    records = make_records(count)
+    for index, record in enumerate(records):
+        record["priority"] = Priority(index % 5 + 1)
+    events = create_events(records).events
+    batch = EventBatch.from_events(events)
+
+    def group_loop() -> None:
+        groups = {}
+        for event in events:
+            groups.setdefault(event.source, []).append(event)
+
+    return [
+        measure("Counter(type) (boucle)", lambda: Counter(e.type for e in events), count),
+        measure("count_by('type') (colonnes)", lambda: batch.count_by("type"), count),
+        measure("filtre priorité <= HIGH (boucle)",
+                lambda: [e for e in events if e.priority <= Priority.HIGH], count),
+        measure("filter(max_priority=HIGH) (colonnes)",
+                lambda: batch.filter(max_priority=Priority.HIGH), count),
+        measure("regroupement par source (boucle)", group_loop, count),
+        measure("group_by('source') (colonnes)", lambda: batch.group_by("source"), count),
+        measure("tri par horodatage (sorted)", lambda: sorted(events, key=lambda e: e.timestamp), count),
+        measure("sort_by('timestamp') (colonnes)", lambda: batch.sort_by("timestamp"), count),
+        measure("EventBatch.from_events", lambda: EventBatch.from_events(events), count),
+        measure("EventBatch.to_events", batch.to_events, count),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,101 @@
+"""
+Benchmark : appels unitaires vs micro-batching vers une intégration.
+
+L'intégration simulée coûte 1 ms d'aller-retour par appel, quelle que soit
+la taille du lot. On compare le WorkerPool (un appel par événement) et le
+BatchingStage pour plusieurs tailles de lot.
+"""
+
+import asyncio
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import (
+    AbstractProcessor,
+    BatchingStage,
+    BatchPolicy,
+    ProcessingResult,
+    ProcessorRegistry,
+    WorkerPool,
+)
+from nexus.queue import PriorityEventQueue
+
+ROUND_TRIP = 0.001
+
+
+class RemoteProcessor(AbstractProcessor):
+    """Intégration simulée : un aller-retour réseau par appel."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        self.calls += 1
+        await asyncio.sleep(ROUND_TRIP)
+        return ProcessingResult(processor="remote", event_id=event.event_id, success=True)
+
+    async def process_batch(self, events: List[BaseEvent]) -> List[ProcessingResult]:
+        self.calls += 1
+        await asyncio.sleep(ROUND_TRIP)
+        return [ProcessingResult(processor="remote", event_id=e.event_id, success=True) for e in events]
+
+    def can_handle(self, event_type: str) -> bool:
+        return True
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def per_event(events: List[BaseEvent], processor: RemoteProcessor) -> None:
+    """Un appel par événement, 16 workers."""
+
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=0)
+        registry = ProcessorRegistry()
+        registry.register(processor)
+        for event in events:
+            queue.put_nowait(event)
+        async with WorkerPool(queue, registry, workers=16, key=lambda event: None):
+            pass
+
+    asyncio.run(main())
+
+
+def batched(events: List[BaseEvent], processor: RemoteProcessor, size: int) -> None:
+    """Un appel par lot."""
+
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=0)
+        registry = ProcessorRegistry()
+        registry.register(processor)
+        stage = BatchingStage(registry, default_policy=BatchPolicy(max_size=size, max_linger=0.005))
+        for event in events:
+            queue.put_nowait(event)
+        consumer = asyncio.create_task(stage.consume(queue))
+        await queue.join()
+        consumer.cancel()
+
+    asyncio.run(main())
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure débit et nombre d'allers-retours."""
+    count = scaled(5_000, scale)
+    events = [BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source="bench") for _ in range(count)]
+
+    results = []
+    for size in (1, 10, 100, 500):
+        processor = RemoteProcessor()
+        if size == 1:
+            result = measure("unitaire, 16 workers", lambda: per_event(events, processor), count, repeat=1)
+        else:
+            result = measure(f"lots de {size}", lambda: batched(events, processor, size), count, repeat=1)
+        result.extra["round_trips"] = processor.calls
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
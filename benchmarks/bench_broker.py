@@ -0,0 +1,82 @@
+"""
+Benchmark : broker local, publication et consommation par plusieurs nœuds.
+
+Le broker, le publieur et les nœuds partagent une boucle asyncio : la
+mesure porte sur le coût du protocole (encodage, partitionnement, trames
+regroupées, acquittements par plages), pas sur le parallélisme. Une
+publication attendue avant la suivante (max_in_flight=1) montre le gain
+du pipelining.
+"""
+
+import asyncio
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.broker import BrokerClient, LocalBroker
+from nexus.core.events import BaseEvent, EventType
+
+CHUNK = 500
+
+
+def make_events(count: int) -> List[BaseEvent]:
+    return [
+        BaseEvent.from_trusted(type=EventType.FILE_MODIFIED, source=f"sync{i % 64}", payload={"path": f"/f/{i}"})
+        for i in range(count)
+    ]
+
+
+def publish(events: List[BaseEvent], max_in_flight: int) -> None:
+    async def main() -> None:
+        async with LocalBroker() as broker, BrokerClient(broker.address, max_in_flight=max_in_flight) as client:
+            chunks = [events[start:start + CHUNK] for start in range(0, len(events), CHUNK)]
+            await asyncio.gather(*(client.publish(chunk) for chunk in chunks))
+
+    asyncio.run(main())
+
+
+def end_to_end(events: List[BaseEvent], nodes: int) -> None:
+    async def consume(subscription, received: List[int]) -> None:
+        async for batch in subscription:
+            for event in batch:
+                subscription.ack(event)
+            received[0] += len(batch)
+            if received[0] >= len(events):
+                return
+
+    async def main() -> None:
+        async with LocalBroker() as broker:
+            clients = [BrokerClient(broker.address) for _ in range(nodes)]
+            for client in clients:
+                await client.connect()
+            subscriptions = [await client.subscribe("nexus", f"node{i}") for i, client in enumerate(clients)]
+            for subscription in subscriptions:
+                await subscription.wait_assigned()
+            received = [0]
+            consumers = [asyncio.create_task(consume(subscription, received)) for subscription in subscriptions]
+            async with BrokerClient(broker.address) as publisher:
+                await asyncio.gather(*(publisher.publish(events[start:start + CHUNK])
+                                       for start in range(0, len(events), CHUNK)))
+            await asyncio.wait(consumers, return_when=asyncio.FIRST_COMPLETED)
+            for client in clients:
+                await client.close()
+            await asyncio.gather(*consumers, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure la publication (pipelinée ou non) et le trajet publieur -> broker -> nœuds."""
+    count = scaled(100_000, scale)
+    events = make_events(count)
+    results = [
+        measure(f"publication par lots de {CHUNK}, pipelinée", lambda: publish(events, 64), count),
+        measure(f"publication par lots de {CHUNK}, une à la fois", lambda: publish(events, 1), count),
+    ]
+    for nodes in (1, 2, 4):
+        results.append(measure(f"publication -> {nodes} nœud(s), acquittés", lambda: end_to_end(events, nodes), count))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
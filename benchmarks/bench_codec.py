@@ -0,0 +1,52 @@
+"""
+Benchmark : taille et débit du format binaire compact vs JSON.
+"""
+
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.codec import decode_event, decode_events, encode_event, encode_events
+from nexus.core.events import create_events, parse_event
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Compare l'encodage et le décodage JSON et binaire."""
+    count = scaled(20_000, scale)
+    events = create_events(make_records(count)).events
+    documents = [event.model_dump_json().encode() for event in events]
+    frames = [encode_event(event) for event in events]
+    batch = encode_events(events)
+    json_size = sum(len(document) for document in documents) / count
+    binary_size = sum(len(frame) for frame in frames) / count
+
+    # Chaque cas conserve ses résultats, comme le fait le décodage par lot
+    def json_encode() -> None:
+        [event.model_dump_json() for event in events]
+
+    def json_decode() -> None:
+        [parse_event(document) for document in documents]
+
+    def binary_encode() -> None:
+        [encode_event(event) for event in events]
+
+    def binary_decode() -> None:
+        [decode_event(frame) for frame in frames]
+
+    def binary_decode_trusted() -> None:
+        [decode_event(frame, trusted=True) for frame in frames]
+
+    return [
+        measure("JSON encode (model_dump_json)", json_encode, count, bytes=round(json_size)),
+        measure("JSON decode (parse_event)", json_decode, count),
+        measure("binaire encode_event", binary_encode, count, bytes=round(binary_size)),
+        measure("binaire decode_event", binary_decode, count),
+        measure("binaire decode_event (trusted)", binary_decode_trusted, count),
+        measure("binaire encode_events (lot)", lambda: encode_events(events), count, bytes=len(batch)),
+        measure("binaire decode_events (lot, trusted)", lambda: decode_events(batch, trusted=True), count),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
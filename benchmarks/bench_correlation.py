@@ -0,0 +1,118 @@
+"""
+Benchmark : moteur de corrélation.
+
+Coût par événement selon le nombre de règles : chaque règle attend
+FILE_CREATED puis EMAIL_RECEIVED d'une source qui lui est propre, et le
+flux (paires réparties sur 10 sources, environ 1000 séquences ouvertes)
+ne concerne qu'une règle par événement. L'index (type, source) évite de
+parcourir les autres règles : le débit ne doit pas dépendre de leur nombre.
+
+Mémoire : un million de séquences ouvertes (correlation_id distincts, sans
+étape suivante), puis le même flux avec max_open=100 000.
+"""
+
+import gc
+import os
+import time
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import CorrelationEngine, CorrelationRule, PatternStep
+
+
+def rules(count: int) -> List[CorrelationRule]:
+    """Règles « fichier créé puis email reçu », une source par règle."""
+    return [
+        CorrelationRule(
+            f"upload_notified_{i}",
+            [PatternStep(EventType.FILE_CREATED, source=f"s{i}"), PatternStep(EventType.EMAIL_RECEIVED, source=f"s{i}")],
+            within=30.0,
+        )
+        for i in range(count)
+    ]
+
+
+def make_stream(count: int, open_runs: int = 1000) -> List[BaseEvent]:
+    """Paires FILE_CREATED / EMAIL_RECEIVED décalées de ``open_runs`` séquences."""
+    events: List[BaseEvent] = []
+    for k in range(count // 2 + open_runs):
+        if k < count // 2:
+            events.append(BaseEvent.from_trusted(
+                type=EventType.FILE_CREATED, source=f"s{k % 10}", correlation_id=f"c{k}",
+                payload={"file_path": f"/in/{k}.pdf"},
+            ))
+        if k >= open_runs:
+            j = k - open_runs
+            events.append(BaseEvent.from_trusted(
+                type=EventType.EMAIL_RECEIVED, source=f"s{j % 10}", correlation_id=f"c{j}",
+                payload={"from": "a@example.com", "subject": str(j), "received_at": "2025-01-01T00:00:00"},
+            ))
+    return events
+
+
+def open_runs(engine: CorrelationEngine, count: int, chunk: int = 100_000) -> float:
+    """
+    Ouvre ``count`` séquences (correlation_id distincts, sans suite).
+
+    Les événements sont construits par morceaux hors de la mesure : seule
+    la durée cumulée des appels à offer() est retournée.
+    """
+    elapsed = 0.0
+    for start in range(0, count, chunk):
+        events = [
+            BaseEvent.from_trusted(type=EventType.FILE_CREATED, source="s0", correlation_id=f"open-{k}", payload={})
+            for k in range(start, min(start + chunk, count))
+        ]
+        begin = time.perf_counter()
+        for event in events:
+            engine.offer(event)
+        elapsed += time.perf_counter() - begin
+    return elapsed
+
+
+def rss_mb() -> float:
+    """Mémoire résidente actuelle du processus, en Mo."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le débit selon le nombre de règles et la mémoire des séquences ouvertes."""
+    count = scaled(100_000, scale)
+    events = make_stream(count)
+    results = []
+    for rule_count in (10, 100, 1000, 10_000):
+        engine_rules = rules(rule_count)
+
+        def correlate() -> CorrelationEngine:
+            engine = CorrelationEngine(engine_rules, clock=lambda: 0.0)
+            for event in events:
+                engine.offer(event)
+            return engine
+
+        result = measure(f"corrélation, {rule_count} règles", correlate, len(events))
+        result.extra.update(ns_per_event=round(result.seconds / len(events) * 1e9), matched=correlate().matched)
+        results.append(result)
+
+    opened = scaled(1_000_000, scale)
+    for max_open in (opened, opened // 10):
+        gc.collect()
+        before = rss_mb()
+        engine = CorrelationEngine(rules(10), max_open=max_open, clock=lambda: 0.0)
+        elapsed = open_runs(engine, opened)
+        gc.collect()
+        grown = rss_mb() - before
+        result = BenchResult(f"{opened} séquences ouvertes, max_open={max_open}", opened, elapsed)
+        # Croissance de la mémoire résidente, morceau d'événements en cours compris
+        result.extra.update(open=engine.open, evicted=engine.evicted, rss_mb=round(grown))
+        if not engine.evicted:
+            result.extra["bytes_per_open"] = round(grown * 2**20 / engine.open)
+        results.append(result)
+        del engine
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,108 @@
+"""
+Benchmark : dead letter queue persistante.
+
+Remplit un DeadLetterStore SQLite puis mesure l'insertion, les requêtes
+paginées indexées (y compris en fin de table), le parcours complet et le
+rejeu vers une PriorityEventQueue bornée, avec la mémoire de pointe du
+rejeu comparée à un chargement complet.
+"""
+
+import asyncio
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from bench_create_events import make_records
+from nexus.core.events import BaseEvent
+from nexus.queue import DeadLetter, DeadLetterReason, DeadLetterStore, PriorityEventQueue
+
+ERRORS = ("ConnectionError: refused", "TimeoutError: ", "ValueError: bad payload")
+
+
+def make_letters(count: int) -> List[DeadLetter]:
+    """Entrées variées par type, source et erreur."""
+    letters = []
+    for index, record in enumerate(make_records(count)):
+        event = BaseEvent.from_trusted(**record)
+        letters.append(DeadLetter(integration="toasty", event=event, reason=DeadLetterReason.EXHAUSTED,
+                                  error=ERRORS[index % len(ERRORS)], attempts=4))
+    return letters
+
+
+def reprocess(path: Path, memory: List[int], trace: bool = False) -> int:
+    """Rejoue tout le store dans une file bornée vidée par un consommateur."""
+
+    async def main() -> int:
+        queue = PriorityEventQueue(capacity=1000)
+
+        async def consume() -> None:
+            while True:
+                await queue.get()
+                queue.task_done()
+
+        consumer = asyncio.create_task(consume())
+        with DeadLetterStore(path) as store:
+            if trace:
+                tracemalloc.start()
+            count = await store.reprocess(queue, page_size=1000, delete=False)
+            if trace:
+                memory.append(tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+        consumer.cancel()
+        return count
+
+    return asyncio.run(main())
+
+
+def load_all(path: Path, memory: List[int], trace: bool = False) -> int:
+    """Référence : toutes les entrées chargées en une requête."""
+    with DeadLetterStore(path) as store:
+        if trace:
+            tracemalloc.start()
+        letters = store.query(limit=-1)
+        if trace:
+            memory.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        return len(letters)
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le store sur 200 000 entrées."""
+    count = scaled(200_000, scale)
+    letters = make_letters(count)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "dlq.sqlite"
+
+        def fill() -> None:
+            path.unlink(missing_ok=True)
+            with DeadLetterStore(path) as store:
+                for start in range(0, count, 1000):
+                    store.add(letters[start:start + 1000])
+
+        results.append(measure("insertion par lots de 1000", fill, count, repeat=1))
+
+        with DeadLetterStore(path) as store:
+            last = store.query(after=count - 200, limit=1)[0].letter_id - 1
+            results.append(measure("page de 100, filtre source", lambda: store.query(limit=100, source="producer_3"),
+                                   100))
+            results.append(measure("page de 100 en fin de table, filtre classe d'erreur",
+                                   lambda: store.query(after=last, limit=100, error_class="TimeoutError"), 100))
+            results.append(measure("comptage par classe d'erreur", lambda: store.count(error_class="ValueError"), 1))
+            results.append(measure("parcours complet", lambda: sum(1 for _ in store.scan()), count, repeat=1))
+
+        # Mémoire de pointe mesurée à part : tracemalloc fausse les temps
+        for name, func in (("rejeu vers une file bornée", reprocess), ("référence : chargement complet", load_all)):
+            memory: List[int] = []
+            result = measure(name, lambda: func(path, memory), count, repeat=1)
+            func(path, memory, trace=True)
+            result.extra["peak_mb"] = round(memory[-1] / 2**20, 1)
+            results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
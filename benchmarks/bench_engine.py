@@ -0,0 +1,71 @@
+"""
+Benchmark : débit du WorkerPool selon le nombre de workers.
+
+Un processeur simulant un appel d'E/S de 5 ms mesure la mise à l'échelle ;
+un processeur instantané mesure le surcoût propre du moteur.
+"""
+
+import asyncio
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry, WorkerPool
+from nexus.queue import PriorityEventQueue
+
+
+class IOProcessor(AbstractProcessor):
+    """Processeur simulant une latence d'E/S."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return ProcessingResult(processor="io", event_id=event.event_id, success=True)
+
+    def can_handle(self, event_type: str) -> bool:
+        return True
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def consume(events: List[BaseEvent], workers: int, delay: float) -> None:
+    """Fait traiter tous les événements par un WorkerPool."""
+
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=0)
+        registry = ProcessorRegistry()
+        registry.register(IOProcessor(delay))
+        for event in events:
+            queue.put_nowait(event)
+        async with WorkerPool(queue, registry, workers=workers):
+            pass
+
+    asyncio.run(main())
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le débit pour 1 à 64 workers."""
+    io_count = scaled(1_000, scale)
+    cpu_count = scaled(20_000, scale)
+    # 100 corrélations : au plus 100 couloirs traités en parallèle
+    events = [
+        BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source="bench", correlation_id=f"c{i % 100}")
+        for i in range(max(io_count, cpu_count))
+    ]
+    results = []
+    for workers in (1, 4, 16, 64):
+        results.append(measure(f"E/S 5 ms, {workers} workers",
+                               lambda: consume(events[:io_count], workers, 0.005), io_count, repeat=1))
+    for workers in (1, 16):
+        results.append(measure(f"surcoût moteur, {workers} workers",
+                               lambda: consume(events[:cpu_count], workers, 0), cpu_count))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,37 @@
+"""
+Benchmark : génération d'identifiants d'événements.
+"""
+
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.ids import MonotonicIdGenerator, new_event_id, uuid4_id
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Compare uuid4 et le générateur monotone."""
+    count = scaled(200_000, scale)
+    generator = MonotonicIdGenerator()
+
+    def legacy() -> None:
+        for _ in range(count):
+            uuid4_id()
+
+    def monotonic() -> None:
+        for _ in range(count):
+            generator()
+
+    def configured() -> None:
+        for _ in range(count):
+            new_event_id()
+
+    return [
+        measure("str(uuid4())", legacy, count),
+        measure("MonotonicIdGenerator", monotonic, count),
+        measure("new_event_id (défaut)", configured, count),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
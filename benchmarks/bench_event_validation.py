@@ -0,0 +1,55 @@
+"""
+Benchmark : construction et validation par type d'événement.
+
+Mesure, pour chaque classe, le constructeur, model_validate(),
+model_validate_json() et from_trusted() sur des données valides.
+"""
+
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import _EVENT_CLASSES, BaseEvent
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure les taux de construction et de validation par type."""
+    count = scaled(10_000, scale)
+    results = []
+    seen = set()
+    for record in make_records(len(_EVENT_CLASSES)):
+        event_class = _EVENT_CLASSES[record["type"]]
+        if event_class in seen:
+            continue
+        seen.add(event_class)
+        event = event_class(**record)
+        document = event.model_dump_json()
+        fields = event.model_dump()
+        name = event_class.__name__
+
+        def construct() -> None:
+            for _ in range(count):
+                event_class(**record)
+
+        def validate() -> None:
+            for _ in range(count):
+                event_class.model_validate(record)
+
+        def validate_json() -> None:
+            for _ in range(count):
+                event_class.model_validate_json(document)
+
+        def trusted() -> None:
+            for _ in range(count):
+                BaseEvent.from_trusted(**fields)
+
+        results.append(measure(f"{name}(**data)", construct, count))
+        results.append(measure(f"{name}.model_validate", validate, count))
+        results.append(measure(f"{name}.model_validate_json", validate_json, count))
+        results.append(measure(f"BaseEvent.from_trusted -> {name}", trusted, count))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
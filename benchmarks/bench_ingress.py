@@ -0,0 +1,114 @@
+"""
+Benchmark : débit du récepteur HTTP/WebSocket.
+
+Le récepteur tourne dans un processus séparé avec un consommateur qui vide
+la file ; un générateur de charge local (aiohttp) envoie des événements
+pré-sérialisés par requêtes unitaires, par lots JSON ou NDJSON, et par
+WebSocket. Sur une machine à un cœur, générateur et récepteur se
+partagent ce cœur : les débits sont des bornes basses.
+"""
+
+import asyncio
+import multiprocessing
+from typing import Awaitable, Callable, Iterator, List
+
+import aiohttp
+from pydantic_core import to_json
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.api import EventReceiver
+from nexus.queue import PriorityEventQueue
+
+JSON = {"Content-Type": "application/json"}
+NDJSON = {"Content-Type": "application/x-ndjson"}
+
+
+def serve(ports: "multiprocessing.Queue") -> None:
+    """Processus récepteur : file vidée au fil de l'eau."""
+
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=10_000)
+        receiver = EventReceiver(queue)
+        await receiver.start(port=0)
+        ports.put(receiver.port)
+        while True:
+            await queue.get()
+            queue.task_done()
+
+    asyncio.run(main())
+
+
+async def post_all(url: str, bodies: List[bytes], headers: dict, concurrency: int) -> None:
+    """Envoie les corps par ``concurrency`` connexions persistantes ; 429 : nouvel essai."""
+    pending: Iterator[bytes] = iter(bodies)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def worker() -> None:
+            for body in pending:
+                while True:
+                    async with session.post(url, data=body, headers=headers) as response:
+                        await response.read()
+                        if response.status != 429:
+                            assert response.status == 202, response.status
+                            break
+                    await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def stream_all(url: str, messages: List[str]) -> None:
+    """Envoie les messages sur une connexion WebSocket et attend tous les accusés."""
+    async with aiohttp.ClientSession() as session, session.ws_connect(url) as ws:
+
+        async def read_acks() -> None:
+            for _ in messages:
+                await ws.receive()
+
+        acks = asyncio.create_task(read_acks())
+        for message in messages:
+            await ws.send_str(message)
+        await acks
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le débit d'ingestion par mode d'envoi."""
+    single_count = scaled(5000, scale)
+    batch_count = scaled(100_000, scale)
+    records = make_records(batch_count)
+    documents = [to_json(record) for record in records]
+    arrays = [to_json(records[start:start + 100]) for start in range(0, batch_count, 100)]
+    ndjson = [b"\n".join(documents[start:start + 100]) for start in range(0, batch_count, 100)]
+
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    server = context.Process(target=serve, args=(ports,), daemon=True)
+    server.start()
+    base = f"http://127.0.0.1:{ports.get(timeout=30)}"
+
+    def bench(name: str, load: Callable[[], Awaitable[None]], count: int) -> BenchResult:
+        return measure(name, lambda: asyncio.run(load()), count)
+
+    try:
+        return [
+            bench("POST /events, 16 connexions", lambda: post_all(
+                f"{base}/events", documents[:single_count], JSON, 16), single_count),
+            bench("POST /events/batch JSON x100, 4 connexions", lambda: post_all(
+                f"{base}/events/batch", arrays, JSON, 4), batch_count),
+            bench("POST /events/batch NDJSON x100, 4 connexions", lambda: post_all(
+                f"{base}/events/batch", ndjson, NDJSON, 4), batch_count),
+            bench("WebSocket, 1 événement par message", lambda: stream_all(
+                f"{base}/events/ws", [document.decode() for document in documents[:batch_count // 4]]),
+                batch_count // 4),
+            bench("WebSocket, tableaux de 100", lambda: stream_all(
+                f"{base}/events/ws", [array.decode() for array in arrays]), batch_count),
+        ]
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,179 @@
+"""
+Benchmark : cycle de vie d'un événement, étape par étape.
+
+Sert de référence pour la détection des régressions (voir run.py) :
+
+    création       create_event() pour chaque type d'événement
+    sérialisation  model_dump_json() et model_validate_json() par type
+    file           PriorityEventQueue.put_nowait() + get_nowait()
+    bout en bout   producteur -> file bornée -> WorkerPool -> intégration
+                   factice appelée via ResilientExecutor
+
+Les payloads sont synthétiques et déterministes : champs requis du type,
+complétés jusqu'à ``payload_size`` octets une fois sérialisés en JSON.
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType, create_event
+from nexus.integrations import DeliveryOutcome, ResilientExecutor
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry, WorkerPool
+from nexus.queue import PriorityEventQueue
+
+# Champs requis par type
+REQUIRED: Dict[EventType, Dict[str, Any]] = {
+    EventType.EMAIL_RECEIVED: {"from": "a@example.com", "subject": "Invoice", "received_at": "2025-01-01T00:00:00Z"},
+    EventType.FILE_CREATED: {"file_path": "/in/report.pdf"},
+    EventType.FILE_MODIFIED: {"file_path": "/in/report.pdf", "size": 1024},
+    EventType.FILE_DELETED: {"file_path": "/in/report.pdf"},
+    EventType.SCHEDULED_TASK: {"task_id": "backup", "scheduled_time": "2025-01-01T02:00:00Z"},
+    EventType.SYSTEM_HEALTH: {"component": "db", "status": "healthy", "metrics": {"cpu": 12.5}},
+    EventType.ERROR_OCCURRED: {"error_type": "IOError", "message": "disk full", "component": "fs"},
+    EventType.CALENDAR_EVENT: {"event_id": "cal_1"},
+    EventType.CORRELATION_MATCHED: {"rule": "upload_notified", "events": ["evt_1", "evt_2"]},
+}
+
+
+def synthetic_payload(event_type: EventType, size: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Payload valide pour ``event_type`` d'environ ``size`` octets en JSON.
+
+    Les champs de remplissage (``attr_<n>``) alternent chaînes et nombres.
+    """
+    rng = random.Random(seed)
+    payload = dict(REQUIRED[event_type])
+    length = len(json.dumps(payload))
+    index = 0
+    while length < size:
+        if index % 3 == 2:
+            value: Any = rng.randrange(1_000_000)
+        else:
+            value = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randrange(8, 32)))
+        key = f"attr_{index}"
+        payload[key] = value
+        length += len(json.dumps({key: value})) - 1
+        index += 1
+    return payload
+
+
+class IntegrationProcessor(AbstractProcessor):
+    """Processeur transmettant chaque événement à une intégration."""
+
+    def __init__(self, executor: ResilientExecutor, integration: str) -> None:
+        self.executor = executor
+        self.integration = integration
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        outcome = await self.executor.submit(self.integration, event)
+        delivered = outcome is DeliveryOutcome.DELIVERED
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=delivered)
+
+    def can_handle(self, event_type: str) -> bool:
+        return True
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def end_to_end(count: int, payload: Dict[str, Any], latencies: List[float]) -> None:
+    """
+    Produit ``count`` événements et attend leur livraison à l'intégration.
+
+    La latence (création -> appel de l'intégration) de chaque événement est
+    ajoutée à ``latencies``.
+    """
+    produced: Dict[str, float] = {}
+
+    async def stub(event: BaseEvent) -> None:
+        latencies.append(time.perf_counter() - produced[event.event_id])
+
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=1000)
+        executor = ResilientExecutor()
+        executor.register("stub", stub)
+        registry = ProcessorRegistry()
+        registry.register(IntegrationProcessor(executor, "stub"))
+        async with WorkerPool(queue, registry, workers=16):
+            for index in range(count):
+                started = time.perf_counter()
+                event = create_event(EventType.FILE_MODIFIED, "bench", payload, correlation_id=f"c{index % 100}")
+                produced[event.event_id] = started
+                await queue.put(event)
+            await queue.join()
+        await executor.close()
+
+    asyncio.run(main())
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Quantile ``fraction`` de valeurs non vides."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(scale: float = 1.0, payload_size: int = 256) -> List[BenchResult]:
+    """
+    Mesure chaque étape du cycle de vie.
+
+    Args:
+        scale: Facteur d'échelle du nombre d'opérations
+        payload_size: Taille visée des payloads sérialisés, en octets
+    """
+    count = scaled(10_000, scale)
+    results = []
+    for event_type in EventType:
+        payload = synthetic_payload(event_type, payload_size)
+        name = event_type.value
+
+        def create() -> List[BaseEvent]:
+            return [create_event(event_type, "bench", payload) for _ in range(count)]
+
+        events = create()
+        event_class = type(events[0])
+        documents = [event.model_dump_json() for event in events]
+        results.append(measure(f"create_event {name}", create, count))
+        results.append(measure(f"model_dump_json {name}", lambda: [e.model_dump_json() for e in events], count,
+                               bytes=len(documents[0])))
+        results.append(measure(f"model_validate_json {name}",
+                               lambda: [event_class.model_validate_json(d) for d in documents], count))
+
+    queue_count = scaled(100_000, scale)
+    queued = [
+        BaseEvent.from_trusted(type=EventType.FILE_MODIFIED, source="bench", payload={}) for _ in range(queue_count)
+    ]
+
+    def drain() -> None:
+        queue = PriorityEventQueue(capacity=0)
+        for start in range(0, queue_count, 100):
+            chunk = queued[start:start + 100]
+            for event in chunk:
+                queue.put_nowait(event)
+            for _ in chunk:
+                queue.get_nowait()
+                queue.task_done()
+
+    results.append(measure("PriorityEventQueue put/get (profondeur 100)", drain, queue_count))
+
+    flow_count = scaled(10_000, scale)
+    payload = synthetic_payload(EventType.FILE_MODIFIED, payload_size)
+    latencies: List[float] = []
+    result = measure("bout en bout : production -> intégration", lambda: end_to_end(flow_count, payload, latencies),
+                     flow_count)
+    assert len(latencies) == 3 * flow_count
+    result.extra.update(
+        p50_ms=round(statistics.median(latencies) * 1000, 3),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+    )
+    results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
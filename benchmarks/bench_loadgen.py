@@ -0,0 +1,60 @@
+"""
+Benchmark : débit du générateur de charge et du rejeu.
+
+Le générateur ne doit pas limiter le pipeline testé : objectif 50 000
+événements/s. Sans attente (speed=inf) on mesure son débit maximal ; au
+rythme d'une classe à 60 000 événements/s, on vérifie qu'il tient la
+cadence (durée réelle proche de la durée simulée).
+"""
+
+import asyncio
+import math
+import time
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import EventType
+from nexus.loadgen import PRODUCTION_MIX, LoadGenerator, PayloadSize, TrafficClass, replay
+
+
+def drain(chunks) -> int:
+    """Consomme les morceaux ; retourne le nombre d'événements."""
+
+    async def main() -> int:
+        total = 0
+        async for chunk in chunks:
+            total += len(chunk)
+        return total
+
+    return asyncio.run(main())
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure la génération sans attente, au rythme, et le rejeu."""
+    count = scaled(100_000, scale)
+    single = [TrafficClass(EventType.FILE_MODIFIED, rate=60_000.0, sources=20, payload_size=PayloadSize(512, 0.5))]
+    results = [
+        measure("générateur PRODUCTION_MIX, sans attente",
+                lambda: drain(LoadGenerator(PRODUCTION_MIX, seed=1).chunks(count=count, speed=math.inf)), count),
+        measure("générateur 1 classe, sans attente",
+                lambda: drain(LoadGenerator(single, seed=1).chunks(count=count, speed=math.inf)), count),
+    ]
+
+    duration = max(0.5, 2.0 * scale)
+    start = time.perf_counter()
+    generated = drain(LoadGenerator(single, seed=1).chunks(duration=duration))
+    result = BenchResult(f"générateur au rythme de 60 000/s, {duration:g} s", generated, time.perf_counter() - start)
+    result.extra["lag_ms"] = round((result.seconds - duration) * 1000)
+    results.append(result)
+
+    async def record() -> List[list]:
+        return [chunk async for chunk in LoadGenerator(PRODUCTION_MIX, seed=1).chunks(count=count, speed=math.inf)]
+
+    recorded = asyncio.run(record())
+    results.append(measure("rejeu sans attente", lambda: drain(replay(recorded, speed=math.inf)), count))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
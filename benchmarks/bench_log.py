@@ -0,0 +1,78 @@
+"""
+Benchmark : débit d'ajout durable et de relecture du journal d'événements.
+
+Compare un fsync par événement, le fsync groupé de append() avec des
+producteurs concurrents, et l'ajout par lots.
+"""
+
+import asyncio
+import tempfile
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import create_events
+from nexus.queue import EventLog
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure l'ajout durable (fsync) et la relecture."""
+    count = scaled(20_000, scale)
+    # create_events() valide par classe : on rétablit l'ordre de création
+    # des identifiants, celui dans lequel un producteur les journalise
+    events = sorted(create_events(make_records(count)).events, key=lambda event: event.event_id)
+    single_count = min(count, scaled(500, scale))
+
+    def fsync_each() -> None:
+        with tempfile.TemporaryDirectory() as directory, EventLog(directory) as log:
+            for event in events[:single_count]:
+                log.append_nowait(event)
+                log.sync()
+
+    def group_commit(producers: int = 100) -> None:
+        async def main(log: EventLog) -> None:
+            async def produce(offset: int) -> None:
+                for event in events[offset::producers]:
+                    await log.append(event)
+
+            await asyncio.gather(*(produce(offset) for offset in range(producers)))
+
+        with tempfile.TemporaryDirectory() as directory, EventLog(directory) as log:
+            asyncio.run(main(log))
+
+    def batched(size: int = 1000) -> None:
+        with tempfile.TemporaryDirectory() as directory, EventLog(directory) as log:
+            for start in range(0, count, size):
+                for event in events[start:start + size]:
+                    log.append_nowait(event)
+                log.sync()
+
+    with tempfile.TemporaryDirectory() as directory:
+        with EventLog(directory) as log:
+            for event in events:
+                log.append_nowait(event)
+            log.sync()
+
+            def scan() -> None:
+                for _ in log.records():
+                    pass
+
+            replay_results = [
+                measure("records() (mmap, sans copie)", scan, count),
+                measure("replay() (décodage)", lambda: list(log.replay()), count),
+                measure("find() x100 (index creux)",
+                        lambda: [log.find(events[i].event_id) for i in range(0, count, max(1, count // 100))],
+                        100),
+            ]
+
+    return [
+        measure("append + fsync par événement", fsync_each, single_count, repeat=1),
+        measure("append() concurrent, fsync groupé (100 producteurs)", group_commit, count, repeat=1),
+        measure("append_nowait + sync() par lot de 1000", batched, count, repeat=1),
+        *replay_results,
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
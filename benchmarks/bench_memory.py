@@ -0,0 +1,54 @@
+"""
+Benchmark : empreinte mémoire par événement (tracemalloc).
+
+Compare des listes de BaseEvent, de CompactEvent et de trames binaires
+brutes pour dimensionner les files d'attente.
+"""
+
+import tracemalloc
+from typing import Any, Callable, List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.codec import encode_event
+from nexus.core.compact import CompactEvent
+from nexus.core.events import create_events
+
+
+def footprint(build: Callable[[], List[Any]]) -> float:
+    """Mesure les octets alloués par élément de la liste construite."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(items)
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure l'empreinte et le coût de conversion des représentations."""
+    count = scaled(20_000, scale)
+    records = make_records(count)
+    events = create_events(records).events
+    compacts = [CompactEvent.from_event(event) for event in events]
+
+    full_size = footprint(lambda: create_events(records).events)
+    compact_size = footprint(lambda: [CompactEvent.from_event(event) for event in events])
+    frame_size = footprint(lambda: [encode_event(event) for event in events])
+
+    return [
+        measure("BaseEvent (create_events)", lambda: create_events(records), count,
+                bytes_per_event=round(full_size)),
+        measure("CompactEvent.from_event", lambda: [CompactEvent.from_event(e) for e in events], count,
+                bytes_per_event=round(compact_size)),
+        measure("trame brute (encode_event)", lambda: [encode_event(e) for e in events], count,
+                bytes_per_event=round(frame_size)),
+        measure("CompactEvent.to_event", lambda: [c.to_event() for c in compacts], count),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
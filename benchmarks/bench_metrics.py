@@ -0,0 +1,117 @@
+"""
+Benchmark : surcoût de l'instrumentation Prometheus.
+
+Mesure le même chemin (file seule à profondeur 100, puis file +
+WorkerPool avec un processeur instantané) sans instrumentation et avec, ainsi que le coût
+unitaire des points de mesure, comparé aux métriques à étiquettes de
+prometheus_client (verrou par échantillon). Le scrape agrège 8 types x 50
+sources ; collect() est mesuré seul, puis avec la mise en forme de
+generate_latest().
+"""
+
+import asyncio
+import random
+from typing import Callable, List
+
+from harness import BenchResult, measure, report, scaled
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest
+
+from bench_engine import IOProcessor
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.observability import LATENCY_BUCKETS, EventMetrics, disable_metrics, enable_metrics
+from nexus.processors import ProcessorRegistry, WorkerPool
+from nexus.queue import PriorityEventQueue
+
+
+def make_events(count: int) -> List[BaseEvent]:
+    """Événements répartis sur 8 types et 50 sources."""
+    rng = random.Random(3)
+    types = list(EventType)
+    return [
+        BaseEvent.from_trusted(type=rng.choice(types), source=f"source{rng.randrange(50)}", correlation_id=f"c{i % 100}")
+        for i in range(count)
+    ]
+
+
+def through_queue(events: List[BaseEvent], depth: int = 100) -> None:
+    """Mise en file puis retrait des événements, par paquets de ``depth``."""
+    queue = PriorityEventQueue(capacity=0)
+    for start in range(0, len(events), depth):
+        chunk = events[start:start + depth]
+        for event in chunk:
+            queue.put_nowait(event)
+        for _ in chunk:
+            queue.get_nowait()
+            queue.task_done()
+
+
+def through_pool(events: List[BaseEvent]) -> None:
+    """Traitement de tous les événements par un WorkerPool à 16 workers."""
+
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=0)
+        registry = ProcessorRegistry()
+        registry.register(IOProcessor(0))
+        for event in events:
+            queue.put_nowait(event)
+        async with WorkerPool(queue, registry, workers=16):
+            pass
+
+    asyncio.run(main())
+
+
+def compare(name: str, func: Callable[[], None], count: int) -> List[BenchResult]:
+    """Mesure ``func`` sans puis avec instrumentation."""
+    disable_metrics()
+    baseline = measure(f"{name}, sans métriques", func, count, repeat=5)
+    enable_metrics(CollectorRegistry())
+    instrumented = measure(f"{name}, avec métriques", func, count, repeat=5)
+    disable_metrics()
+    instrumented.extra["overhead_ns_per_event"] = round((instrumented.seconds - baseline.seconds) / count * 1e9)
+    instrumented.extra["overhead_pct"] = round((instrumented.seconds / baseline.seconds - 1) * 100, 1)
+    return [baseline, instrumented]
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le surcoût de l'instrumentation sur le chemin critique."""
+    count = scaled(100_000, scale)
+    events = make_events(count)
+    pool_events = events[:scaled(20_000, scale)]
+    results = compare("file put/get", lambda: through_queue(events), count)
+    results += compare("file + WorkerPool", lambda: through_pool(pool_events), len(pool_events))
+
+    recorder = EventMetrics()
+    registry = CollectorRegistry()
+    registry.register(recorder)
+    # Métriques de référence dans un registre à part : le scrape ne mesure qu'EventMetrics
+    reference_registry = CollectorRegistry()
+    histogram = Histogram(
+        "bench_latency_seconds", "", ("type", "source"), buckets=LATENCY_BUCKETS, registry=reference_registry
+    )
+    counter = Counter("bench_events", "", ("type", "source"), registry=reference_registry)
+
+    def points() -> None:
+        for event in events:
+            recorder.enqueued(event)
+            recorder.dequeued(event, 0.001)
+            recorder.processed(event, "processor", 0.002, True)
+
+    def reference() -> None:
+        for event in events:
+            counter.labels(event.type, event.source).inc()
+            histogram.labels(event.type, event.source).observe(0.001)
+            histogram.labels(event.type, event.source).observe(0.002)
+
+    results.append(measure("EventMetrics : 2 observations + 2 compteurs", points, count))
+    results.append(measure("prometheus_client : 2 observations + 1 compteur", reference, count))
+    results.append(measure("EventMetrics : latence de bout en bout", lambda: [recorder.completed(e) for e in events], count))
+    results.append(measure("scrape : collect()", lambda: list(recorder.collect()), 1, repeat=5))
+    result = measure("scrape (generate_latest)", lambda: generate_latest(registry), 1, repeat=5)
+    result.extra["bytes"] = len(generate_latest(registry))
+    results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,35 @@
+"""
+Benchmark : décodage JSON discriminé vs json.loads + create_event().
+"""
+
+import json
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import create_event, create_events, parse_event
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Compare le décodage direct et le décodage manuel par dispatch."""
+    count = scaled(20_000, scale)
+    documents = [event.model_dump_json().encode() for event in create_events(make_records(count)).events]
+
+    def manual() -> None:
+        for document in documents:
+            data = json.loads(document)
+            create_event(data.pop("type"), data.pop("source"), data.pop("payload"), **data)
+
+    def tagged() -> None:
+        for document in documents:
+            parse_event(document)
+
+    return [
+        measure("json.loads + create_event", manual, count),
+        measure("parse_event (union discriminée)", tagged, count),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
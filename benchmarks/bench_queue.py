@@ -0,0 +1,64 @@
+"""
+Benchmark : débit de PriorityEventQueue comparé à asyncio.Queue.
+"""
+
+import asyncio
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType, Priority
+from nexus.queue import OverflowPolicy, PriorityEventQueue
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure put_nowait + get_nowait sur des priorités mélangées."""
+    count = scaled(100_000, scale)
+    events = [
+        BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source="bench", priority=Priority(index % 5 + 1))
+        for index in range(count)
+    ]
+
+    def drain(queue) -> None:
+        for event in events:
+            queue.put_nowait(event)
+        for _ in range(count):
+            queue.get_nowait()
+
+    async def round_trip(queue) -> None:
+        async def produce():
+            for event in events:
+                await queue.put(event)
+
+        async def consume():
+            for _ in range(count):
+                await queue.get()
+                queue.task_done()
+
+        await asyncio.gather(produce(), consume())
+
+    return [
+        measure("asyncio.Queue put/get_nowait", lambda: drain(asyncio.Queue()), count),
+        measure("PriorityEventQueue put/get_nowait", lambda: drain(PriorityEventQueue(capacity=0)), count),
+        measure("PriorityEventQueue sans vieillissement",
+                lambda: drain(PriorityEventQueue(capacity=0, aging_interval=None)), count),
+        measure("asyncio.Queue producteur/consommateur (borne 1000)",
+                lambda: asyncio.run(round_trip(asyncio.Queue(maxsize=1000))), count),
+        measure("PriorityEventQueue producteur/consommateur",
+                lambda: asyncio.run(round_trip(PriorityEventQueue(capacity=1000))), count),
+        measure("PriorityEventQueue DROP_OLDEST (borne 1000)",
+                lambda: drain_dropping(events), count),
+    ]
+
+
+def drain_dropping(events: List[BaseEvent]) -> None:
+    """Remplit une file bornée en évinçant, puis la vide."""
+    queue = PriorityEventQueue(capacity=1000, policy=OverflowPolicy.DROP_OLDEST)
+    for event in events:
+        queue.put_nowait(event)
+    while not queue.empty():
+        queue.get_nowait()
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,89 @@
+"""
+Benchmark : débit des contrôles de RateLimiter, en un ou plusieurs processus.
+
+Chaque processus contrôle des événements répartis sur 100 sources ; le
+débit agrégé est le nombre total de contrôles divisé par le temps du
+processus le plus lent (démarrage des processus exclu). Référence : un
+dictionnaire de seaux partagé via multiprocessing.Manager.
+"""
+
+import multiprocessing
+import time
+from typing import List
+
+from harness import BenchResult, report, scaled
+
+from nexus.api import RateLimit, RateLimiter
+from nexus.core.events import BaseEvent, EventType
+
+
+def make_events(count: int = 100) -> List[BaseEvent]:
+    """Un événement par source."""
+    return [BaseEvent.from_trusted(type=EventType.EMAIL_RECEIVED, source=f"source{i}") for i in range(count)]
+
+
+def check_loop(limiter: RateLimiter, checks: int, results) -> None:
+    """Processus de travail : contrôles en boucle, temps écoulé renvoyé."""
+    events = make_events()
+    admit = limiter.admit_nowait
+    start = time.perf_counter()
+    for i in range(checks):
+        admit(events[i % 100])
+    results.put(time.perf_counter() - start)
+    limiter.close()
+
+
+def manager_loop(buckets, lock, checks: int, results) -> None:
+    """Référence : seaux dans un dict Manager sous un verrou global."""
+    events = make_events()
+    start = time.perf_counter()
+    for i in range(checks):
+        source = events[i % 100].source
+        with lock:
+            now = time.monotonic()
+            tokens, last = buckets.get(source, (1e9, now))
+            tokens = min(1e9, tokens + (now - last) * 1e9)
+            buckets[source] = (tokens - 1, now)
+    results.put(time.perf_counter() - start)
+
+
+def run_processes(processes: int, target, args) -> float:
+    """Lance les processus et retourne le temps du plus lent."""
+    context = multiprocessing.get_context()
+    results = context.Queue()
+    workers = [context.Process(target=target, args=(*args, results)) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    elapsed = max(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+    return elapsed
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le débit agrégé pour 1, 2 et 4 processus."""
+    checks = scaled(200_000, scale)
+    results = []
+
+    with RateLimiter(default=RateLimit(rate=1e9, burst=1e9)) as limiter:
+        start = time.perf_counter()
+        events = make_events()
+        for i in range(checks):
+            limiter.admit_nowait(events[i % 100])
+        results.append(BenchResult("en processus", checks, time.perf_counter() - start))
+
+    for processes in (1, 2, 4):
+        with RateLimiter(default=RateLimit(rate=1e9, burst=1e9)) as limiter:
+            elapsed = run_processes(processes, check_loop, (limiter, checks))
+        results.append(BenchResult(f"mémoire partagée, {processes} processus", checks * processes, elapsed))
+
+    manager_checks = scaled(5_000, scale)
+    with multiprocessing.Manager() as manager:
+        for processes in (1, 4):
+            elapsed = run_processes(processes, manager_loop, (manager.dict(), manager.Lock(), manager_checks))
+            results.append(BenchResult(f"référence Manager, {processes} processus", manager_checks * processes, elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
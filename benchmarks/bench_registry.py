@@ -0,0 +1,61 @@
+"""
+Benchmark : coût de routage avec 1, 10 et 100 processeurs.
+
+Compare l'interrogation de chaque processeur (can_handle) à la table de
+routage précalculée de ProcessorRegistry.
+"""
+
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType, create_events
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry
+
+_TYPES = list(EventType)
+
+
+class TypeProcessor(AbstractProcessor):
+    """Processeur traitant un seul type d'événement."""
+
+    def __init__(self, event_type: EventType) -> None:
+        self.event_type = event_type
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+
+    def can_handle(self, event_type: str) -> bool:
+        return event_type == self.event_type
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure le routage de 20k événements pour plusieurs tailles de registre."""
+    count = scaled(20_000, scale)
+    events = create_events(make_records(count)).events
+    results = []
+    for size in (1, 10, 100):
+        processors = [TypeProcessor(_TYPES[index % len(_TYPES)]) for index in range(size)]
+        registry = ProcessorRegistry()
+        for processor in processors:
+            registry.register(processor)
+
+        def linear() -> None:
+            for event in events:
+                [p for p in processors if p.can_handle(event.type)]
+
+        def table() -> None:
+            route = registry.route
+            for event in events:
+                route(event)
+
+        results.append(measure(f"can_handle() linéaire ({size} processeurs)", linear, count))
+        results.append(measure(f"ProcessorRegistry.route ({size} processeurs)", table, count))
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,87 @@
+"""
+Benchmark : soumissions pendant une panne d'intégration.
+
+Compare le ResilientExecutor (tas unique, plafond, dead letter queue) à
+l'approche naïve d'une tâche endormie par événement en attente de nouvelle
+tentative : débit de soumission et mémoire retenue (tracemalloc).
+"""
+
+import asyncio
+import tracemalloc
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.integrations import CircuitBreaker, ResilientExecutor, RetryPolicy
+
+
+async def failing(event: BaseEvent) -> None:
+    """Intégration en panne."""
+    raise ConnectionError("integration unavailable")
+
+
+async def naive_retry(event: BaseEvent, delays=(1.0, 2.0, 4.0)) -> None:
+    """Approche naïve : une coroutine dort entre les tentatives."""
+    for delay in (0.0, *delays):
+        await asyncio.sleep(delay)
+        try:
+            await failing(event)
+            return
+        except ConnectionError:
+            continue
+
+
+def run_naive(events: List[BaseEvent], memory: List[int]) -> None:
+    """Une tâche par événement, toutes endormies pendant la panne."""
+
+    async def main() -> None:
+        tracemalloc.start()
+        tasks = [asyncio.create_task(naive_retry(event)) for event in events]
+        await asyncio.sleep(0)
+        memory.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def run_executor(events: List[BaseEvent], memory: List[int], cap: int) -> None:
+    """Soumissions au ResilientExecutor pendant la panne."""
+
+    async def main() -> None:
+        tracemalloc.start()
+        executor = ResilientExecutor(max_retries_in_flight=cap)
+        executor.register("toasty", failing, breaker=CircuitBreaker(failure_threshold=5), policy=RetryPolicy())
+        for event in events:
+            await executor.submit("toasty", event)
+        memory.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        await executor.close()
+
+    asyncio.run(main())
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure débit et mémoire retenue pour 100 000 événements en panne."""
+    count = scaled(100_000, scale)
+    events = [BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source="bench") for _ in range(count)]
+    results = []
+
+    memory: List[int] = []
+    result = measure("naïf : une tâche par nouvelle tentative", lambda: run_naive(events, memory), count, repeat=1)
+    result.extra["memory_mb"] = round(memory[-1] / 2**20, 1)
+    results.append(result)
+
+    for cap in (count, 10_000):
+        memory = []
+        result = measure(f"exécuteur, plafond {cap}", lambda: run_executor(events, memory, cap), count, repeat=1)
+        result.extra["memory_mb"] = round(memory[-1] / 2**20, 1)
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,84 @@
+"""
+Benchmark : pipeline multi-processus partitionné par source.
+
+Un processeur coûteux en CPU (hachages successifs du payload) limite une
+boucle asyncio à un cœur ; ShardedPipeline doit en multiplier le débit par
+le nombre de shards tant qu'il reste des cœurs libres. La référence est un
+WorkerPool dans le processus courant. Sur une machine à un seul cœur, les
+shards ne font que mesurer le coût du transport (encodage, anneau,
+décodage) et du changement de processus.
+"""
+
+import asyncio
+import hashlib
+import os
+from typing import List
+
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry, ShardedPipeline, WorkerPool
+from nexus.queue import PriorityEventQueue
+
+ROUNDS = 200
+
+
+class HashingProcessor(AbstractProcessor):
+    """Processeur limité par le CPU (~100 µs par événement)."""
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        digest = event.event_id.encode()
+        for _ in range(ROUNDS):
+            digest = hashlib.sha256(digest).digest()
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+
+    def can_handle(self, event_type: str) -> bool:
+        return True
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def build_registry() -> ProcessorRegistry:
+    registry = ProcessorRegistry()
+    registry.register(HashingProcessor())
+    return registry
+
+
+def in_process(events: List[BaseEvent]) -> None:
+    async def main() -> None:
+        queue = PriorityEventQueue(capacity=10_000)
+        async with WorkerPool(queue, build_registry(), workers=8):
+            for event in events:
+                await queue.put(event)
+
+    asyncio.run(main())
+
+
+def sharded(events: List[BaseEvent], shards: int) -> None:
+    async def main() -> None:
+        async with ShardedPipeline(build_registry, shards=shards) as pipeline:
+            for start in range(0, len(events), 500):
+                await pipeline.put_many(events[start:start + 500])
+        assert pipeline.processed == len(events)
+
+    asyncio.run(main())
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Compare le traitement dans le processus et sur 1, 2 et 4 shards."""
+    count = scaled(20_000, scale)
+    events = [
+        BaseEvent.from_trusted(type=EventType.FILE_MODIFIED, source=f"sync{i % 64}", payload={"path": f"/f/{i}"})
+        for i in range(count)
+    ]
+    results = [measure("WorkerPool dans le processus", lambda: in_process(events), count)]
+    for shards in (1, 2, 4):
+        result = measure(f"ShardedPipeline, {shards} shard(s)", lambda: sharded(events, shards), count)
+        result.extra["cpus"] = os.cpu_count()
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
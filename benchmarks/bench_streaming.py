@@ -0,0 +1,70 @@
+"""
+Benchmark : import et export d'événements en flux (NDJSON et binaire).
+
+Écrit puis relit un fichier d'un million d'événements (10 millions avec
+``scale=10``) par morceaux de 1000, sans jamais conserver le fichier en
+mémoire : les événements écrits sont tirés en boucle d'un petit
+échantillon. La mémoire résidente maximale du processus est relevée après
+chaque étape ; elle ne dépend pas du nombre d'événements.
+"""
+
+import asyncio
+import itertools
+import resource
+import tempfile
+from pathlib import Path
+from typing import List
+
+from bench_create_events import make_records
+from harness import BenchResult, measure, report, scaled
+
+from nexus.core.events import create_events
+from nexus.core.streaming import chunked, read_binary, read_ndjson, write_binary, write_ndjson
+
+CHUNK_SIZE = 1000
+
+
+def max_rss_mb() -> float:
+    """Mémoire résidente maximale du processus, en Mo."""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def run(scale: float = 1.0) -> List[BenchResult]:
+    """Mesure l'écriture et la lecture en flux d'un million d'événements."""
+    count = scaled(1_000_000, scale)
+    sample = create_events(make_records(1000)).events
+
+    def events():
+        return chunked(itertools.islice(itertools.cycle(sample), count), CHUNK_SIZE)
+
+    async def drain(chunks) -> int:
+        read = 0
+        async for chunk in chunks:
+            read += len(chunk)
+        assert read == count
+        return read
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        ndjson = Path(directory) / "events.ndjson"
+        binary = Path(directory) / "events.nxb"
+        steps = [
+            ("écriture NDJSON", lambda: asyncio.run(write_ndjson(ndjson, events())), ndjson),
+            ("écriture binaire", lambda: asyncio.run(write_binary(binary, events())), binary),
+            ("lecture NDJSON validée", lambda: asyncio.run(drain(read_ndjson(ndjson, CHUNK_SIZE))), ndjson),
+            ("lecture binaire validée", lambda: asyncio.run(drain(read_binary(binary, CHUNK_SIZE))), binary),
+            ("lecture binaire sans validation",
+             lambda: asyncio.run(drain(read_binary(binary, CHUNK_SIZE, validate=False))), binary),
+            ("conversion NDJSON -> binaire",
+             lambda: asyncio.run(write_binary(binary, read_ndjson(ndjson, CHUNK_SIZE))), ndjson),
+        ]
+        for name, func, path in steps:
+            result = measure(name, func, count, repeat=1)
+            result.extra["file_mb"] = round(path.stat().st_size / 2**20)
+            result.extra["max_rss_mb"] = max_rss_mb()
+            results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
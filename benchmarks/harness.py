@@ -0,0 +1,68 @@
+"""
+Outils communs aux benchmarks Nexus.
+
+Chaque module ``bench_*.py`` expose une fonction ``run(scale)`` qui retourne
+une liste de BenchResult, et peut être exécuté directement.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable
+
+
+@dataclass
+class BenchResult:
+    """Mesure d'un benchmark : meilleur temps pour un nombre d'opérations."""
+
+    name: str
+    operations: int
+    seconds: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Débit mesuré en opérations par seconde."""
+        return self.operations / self.seconds if self.seconds else float("inf")
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    operations: int,
+    repeat: int = 3,
+    **extra: Any,
+) -> BenchResult:
+    """
+    Mesure une fonction en conservant le meilleur temps sur plusieurs essais.
+
+    Args:
+        name: Nom du benchmark
+        func: Fonction exécutant ``operations`` opérations par appel
+        operations: Nombre d'opérations effectuées par appel
+        repeat: Nombre d'essais
+        **extra: Informations complémentaires à joindre au résultat
+
+    Returns:
+        Résultat du meilleur essai
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return BenchResult(name=name, operations=operations, seconds=best, extra=dict(extra))
+
+
+def scaled(count: int, scale: float) -> int:
+    """Applique le facteur d'échelle à un nombre d'opérations."""
+    return max(1, int(count * scale))
+
+
+def report(results: Iterable[BenchResult]) -> None:
+    """Affiche les résultats sous forme de tableau."""
+    for result in results:
+        extra = " ".join(f"{key}={value}" for key, value in result.extra.items())
+        print(
+            f"{result.name:<48} {result.ops_per_sec:>14,.0f} ops/s"
+            f" {result.seconds * 1000:>10.2f} ms  {extra}"
+        )
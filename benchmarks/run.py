@@ -0,0 +1,172 @@
+"""
+Exécute les benchmarks et compare les résultats à une exécution de référence.
+
+Usage :
+
+    python benchmarks/run.py --scale 0.1 --output current.json
+    python benchmarks/run.py --only lifecycle codec --baseline main.json --threshold 15
+
+Les résultats sont écrits en JSON (commit, interpréteur, paramètres, puis
+un résultat par mesure) pour être comparés d'un commit à l'autre. Avec
+``--baseline``, toute mesure dont le débit baisse de plus de ``--threshold``
+pour cent par rapport à la référence est signalée et le code de sortie
+vaut 1. Les mesures absentes de l'une des deux exécutions sont ignorées.
+
+Le seuil doit tenir compte du bruit de la machine : comparer deux
+exécutions de référence successives en donne l'ordre de grandeur, et
+``--rounds`` le réduit en ne gardant que le meilleur de plusieurs passes.
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path[:0] = [str(BENCHMARKS), str(BENCHMARKS.parent / "src")]
+
+from harness import BenchResult, report  # noqa: E402
+
+# (module, nom de la mesure)
+_Key = Tuple[str, str]
+
+
+def discover() -> List[str]:
+    """Noms courts des modules bench_*.py, triés."""
+    return sorted(path.stem[len("bench_"):] for path in BENCHMARKS.glob("bench_*.py"))
+
+
+def git_revision() -> Dict[str, Any]:
+    """Commit courant et présence de modifications non commitées."""
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=BENCHMARKS, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(status) if status is not None else None}
+
+
+def run_module(name: str, scale: float, payload_size: int) -> List[BenchResult]:
+    """Exécute ``bench_<name>.run()`` ; payload_size est transmis s'il est accepté."""
+    module = importlib.import_module(f"bench_{name}")
+    options: Dict[str, Any] = {}
+    if "payload_size" in inspect.signature(module.run).parameters:
+        options["payload_size"] = payload_size
+    return module.run(scale, **options)
+
+
+def collect(names: Sequence[str], scale: float, payload_size: int, rounds: int = 1) -> Dict[str, Any]:
+    """
+    Exécute les modules demandés et construit le document de résultats.
+
+    Args:
+        names: Noms courts des modules (``queue`` pour bench_queue.py)
+        scale: Facteur d'échelle du nombre d'opérations
+        payload_size: Taille des payloads synthétiques, en octets
+        rounds: Nombre d'exécutions de chaque module ; le meilleur
+            résultat de chaque mesure est conservé
+
+    Returns:
+        Document JSON-sérialisable
+    """
+    document: Dict[str, Any] = {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "payload_size": payload_size,
+        "rounds": rounds,
+        "results": [],
+    }
+    for name in names:
+        best: Dict[str, BenchResult] = {}
+        for round_number in range(1, rounds + 1):
+            print(f"== {name} ({round_number}/{rounds})", file=sys.stderr)
+            results = run_module(name, scale, payload_size)
+            report(results)
+            for result in results:
+                if result.name not in best or result.seconds < best[result.name].seconds:
+                    best[result.name] = result
+        for result in best.values():
+            document["results"].append({
+                "module": name,
+                "name": result.name,
+                "operations": result.operations,
+                "seconds": result.seconds,
+                "ops_per_sec": result.ops_per_sec,
+                "extra": result.extra,
+            })
+    return document
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+) -> List[Tuple[_Key, float, float, float]]:
+    """
+    Mesures dont le débit a baissé de plus de ``threshold`` pour cent.
+
+    Returns:
+        Liste de (clé, débit de référence, débit courant, variation en %)
+    """
+    reference = {(r["module"], r["name"]): r["ops_per_sec"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["module"], result["name"])
+        before = reference.get(key)
+        if not before:
+            continue
+        change = (result["ops_per_sec"] / before - 1) * 100
+        if change < -threshold:
+            regressions.append((key, before, result["ops_per_sec"], change))
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Point d'entrée ; retourne le code de sortie."""
+    available = discover()
+    parser = argparse.ArgumentParser(description="Run the Nexus benchmarks")
+    parser.add_argument("--only", nargs="+", choices=available, metavar="NAME",
+                        help=f"benchmarks to run (default: all): {', '.join(available)}")
+    parser.add_argument("--scale", type=float, default=1.0, help="operation count multiplier")
+    parser.add_argument("--payload-size", type=int, default=256, help="synthetic payload size in bytes")
+    parser.add_argument("--rounds", type=int, default=1, help="runs per benchmark, best result kept")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="throughput drop (percent) reported as a regression")
+    args = parser.parse_args(argv)
+    if args.scale <= 0 or args.rounds < 1 or args.payload_size < 0 or args.threshold < 0:
+        parser.error("--scale and --rounds must be positive, --payload-size and --threshold not negative")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    current = collect(args.only or available, args.scale, args.payload_size, args.rounds)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2, ensure_ascii=False) + "\n")
+    if baseline is None:
+        return 0
+
+    if baseline.get("scale") != current["scale"] or baseline.get("payload_size") != current["payload_size"]:
+        print("warning: baseline was run with different --scale or --payload-size", file=sys.stderr)
+    regressions = compare(baseline, current, args.threshold)
+    for (module, name), before, after, change in regressions:
+        print(f"REGRESSION {module}: {name}: {before:,.0f} -> {after:,.0f} ops/s ({change:+.1f}%)")
+    reference = (baseline.get("commit") or "?")[:12]
+    print(f"{len(regressions)} regression(s) over {args.threshold:g}% against {reference}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
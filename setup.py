@@ -53,5 +53,8 @@ setup(
             "sphinx>=7.0.0",
             "sphinx-rtd-theme>=1.3.0",
         ],
+        "analytics": [
+            "numpy>=1.24.0",
+        ],
     },
 )
\ No newline at end of file
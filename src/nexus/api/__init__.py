@@ -0,0 +1,13 @@
+"""
+Interface de réception et middleware de Nexus.
+"""
+
+from .ratelimit import RateLimit, RateLimitAction, RateLimiter
+from .server import EventReceiver
+
+__all__ = [
+    "EventReceiver",
+    "RateLimit",
+    "RateLimitAction",
+    "RateLimiter",
+]
@@ -0,0 +1,293 @@
+"""
+Limitation de débit par source, partagée entre processus.
+
+Chaque clé (la source de l'événement, éventuellement combinée au type ou à
+la priorité) dispose d'un seau à jetons. Les seaux vivent dans une table de
+mémoire partagée (multiprocessing.shared_memory) : tous les processus
+d'ingestion locaux qui reçoivent le même RateLimiter appliquent un budget
+global commun.
+
+La table est adressée par un hachage stable (BLAKE2b 64 bits) de la clé,
+avec sondage linéaire ; chaque processus mémorise l'emplacement des clés
+déjà vues, d'où un contrôle en O(1). Les mises à jour sont protégées par
+des verrous répartis (striped) : deux clés ne se disputent un verrou que si
+elles tombent dans la même bande, et un verrou libre s'acquiert sans appel
+système. Un verrou global ne sert qu'à réserver l'emplacement d'une clé
+nouvelle.
+
+Table pleine : les clés supplémentaires partagent un même seau de
+débordement, ce qui borne la mémoire face à un grand nombre de sources.
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import shared_memory
+from multiprocessing.context import BaseContext
+from operator import attrgetter
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from ..core.events import BaseEvent, Priority
+
+# Emplacement : hachage de la clé (0 = libre), jetons, dernière recharge
+_SLOT_WORDS = 3
+_WORD_SIZE = 8
+
+
+class RateLimitAction(str, Enum):
+    """Traitement d'un événement dépassant sa limite."""
+
+    DROP = "drop"
+    DELAY = "delay"
+    DOWNGRADE = "downgrade"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Seau à jetons : débit soutenu et rafale maximale."""
+
+    rate: float
+    burst: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+class RateLimiter:
+    """
+    Limiteur de débit à seaux à jetons en mémoire partagée.
+
+    L'instance se transmet aux processus de travail par héritage (argument
+    de multiprocessing.Process) ; tous doivent utiliser la même
+    configuration. Le processus créateur libère la mémoire avec close().
+
+    Args:
+        default: Limite des sources sans limite dédiée, None pour ne pas
+            les limiter
+        limits: Limite par source
+        keys: Attributs de l'événement formant la clé d'un seau
+            (par exemple ("source", "type"))
+        action: Traitement d'un événement hors limite
+        max_delay: Attente maximale en secondes avec DELAY ; au-delà,
+            l'événement est abandonné
+        slots: Nombre de seaux de la table partagée
+        stripes: Nombre de verrous répartis
+        context: Contexte multiprocessing des processus de travail
+        clock: Horloge monotone commune aux processus
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        limits: Optional[Mapping[str, RateLimit]] = None,
+        keys: Sequence[str] = ("source",),
+        action: RateLimitAction = RateLimitAction.DROP,
+        max_delay: float = 1.0,
+        slots: int = 4096,
+        stripes: int = 64,
+        context: Optional[BaseContext] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not keys:
+            raise ValueError("keys must not be empty")
+        if slots < 1 or stripes < 1:
+            raise ValueError("slots and stripes must be at least 1")
+        self._default = default
+        self._limits: Dict[str, RateLimit] = dict(limits or {})
+        self._keys = tuple(keys)
+        self._action = RateLimitAction(action)
+        self._max_delay = max_delay
+        self._slots = slots
+        self._clock = clock
+
+        # Dernier emplacement : seau de débordement
+        self._memory = shared_memory.SharedMemory(create=True, size=(slots + 1) * _SLOT_WORDS * _WORD_SIZE)
+        self._owner = os.getpid()
+        context = context or multiprocessing.get_context()
+        self._table_lock = context.Lock()
+        self._locks = [context.Lock() for _ in range(stripes)]
+        self._attach()
+
+    def _attach(self) -> None:
+        buffer = self._memory.buf
+        self._words = buffer.cast("Q")
+        self._floats = buffer.cast("d")
+        self._key_of: Callable[[BaseEvent], Any] = attrgetter(*self._keys)
+        self._cache: Dict[str, Tuple[int, RateLimit]] = {}
+
+        self.admitted = 0
+        self.dropped = 0
+        self.delayed = 0
+        self.downgraded = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {
+            name: value for name, value in self.__dict__.items()
+            if name not in ("_memory", "_words", "_floats", "_key_of", "_cache")
+        }
+        state["_memory_name"] = self._memory.name
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        name = state.pop("_memory_name")
+        self.__dict__.update(state)
+        self._memory = shared_memory.SharedMemory(name=name)
+        self._attach()
+
+    def close(self) -> None:
+        """Détache la table partagée ; le processus créateur la supprime."""
+        if self._memory is None:
+            return
+        self._words.release()
+        self._floats.release()
+        self._memory.close()
+        if self._owner == os.getpid():
+            self._memory.unlink()
+        self._memory = None
+
+    def __enter__(self) -> "RateLimiter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def key(self, event: BaseEvent) -> str:
+        """Clé du seau d'un événement."""
+        value = self._key_of(event)
+        if isinstance(value, tuple):
+            return "\x1f".join(str(getattr(part, "value", part)) for part in value)
+        if type(value) is str:
+            return value
+        return str(getattr(value, "value", value))
+
+    def _bucket(self, key: str, source: str) -> Optional[Tuple[int, RateLimit]]:
+        bucket = self._cache.get(key)
+        if bucket is not None:
+            return bucket
+        limit = self._limits.get(source, self._default)
+        if limit is None:
+            return None
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+        words, floats = self._words, self._floats
+        index = digest % self._slots
+        for _ in range(self._slots):
+            offset = index * _SLOT_WORDS
+            current = words[offset]
+            if current == 0:
+                with self._table_lock:
+                    current = words[offset]
+                    if current == 0:
+                        floats[offset + 1] = limit.burst
+                        floats[offset + 2] = self._clock()
+                        words[offset] = digest
+                        current = digest
+            if current == digest:
+                bucket = self._cache[key] = (index, limit)
+                return bucket
+            index = (index + 1) % self._slots
+
+        # Table pleine : seau de débordement, non mémorisé localement
+        offset = self._slots * _SLOT_WORDS
+        with self._table_lock:
+            if words[offset] == 0:
+                floats[offset + 1] = limit.burst
+                floats[offset + 2] = self._clock()
+                words[offset] = 1
+        return self._slots, limit
+
+    def reserve(self, event: BaseEvent, max_wait: float = 0.0) -> Optional[float]:
+        """
+        Consomme un jeton du seau de l'événement.
+
+        Args:
+            event: Événement à admettre
+            max_wait: Attente acceptable ; un jeton peut être réservé
+                par anticipation dans cette limite
+
+        Returns:
+            Attente avant admission (0.0 si immédiate), ou None si elle
+            dépasserait max_wait, auquel cas aucun jeton n'est consommé
+        """
+        bucket = self._bucket(self.key(event), event.source)
+        if bucket is None:
+            return 0.0
+        index, limit = bucket
+        offset = index * _SLOT_WORDS
+        floats = self._floats
+        with self._locks[index % len(self._locks)]:
+            now = self._clock()
+            tokens = min(limit.burst, floats[offset + 1] + (now - floats[offset + 2]) * limit.rate)
+            floats[offset + 2] = now
+            if tokens >= 1.0:
+                floats[offset + 1] = tokens - 1.0
+                return 0.0
+            wait = (1.0 - tokens) / limit.rate
+            if wait > max_wait:
+                floats[offset + 1] = tokens
+                return None
+            floats[offset + 1] = tokens - 1.0
+            return wait
+
+    def admit_nowait(self, event: BaseEvent) -> Optional[BaseEvent]:
+        """
+        Applique la limite sans attendre (actions DROP et DOWNGRADE).
+
+        Returns:
+            L'événement admis, éventuellement rétrogradé en BACKGROUND, ou
+            None s'il est abandonné
+
+        Raises:
+            ValueError: Si l'action configurée est DELAY
+        """
+        if self._action is RateLimitAction.DELAY:
+            raise ValueError("DELAY action requires admit()")
+        if self.reserve(event) is not None:
+            self.admitted += 1
+            return event
+        return self._reject(event)
+
+    async def admit(self, event: BaseEvent) -> Optional[BaseEvent]:
+        """
+        Applique la limite, en attendant un jeton avec l'action DELAY.
+
+        Returns:
+            L'événement admis, éventuellement rétrogradé en BACKGROUND, ou
+            None s'il est abandonné
+        """
+        if self._action is not RateLimitAction.DELAY:
+            return self.admit_nowait(event)
+        wait = self.reserve(event, self._max_delay)
+        if wait is None:
+            self.dropped += 1
+            return None
+        if wait:
+            self.delayed += 1
+            await asyncio.sleep(wait)
+        self.admitted += 1
+        return event
+
+    def _reject(self, event: BaseEvent) -> Optional[BaseEvent]:
+        if self._action is RateLimitAction.DOWNGRADE:
+            self.downgraded += 1
+            if event.priority == Priority.BACKGROUND:
+                return event
+            return event.model_copy(update={"priority": Priority.BACKGROUND.value})
+        self.dropped += 1
+        return None
+
+    def tokens(self, event: BaseEvent) -> Optional[float]:
+        """Jetons disponibles pour l'événement, None s'il n'est pas limité."""
+        bucket = self._bucket(self.key(event), event.source)
+        if bucket is None:
+            return None
+        index, limit = bucket
+        offset = index * _SLOT_WORDS
+        elapsed = self._clock() - self._floats[offset + 2]
+        return min(limit.burst, self._floats[offset + 1] + elapsed * limit.rate)
@@ -0,0 +1,253 @@
+"""
+Récepteur HTTP/WebSocket des événements externes (aiohttp).
+
+Routes :
+
+    POST /events          un événement JSON
+    POST /events/batch    tableau JSON (application/json), NDJSON
+                          (application/x-ndjson) ou lot binaire de
+                          nexus.core.codec (application/octet-stream)
+    GET  /events/ws       canal WebSocket : chaque message texte est un
+                          événement ou un tableau JSON, chaque message
+                          binaire un lot du codec ; chaque message reçoit
+                          un accusé {"seq", "accepted", "throttled", "errors"}
+    GET  /health          état du récepteur et taille de la file
+    GET  /metrics         métriques Prometheus (si un registre est fourni)
+
+Les corps sont décodés directement vers les classes typées (un seul appel
+au validateur compilé pour un tableau valide). Les éléments invalides
+d'un tableau ou d'un flux NDJSON sont rejetés individuellement ; un lot
+binaire est validé en bloc.
+
+Back-pressure : un lot HTTP est ajouté à la file en entier ou pas du tout
+(PriorityEventQueue.put_many_nowait) ; si la file n'a pas la place, la
+réponse est 429 avec Retry-After et rien n'est conservé en mémoire. Sur
+WebSocket, le récepteur attend une place dans la file avant de lire le
+message suivant : aiohttp suspend alors la lecture du socket et le
+contrôle de flux TCP ralentit le producteur.
+"""
+
+import asyncio
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+from aiohttp import WSMsgType, web
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from pydantic import ValidationError
+
+from ..core.codec import CodecError, decode_events
+from ..core.events import BulkEventResult, Event, EventRecordError, parse_event, parse_event_array, parse_events
+from .ratelimit import RateLimiter
+
+logger = structlog.get_logger(__name__)
+
+_NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+_BINARY_TYPES = {"application/octet-stream"}
+
+
+def _error_list(errors: List[EventRecordError]) -> List[Dict[str, Any]]:
+    return [{"index": error.index, "message": error.message} for error in errors]
+
+
+def _decode_text(data: str) -> BulkEventResult:
+    """Événement ou tableau JSON d'un message WebSocket texte."""
+    if data.lstrip().startswith("["):
+        return parse_event_array(data)
+    return BulkEventResult(events=[parse_event(data)])
+
+
+def _decode_binary(data: bytes) -> BulkEventResult:
+    """Lot binaire du codec, validé en bloc."""
+    return BulkEventResult(events=decode_events(data))
+
+
+class EventReceiver:
+    """
+    Point d'entrée HTTP/WebSocket des événements, avec back-pressure.
+
+    Args:
+        queue: File de destination (PriorityEventQueue ou équivalent
+            exposant put(), put_many_nowait() et qsize())
+        limiter: Limiteur de débit appliqué à chaque événement reçu
+        max_body: Taille maximale d'un corps de requête ou d'un message
+            WebSocket, en octets
+        max_batch: Nombre maximum d'événements par requête ou message
+        retry_after: Délai suggéré au client (en-tête Retry-After) quand
+            la file est pleine, en secondes
+        metrics: Registre Prometheus exposé sur /metrics, None pour ne
+            pas exposer la route
+    """
+
+    def __init__(
+        self,
+        queue: Any,
+        limiter: Optional[RateLimiter] = None,
+        max_body: int = 16 * 1024 * 1024,
+        max_batch: int = 10_000,
+        retry_after: float = 1.0,
+        metrics: Optional[CollectorRegistry] = None,
+    ) -> None:
+        self._queue = queue
+        self._limiter = limiter
+        self._max_body = max_body
+        self._max_batch = max_batch
+        self._retry_after = str(max(1, math.ceil(retry_after)))
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application(client_max_size=max_body)
+        self.app.add_routes([
+            web.post("/events", self._post_event),
+            web.post("/events/batch", self._post_batch),
+            web.get("/events/ws", self._websocket),
+            web.get("/health", self._health),
+        ])
+        self._metrics = metrics
+        if metrics is not None:
+            self.app.router.add_get("/metrics", self._metrics_page)
+
+        self.accepted = 0
+        self.invalid = 0
+        self.throttled = 0
+
+    # Cycle de vie
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """Démarre le serveur HTTP (port 0 : port libre choisi par le système)."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info("Event receiver started", addresses=self._runner.addresses)
+
+    @property
+    def port(self) -> int:
+        """Port d'écoute du serveur démarré."""
+        if self._runner is None:
+            raise RuntimeError("Receiver is not started")
+        return self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Arrête le serveur et ferme les connexions ouvertes."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # Admission
+
+    async def _limit(self, events: List[Event]) -> Tuple[List[Event], int]:
+        """Applique le limiteur de débit ; retourne les événements admis."""
+        if self._limiter is None:
+            return events, 0
+        admitted = []
+        for event in events:
+            event = await self._limiter.admit(event)
+            if event is not None:
+                admitted.append(event)
+        return admitted, len(events) - len(admitted)
+
+    def _queue_full(self, count: int) -> web.Response:
+        self.throttled += count
+        return web.json_response(
+            {"error": "Queue full", "retry_after": int(self._retry_after)},
+            status=429,
+            headers={"Retry-After": self._retry_after},
+        )
+
+    async def _admit(self, result: BulkEventResult) -> web.Response:
+        self.invalid += len(result.errors)
+        errors = _error_list(result.errors)
+        if not result.events:
+            return web.json_response({"accepted": 0, "throttled": 0, "errors": errors}, status=400)
+        events, limited = await self._limit(result.events)
+        self.throttled += limited
+        try:
+            self._queue.put_many_nowait(events)
+        except asyncio.QueueFull:
+            return self._queue_full(len(events))
+        self.accepted += len(events)
+        return web.json_response({"accepted": len(events), "throttled": limited, "errors": errors}, status=202)
+
+    # Routes HTTP
+
+    async def _post_event(self, request: web.Request) -> web.Response:
+        try:
+            event = parse_event(await request.read())
+        except ValidationError as exc:
+            error = EventRecordError(index=0, errors=exc.errors(include_url=False))
+            return await self._admit(BulkEventResult(errors=[error]))
+        return await self._admit(BulkEventResult(events=[event]))
+
+    async def _post_batch(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        content_type = request.content_type
+        try:
+            if content_type in _NDJSON_TYPES:
+                result = parse_events(line for line in body.split(b"\n") if line.strip())
+            elif content_type in _BINARY_TYPES:
+                result = _decode_binary(body)
+            else:
+                result = parse_event_array(body)
+        except (ValueError, CodecError) as exc:
+            self.invalid += 1
+            raise web.HTTPBadRequest(text=f"Invalid event batch: {exc}") from None
+        if len(result.events) + len(result.errors) > self._max_batch:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=self._max_batch,
+                actual_size=len(result.events) + len(result.errors),
+                text=f"Too many events in batch (maximum {self._max_batch})",
+            )
+        return await self._admit(result)
+
+    async def _health(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok", "queued": self._queue.qsize()})
+
+    async def _metrics_page(self, request: web.Request) -> web.Response:
+        response = web.Response(body=generate_latest(self._metrics))
+        response.headers["Content-Type"] = CONTENT_TYPE_LATEST
+        return response
+
+    # WebSocket
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=self._max_body, heartbeat=30.0)
+        await ws.prepare(request)
+        sequence = 0
+        async for message in ws:
+            if message.type is WSMsgType.TEXT:
+                decode = _decode_text
+            elif message.type is WSMsgType.BINARY:
+                decode = _decode_binary
+            else:
+                continue
+            sequence += 1
+            try:
+                result = decode(message.data)
+            except ValidationError as exc:
+                result = BulkEventResult(errors=[EventRecordError(index=0, errors=exc.errors(include_url=False))])
+            except (ValueError, CodecError) as exc:
+                result = BulkEventResult(errors=[
+                    EventRecordError(index=0, errors=[{"type": "invalid_message", "loc": (), "msg": str(exc)}])
+                ])
+            if len(result.events) > self._max_batch:
+                await ws.close(code=1009, message=b"Too many events in message")
+                break
+            self.invalid += len(result.errors)
+            events, throttled = await self._limit(result.events)
+            accepted = 0
+            for event in events:
+                # Attente d'une place : la lecture du socket est suspendue
+                try:
+                    await self._queue.put(event)
+                except asyncio.QueueFull:
+                    throttled += 1
+                else:
+                    accepted += 1
+            self.accepted += accepted
+            self.throttled += throttled
+            await ws.send_json({
+                "seq": sequence,
+                "accepted": accepted,
+                "throttled": throttled,
+                "errors": _error_list(result.errors),
+            })
+        return ws
@@ -0,0 +1,17 @@
+"""
+Distribution des événements entre nœuds Nexus par un broker de messages.
+"""
+
+from .base import AbstractBroker, BrokerError, Subscription, partition_of
+from .client import BrokerClient, BrokerSubscription
+from .local import LocalBroker
+
+__all__ = [
+    "AbstractBroker",
+    "BrokerClient",
+    "BrokerError",
+    "BrokerSubscription",
+    "LocalBroker",
+    "Subscription",
+    "partition_of",
+]
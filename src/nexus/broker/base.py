@@ -0,0 +1,103 @@
+"""
+Abstraction du broker : publication et consommation d'événements entre nœuds.
+
+Un broker répartit les événements publiés en partitions par source
+(partition_of) : tous les événements d'une source restent ordonnés dans
+une même partition. Un groupe de consommateurs se partage les partitions,
+chacune n'étant lue que par un membre à la fois ; ajouter un nœud au
+groupe redistribue les partitions. Un événement reste dû au groupe tant
+qu'il n'est pas acquitté (livraison au moins une fois) : s'il n'est pas
+acquitté avant le départ de son consommateur, il est relivré au membre
+qui reprend sa partition.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence
+
+from ..core.events import BaseEvent
+
+
+class BrokerError(RuntimeError):
+    """Opération refusée par le broker."""
+
+
+def partition_of(source: str, partitions: int) -> int:
+    """Partition d'une source (CRC32, stable d'une exécution à l'autre)."""
+    return zlib.crc32(source.encode()) % partitions
+
+
+class Subscription(ABC):
+    """Abonnement d'un consommateur à un groupe ; itérable en lots d'événements."""
+
+    group: str
+    consumer: str
+
+    @property
+    @abstractmethod
+    def partitions(self) -> List[int]:
+        """Partitions actuellement attribuées à ce consommateur."""
+        pass
+
+    @abstractmethod
+    async def get(self) -> List[BaseEvent]:
+        """
+        Attend le prochain lot d'événements livrés.
+
+        Raises:
+            StopAsyncIteration: Si l'abonnement est fermé
+        """
+        pass
+
+    @abstractmethod
+    def ack(self, event: BaseEvent) -> None:
+        """Acquitte un événement livré par cet abonnement."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Quitte le groupe ; les événements non acquittés seront relivrés."""
+        pass
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> List[BaseEvent]:
+        return await self.get()
+
+
+class AbstractBroker(ABC):
+    """Interface commune des brokers (client local, ou autre implémentation)."""
+
+    @abstractmethod
+    async def publish(self, events: Sequence[BaseEvent]) -> int:
+        """
+        Publie des événements et attend leur prise en charge par le broker.
+
+        Returns:
+            Nombre d'événements ajoutés
+        """
+        pass
+
+    @abstractmethod
+    async def subscribe(self, group: str, consumer: Optional[str] = None, prefetch: int = 1000) -> Subscription:
+        """
+        Rejoint un groupe de consommateurs.
+
+        Args:
+            group: Nom du groupe
+            consumer: Nom du consommateur dans le groupe (unique par nœud)
+            prefetch: Événements livrés et non acquittés au maximum
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Ferme la connexion au broker."""
+        pass
+
+    async def __aenter__(self) -> "AbstractBroker":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -0,0 +1,306 @@
+"""
+Client du broker local : publication et abonnement d'un nœud Nexus.
+
+Une connexion porte les publications et au plus un abonnement. Les
+publications sont pipelinées : plusieurs lots peuvent attendre leur
+confirmation en même temps (``max_in_flight``), et toutes les trames émises
+pendant un tour de boucle partent en une seule écriture. Les
+acquittements ne sont pas confirmés : ack() les accumule et ils partent
+regroupés en plages au tour de boucle suivant.
+
+Un nœud consomme un groupe en remettant les lots livrés à sa file et en
+acquittant chaque événement une fois traité :
+
+    async with BrokerClient("tcp://127.0.0.1:7400") as broker:
+        subscription = await broker.subscribe("nexus")
+        pool = WorkerPool(queue, registry, on_result=lambda event, results: subscription.ack(event))
+        async with pool:
+            async for events in subscription:
+                for event in events:
+                    await queue.put(event)
+"""
+
+import asyncio
+import os
+import socket
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from ..core.codec import CodecError, decode_events, encode_events
+from ..core.events import BaseEvent
+from .base import AbstractBroker, BrokerError, Subscription
+from .protocol import (
+    COUNT,
+    PUBLISHED,
+    REQUEST,
+    RUN,
+    Connection,
+    Op,
+    ProtocolError,
+    decode_json,
+    decode_runs,
+    encode_json,
+    encode_runs,
+    merge_runs,
+    parse_address,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class BrokerSubscription(Subscription):
+    """Abonnement d'un BrokerClient ; créé par BrokerClient.subscribe()."""
+
+    def __init__(self, client: "BrokerClient", group: str, consumer: str) -> None:
+        self.group = group
+        self.consumer = consumer
+        self._client = client
+        self._partitions: List[int] = []
+        self._assigned = asyncio.Event()
+        self._batches: "asyncio.Queue[Optional[List[BaseEvent]]]" = asyncio.Queue()
+        # event_id -> positions livrées (plusieurs si l'identifiant est republié)
+        self._positions: Dict[str, Deque[Tuple[int, int]]] = {}
+        self._acks: List[Tuple[int, int]] = []
+        self._flush: Optional[asyncio.Handle] = None
+
+    @property
+    def partitions(self) -> List[int]:
+        return list(self._partitions)
+
+    @property
+    def unacked(self) -> int:
+        """Événements livrés à cet abonnement et pas encore acquittés."""
+        return sum(len(positions) for positions in self._positions.values())
+
+    async def wait_assigned(self) -> List[int]:
+        """Attend la première attribution de partitions par le broker."""
+        await self._assigned.wait()
+        return self.partitions
+
+    async def get(self) -> List[BaseEvent]:
+        batch = await self._batches.get()
+        if batch is None:
+            # Marqueur de fin remis en place pour les appels suivants
+            self._batches.put_nowait(None)
+            raise StopAsyncIteration
+        return batch
+
+    def ack(self, event: BaseEvent) -> None:
+        positions = self._positions.get(event.event_id)
+        if not positions:
+            return
+        self._acks.append(positions.popleft())
+        if not positions:
+            del self._positions[event.event_id]
+        if self._flush is None:
+            self._flush = asyncio.get_running_loop().call_soon(self._send_acks)
+
+    def _send_acks(self) -> None:
+        self._flush = None
+        acks, self._acks = self._acks, []
+        if acks and not self._client.closed:
+            self._client._connection.send(Op.ACK, encode_runs(merge_runs(acks)))
+
+    async def close(self) -> None:
+        """Quitte le groupe en fermant la connexion du client."""
+        await self._client.close()
+
+    # Messages du broker
+
+    def _on_assigned(self, partitions: List[int]) -> None:
+        revoked = set(self._partitions) - set(partitions)
+        self._partitions = partitions
+        self._assigned.set()
+        if revoked:
+            # Relivrés au nouveau propriétaire : leurs acquittements seraient ignorés
+            for event_id in list(self._positions):
+                positions = deque(p for p in self._positions[event_id] if p[0] not in revoked)
+                if positions:
+                    self._positions[event_id] = positions
+                else:
+                    del self._positions[event_id]
+        logger.info("Partitions assigned", group=self.group, consumer=self.consumer, partitions=len(partitions))
+
+    def _on_deliver(self, body: bytes) -> None:
+        if len(body) < COUNT.size:
+            raise ProtocolError("Truncated DELIVER message")
+        (count,) = COUNT.unpack_from(body, 0)
+        runs_end = COUNT.size + count * RUN.size
+        if len(body) < runs_end:
+            raise ProtocolError("Truncated DELIVER position runs")
+        runs = decode_runs(memoryview(body)[COUNT.size:runs_end], count)
+        try:
+            events = decode_events(memoryview(body)[runs_end:], trusted=self._client.trusted)
+        except CodecError as exc:
+            raise ProtocolError(f"Invalid DELIVER batch: {exc}") from exc
+        if sum(run[2] for run in runs) != len(events):
+            raise ProtocolError("DELIVER position runs do not match the batch")
+        iterator = iter(events)
+        for partition, first, run_length in runs:
+            for offset in range(first, first + run_length):
+                event = next(iterator)
+                positions = self._positions.get(event.event_id)
+                if positions is None:
+                    self._positions[event.event_id] = deque(((partition, offset),))
+                else:
+                    positions.append((partition, offset))
+        self._batches.put_nowait(events)
+
+    def _on_closed(self) -> None:
+        self._assigned.set()
+        self._batches.put_nowait(None)
+
+
+class BrokerClient(AbstractBroker):
+    """
+    Connexion à un LocalBroker.
+
+    Args:
+        address: ``tcp://hôte:port`` ou ``unix:///chemin``
+        max_in_flight: Publications au maximum en attente de confirmation
+        trusted: Si True, les événements livrés sont reconstruits sans
+            revalidation (le broker ne relaie que des trames publiées par
+            des clients Nexus)
+    """
+
+    def __init__(self, address: str, max_in_flight: int = 64, trusted: bool = True) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.address = address
+        self.trusted = trusted
+        self._target = parse_address(address)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._connection: Optional[Connection] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._requests: Dict[int, asyncio.Future] = {}
+        self._next_request = 0
+        self._subscription: Optional[BrokerSubscription] = None
+        self.closed = False
+
+        self.published = 0
+
+    async def connect(self) -> None:
+        """
+        Ouvre la connexion au broker.
+
+        Raises:
+            OSError: Si le broker est injoignable
+        """
+        if self._connection is not None:
+            raise RuntimeError("BrokerClient is already connected")
+        scheme, target = self._target
+        if scheme == "unix":
+            reader, writer = await asyncio.open_unix_connection(target)
+        else:
+            reader, writer = await asyncio.open_connection(*target)
+        self._connection = Connection(reader, writer)
+        self._reader = asyncio.create_task(self._read())
+
+    async def __aenter__(self) -> "BrokerClient":
+        if self._connection is None:
+            await self.connect()
+        return self
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+        if self._subscription is not None:
+            self._subscription._send_acks()
+        self.closed = True
+        if self._connection is not None:
+            await self._connection.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+    def _require_connection(self) -> Connection:
+        if self._connection is None or self.closed:
+            raise RuntimeError("BrokerClient is not connected")
+        return self._connection
+
+    async def publish(self, events: Sequence[BaseEvent]) -> int:
+        """
+        Publie des événements en un lot et attend la confirmation du broker.
+
+        Raises:
+            BrokerError: Si le broker refuse le lot
+            ConnectionError: Si la connexion est perdue avant la confirmation
+        """
+        async with self._in_flight:
+            connection = self._require_connection()
+            request = self._next_request
+            self._next_request = (request + 1) & 0xFFFFFFFF
+            future = asyncio.get_running_loop().create_future()
+            self._requests[request] = future
+            connection.send(Op.PUBLISH, REQUEST.pack(request), encode_events(events))
+            await connection.drain()
+            count = await future
+        self.published += count
+        return count
+
+    async def subscribe(self, group: str, consumer: Optional[str] = None, prefetch: int = 1000) -> BrokerSubscription:
+        """
+        Rejoint un groupe ; une seule fois par client.
+
+        Args:
+            group: Nom du groupe
+            consumer: Nom du consommateur, par défaut hôte-pid-client
+            prefetch: Événements livrés et non acquittés au maximum
+        """
+        connection = self._require_connection()
+        if self._subscription is not None:
+            raise RuntimeError("BrokerClient already has a subscription")
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        consumer = consumer or f"{socket.gethostname()}-{os.getpid()}-{id(self):x}"
+        self._subscription = BrokerSubscription(self, group, consumer)
+        connection.send(Op.SUBSCRIBE, encode_json({"group": group, "consumer": consumer, "prefetch": prefetch}))
+        return self._subscription
+
+    async def _read(self) -> None:
+        assert self._connection is not None
+        error: Exception = ConnectionError("Connection to broker closed")
+        try:
+            while True:
+                op, body = await self._connection.receive()
+                if op is Op.PUBLISHED:
+                    if len(body) != PUBLISHED.size:
+                        raise ProtocolError("Invalid PUBLISHED message")
+                    request, count = PUBLISHED.unpack(body)
+                    future = self._requests.pop(request, None)
+                    if future is not None and not future.done():
+                        future.set_result(count)
+                elif op is Op.ERROR:
+                    message = decode_json(body)
+                    future = self._requests.pop(message.get("request"), None)
+                    if future is not None and not future.done():
+                        future.set_exception(BrokerError(message.get("error", "unknown error")))
+                elif op is Op.DELIVER and self._subscription is not None:
+                    self._subscription._on_deliver(body)
+                elif op is Op.ASSIGNED and self._subscription is not None:
+                    try:
+                        partitions = [int(partition) for partition in decode_json(body)["partitions"]]
+                    except (KeyError, TypeError, ValueError) as exc:
+                        raise ProtocolError(f"Invalid ASSIGNED message: {exc}") from exc
+                    self._subscription._on_assigned(partitions)
+                else:
+                    raise ProtocolError(f"Unexpected {op.name} message")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            if not self.closed:
+                logger.warning("Connection to broker lost", address=self.address)
+        except ProtocolError as exc:
+            logger.error("Invalid message from broker", address=self.address, error=str(exc))
+            error = ConnectionError(str(exc))
+        finally:
+            self.closed = True
+            for future in self._requests.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._requests.clear()
+            if self._subscription is not None:
+                self._subscription._on_closed()
+            await self._connection.close()
+
+    def __repr__(self) -> str:
+        return f"BrokerClient({self.address!r})"
@@ -0,0 +1,353 @@
+"""
+Broker local : serveur TCP ou socket Unix, en mémoire, pour plusieurs nœuds.
+
+Remplaçant d'un broker de messages réel pour le déploiement multi-nœuds
+sur une machine (ou un réseau de confiance) : un processus ``nexus
+broker`` reçoit les publications, et chaque nœud Nexus s'y abonne avec
+BrokerClient dans un groupe commun.
+
+Chaque partition est une suite de trames binaires du codec, conservées
+sans décodage (seule la source est lue pour choisir la partition). Pour
+chaque groupe et chaque partition, le broker retient l'offset suivant à
+livrer et les offsets livrés non acquittés. Une partition n'est acquittée
+qu'à partir du plus ancien offset non acquitté de tous les groupes ; au-delà
+de ``retention`` trames, les plus anciennes sont abandonnées même si un
+groupe ne les a pas lues (compteur ``dropped``). Un nouveau groupe commence
+à la plus ancienne trame conservée ; un groupe vide garde sa position.
+
+Attribution : les partitions sont réparties en tourniquet entre les membres
+triés par nom. Lors d'un changement de membre, les événements non acquittés
+d'une partition qui change de propriétaire sont relivrés au nouveau (au
+moins une fois) ; les acquittements de l'ancien propriétaire sont ignorés.
+"""
+
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from ..core.codec import CodecError, batch_frames, decode_source, encode_frames
+from .base import partition_of
+from .protocol import (
+    COUNT,
+    PUBLISHED,
+    REQUEST,
+    Connection,
+    Op,
+    ProtocolError,
+    decode_json,
+    decode_runs,
+    encode_json,
+    encode_runs,
+    parse_address,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Offsets acquittés par tous les groupes avant compactage d'une partition
+_TRIM_CHUNK = 4096
+
+
+class _Partition:
+    """Trames d'une partition ; ``base`` est l'offset de frames[0]."""
+
+    __slots__ = ("base", "frames")
+
+    def __init__(self) -> None:
+        self.base = 0
+        self.frames: List[bytes] = []
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.frames)
+
+    def drop(self, count: int) -> None:
+        del self.frames[:count]
+        self.base += count
+
+
+class _Member:
+    """Consommateur connecté à un groupe."""
+
+    def __init__(self, connection: Connection, group: "_Group", name: str, prefetch: int, order: int) -> None:
+        self.connection = connection
+        self.group = group
+        self.name = name
+        self.prefetch = prefetch
+        self.order = order
+        self.inflight = 0
+        self.partitions: List[int] = []
+        # Première partition servie au prochain lot (tourniquet)
+        self.cursor = 0
+
+
+class _Group:
+    """Position d'un groupe dans chaque partition et membres connectés."""
+
+    def __init__(self, name: str, starts: List[int]) -> None:
+        self.name = name
+        self.members: List[_Member] = []
+        self.owners: List[Optional[_Member]] = [None] * len(starts)
+        self.next = starts
+        # Offsets livrés non acquittés, dans l'ordre de livraison (dict ordonné)
+        self.pending: List[Dict[int, None]] = [{} for _ in starts]
+
+    def low_water(self, partition: int) -> int:
+        """Plus ancien offset encore dû au groupe."""
+        return next(iter(self.pending[partition]), self.next[partition])
+
+
+class LocalBroker:
+    """
+    Broker en mémoire servant le protocole de nexus.broker.protocol.
+
+    Args:
+        partitions: Nombre de partitions (fixe : il détermine la
+            répartition des sources)
+        retention: Trames conservées au maximum par partition
+        max_batch: Événements au maximum par livraison
+    """
+
+    def __init__(self, partitions: int = 16, retention: int = 1_000_000, max_batch: int = 1000) -> None:
+        if not 1 <= partitions <= 0xFFFF:
+            raise ValueError("partitions must be between 1 and 65535")
+        if retention < 1 or max_batch < 1:
+            raise ValueError("retention and max_batch must be at least 1")
+        self._partitions = [_Partition() for _ in range(partitions)]
+        self._retention = retention
+        self._max_batch = max_batch
+        self._groups: Dict[str, _Group] = {}
+        self._connections: Set[Connection] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._address: Optional[str] = None
+        self._order = itertools.count()
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def partitions(self) -> int:
+        """Nombre de partitions."""
+        return len(self._partitions)
+
+    @property
+    def address(self) -> str:
+        """Adresse d'écoute effective (port attribué compris)."""
+        if self._address is None:
+            raise RuntimeError("LocalBroker is not started")
+        return self._address
+
+    def lag(self, group: str) -> int:
+        """Événements publiés et pas encore acquittés par un groupe."""
+        state = self._groups.get(group)
+        if state is None:
+            return sum(len(partition.frames) for partition in self._partitions)
+        return sum(
+            partition.end - max(state.low_water(index), partition.base)
+            for index, partition in enumerate(self._partitions)
+        )
+
+    # Cycle de vie
+
+    async def start(self, address: str = "tcp://127.0.0.1:0") -> None:
+        """
+        Commence à écouter.
+
+        Args:
+            address: ``tcp://hôte:port`` (port 0 : port libre) ou
+                ``unix:///chemin``
+        """
+        if self._server is not None:
+            raise RuntimeError("LocalBroker is already started")
+        scheme, target = parse_address(address)
+        if scheme == "unix":
+            self._server = await asyncio.start_unix_server(self._serve, path=target)
+            self._address = address
+        else:
+            host, port = target
+            self._server = await asyncio.start_server(self._serve, host, port)
+            port = self._server.sockets[0].getsockname()[1]
+            self._address = f"tcp://{host}:{port}"
+        logger.info("Broker started", address=self._address, partitions=self.partitions)
+
+    async def stop(self) -> None:
+        """Ferme les connexions et cesse d'écouter."""
+        if self._server is None:
+            return
+        self._server.close()
+        for connection in list(self._connections):
+            await connection.close()
+        await self._server.wait_closed()
+        self._server = None
+        logger.info("Broker stopped", published=self.published, delivered=self.delivered, dropped=self.dropped)
+
+    async def __aenter__(self) -> "LocalBroker":
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    # Connexions
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = Connection(reader, writer)
+        self._connections.add(connection)
+        member: Optional[_Member] = None
+        try:
+            while True:
+                op, body = await connection.receive()
+                if op is Op.PUBLISH:
+                    self._publish(connection, body)
+                elif op is Op.ACK and member is not None:
+                    self._ack(member, body)
+                elif op is Op.SUBSCRIBE and member is None:
+                    member = self._join(connection, decode_json(body))
+                else:
+                    raise ProtocolError(f"Unexpected {op.name} message")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ProtocolError as exc:
+            logger.warning("Closing broker connection", error=str(exc))
+        finally:
+            self._connections.discard(connection)
+            if member is not None:
+                self._leave(member)
+            await connection.close()
+
+    def _publish(self, connection: Connection, body: bytes) -> None:
+        if len(body) < REQUEST.size:
+            raise ProtocolError("Truncated PUBLISH message")
+        (request,) = REQUEST.unpack_from(body, 0)
+        try:
+            frames = batch_frames(memoryview(body)[REQUEST.size:])
+            targets = [partition_of(decode_source(frame), len(self._partitions)) for frame in frames]
+        except CodecError as exc:
+            connection.send(Op.ERROR, encode_json({"request": request, "error": str(exc)}))
+            return
+        for frame, index in zip(frames, targets):
+            self._partitions[index].frames.append(bytes(frame))
+        for index in set(targets):
+            self._enforce_retention(index)
+        self.published += len(frames)
+        connection.send(Op.PUBLISHED, PUBLISHED.pack(request, len(frames)))
+        for group in self._groups.values():
+            self._pump(group)
+
+    def _enforce_retention(self, index: int) -> None:
+        partition = self._partitions[index]
+        excess = len(partition.frames) - self._retention
+        if excess <= 0:
+            return
+        partition.drop(excess)
+        self.dropped += excess
+        for group in self._groups.values():
+            owner = group.owners[index]
+            pending = group.pending[index]
+            for offset in [offset for offset in pending if offset < partition.base]:
+                del pending[offset]
+                if owner is not None:
+                    owner.inflight -= 1
+            group.next[index] = max(group.next[index], partition.base)
+
+    def _ack(self, member: _Member, body: bytes) -> None:
+        group = member.group
+        for index, first, count in decode_runs(body):
+            if index >= len(self._partitions) or group.owners[index] is not member:
+                continue
+            pending = group.pending[index]
+            for offset in range(first, first + count):
+                if offset in pending:
+                    del pending[offset]
+                    member.inflight -= 1
+            self._trim(index)
+        self._pump(group)
+
+    def _trim(self, index: int) -> None:
+        """Supprime les trames acquittées par tous les groupes, par blocs."""
+        partition = self._partitions[index]
+        if not self._groups:
+            return
+        low_water = min(group.low_water(index) for group in self._groups.values())
+        count = low_water - partition.base
+        if count >= _TRIM_CHUNK or (count > 0 and count == len(partition.frames)):
+            partition.drop(count)
+
+    # Groupes
+
+    def _join(self, connection: Connection, message: Dict[str, Any]) -> _Member:
+        try:
+            name, consumer, prefetch = str(message["group"]), str(message["consumer"]), int(message["prefetch"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ProtocolError(f"Invalid subscription: {exc}") from exc
+        if prefetch < 1:
+            raise ProtocolError("prefetch must be at least 1")
+        group = self._groups.get(name)
+        if group is None:
+            group = self._groups[name] = _Group(name, [partition.base for partition in self._partitions])
+        member = _Member(connection, group, consumer, prefetch, next(self._order))
+        group.members.append(member)
+        logger.info("Consumer joined", group=name, consumer=consumer, members=len(group.members))
+        self._rebalance(group, joined=member)
+        return member
+
+    def _leave(self, member: _Member) -> None:
+        group = member.group
+        group.members.remove(member)
+        logger.info("Consumer left", group=group.name, consumer=member.name, members=len(group.members))
+        self._rebalance(group)
+
+    def _rebalance(self, group: _Group, joined: Optional[_Member] = None) -> None:
+        members = sorted(group.members, key=lambda member: (member.name, member.order))
+        previous = {id(member): list(member.partitions) for member in members}
+        for member in members:
+            member.partitions = []
+        for index in range(len(self._partitions)):
+            owner = members[index % len(members)] if members else None
+            if owner is not group.owners[index]:
+                # Les livraisons non acquittées repartent du plus ancien offset dû
+                pending = group.pending[index]
+                if pending:
+                    group.next[index] = next(iter(pending))
+                    if group.owners[index] is not None:
+                        group.owners[index].inflight -= len(pending)
+                    pending.clear()
+                group.owners[index] = owner
+            if owner is not None:
+                owner.partitions.append(index)
+        for member in members:
+            # Le nouvel arrivant est toujours notifié, même sans partition
+            if member is joined or member.partitions != previous[id(member)]:
+                member.connection.send(Op.ASSIGNED, encode_json({"partitions": member.partitions}))
+        self._pump(group)
+
+    def _pump(self, group: _Group) -> None:
+        """Livre à chaque membre de quoi remplir sa fenêtre de prefetch."""
+        for member in group.members:
+            while member.inflight < member.prefetch and not member.connection.closing:
+                runs: List[Tuple[int, int, int]] = []
+                frames: List[bytes] = []
+                budget = min(member.prefetch - member.inflight, self._max_batch)
+                cursor = member.cursor % len(member.partitions) if member.partitions else 0
+                member.cursor = cursor + 1
+                for index in member.partitions[cursor:] + member.partitions[:cursor]:
+                    partition = self._partitions[index]
+                    first = max(group.next[index], partition.base)
+                    count = min(partition.end - first, budget - len(frames))
+                    if count <= 0:
+                        continue
+                    start = first - partition.base
+                    frames.extend(partition.frames[start:start + count])
+                    runs.append((index, first, count))
+                    group.next[index] = first + count
+                    group.pending[index].update(dict.fromkeys(range(first, first + count)))
+                    if len(frames) == budget:
+                        break
+                if not frames:
+                    break
+                member.inflight += len(frames)
+                self.delivered += len(frames)
+                member.connection.send(Op.DELIVER, COUNT.pack(len(runs)), encode_runs(runs), encode_frames(frames))
@@ -0,0 +1,187 @@
+"""
+Protocole du broker local (TCP ou socket Unix).
+
+Chaque message est une trame ``<BI`` (opération, longueur du corps) suivie
+du corps. Les événements circulent en lots binaires de nexus.core.codec ;
+les positions sont des plages ``<HQI`` (partition, premier offset, nombre).
+
+    PUBLISH    client -> broker  <I requête, lot d'événements
+    PUBLISHED  broker -> client  <II requête, événements ajoutés
+    SUBSCRIBE  client -> broker  JSON {"group", "consumer", "prefetch"}
+    ASSIGNED   broker -> client  JSON {"partitions": [...]}
+    DELIVER    broker -> client  <I nombre de plages, plages, lot d'événements
+    ACK        client -> broker  plages acquittées
+    ERROR      broker -> client  JSON {"request", "error"}
+
+Les écritures sont regroupées : send() accumule les trames et une seule
+écriture sur le socket part au prochain tour de boucle, quel que soit le
+nombre de publications, livraisons ou acquittements émis entre-temps.
+"""
+
+import asyncio
+import json
+import struct
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_FRAME = struct.Struct("<BI")
+RUN = struct.Struct("<HQI")
+COUNT = struct.Struct("<I")
+REQUEST = struct.Struct("<I")
+PUBLISHED = struct.Struct("<II")
+
+# Corps maximal d'une trame reçue
+MAX_FRAME = 64 * 1024 * 1024
+
+
+class Op(IntEnum):
+    """Opérations du protocole."""
+
+    PUBLISH = 1
+    PUBLISHED = 2
+    SUBSCRIBE = 3
+    ASSIGNED = 4
+    DELIVER = 5
+    ACK = 6
+    ERROR = 7
+
+
+class ProtocolError(ValueError):
+    """Trame invalide ou inattendue."""
+
+
+def parse_address(address: str) -> Tuple[str, Any]:
+    """
+    Décode une adresse de broker.
+
+    Args:
+        address: ``tcp://hôte:port`` ou ``unix:///chemin/du/socket``
+
+    Returns:
+        ("tcp", (hôte, port)) ou ("unix", chemin)
+
+    Raises:
+        ValueError: Si le schéma ou le port est invalide
+    """
+    scheme, separator, rest = address.partition("://")
+    if separator and scheme == "unix" and rest:
+        return "unix", rest
+    if separator and scheme == "tcp":
+        host, _, port = rest.rpartition(":")
+        if host and port.isdigit():
+            return "tcp", (host.strip("[]"), int(port))
+    raise ValueError(f"Invalid broker address {address!r}: expected tcp://host:port or unix:///path")
+
+
+def encode_runs(runs: Iterable[Tuple[int, int, int]]) -> bytes:
+    """Plages (partition, premier offset, nombre) concaténées."""
+    return b"".join(RUN.pack(*run) for run in runs)
+
+
+def decode_runs(data: Buffer, count: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    """
+    Décode des plages produites par encode_runs().
+
+    Args:
+        data: Plages concaténées
+        count: Nombre de plages, None pour lire tout le tampon
+    """
+    if count is None:
+        count, remainder = divmod(len(data), RUN.size)
+        if remainder:
+            raise ProtocolError("Truncated position runs")
+    return [RUN.unpack_from(data, index * RUN.size) for index in range(count)]
+
+
+def merge_runs(positions: Iterable[Tuple[int, int]]) -> List[Tuple[int, int, int]]:
+    """Regroupe des positions (partition, offset) en plages contiguës."""
+    runs: List[List[int]] = []
+    for partition, offset in sorted(positions):
+        if runs and runs[-1][0] == partition and runs[-1][1] + runs[-1][2] == offset:
+            runs[-1][2] += 1
+        else:
+            runs.append([partition, offset, 1])
+    return [(partition, first, count) for partition, first, count in runs]
+
+
+def encode_json(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode()
+
+
+def decode_json(body: Buffer) -> Dict[str, Any]:
+    try:
+        message = json.loads(bytes(body))
+    except ValueError as exc:
+        raise ProtocolError(f"Invalid control message: {exc}") from exc
+    if not isinstance(message, dict):
+        raise ProtocolError("Control message must be a JSON object")
+    return message
+
+
+class Connection:
+    """
+    Canal de trames sur un flux asyncio, à écritures regroupées.
+
+    Args:
+        reader: Flux de lecture
+        writer: Flux d'écriture
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._pending: List[Buffer] = []
+        self._flush: Optional[asyncio.Handle] = None
+
+    @property
+    def closing(self) -> bool:
+        """Indique si le flux est fermé ou en cours de fermeture."""
+        return self._writer.is_closing()
+
+    def send(self, op: Op, *parts: Buffer) -> None:
+        """Ajoute une trame, écrite au prochain tour de boucle."""
+        self._pending.append(_FRAME.pack(op, sum(len(part) for part in parts)))
+        self._pending.extend(parts)
+        if self._flush is None:
+            self._flush = asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Écrit immédiatement les trames en attente, en une seule écriture."""
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+        if self._pending and not self._writer.is_closing():
+            self._writer.write(b"".join(self._pending))
+        self._pending = []
+
+    async def drain(self) -> None:
+        """Attend que le tampon d'écriture du transport repasse sous son seuil haut."""
+        await self._writer.drain()
+
+    async def receive(self) -> Tuple[Op, bytes]:
+        """
+        Lit la trame suivante.
+
+        Raises:
+            asyncio.IncompleteReadError: Si le pair a fermé la connexion
+            ProtocolError: Si l'opération est inconnue ou la trame trop grande
+        """
+        op, length = _FRAME.unpack(await self._reader.readexactly(_FRAME.size))
+        if length > MAX_FRAME:
+            raise ProtocolError(f"Frame of {length} bytes exceeds maximum of {MAX_FRAME}")
+        try:
+            op = Op(op)
+        except ValueError as exc:
+            raise ProtocolError(f"Unknown operation {op}") from exc
+        return op, await self._reader.readexactly(length)
+
+    async def close(self) -> None:
+        """Écrit les trames en attente et ferme le flux."""
+        self.flush()
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
@@ -0,0 +1,467 @@
+"""
+Interface en ligne de commande de Nexus.
+
+Les commandes de fichiers travaillent en flux (voir nexus.core.streaming) :
+mémoire constante quelle que soit la taille du fichier. ``-`` désigne
+l'entrée ou la sortie standard. Les enregistrements rejetés sont signalés
+sur la sortie d'erreur (``fichier:numéro: message``) sans interrompre le
+traitement ; le code de sortie vaut alors 1.
+"""
+
+import asyncio
+import signal
+import time
+from collections import deque
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, List, Optional, Tuple
+
+import aiohttp
+import click
+from prometheus_client import REGISTRY
+
+from . import __version__
+from .api import EventReceiver
+from .broker import BrokerClient, LocalBroker
+from .broker.protocol import parse_address
+from .core.codec import CodecError, encode_events
+from .core.events import BaseEvent, EventRecordError, EventType
+from .core.streaming import StreamFile, StreamFormat, chunked, read_events, write_events
+from .loadgen import PRODUCTION_MIX, LoadGenerator, load_profile, replay
+from .observability import disable_metrics, enable_metrics
+from .queue import DeadLetterReason, DeadLetterStore, EventLog, PriorityEventQueue
+
+_FORMATS = click.Choice([format.value for format in StreamFormat])
+_NDJSON_SUFFIXES = {".ndjson", ".jsonl", ".json"}
+
+
+class _Rejections:
+    """Signale les enregistrements rejetés sur la sortie d'erreur et les compte."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.count = 0
+
+    def __call__(self, error: EventRecordError) -> None:
+        self.count += 1
+        click.echo(f"{self.source}:{error.index}: {error.message}", err=True)
+
+
+def _stream_file(path: str, fd: int) -> StreamFile:
+    return fd if path == "-" else path
+
+
+def _output_format(path: str, to: Optional[str]) -> StreamFormat:
+    if to is not None:
+        return StreamFormat(to)
+    if path == "-" or Path(path).suffix.lower() in _NDJSON_SUFFIXES:
+        return StreamFormat.NDJSON
+    return StreamFormat.BINARY
+
+
+def _run(main: Callable[[], Awaitable[Any]]) -> Any:
+    try:
+        return asyncio.run(main())
+    except (CodecError, OSError) as exc:
+        raise click.ClickException(str(exc)) from exc
+
+
+def _finish(action: str, count: int, rejections: _Rejections) -> None:
+    click.echo(f"{action} {count} events, {rejections.count} rejected", err=True)
+    if rejections.count:
+        click.get_current_context().exit(1)
+
+
+def _chunk_size_option(func: Callable[..., Any]) -> Callable[..., Any]:
+    return click.option("--chunk-size", default=1000, show_default=True, type=click.IntRange(min=1),
+                        help="Événements par morceau lu ou écrit.")(func)
+
+
+@click.group()
+@click.version_option(__version__, message="%(version)s")
+def main() -> None:
+    """Nexus : réception, import, export et conversion d'événements."""
+
+
+@main.command()
+@click.argument("source")
+@click.argument("destination")
+@click.option("--to", "to", type=_FORMATS, help="Format de sortie (par défaut selon l'extension).")
+@click.option("--trusted", is_flag=True, help="Ne pas revalider les trames binaires produites par Nexus.")
+@_chunk_size_option
+def convert(source: str, destination: str, to: Optional[str], trusted: bool, chunk_size: int) -> None:
+    """Convertit un fichier d'événements (NDJSON ou binaire)."""
+    rejections = _Rejections(source)
+
+    async def run() -> int:
+        chunks = read_events(_stream_file(source, 0), chunk_size=chunk_size, on_error=rejections,
+                             validate=not trusted)
+        return await write_events(_stream_file(destination, 1), chunks, _output_format(destination, to))
+
+    _finish("Wrote", _run(run), rejections)
+
+
+@main.command()
+@click.argument("source")
+@_chunk_size_option
+def validate(source: str, chunk_size: int) -> None:
+    """Valide un fichier d'événements sans rien écrire."""
+    rejections = _Rejections(source)
+
+    async def run() -> int:
+        valid = 0
+        async for chunk in read_events(_stream_file(source, 0), chunk_size=chunk_size, on_error=rejections):
+            valid += len(chunk)
+        return valid
+
+    _finish("Validated", _run(run), rejections)
+
+
+@main.command("import")
+@click.argument("source")
+@click.argument("log_dir", type=click.Path(file_okay=False))
+@_chunk_size_option
+def import_events(source: str, log_dir: str, chunk_size: int) -> None:
+    """Ajoute les événements d'un fichier au journal LOG_DIR (un fsync par morceau)."""
+    rejections = _Rejections(source)
+
+    async def run() -> int:
+        imported = 0
+        with EventLog(log_dir) as log:
+            async for chunk in read_events(_stream_file(source, 0), chunk_size=chunk_size, on_error=rejections):
+                await log.append_many(chunk)
+                imported += len(chunk)
+        return imported
+
+    _finish("Imported", _run(run), rejections)
+
+
+@main.command("export")
+@click.argument("log_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("destination")
+@click.option("--to", "to", type=_FORMATS, help="Format de sortie (par défaut selon l'extension).")
+@click.option("--start", default=0, show_default=True, type=click.IntRange(min=0),
+              help="Première séquence exportée.")
+@click.option("--since", type=click.DateTime(), help="Ignore les événements antérieurs (UTC).")
+@_chunk_size_option
+def export_events(log_dir: str, destination: str, to: Optional[str], start: int, since: Optional[datetime],
+                  chunk_size: int) -> None:
+    """Exporte les événements du journal LOG_DIR vers un fichier."""
+
+    async def run() -> int:
+        with EventLog(log_dir) as log:
+            chunks = chunked(log.replay(start, since=since), chunk_size)
+            return await write_events(_stream_file(destination, 1), chunks, _output_format(destination, to))
+
+    click.echo(f"Wrote {_run(run)} events", err=True)
+
+
+async def _journal(queue: PriorityEventQueue, log: EventLog, batch_size: int = 1000) -> None:
+    """Ajoute au journal les événements de la file, par lots (un fsync par lot)."""
+    while True:
+        events = [await queue.get()]
+        while len(events) < batch_size and not queue.empty():
+            events.append(queue.get_nowait())
+        await log.append_many(events)
+        for _ in events:
+            queue.task_done()
+
+
+async def _ingest(receiver: EventReceiver, queue: PriorityEventQueue, log: EventLog, stop: asyncio.Event) -> None:
+    """Journalise les événements reçus jusqu'à l'arrêt, puis vide la file."""
+    journal = asyncio.create_task(_journal(queue, log))
+    try:
+        await stop.wait()
+    finally:
+        # Plus de nouvelles requêtes, puis vidange de la file dans le journal
+        await receiver.stop()
+        if not journal.done():
+            await queue.join()
+        journal.cancel()
+
+
+@main.command()
+@click.argument("log_dir", type=click.Path(file_okay=False))
+@click.option("--host", default="127.0.0.1", show_default=True, help="Adresse d'écoute.")
+@click.option("--port", default=8080, show_default=True, type=click.IntRange(0, 65535), help="Port d'écoute.")
+@click.option("--capacity", default=10_000, show_default=True, type=click.IntRange(min=1),
+              help="Capacité de chaque niveau de priorité de la file (au-delà : 429).")
+@click.option("--metrics/--no-metrics", default=True, show_default=True,
+              help="Instrumentation du cycle de vie et route /metrics (Prometheus).")
+def serve(log_dir: str, host: str, port: int, capacity: int, metrics: bool) -> None:
+    """
+    Reçoit des événements HTTP/WebSocket et les ajoute au journal LOG_DIR.
+
+    Arrêt par SIGINT ou SIGTERM : la file est vidée dans le journal.
+    """
+    recorder = enable_metrics(REGISTRY) if metrics else None
+
+    async def run() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        queue = PriorityEventQueue(capacity=capacity)
+        receiver = EventReceiver(queue, metrics=REGISTRY if recorder else None)
+        if recorder is not None:
+            recorder.watch_queue(queue)
+        with EventLog(log_dir) as log:
+            await receiver.start(host, port)
+            click.echo(f"Listening on http://{host}:{receiver.port}", err=True)
+            await _ingest(receiver, queue, log, stop)
+        click.echo(f"Stopped after {receiver.accepted} events", err=True)
+
+    try:
+        _run(run)
+    finally:
+        disable_metrics()
+
+
+@main.command()
+@click.option("--listen", default="tcp://127.0.0.1:7400", show_default=True,
+              help="Adresse d'écoute : tcp://hôte:port ou unix:///chemin.")
+@click.option("--partitions", default=16, show_default=True, type=click.IntRange(1, 0xFFFF),
+              help="Nombre de partitions (répartition des sources entre les nœuds).")
+@click.option("--retention", default=1_000_000, show_default=True, type=click.IntRange(min=1),
+              help="Événements conservés au maximum par partition.")
+def broker(listen: str, partitions: int, retention: int) -> None:
+    """
+    Démarre un broker local pour distribuer les événements entre nœuds.
+
+    Les nœuds s'y abonnent avec nexus.broker.BrokerClient dans un groupe
+    commun ; generate et replay y publient. Arrêt par SIGINT ou SIGTERM.
+    """
+    try:
+        parse_address(listen)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--listen") from exc
+
+    async def run() -> int:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        server = LocalBroker(partitions=partitions, retention=retention)
+        await server.start(listen)
+        async with server:
+            click.echo(f"Broker listening on {server.address}", err=True)
+            await stop.wait()
+        return server.published
+
+    click.echo(f"Stopped after {_run(run)} events", err=True)
+
+
+async def _post_chunks(url: str, chunks: AsyncIterator[List[BaseEvent]]) -> Tuple[int, int, int]:
+    """
+    Envoie chaque morceau en un lot binaire à ``url``/events/batch.
+
+    Un lot refusé faute de place (429) est compté comme limité, sans
+    nouvelle tentative.
+
+    Returns:
+        (événements envoyés, acceptés, limités)
+    """
+    endpoint = url.rstrip("/") + "/events/batch"
+    sent = accepted = throttled = 0
+    async with aiohttp.ClientSession(headers={"Content-Type": "application/octet-stream"}) as session:
+        async for chunk in chunks:
+            async with session.post(endpoint, data=encode_events(chunk)) as response:
+                sent += len(chunk)
+                if response.status == 429:
+                    throttled += len(chunk)
+                    continue
+                if response.status not in (202, 400):
+                    raise click.ClickException(f"{endpoint}: HTTP {response.status}")
+                body = await response.json()
+                accepted += body["accepted"]
+                throttled += body["throttled"]
+    return sent, accepted, throttled
+
+
+async def _publish_chunks(address: str, chunks: AsyncIterator[List[BaseEvent]], max_in_flight: int = 64) -> int:
+    """
+    Publie chaque morceau sur un broker au fil de la lecture.
+
+    Au plus ``max_in_flight`` publications attendent leur confirmation :
+    au-delà, la plus ancienne est attendue avant de lire le morceau suivant,
+    ce qui borne la mémoire quel que soit le nombre d'événements.
+
+    Returns:
+        Nombre d'événements publiés
+    """
+    published = 0
+    pending: Deque[asyncio.Task] = deque()
+    async with BrokerClient(address, max_in_flight=max_in_flight) as broker:
+        try:
+            async for chunk in chunks:
+                if len(pending) >= max_in_flight:
+                    published += await pending.popleft()
+                pending.append(asyncio.create_task(broker.publish(chunk)))
+                # Laisse la publication partir même si la source n'attend jamais
+                await asyncio.sleep(0)
+            while pending:
+                published += await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+    return published
+
+
+async def _deliver(destination: str, chunks: AsyncIterator[List[BaseEvent]], to: Optional[str]) -> str:
+    """Écrit les morceaux dans un fichier, ou les envoie à un récepteur HTTP ou un broker ; retourne le bilan."""
+    started = time.monotonic()
+    if destination.startswith(("http://", "https://")):
+        sent, accepted, throttled = await _post_chunks(destination, chunks)
+        outcome = f", {accepted} accepted, {throttled} throttled"
+    elif destination.startswith(("tcp://", "unix://")):
+        sent = await _publish_chunks(destination, chunks)
+        outcome = " published"
+    else:
+        sent = await write_events(_stream_file(destination, 1), chunks, _output_format(destination, to))
+        outcome = ""
+    elapsed = time.monotonic() - started
+    return f"{sent} events in {elapsed:.1f}s ({sent / elapsed if elapsed else 0:,.0f}/s){outcome}"
+
+
+def _speed_option(func: Callable[..., Any]) -> Callable[..., Any]:
+    return click.option("--speed", default=1.0, show_default=True, type=click.FloatRange(min=0, min_open=True),
+                        help="Accélération du temps (inf : sans attente).")(func)
+
+
+@main.command()
+@click.argument("destination")
+@click.option("--profile", type=click.Path(exists=True, dir_okay=False),
+              help="Profil de charge YAML (par défaut : fichiers en rafales, sondes, emails volumineux).")
+@click.option("--duration", type=click.FloatRange(min=0, min_open=True), help="Durée simulée en secondes.")
+@click.option("--count", type=click.IntRange(min=1), help="Nombre maximum d'événements.")
+@click.option("--rate-scale", default=1.0, show_default=True, type=click.FloatRange(min=0, min_open=True),
+              help="Multiplie le débit de chaque classe de trafic.")
+@click.option("--seed", type=int, help="Graine du générateur (trafic reproductible).")
+@_speed_option
+@click.option("--to", "to", type=_FORMATS, help="Format de sortie (par défaut selon l'extension).")
+@_chunk_size_option
+def generate(destination: str, profile: Optional[str], duration: Optional[float], count: Optional[int],
+             rate_scale: float, seed: Optional[int], speed: float, to: Optional[str], chunk_size: int) -> None:
+    """
+    Génère du trafic synthétique vers DESTINATION.
+
+    DESTINATION est un fichier (``-`` : sortie standard), l'URL d'un
+    récepteur ``nexus serve`` (http://127.0.0.1:8080) ou d'un broker
+    ``nexus broker`` (tcp://127.0.0.1:7400).
+    """
+    if duration is None and count is None:
+        raise click.UsageError("--duration or --count is required")
+    try:
+        classes = load_profile(profile) if profile else list(PRODUCTION_MIX)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+    generator = LoadGenerator([replace(traffic, rate=traffic.rate * rate_scale) for traffic in classes], seed=seed)
+
+    async def run() -> str:
+        chunks = generator.chunks(duration=duration, count=count, speed=speed, max_chunk=chunk_size)
+        return await _deliver(destination, chunks, to)
+
+    click.echo(f"Generated {_run(run)}", err=True)
+
+
+@main.command("replay")
+@click.argument("source")
+@click.argument("destination")
+@_speed_option
+@click.option("--to", "to", type=_FORMATS, help="Format de sortie (par défaut selon l'extension).")
+@click.option("--trusted", is_flag=True, help="Ne pas revalider les trames binaires produites par Nexus.")
+@_chunk_size_option
+def replay_events(source: str, destination: str, speed: float, to: Optional[str], trusted: bool,
+                  chunk_size: int) -> None:
+    """
+    Rejoue un fichier d'événements vers DESTINATION en conservant leurs intervalles.
+
+    DESTINATION est un fichier, l'URL d'un récepteur ou d'un broker, comme
+    pour generate.
+    """
+    rejections = _Rejections(source)
+
+    async def run() -> str:
+        chunks = read_events(_stream_file(source, 0), chunk_size=chunk_size, on_error=rejections,
+                             validate=not trusted)
+        return await _deliver(destination, replay(chunks, speed=speed, max_chunk=chunk_size), to)
+
+    click.echo(f"Replayed {_run(run)}, {rejections.count} rejected", err=True)
+    if rejections.count:
+        click.get_current_context().exit(1)
+
+
+def _dlq_filters(func: Callable[..., Any]) -> Callable[..., Any]:
+    options = [
+        click.option("--type", "event_type", type=click.Choice([t.value for t in EventType]),
+                     help="Type d'événement."),
+        click.option("--source", help="Source des événements."),
+        click.option("--error-class", help="Classe d'erreur (ex. TimeoutError)."),
+        click.option("--integration", help="Intégration en échec."),
+        click.option("--reason", type=click.Choice([r.value for r in DeadLetterReason]), help="Motif d'abandon."),
+        click.option("--since", type=click.DateTime(), help="Échecs à partir de cet instant (UTC)."),
+        click.option("--until", type=click.DateTime(), help="Échecs antérieurs à cet instant (UTC)."),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+class _LogQueue:
+    """Destination de rejeu : ajout au journal, rendu durable par le checkpoint de chaque page."""
+
+    def __init__(self, log: EventLog) -> None:
+        self.log = log
+
+    async def put(self, event: BaseEvent) -> None:
+        self.log.append_nowait(event)
+
+
+@main.group()
+def dlq() -> None:
+    """Dead letter queue persistante."""
+
+
+@dlq.command("count")
+@click.argument("database", type=click.Path(exists=True, dir_okay=False))
+@_dlq_filters
+def dlq_count(database: str, event_type: Optional[str], **filters: Any) -> None:
+    """Compte les entrées de DATABASE correspondant aux filtres."""
+    with DeadLetterStore(database) as store:
+        click.echo(store.count(type=event_type, **filters))
+
+
+@dlq.command("reprocess")
+@click.argument("database", type=click.Path(exists=True, dir_okay=False))
+@click.argument("log_dir", type=click.Path(file_okay=False))
+@click.option("--rate", type=click.FloatRange(min=0, min_open=True), help="Événements par seconde au maximum.")
+@click.option("--page-size", default=500, show_default=True, type=click.IntRange(min=1),
+              help="Entrées lues, journalisées et supprimées ensemble.")
+@click.option("--keep", is_flag=True, help="Conserver les entrées rejouées.")
+@_dlq_filters
+def dlq_reprocess(database: str, log_dir: str, rate: Optional[float], page_size: int, keep: bool,
+                  event_type: Optional[str], **filters: Any) -> None:
+    """
+    Rejoue les entrées de DATABASE dans le journal LOG_DIR.
+
+    Chaque page est synchronisée dans le journal avant d'être supprimée.
+    """
+
+    async def run() -> int:
+        with DeadLetterStore(database) as store, EventLog(log_dir) as log:
+            return await store.reprocess(
+                _LogQueue(log),
+                rate=rate,
+                page_size=page_size,
+                delete=not keep,
+                checkpoint=lambda: log.wait_durable(log.next_sequence - 1),
+                type=event_type,
+                **filters,
+            )
+
+    click.echo(f"Reprocessed {_run(run)} events", err=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,73 @@
 Composants centraux du système Nexus.
 """
 
+from .codec import (
+    CodecError,
+    decode_event,
+    decode_events,
+    encode_event,
+    encode_events,
+)
+from .compact import CompactEvent
 from .events import (
     BaseEvent,
+    BulkEventResult,
+    CorrelationEvent,
     EmailEvent,
     ErrorEvent,
     Event,
+    EventRecordError,
     EventType,
     FileEvent,
     Priority,
     ScheduledEvent,
     SystemHealthEvent,
     create_event,
+    create_events,
+    parse_event,
+    parse_event_array,
+    parse_events,
+)
+from .ids import (
+    MonotonicIdGenerator,
+    event_id_floor,
+    new_event_id,
+    set_id_generator,
+    uuid4_id,
 )
+from .streaming import StreamFormat, chunked, read_events, write_events
 
 __all__ = [
     "BaseEvent",
+    "BulkEventResult",
+    "CodecError",
+    "CompactEvent",
+    "CorrelationEvent",
     "EmailEvent",
     "ErrorEvent",
     "Event",
+    "EventRecordError",
     "EventType",
     "FileEvent",
+    "MonotonicIdGenerator",
     "Priority",
     "ScheduledEvent",
+    "StreamFormat",
     "SystemHealthEvent",
+    "chunked",
     "create_event",
+    "create_events",
+    "decode_event",
+    "decode_events",
+    "encode_event",
+    "encode_events",
+    "event_id_floor",
+    "new_event_id",
+    "parse_event",
+    "parse_event_array",
+    "parse_events",
+    "read_events",
+    "set_id_generator",
+    "uuid4_id",
+    "write_events",
 ]
\ No newline at end of file
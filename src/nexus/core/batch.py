@@ -0,0 +1,343 @@
+"""
+Lot d'événements stocké par colonnes (struct-of-arrays).
+
+Les traitements en masse (comptage par type, filtrage par priorité,
+regroupement par source, histogrammes temporels) s'exécutent en opérations
+vectorisées NumPy plutôt qu'en boucles Python sur des modèles Pydantic.
+
+Colonnes :
+    type_codes, priorities   uint8 (codes de nexus.core.codec)
+    timestamps               int64, microsecondes UTC depuis l'époque Unix
+    tz_offsets               int32, décalage UTC en secondes (NAIVE si absent)
+    source_codes             int32, index dans le dictionnaire ``sources``
+    correlation_codes        int32, index dans ``correlations`` (-1 si absent)
+    event_ids, payloads      tableaux d'objets
+
+Nécessite NumPy (extra ``analytics``).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .codec import TYPE_CODES, TYPES_BY_CODE, datetime_to_micros, micros_to_datetime
+from .events import _EVENT_ADAPTER, BaseEvent, Event, EventType, Priority
+
+# Valeur de tz_offsets pour un horodatage naïf (UTC)
+NAIVE = np.iinfo(np.int32).min
+
+_GROUP_COLUMNS = ("type", "priority", "source", "correlation_id")
+_SORT_COLUMNS = ("timestamp", "priority", "type", "source")
+
+
+def _as_list(value: Any) -> List[Any]:
+    if isinstance(value, (str, int)):
+        return [value]
+    return list(value)
+
+
+class EventBatch:
+    """
+    Lot d'événements en colonnes.
+
+    Les opérations de sélection (take, filter, sort_by, group_by) retournent
+    de nouveaux lots partageant les dictionnaires de sources et de
+    corrélations du lot d'origine.
+    """
+
+    __slots__ = (
+        "event_ids",
+        "type_codes",
+        "priorities",
+        "timestamps",
+        "tz_offsets",
+        "source_codes",
+        "sources",
+        "correlation_codes",
+        "correlations",
+        "payloads",
+    )
+
+    def __init__(
+        self,
+        event_ids: np.ndarray,
+        type_codes: np.ndarray,
+        priorities: np.ndarray,
+        timestamps: np.ndarray,
+        tz_offsets: np.ndarray,
+        source_codes: np.ndarray,
+        sources: List[str],
+        correlation_codes: np.ndarray,
+        correlations: List[str],
+        payloads: np.ndarray,
+    ) -> None:
+        self.event_ids = event_ids
+        self.type_codes = type_codes
+        self.priorities = priorities
+        self.timestamps = timestamps
+        self.tz_offsets = tz_offsets
+        self.source_codes = source_codes
+        self.sources = sources
+        self.correlation_codes = correlation_codes
+        self.correlations = correlations
+        self.payloads = payloads
+
+    @classmethod
+    def from_events(cls, events: Iterable[BaseEvent]) -> "EventBatch":
+        """
+        Construit un lot à partir d'événements.
+
+        Args:
+            events: Événements à stocker
+
+        Returns:
+            Lot en colonnes, dans l'ordre des événements
+        """
+        event_ids: List[str] = []
+        type_codes: List[int] = []
+        priorities: List[int] = []
+        timestamps: List[int] = []
+        tz_offsets: List[int] = []
+        source_codes: List[int] = []
+        correlation_codes: List[int] = []
+        payloads: List[Dict[str, Any]] = []
+        source_index: Dict[str, int] = {}
+        correlation_index: Dict[str, int] = {}
+
+        for event in events:
+            event_ids.append(event.event_id)
+            type_codes.append(TYPE_CODES[event.type])
+            priorities.append(event.priority)
+            micros, offset = datetime_to_micros(event.timestamp)
+            timestamps.append(micros)
+            tz_offsets.append(NAIVE if offset is None else offset)
+            source_codes.append(source_index.setdefault(event.source, len(source_index)))
+            correlation_id = event.correlation_id
+            if correlation_id is None:
+                correlation_codes.append(-1)
+            else:
+                correlation_codes.append(correlation_index.setdefault(correlation_id, len(correlation_index)))
+            payloads.append(event.payload)
+
+        count = len(event_ids)
+        object_ids = np.empty(count, dtype=object)
+        object_ids[:] = event_ids
+        object_payloads = np.empty(count, dtype=object)
+        object_payloads[:] = payloads
+        return cls(
+            event_ids=object_ids,
+            type_codes=np.array(type_codes, dtype=np.uint8),
+            priorities=np.array(priorities, dtype=np.uint8),
+            timestamps=np.array(timestamps, dtype=np.int64),
+            tz_offsets=np.array(tz_offsets, dtype=np.int32),
+            source_codes=np.array(source_codes, dtype=np.int32),
+            sources=list(source_index),
+            correlation_codes=np.array(correlation_codes, dtype=np.int32),
+            correlations=list(correlation_index),
+            payloads=object_payloads,
+        )
+
+    def to_events(self, trusted: bool = True) -> List[Event]:
+        """
+        Reconstruit les événements typés.
+
+        Args:
+            trusted: Si True (défaut), reconstruit sans validation
+
+        Returns:
+            Événements dans l'ordre du lot
+        """
+        build = BaseEvent.from_trusted if trusted else lambda **fields: _EVENT_ADAPTER.validate_python(fields)
+        sources = self.sources
+        correlations = self.correlations
+        events = []
+        for event_id, type_code, priority, micros, offset, source_code, correlation_code, payload in zip(
+            self.event_ids,
+            self.type_codes.tolist(),
+            self.priorities.tolist(),
+            self.timestamps.tolist(),
+            self.tz_offsets.tolist(),
+            self.source_codes.tolist(),
+            self.correlation_codes.tolist(),
+            self.payloads,
+        ):
+            events.append(build(
+                event_id=event_id,
+                type=TYPES_BY_CODE[type_code],
+                timestamp=micros_to_datetime(micros, None if offset == NAIVE else offset),
+                source=sources[source_code],
+                correlation_id=None if correlation_code < 0 else correlations[correlation_code],
+                priority=priority,
+                payload=payload,
+            ))
+        return events
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    def take(self, selection: Union[np.ndarray, Sequence[int]]) -> "EventBatch":
+        """
+        Sélectionne des lignes par masque booléen ou par indices.
+
+        Args:
+            selection: Masque booléen de la taille du lot, ou indices
+
+        Returns:
+            Nouveau lot contenant les lignes sélectionnées
+        """
+        return EventBatch(
+            event_ids=self.event_ids[selection],
+            type_codes=self.type_codes[selection],
+            priorities=self.priorities[selection],
+            timestamps=self.timestamps[selection],
+            tz_offsets=self.tz_offsets[selection],
+            source_codes=self.source_codes[selection],
+            sources=self.sources,
+            correlation_codes=self.correlation_codes[selection],
+            correlations=self.correlations,
+            payloads=self.payloads[selection],
+        )
+
+    def mask(
+        self,
+        type: Optional[Union[EventType, Iterable[EventType]]] = None,
+        priority: Optional[Union[Priority, Iterable[Priority]]] = None,
+        max_priority: Optional[Priority] = None,
+        source: Optional[Union[str, Iterable[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """
+        Calcule le masque des lignes satisfaisant tous les critères fournis.
+
+        Args:
+            type: Type ou types acceptés
+            priority: Priorité ou priorités acceptées
+            max_priority: Priorité la moins urgente acceptée (CRITICAL=1)
+            source: Source ou sources acceptées
+            since: Horodatage minimal inclus
+            until: Horodatage maximal exclu
+
+        Returns:
+            Masque booléen de la taille du lot
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if type is not None:
+            codes = [TYPE_CODES[event_type] for event_type in _as_list(type)]
+            selected &= np.isin(self.type_codes, codes)
+        if priority is not None:
+            selected &= np.isin(self.priorities, [int(value) for value in _as_list(priority)])
+        if max_priority is not None:
+            selected &= self.priorities <= int(max_priority)
+        if source is not None:
+            wanted = set(_as_list(source))
+            codes = [code for code, name in enumerate(self.sources) if name in wanted]
+            selected &= np.isin(self.source_codes, codes)
+        if since is not None:
+            selected &= self.timestamps >= datetime_to_micros(since)[0]
+        if until is not None:
+            selected &= self.timestamps < datetime_to_micros(until)[0]
+        return selected
+
+    def filter(self, **criteria: Any) -> "EventBatch":
+        """Retourne le lot des lignes satisfaisant les critères de mask()."""
+        return self.take(self.mask(**criteria))
+
+    def sort_by(self, column: str = "timestamp", descending: bool = False) -> "EventBatch":
+        """
+        Trie le lot de façon stable.
+
+        Args:
+            column: timestamp, priority, type ou source
+            descending: Ordre décroissant
+
+        Returns:
+            Nouveau lot trié
+        """
+        if column not in _SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by '{column}', expected one of {_SORT_COLUMNS}")
+        if column == "source":
+            ranks = np.argsort(np.array(self.sources, dtype=object), kind="stable").argsort()
+            keys = ranks[self.source_codes] if len(self.sources) else self.source_codes
+        else:
+            keys = self._column(column)
+        order = np.argsort(-keys.astype(np.int64) if descending else keys, kind="stable")
+        return self.take(order)
+
+    def group_by(self, column: str) -> Dict[Any, "EventBatch"]:
+        """
+        Regroupe les lignes par valeur de colonne.
+
+        Args:
+            column: type, priority, source ou correlation_id
+
+        Returns:
+            Lot par valeur (EventType, priorité, source ou ID de corrélation,
+            None pour les événements sans corrélation), ordre interne conservé
+        """
+        if column not in _GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by '{column}', expected one of {_GROUP_COLUMNS}")
+        keys = self._column(column)
+        order = np.argsort(keys, kind="stable")
+        values, starts = np.unique(keys[order], return_index=True)
+        groups = {}
+        for value, indices in zip(values.tolist(), np.split(order, starts[1:])):
+            groups[self._label(column, value)] = self.take(indices)
+        return groups
+
+    def count_by(self, column: str) -> Dict[Any, int]:
+        """
+        Compte les lignes par valeur de colonne.
+
+        Args:
+            column: type, priority, source ou correlation_id
+
+        Returns:
+            Nombre d'événements par valeur présente
+        """
+        if column not in _GROUP_COLUMNS:
+            raise ValueError(f"Cannot count by '{column}', expected one of {_GROUP_COLUMNS}")
+        # Codes denses et bornés : bincount évite le tri de np.unique
+        # (décalage de 1 pour le code -1 des corrélations absentes)
+        shift = 1 if column == "correlation_id" else 0
+        counts = np.bincount(self._column(column).astype(np.intp) + shift)
+        return {
+            self._label(column, value - shift): count
+            for value, count in enumerate(counts.tolist())
+            if count
+        }
+
+    def bucket_counts(self, width: timedelta) -> Dict[datetime, int]:
+        """
+        Compte les événements par intervalle de temps.
+
+        Args:
+            width: Largeur des intervalles
+
+        Returns:
+            Nombre d'événements par début d'intervalle (UTC naïf)
+        """
+        width_us = width // timedelta(microseconds=1)
+        buckets, counts = np.unique(self.timestamps // width_us * width_us, return_counts=True)
+        return {micros_to_datetime(bucket): count for bucket, count in zip(buckets.tolist(), counts.tolist())}
+
+    def _column(self, column: str) -> np.ndarray:
+        if column == "type":
+            return self.type_codes
+        if column == "priority":
+            return self.priorities
+        if column == "source":
+            return self.source_codes
+        if column == "correlation_id":
+            return self.correlation_codes
+        return self.timestamps
+
+    def _label(self, column: str, value: int) -> Any:
+        if column == "type":
+            return EventType(TYPES_BY_CODE[value])
+        if column == "priority":
+            return Priority(value)
+        if column == "source":
+            return self.sources[value]
+        return None if value < 0 else self.correlations[value]
@@ -0,0 +1,440 @@
+"""
+Format binaire compact des événements Nexus.
+
+Alternative au JSON pour les échanges internes (queues, journaux, transport
+entre processus). Une trame d'événement (version 1) a la structure :
+
+    en-tête   <BBBBqBHH : version, code de type, priorité, drapeaux,
+                          horodatage en microsecondes depuis l'époque Unix
+                          (UTC), longueurs de event_id, source et
+                          correlation_id
+    chaînes   event_id, source puis correlation_id (si FLAG_CORRELATION),
+              en UTF-8
+    [fuseau]  décalage UTC en secondes (i32), si FLAG_AWARE
+    payload   reste de la trame, en JSON compact
+
+Les énumérations sont codées sur un octet et le champ type sélectionne la
+classe spécialisée au décodage. Un lot est un en-tête (magie, version,
+nombre de trames) suivi de trames préfixées par leur longueur (u32).
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic_core import from_json, to_json
+
+from .events import _EVENT_ADAPTER, BaseEvent, Event, EventType
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+FORMAT_VERSION = 1
+BATCH_MAGIC = b"NXEB"
+
+FLAG_CORRELATION = 0x01
+FLAG_AWARE = 0x02
+
+# Codes stables des types : ne jamais réattribuer un code existant
+TYPE_CODES: Dict[EventType, int] = {
+    EventType.EMAIL_RECEIVED: 1,
+    EventType.FILE_CREATED: 2,
+    EventType.FILE_MODIFIED: 3,
+    EventType.FILE_DELETED: 4,
+    EventType.SCHEDULED_TASK: 5,
+    EventType.CALENDAR_EVENT: 6,
+    EventType.SYSTEM_HEALTH: 7,
+    EventType.ERROR_OCCURRED: 8,
+    EventType.CORRELATION_MATCHED: 9,
+}
+TYPES_BY_CODE: Dict[int, str] = {code: event_type.value for event_type, code in TYPE_CODES.items()}
+
+_HEADER = struct.Struct("<BBBBqBHH")
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_BATCH_HEADER = struct.Struct("<4sBI")
+
+# Longueurs maximales (en octets UTF-8) des chaînes de l'en-tête
+MAX_STRING_LENGTHS: Dict[str, int] = {"event_id": 0xFF, "source": 0xFFFF, "correlation_id": 0xFFFF}
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_ONE_SECOND = timedelta(seconds=1)
+_TIMEZONES: Dict[int, timezone] = {0: timezone.utc}
+
+
+HEADER_SIZE = _HEADER.size
+
+
+class CodecError(ValueError):
+    """Trame binaire invalide ou de version non supportée."""
+
+
+class FrameHeader(NamedTuple):
+    """En-tête décodé d'une trame d'événement."""
+
+    version: int
+    type_code: int
+    priority: int
+    flags: int
+    micros: int
+    id_length: int
+    source_length: int
+    correlation_length: int
+
+
+def datetime_to_micros(value: datetime) -> Tuple[int, Optional[int]]:
+    """
+    Convertit un horodatage en microsecondes UTC depuis l'époque Unix.
+
+    Args:
+        value: Horodatage, naïf (UTC) ou avec fuseau
+
+    Returns:
+        Les microsecondes, et le décalage UTC en secondes (None si naïf)
+    """
+    offset = value.utcoffset()
+    if offset is None:
+        return (value - _EPOCH) // _ONE_MICROSECOND, None
+    return (value.replace(tzinfo=None) - offset - _EPOCH) // _ONE_MICROSECOND, offset // _ONE_SECOND
+
+
+def datetime_to_seconds(value: datetime) -> float:
+    """
+    Convertit un horodatage en secondes depuis l'époque Unix.
+
+    Args:
+        value: Horodatage, naïf (UTC) ou avec fuseau
+
+    Returns:
+        Les secondes, comparables à time.time()
+    """
+    if value.tzinfo is None:
+        return (value - _EPOCH).total_seconds()
+    return value.timestamp()
+
+
+def micros_to_datetime(micros: int, offset: Optional[int] = None) -> datetime:
+    """
+    Reconstruit un horodatage depuis datetime_to_micros().
+
+    Args:
+        micros: Microsecondes UTC depuis l'époque Unix
+        offset: Décalage UTC en secondes, None pour un horodatage naïf
+
+    Returns:
+        Horodatage naïf (UTC) ou avec fuseau
+    """
+    value = _EPOCH + timedelta(0, 0, micros)
+    if offset is None:
+        return value
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        tz = _TIMEZONES.setdefault(offset, timezone(timedelta(seconds=offset)))
+    return (value + timedelta(seconds=offset)).replace(tzinfo=tz)
+
+
+def decode_header(data: Buffer) -> FrameHeader:
+    """
+    Décode l'en-tête d'une trame sans décoder le reste.
+
+    Args:
+        data: Trame produite par encode_event()
+
+    Returns:
+        En-tête de la trame
+
+    Raises:
+        CodecError: Si l'en-tête est tronqué ou de version inconnue
+    """
+    try:
+        header = FrameHeader._make(_HEADER.unpack_from(data, 0))
+    except struct.error as exc:
+        raise CodecError(f"Invalid event frame: {exc}") from exc
+    if header.version != FORMAT_VERSION:
+        raise CodecError(f"Unsupported event frame version: {header.version}")
+    return header
+
+
+def decode_timestamp(data: Buffer) -> datetime:
+    """
+    Décode l'horodatage d'une trame sans décoder le reste.
+
+    Args:
+        data: Trame produite par encode_event()
+
+    Returns:
+        Horodatage de l'événement, avec son fuseau d'origine
+    """
+    header = decode_header(data)
+    offset = None
+    if header.flags & FLAG_AWARE:
+        position = HEADER_SIZE + header.id_length + header.source_length + header.correlation_length
+        (offset,) = _I32.unpack_from(data, position)
+    return micros_to_datetime(header.micros, offset)
+
+
+def decode_source(data: Buffer) -> str:
+    """
+    Décode la source d'une trame sans décoder le reste.
+
+    Args:
+        data: Trame produite par encode_event()
+
+    Returns:
+        Source de l'événement
+    """
+    header = decode_header(data)
+    start = HEADER_SIZE + header.id_length
+    return bytes(data[start:start + header.source_length]).decode()
+
+
+def encode_event(event: BaseEvent) -> bytes:
+    """
+    Encode un événement en trame binaire.
+
+    Args:
+        event: Événement à encoder
+
+    Returns:
+        Trame binaire de l'événement
+
+    Raises:
+        CodecError: Si event_id, source ou correlation_id dépasse sa
+            longueur maximale (MAX_STRING_LENGTHS)
+    """
+    flags = 0
+    event_id = event.event_id.encode()
+    source = event.source.encode()
+    parts = [b"", event_id, source]
+
+    correlation = b""
+    if event.correlation_id is not None:
+        flags |= FLAG_CORRELATION
+        correlation = event.correlation_id.encode()
+        parts.append(correlation)
+
+    micros, offset = datetime_to_micros(event.timestamp)
+    if offset is not None:
+        flags |= FLAG_AWARE
+        parts.append(_I32.pack(offset))
+
+    parts.append(to_json(event.payload))
+    try:
+        parts[0] = _HEADER.pack(
+            FORMAT_VERSION,
+            TYPE_CODES[event.type],
+            event.priority,
+            flags,
+            micros,
+            len(event_id),
+            len(source),
+            len(correlation),
+        )
+    except struct.error as exc:
+        for name, value in (("event_id", event_id), ("source", source), ("correlation_id", correlation)):
+            if len(value) > MAX_STRING_LENGTHS[name]:
+                raise CodecError(
+                    f"Cannot encode {name} of {len(value)} bytes (maximum {MAX_STRING_LENGTHS[name]})"
+                ) from exc
+        raise CodecError(f"Cannot encode event: {exc}") from exc
+    return b"".join(parts)
+
+
+def decode_fields(data: Buffer) -> Dict[str, Any]:
+    """
+    Décode une trame binaire en dictionnaire de champs d'événement.
+
+    Args:
+        data: Trame produite par encode_event()
+
+    Returns:
+        Champs de l'événement, dans l'ordre des champs de BaseEvent
+
+    Raises:
+        CodecError: Si la trame est tronquée ou de version inconnue
+    """
+    try:
+        (version, type_code, priority, flags, micros,
+         id_length, source_length, correlation_length) = _HEADER.unpack_from(data, 0)
+        if version != FORMAT_VERSION:
+            raise CodecError(f"Unsupported event frame version: {version}")
+        if type(data) is not bytes:
+            data = bytes(data)
+
+        start = _HEADER.size
+        end = start + id_length
+        event_id = data[start:end].decode()
+        start, end = end, end + source_length
+        source = data[start:end].decode()
+
+        correlation_id = None
+        if flags & FLAG_CORRELATION:
+            start, end = end, end + correlation_length
+            correlation_id = data[start:end].decode()
+
+        offset = None
+        if flags & FLAG_AWARE:
+            (offset,) = _I32.unpack_from(data, end)
+            end += 4
+
+        if end > len(data):
+            raise CodecError("Truncated event frame")
+        payload = from_json(data[end:])
+        event_type = TYPES_BY_CODE[type_code]
+    except (struct.error, KeyError, UnicodeDecodeError, ValueError) as exc:
+        if isinstance(exc, CodecError):
+            raise
+        raise CodecError(f"Invalid event frame: {exc}") from exc
+
+    return {
+        'event_id': event_id,
+        'type': event_type,
+        'timestamp': micros_to_datetime(micros, offset),
+        'source': source,
+        'correlation_id': correlation_id,
+        'priority': priority,
+        'payload': payload,
+    }
+
+
+def decode_event(data: Buffer, trusted: bool = False) -> Event:
+    """
+    Décode une trame binaire vers la classe d'événement typée.
+
+    Args:
+        data: Trame produite par encode_event()
+        trusted: Si True, reconstruit l'événement sans validation (trames
+            produites en interne à partir d'événements déjà validés)
+
+    Returns:
+        Instance d'événement du type désigné par la trame
+
+    Raises:
+        CodecError: Si la trame est invalide
+        ValidationError: Si trusted est False et le contrat n'est pas respecté
+
+    Note:
+        La validation porte sur le dictionnaire extrait de la trame : elle
+        est plus lente que parse_event(), qui valide le JSON en une seule
+        passe. Le format binaire est à privilégier pour les trames internes
+        (trusted=True) ; pour des données externes non fiables, le JSON se
+        valide plus vite.
+    """
+    fields = decode_fields(data)
+    if trusted:
+        return BaseEvent.from_trusted(**fields)
+    return _EVENT_ADAPTER.validate_python(fields)
+
+
+def encode_events(events: Iterable[BaseEvent]) -> bytes:
+    """
+    Encode un lot d'événements.
+
+    Args:
+        events: Événements à encoder
+
+    Returns:
+        Lot binaire : en-tête puis trames préfixées par leur longueur
+    """
+    parts = [b""]
+    count = 0
+    for event in events:
+        frame = encode_event(event)
+        parts.append(_U32.pack(len(frame)))
+        parts.append(frame)
+        count += 1
+    parts[0] = _BATCH_HEADER.pack(BATCH_MAGIC, FORMAT_VERSION, count)
+    return b"".join(parts)
+
+
+def encode_frames(frames: Iterable[Buffer]) -> bytes:
+    """
+    Assemble un lot à partir de trames déjà encodées.
+
+    Args:
+        frames: Trames produites par encode_event()
+
+    Returns:
+        Lot binaire, identique à celui d'encode_events()
+    """
+    parts = [b""]
+    count = 0
+    for frame in frames:
+        parts.append(_U32.pack(len(frame)))
+        parts.append(frame)
+        count += 1
+    parts[0] = _BATCH_HEADER.pack(BATCH_MAGIC, FORMAT_VERSION, count)
+    return b"".join(parts)
+
+
+def iter_frames(data: Buffer, count: Optional[int] = None) -> Iterator[memoryview]:
+    """
+    Parcourt une suite de trames préfixées par leur longueur, sans copie.
+
+    Args:
+        data: Trames concaténées (u32 longueur + trame)
+        count: Nombre de trames attendu, None pour parcourir tout le tampon
+
+    Yields:
+        Vue sur chaque trame
+
+    Raises:
+        CodecError: Si une trame est tronquée
+    """
+    view = memoryview(data)
+    position = 0
+    end = len(view)
+    read = 0
+    while position < end and (count is None or read < count):
+        if position + 4 > end:
+            raise CodecError("Truncated frame length")
+        (length,) = _U32.unpack_from(view, position)
+        position += 4
+        if position + length > end:
+            raise CodecError("Truncated event frame")
+        yield view[position:position + length]
+        position += length
+        read += 1
+    if count is not None and read != count:
+        raise CodecError(f"Expected {count} frames, found {read}")
+
+
+def decode_events(data: Buffer, trusted: bool = False) -> List[Event]:
+    """
+    Décode un lot produit par encode_events().
+
+    Args:
+        data: Lot binaire
+        trusted: Si True, reconstruit les événements sans validation
+
+    Returns:
+        Événements du lot, dans l'ordre d'encodage
+
+    Raises:
+        CodecError: Si l'en-tête ou une trame est invalide
+    """
+    return [decode_event(frame, trusted=trusted) for frame in batch_frames(data)]
+
+
+def batch_frames(data: Buffer) -> List[memoryview]:
+    """
+    Trames d'un lot produit par encode_events(), sans les décoder.
+
+    Args:
+        data: Lot binaire
+
+    Returns:
+        Vue sur chaque trame, dans l'ordre du lot
+
+    Raises:
+        CodecError: Si l'en-tête ou une trame est tronqué
+    """
+    try:
+        magic, version, count = _BATCH_HEADER.unpack_from(data, 0)
+    except struct.error as exc:
+        raise CodecError(f"Invalid event batch header: {exc}") from exc
+    if magic != BATCH_MAGIC:
+        raise CodecError("Not an event batch")
+    if version != FORMAT_VERSION:
+        raise CodecError(f"Unsupported event batch version: {version}")
+    return list(iter_frames(memoryview(data)[_BATCH_HEADER.size:], count))
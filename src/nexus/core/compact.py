@@ -0,0 +1,120 @@
+"""
+Représentation compacte des événements en transit.
+
+Un BaseEvent porte un dictionnaire d'instance, un datetime, un payload
+décodé et ses chaînes : il pèse près d'un kilo-octet même avec un petit
+payload. Les files et tampons qui doivent retenir de très nombreux
+événements (pannes prolongées) peuvent conserver à la place des
+CompactEvent : un objet à slots contenant la trame binaire de
+nexus.core.codec, ainsi que la priorité et le code de type nécessaires au
+routage sans décodage. La conversion est sans perte dans les deux sens.
+
+Le script benchmarks/bench_memory.py mesure l'empreinte par événement des
+deux représentations (tracemalloc).
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from .codec import (
+    FLAG_CORRELATION,
+    HEADER_SIZE,
+    TYPES_BY_CODE,
+    Buffer,
+    decode_event,
+    decode_header,
+    decode_timestamp,
+    encode_event,
+)
+from .events import BaseEvent, Event
+
+
+class CompactEvent:
+    """
+    Événement stocké sous forme de trame binaire.
+
+    Les attributs priority et type_code sont lus dans l'en-tête à la
+    construction ; les autres champs sont décodés à la demande.
+    """
+
+    __slots__ = ("frame", "priority", "type_code")
+
+    def __init__(self, frame: bytes) -> None:
+        header = decode_header(frame)
+        self.frame = frame
+        self.priority = header.priority
+        self.type_code = header.type_code
+
+    @classmethod
+    def from_event(cls, event: BaseEvent) -> "CompactEvent":
+        """Construit la représentation compacte d'un événement."""
+        return cls(encode_event(event))
+
+    @classmethod
+    def from_frame(cls, frame: Buffer) -> "CompactEvent":
+        """Construit la représentation compacte depuis une trame binaire."""
+        return cls(bytes(frame))
+
+    def to_event(self, trusted: bool = True) -> Event:
+        """
+        Reconstruit l'événement typé.
+
+        Args:
+            trusted: Si True (défaut), reconstruit sans validation ; la trame
+                provient d'un événement déjà validé
+
+        Returns:
+            Instance d'événement du type approprié
+        """
+        return decode_event(self.frame, trusted=trusted)
+
+    @property
+    def type(self) -> str:
+        """Type de l'événement (valeur de EventType)."""
+        return TYPES_BY_CODE[self.type_code]
+
+    @property
+    def event_id(self) -> str:
+        """Identifiant de l'événement."""
+        header = decode_header(self.frame)
+        return self.frame[HEADER_SIZE:HEADER_SIZE + header.id_length].decode()
+
+    @property
+    def source(self) -> str:
+        """Identifiant du producteur source."""
+        header = decode_header(self.frame)
+        start = HEADER_SIZE + header.id_length
+        return self.frame[start:start + header.source_length].decode()
+
+    @property
+    def correlation_id(self) -> Optional[str]:
+        """ID de corrélation, None s'il est absent."""
+        header = decode_header(self.frame)
+        if not header.flags & FLAG_CORRELATION:
+            return None
+        start = HEADER_SIZE + header.id_length + header.source_length
+        return self.frame[start:start + header.correlation_length].decode()
+
+    @property
+    def timestamp_us(self) -> int:
+        """Horodatage en microsecondes UTC depuis l'époque Unix."""
+        return decode_header(self.frame).micros
+
+    @property
+    def timestamp(self) -> datetime:
+        """Horodatage de création, avec son fuseau d'origine."""
+        return decode_timestamp(self.frame)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactEvent):
+            return NotImplemented
+        return self.frame == other.frame
+
+    def __hash__(self) -> int:
+        return hash(self.frame)
+
+    def __repr__(self) -> str:
+        return f"CompactEvent(type={self.type!r}, priority={self.priority}, size={len(self.frame)})"
@@ -5,12 +5,44 @@ Ce module définit les structures de données pour tous les événements
 qui transitent dans le système événementiel Nexus.
 """
 
+import gc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Literal, Optional, Union
-from uuid import uuid4
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+from pydantic_core import CoreSchema, SchemaValidator, core_schema, from_json
+
+from .ids import new_event_id
+
+
+_object_setattr = object.__setattr__
 
 
 class EventType(str, Enum):
@@ -24,6 +56,7 @@ class EventType(str, Enum):
     CALENDAR_EVENT = "calendar_event"
     SYSTEM_HEALTH = "system_health"
     ERROR_OCCURRED = "error_occurred"
+    CORRELATION_MATCHED = "correlation_matched"
 
 
 class Priority(int, Enum):
@@ -36,17 +69,64 @@ class Priority(int, Enum):
     BACKGROUND = 5
 
 
+class _Checked:
+    """
+    Contrainte de champ vérifiée par pydantic-core.
+
+    Le champ est d'abord validé selon son annotation, puis la valeur obtenue
+    passe par ``check`` ; un échec produit l'erreur ``error_type`` avec un
+    message fixe. Contrairement à un field_validator, aucune fonction Python
+    n'est appelée par enregistrement.
+
+    Args:
+        check: Schéma pydantic-core appliqué à la valeur validée
+        error_type: Type de l'erreur rapportée
+        message: Message de l'erreur rapportée
+    """
+
+    def __init__(self, check: CoreSchema, error_type: str, message: str) -> None:
+        self.check = check
+        self.error_type = error_type
+        self.message = message
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.chain_schema([
+            handler(source),
+            core_schema.custom_error_schema(
+                self.check, custom_error_type=self.error_type, custom_error_message=self.message
+            ),
+        ])
+
+
+# Source non vide, débarrassée des espaces en bordure
+_NON_EMPTY_SOURCE = _Checked(
+    core_schema.str_schema(strip_whitespace=True, min_length=1), 'empty_source', "Source cannot be empty"
+)
+# Horodatage passé ; un horodatage sans fuseau est lu en UTC
+_PAST_TIMESTAMP = _Checked(
+    core_schema.datetime_schema(now_op='past', now_utc_offset=0),
+    'future_timestamp',
+    "Timestamp cannot be in the future",
+)
+
+
 class BaseEvent(BaseModel):
     """Schéma de base pour tous les événements du système."""
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()), description="Identifiant unique de l'événement")
+    event_id: str = Field(default_factory=new_event_id, description="Identifiant unique de l'événement")
     type: EventType = Field(..., description="Type de l'événement")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Horodatage UTC de création")
-    source: str = Field(..., description="Identifiant du producteur source")
+    timestamp: Annotated[datetime, _PAST_TIMESTAMP] = Field(
+        default_factory=datetime.utcnow, description="Horodatage UTC de création"
+    )
+    source: Annotated[str, _NON_EMPTY_SOURCE] = Field(..., description="Identifiant du producteur source")
     correlation_id: Optional[str] = Field(None, description="ID de corrélation pour traçage")
     priority: Priority = Field(Priority.NORMAL, description="Niveau de priorité")
     payload: Dict[str, Any] = Field(default_factory=dict, description="Données spécifiques à l'événement")
 
+    # Contrat de payload déclaré par les classes spécialisées
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ()
+    payload_label: ClassVar[str] = "Event"
+
     model_config = ConfigDict(
         use_enum_values=True,
         ser_json_timedelta='iso8601',
@@ -64,21 +144,98 @@ class BaseEvent(BaseModel):
         }
     )
 
-    @field_validator('source')
+    @model_validator(mode='after')
+    def validate_payload(self) -> 'BaseEvent':
+        """Valide que le payload contient les champs requis par le type d'événement."""
+        message = self.payload_violation(self.payload)
+        if message is not None:
+            raise ValueError(message)
+        return self
+
     @classmethod
-    def validate_source(cls, v: str) -> str:
-        """Valide que la source n'est pas vide."""
-        if not v or not v.strip():
-            raise ValueError("Source cannot be empty")
-        return v.strip()
+    def payload_violation(cls, payload: Mapping[str, Any]) -> Optional[str]:
+        """
+        Vérifie le contrat de payload de la classe.
+
+        Args:
+            payload: Payload d'un événement de cette classe
+
+        Returns:
+            Le message d'erreur du premier champ requis absent, None si le
+            contrat est respecté
+        """
+        for field_name in cls.required_payload_fields:
+            if field_name not in payload:
+                return f"{cls.payload_label} event must contain '{field_name}' in payload"
+        return None
 
-    @field_validator('timestamp')
     @classmethod
-    def validate_timestamp(cls, v: datetime) -> datetime:
-        """Valide que le timestamp n'est pas dans le futur."""
-        if v > datetime.utcnow():
-            raise ValueError("Timestamp cannot be in the future")
-        return v
+    def from_trusted(cls, **data: Any) -> 'BaseEvent':
+        """
+        Reconstruit un événement déjà validé sans repasser par la validation.
+
+        Réservé aux passages internes (queue, registre, processeurs,
+        intégrations) de données issues d'un événement validé à l'entrée :
+        les validateurs de champs et le contrat de payload ne sont pas
+        exécutés. Appelée sur BaseEvent, la méthode retourne la classe
+        spécialisée correspondant au champ ``type``. Les valeurs sont
+        reprises telles quelles, sans copie du payload.
+
+        Args:
+            **data: Champs d'un événement validé (type obligatoire)
+
+        Returns:
+            Instance d'événement du type approprié
+        """
+        event_class = _EVENT_CLASSES.get(data['type'], cls) if cls is BaseEvent else cls
+        # Équivalent allégé de model_construct() : les événements n'ont ni
+        # alias, ni attributs privés, ni champs supplémentaires.
+        fields = event_class.__pydantic_fields__
+        if data.keys() == fields.keys():
+            values = data
+        else:
+            values = {}
+            for name, field_info in fields.items():
+                if name in data:
+                    values[name] = data[name]
+                elif not field_info.is_required():
+                    values[name] = field_info.get_default(call_default_factory=True)
+        event = event_class.__new__(event_class)
+        _object_setattr(event, '__dict__', values)
+        _object_setattr(event, '__pydantic_fields_set__', set(data))
+        _object_setattr(event, '__pydantic_extra__', None)
+        _object_setattr(event, '__pydantic_private__', None)
+        return event
+
+    def to_bytes(self) -> bytes:
+        """Sérialise l'événement au format binaire compact (voir nexus.core.codec)."""
+        from .codec import encode_event
+
+        return encode_event(self)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview], trusted: bool = False) -> 'BaseEvent':
+        """
+        Décode une trame binaire produite par to_bytes().
+
+        Args:
+            data: Trame binaire d'un événement
+            trusted: Si True, reconstruit l'événement sans validation
+
+        Returns:
+            Instance d'événement du type désigné par la trame
+
+        Raises:
+            CodecError: Si la trame est invalide
+            ValidationError: Si le contrat n'est pas respecté
+            TypeError: Si la trame décrit un événement d'une autre classe
+        """
+        from .codec import decode_event
+
+        event = decode_event(data, trusted=trusted)
+        if not isinstance(event, cls):
+            raise TypeError(f"Frame holds a {type(event).__name__}, not a {cls.__name__}")
+        return event
 
 
 class EmailEvent(BaseEvent):
@@ -86,30 +243,24 @@ class EmailEvent(BaseEvent):
 
     type: Literal[EventType.EMAIL_RECEIVED] = Field(EventType.EMAIL_RECEIVED)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validation spécifique aux emails
-        required_fields = ['from', 'subject', 'received_at']
-        for field in required_fields:
-            if field not in self.payload:
-                raise ValueError(f"Email event must contain '{field}' in payload")
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ('from', 'subject', 'received_at')
+    payload_label: ClassVar[str] = "Email"
 
 
 class FileEvent(BaseEvent):
     """Événement pour les modifications de fichiers."""
 
-    type: EventType = Field(..., description="Type spécifique de modification fichier")
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validation du type pour les événements fichier
-        file_types = {EventType.FILE_CREATED, EventType.FILE_MODIFIED, EventType.FILE_DELETED}
-        if self.type not in file_types:
-            raise ValueError(f"FileEvent type must be one of {file_types}")
+    file_types: ClassVar[FrozenSet[EventType]] = frozenset(
+        {EventType.FILE_CREATED, EventType.FILE_MODIFIED, EventType.FILE_DELETED}
+    )
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ('file_path',)
+    payload_label: ClassVar[str] = "File"
 
-        # Validation du payload
-        if 'file_path' not in self.payload:
-            raise ValueError("File event must contain 'file_path' in payload")
+    type: Annotated[EventType, _Checked(
+        core_schema.literal_schema(sorted(event_type.value for event_type in file_types)),
+        'file_type',
+        f"FileEvent type must be one of {', '.join(sorted(event_type.value for event_type in file_types))}",
+    )] = Field(..., description="Type spécifique de modification fichier")
 
 
 class ScheduledEvent(BaseEvent):
@@ -117,13 +268,8 @@ class ScheduledEvent(BaseEvent):
 
     type: Literal[EventType.SCHEDULED_TASK] = Field(EventType.SCHEDULED_TASK)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validation spécifique aux tâches programmées
-        required_fields = ['task_id', 'scheduled_time']
-        for field in required_fields:
-            if field not in self.payload:
-                raise ValueError(f"Scheduled event must contain '{field}' in payload")
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ('task_id', 'scheduled_time')
+    payload_label: ClassVar[str] = "Scheduled"
 
 
 class SystemHealthEvent(BaseEvent):
@@ -132,13 +278,8 @@ class SystemHealthEvent(BaseEvent):
     type: Literal[EventType.SYSTEM_HEALTH] = Field(EventType.SYSTEM_HEALTH)
     priority: Priority = Field(Priority.BACKGROUND)  # Priorité par défaut mais modifiable
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validation spécifique au health check
-        required_fields = ['component', 'status', 'metrics']
-        for field in required_fields:
-            if field not in self.payload:
-                raise ValueError(f"Health event must contain '{field}' in payload")
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ('component', 'status', 'metrics')
+    payload_label: ClassVar[str] = "Health"
 
 
 class ErrorEvent(BaseEvent):
@@ -147,17 +288,63 @@ class ErrorEvent(BaseEvent):
     type: Literal[EventType.ERROR_OCCURRED] = Field(EventType.ERROR_OCCURRED)
     priority: Priority = Field(Priority.HIGH)  # Priorité par défaut mais modifiable
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Validation spécifique aux erreurs
-        required_fields = ['error_type', 'message', 'component']
-        for field in required_fields:
-            if field not in self.payload:
-                raise ValueError(f"Error event must contain '{field}' in payload")
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ('error_type', 'message', 'component')
+    payload_label: ClassVar[str] = "Error"
+
+
+class CorrelationEvent(BaseEvent):
+    """Événement composite émis quand une règle de corrélation est satisfaite."""
+
+    type: Literal[EventType.CORRELATION_MATCHED] = Field(EventType.CORRELATION_MATCHED)
+
+    required_payload_fields: ClassVar[Tuple[str, ...]] = ('rule', 'events')
+    payload_label: ClassVar[str] = "Correlation"
 
 
 # Type union pour tous les événements
-Event = Union[BaseEvent, EmailEvent, FileEvent, ScheduledEvent, SystemHealthEvent, ErrorEvent]
+Event = Union[
+    BaseEvent, EmailEvent, FileEvent, ScheduledEvent, SystemHealthEvent, ErrorEvent, CorrelationEvent
+]
+
+# Mapping des types vers les classes spécialisées
+_EVENT_CLASSES: Dict[EventType, Type[BaseEvent]] = {
+    EventType.EMAIL_RECEIVED: EmailEvent,
+    EventType.FILE_CREATED: FileEvent,
+    EventType.FILE_MODIFIED: FileEvent,
+    EventType.FILE_DELETED: FileEvent,
+    EventType.SCHEDULED_TASK: ScheduledEvent,
+    EventType.SYSTEM_HEALTH: SystemHealthEvent,
+    EventType.ERROR_OCCURRED: ErrorEvent,
+    EventType.CALENDAR_EVENT: BaseEvent,  # Utilise BaseEvent pour l'instant
+    EventType.CORRELATION_MATCHED: CorrelationEvent,
+}
+
+
+class _TaggedEvent:
+    """
+    Union d'événements discriminée par le champ ``type``.
+
+    Le validateur lit la valeur de ``type`` et délègue directement au schéma
+    de la classe correspondante, sans essayer les membres de l'union un à un.
+    FileEvent couvre plusieurs types et CALENDAR_EVENT utilise BaseEvent :
+    l'union est donc déclarée au niveau de pydantic-core, qui n'exige pas de
+    champ Literal.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.tagged_union_schema(
+            choices={
+                event_type.value: handler.generate_schema(event_class)
+                for event_type, event_class in _EVENT_CLASSES.items()
+            },
+            discriminator='type',
+        )
+
+
+# Validateurs compilés utilisés par parse_event(), parse_events() et parse_event_array()
+_EVENT_ADAPTER: TypeAdapter = TypeAdapter(_TaggedEvent)
+_EVENT_LIST_ADAPTER: TypeAdapter = TypeAdapter(List[_TaggedEvent])
 
 
 def create_event(event_type: EventType, source: str, payload: Dict[str, Any], **kwargs) -> Event:
@@ -183,17 +370,224 @@ def create_event(event_type: EventType, source: str, payload: Dict[str, Any], **
         **kwargs
     }
 
-    # Mapping des types vers les classes spécialisées
-    event_classes = {
-        EventType.EMAIL_RECEIVED: EmailEvent,
-        EventType.FILE_CREATED: FileEvent,
-        EventType.FILE_MODIFIED: FileEvent,
-        EventType.FILE_DELETED: FileEvent,
-        EventType.SCHEDULED_TASK: ScheduledEvent,
-        EventType.SYSTEM_HEALTH: SystemHealthEvent,
-        EventType.ERROR_OCCURRED: ErrorEvent,
-        EventType.CALENDAR_EVENT: BaseEvent,  # Utilise BaseEvent pour l'instant
-    }
+    event_class = _EVENT_CLASSES.get(event_type, BaseEvent)
+    return event_class(**base_data)
+
+
+@dataclass(frozen=True)
+class EventRecordError:
+    """Erreur de validation d'un enregistrement soumis à create_events()."""
+
+    index: int
+    errors: List[Dict[str, Any]]
+
+    @property
+    def message(self) -> str:
+        """Résumé lisible des erreurs de l'enregistrement."""
+        return "; ".join(error["msg"] for error in self.errors)
+
+
+@dataclass
+class BulkEventResult:
+    """Résultat d'une création d'événements en lot."""
+
+    events: List[Event] = field(default_factory=list)
+    errors: List[EventRecordError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Indique si tous les enregistrements ont été validés."""
+        return not self.errors
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Suspend le ramasse-miettes cyclique le temps d'un bloc.
+
+    Créer des dizaines de milliers d'objets d'affilée déclenche des
+    collectes répétées qui parcourent tous les événements déjà créés, alors
+    qu'ils ne forment aucun cycle. Si le ramasse-miettes était déjà désactivé,
+    il le reste.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@lru_cache(maxsize=None)
+def _list_validator(event_class: Type[BaseEvent]) -> SchemaValidator:
+    """
+    Retourne le validateur compilé d'une liste d'événements de la classe donnée.
+
+    Le schéma d'un événement est celui du modèle enveloppé par le
+    validateur ``mode='after'`` du contrat de payload. Ce dernier est retiré
+    ici : _validate_group() vérifie le contrat sur le lot validé, sans rappel
+    Python par enregistrement.
+    """
+    schema = event_class.__pydantic_core_schema__
+    if schema['type'] == 'function-after' and schema['schema']['type'] == 'model':
+        schema = schema['schema']
+    return SchemaValidator(core_schema.list_schema(schema))
+
+
+def _validate_group(
+    event_class: Type[BaseEvent],
+    indices: List[int],
+    records: List[Any],
+    slots: List[Optional[Event]],
+    errors: List[EventRecordError],
+) -> None:
+    """Valide en une passe les enregistrements d'une même classe d'événement."""
+    validator = _list_validator(event_class)
+    try:
+        events = validator.validate_python(records)
+    except ValidationError as exc:
+        # La validation d'une liste rapporte toutes les erreurs : on les
+        # regroupe par position puis on revalide le reste en une seule passe.
+        failures: Dict[int, List[Dict[str, Any]]] = {}
+        for error in exc.errors(include_url=False):
+            position = error["loc"][0]
+            failures.setdefault(position, []).append({**error, "loc": error["loc"][1:]})
+        for position, record_errors in failures.items():
+            errors.append(EventRecordError(index=indices[position], errors=record_errors))
+
+        remaining = [position for position in range(len(records)) if position not in failures]
+        if not remaining:
+            return
+        indices = [indices[position] for position in remaining]
+        records = [records[position] for position in remaining]
+        events = validator.validate_python(records)
+
+    required = frozenset(event_class.required_payload_fields)
+    for index, record, event in zip(indices, records, events):
+        if required and not event.payload.keys() >= required:
+            # Même erreur que le validateur de contrat de BaseEvent
+            message = event_class.payload_violation(event.payload)
+            errors.append(EventRecordError(index=index, errors=[{
+                "type": "value_error",
+                "loc": (),
+                "msg": f"Value error, {message}",
+                "input": record,
+                "ctx": {"error": ValueError(message)},
+            }]))
+        else:
+            slots[index] = event
+
+
+def create_events(records: Iterable[Mapping[str, Any]]) -> BulkEventResult:
+    """
+    Crée des événements typés en lot.
+
+    Les enregistrements sont regroupés par classe d'événement (selon leur
+    champ ``type``) puis chaque groupe est validé en un seul appel au
+    validateur compilé, ce qui évite le coût par appel de create_event() ;
+    le contrat de payload est vérifié ensuite sur le groupe validé.
+    Un enregistrement invalide n'interrompt pas le lot.
+
+    Args:
+        records: Dictionnaires utilisant les noms de champs de BaseEvent
+            (type, source, payload, priority, correlation_id, ...)
 
-    event_class = event_classes.get(event_type, BaseEvent)
-    return event_class(**base_data)
\ No newline at end of file
+    Returns:
+        Les événements valides dans l'ordre d'entrée, et une erreur par
+        enregistrement rejeté
+    """
+    groups: Dict[Type[BaseEvent], Tuple[List[int], List[Any]]] = {}
+    count = 0
+    for index, record in enumerate(records):
+        count += 1
+        try:
+            event_class = _EVENT_CLASSES.get(record.get('type'), BaseEvent)
+        except (AttributeError, TypeError):
+            # Enregistrement non dictionnaire ou type non hashable :
+            # BaseEvent produira l'erreur de validation adéquate.
+            event_class = BaseEvent
+        group = groups.get(event_class)
+        if group is None:
+            group = groups[event_class] = ([], [])
+        group[0].append(index)
+        group[1].append(record)
+
+    slots: List[Optional[Event]] = [None] * count
+    errors: List[EventRecordError] = []
+    with _gc_paused():
+        for event_class, (indices, group_records) in groups.items():
+            _validate_group(event_class, indices, group_records, slots, errors)
+
+    errors.sort(key=lambda error: error.index)
+    return BulkEventResult(
+        events=[event for event in slots if event is not None],
+        errors=errors,
+    )
+
+
+def parse_event(data: Union[str, bytes, bytearray]) -> Event:
+    """
+    Décode un événement JSON vers sa classe typée.
+
+    Le JSON brut est validé en un seul appel au validateur compilé, sans
+    passer par un dictionnaire intermédiaire.
+
+    Args:
+        data: Document JSON d'un événement
+
+    Returns:
+        Instance d'événement du type désigné par le champ ``type``
+
+    Raises:
+        ValidationError: Si le JSON est invalide ou ne respecte pas le contrat
+    """
+    return _EVENT_ADAPTER.validate_json(data)
+
+
+def parse_events(documents: Iterable[Union[str, bytes, bytearray]]) -> BulkEventResult:
+    """
+    Décode une suite de documents JSON d'événements.
+
+    Args:
+        documents: Documents JSON, un événement par document
+
+    Returns:
+        Les événements valides dans l'ordre d'entrée, et une erreur par
+        document rejeté
+    """
+    validate_json = _EVENT_ADAPTER.validate_json
+    result = BulkEventResult()
+    for index, document in enumerate(documents):
+        try:
+            result.events.append(validate_json(document))
+        except ValidationError as exc:
+            result.errors.append(EventRecordError(index=index, errors=exc.errors(include_url=False)))
+    return result
+
+
+def parse_event_array(data: Union[str, bytes, bytearray]) -> BulkEventResult:
+    """
+    Décode un tableau JSON d'événements.
+
+    Le tableau est validé en un seul appel, directement depuis le JSON
+    brut ; s'il contient des événements invalides, il est décodé puis
+    revalidé par create_events() pour isoler les erreurs de chaque élément.
+
+    Args:
+        data: Document JSON : tableau d'événements
+
+    Returns:
+        Les événements valides dans l'ordre du tableau, et une erreur par
+        élément rejeté
+
+    Raises:
+        ValueError: Si le document n'est pas du JSON valide ou pas un tableau
+    """
+    try:
+        return BulkEventResult(events=_EVENT_LIST_ADAPTER.validate_json(data))
+    except ValidationError:
+        records = from_json(data)
+        if not isinstance(records, list):
+            raise ValueError("Expected a JSON array of events") from None
+        return create_events(records)
@@ -0,0 +1,130 @@
+"""
+Génération des identifiants d'événements.
+
+Le générateur par défaut produit des identifiants au format UUIDv7 : les
+48 bits de poids fort portent l'horodatage Unix en millisecondes, suivis
+d'un compteur monotone et d'un identifiant aléatoire tiré une fois par
+processus. Les identifiants sont donc uniques, triables par date de
+création (y compris en ordre lexicographique) et ne coûtent aucun appel
+système à la génération.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from uuid import uuid4
+
+# Signature d'un générateur d'identifiants
+IdGenerator = Callable[[], str]
+
+# Compteur sur 26 bits : 12 bits dans rand_a, 14 bits dans rand_b
+_COUNTER_BITS = 26
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+_NODE_BITS = 48
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class MonotonicIdGenerator:
+    """
+    Générateur d'identifiants UUIDv7 monotones par processus.
+
+    Structure (128 bits) : horodatage ms (48) | version 7 (4) | compteur
+    haut (12) | variante RFC 4122 (2) | compteur bas (14) | nœud (48).
+    Le compteur repart à zéro à chaque nouvelle milliseconde. S'il déborde,
+    ou si l'horloge recule, l'horodatage interne avance d'une milliseconde
+    afin de préserver l'ordre strict.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+        self._prefix = ""
+        self._suffix = ""
+        self.reseed()
+
+    def reseed(self) -> None:
+        """Tire un nouvel identifiant de nœud (appelé après un fork)."""
+        node = int.from_bytes(os.urandom(_NODE_BITS // 8), "big")
+        self._suffix = f"-{node:012x}"
+
+    def _format_prefix(self) -> str:
+        # Horodatage et compteur haut ne changent qu'une fois par milliseconde
+        # (ou tous les 16384 identifiants) : leur formatage est mis en cache.
+        ms = self._last_ms
+        return f"{ms >> 16:08x}-{ms & 0xFFFF:04x}-{0x7000 | self._counter >> 14:04x}-"
+
+    def __call__(self) -> str:
+        with self._lock:
+            now = time.time_ns() // 1_000_000
+            if now > self._last_ms:
+                self._last_ms = now
+                self._counter = 0
+                self._prefix = self._format_prefix()
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+                if not self._counter & 0x3FFF:
+                    self._prefix = self._format_prefix()
+            else:
+                self._last_ms += 1
+                self._counter = 0
+                self._prefix = self._format_prefix()
+            prefix = self._prefix
+            low = self._counter & 0x3FFF
+        return f"{prefix}{0x8000 | low:04x}{self._suffix}"
+
+
+def uuid4_id() -> str:
+    """Génère un identifiant UUID4 aléatoire (comportement historique)."""
+    return str(uuid4())
+
+
+_default_generator = MonotonicIdGenerator()
+_generator: IdGenerator = _default_generator
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_default_generator.reseed)
+
+
+def new_event_id() -> str:
+    """Génère un identifiant d'événement avec le générateur configuré."""
+    return _generator()
+
+
+def set_id_generator(generator: Optional[IdGenerator]) -> None:
+    """
+    Remplace le générateur d'identifiants d'événements.
+
+    Args:
+        generator: Fonction sans argument retournant un identifiant, par
+            exemple uuid4_id pour revenir aux UUID4 ; None restaure le
+            générateur monotone par défaut
+    """
+    global _generator
+    _generator = generator if generator is not None else _default_generator
+
+
+def get_id_generator() -> IdGenerator:
+    """Retourne le générateur d'identifiants d'événements configuré."""
+    return _generator
+
+
+def event_id_floor(timestamp: datetime) -> str:
+    """
+    Retourne le plus petit identifiant monotone possible pour un instant.
+
+    Permet les parcours par plage d'identifiants : tout identifiant généré
+    à partir de cet instant lui est supérieur en ordre lexicographique.
+
+    Args:
+        timestamp: Instant de référence (UTC si sans fuseau)
+
+    Returns:
+        Borne inférieure au format UUID
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    ms = (timestamp - _EPOCH) // timedelta(milliseconds=1)
+    return f"{ms >> 16:08x}-{ms & 0xFFFF:04x}-7000-8000-000000000000"
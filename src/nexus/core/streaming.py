@@ -0,0 +1,384 @@
+"""
+Lecture et écriture d'événements en flux, à mémoire bornée.
+
+Deux formats de fichier sont pris en charge :
+
+    ndjson    un document JSON d'événement par ligne (lignes vides ignorées)
+    binary    suite de lots de nexus.core.codec (en-tête puis trames
+              préfixées par leur longueur), un lot par morceau écrit
+
+Les fichiers sont lus par blocs de taille fixe et les événements sont
+remis par morceaux d'au plus ``chunk_size`` : la mémoire utilisée dépend
+de la taille des blocs et des morceaux, pas de celle du fichier. Les
+enregistrements invalides sont signalés (numéro de ligne ou de trame,
+à partir de 1) sans interrompre la lecture ; seule une structure binaire
+illisible, après laquelle les trames ne peuvent plus être délimitées,
+lève une CodecError.
+"""
+
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import aiofiles
+import structlog
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from .codec import _BATCH_HEADER, _U32, BATCH_MAGIC, FORMAT_VERSION, CodecError, decode_event, encode_events
+from .events import Event, EventRecordError, parse_events
+
+logger = structlog.get_logger(__name__)
+
+# Chemin, ou descripteur déjà ouvert (laissé ouvert : entrée/sortie standard)
+StreamFile = Union[str, Path, int]
+ErrorHandler = Callable[[EventRecordError], None]
+Chunks = Union[Iterable[Sequence[Event]], AsyncIterable[Sequence[Event]]]
+
+BLOCK_SIZE = 1024 * 1024
+MAX_RECORD_BYTES = 16 * 1024 * 1024
+
+
+class StreamFormat(str, Enum):
+    """Format d'un fichier d'événements."""
+
+    NDJSON = "ndjson"
+    BINARY = "binary"
+
+
+def _log_error(error: EventRecordError) -> None:
+    logger.warning("Invalid event record", record=error.index, error=error.message)
+
+
+def _record_error(index: int, message: str, error_type: str) -> EventRecordError:
+    return EventRecordError(index=index, errors=[{"type": error_type, "loc": (), "msg": message}])
+
+
+async def _read_blocks(file: StreamFile, block_size: int) -> AsyncIterator[bytes]:
+    async with aiofiles.open(file, "rb", closefd=not isinstance(file, int)) as handle:
+        while True:
+            block = await handle.read(block_size)
+            if not block:
+                return
+            yield block
+
+
+async def _iterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def chunked(
+    events: Union[Iterable[Event], AsyncIterable[Event]], chunk_size: int = 1000
+) -> AsyncIterator[List[Event]]:
+    """
+    Regroupe une suite d'événements en morceaux pour les fonctions d'écriture.
+
+    Args:
+        events: Événements, itérable synchrone ou asynchrone
+        chunk_size: Nombre maximum d'événements par morceau
+
+    Yields:
+        Morceaux de ``chunk_size`` événements (le dernier peut être plus court)
+    """
+    chunk: List[Event] = []
+    async for event in _iterate(events):
+        chunk.append(event)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _ndjson_chunks(
+    blocks: AsyncIterator[bytes], chunk_size: int, on_error: ErrorHandler, max_line: int
+) -> AsyncIterator[List[Event]]:
+    documents: List[bytes] = []
+    lines: List[int] = []
+    line_number = 0
+    tail = b""
+    skipping = False
+
+    def parse() -> List[Event]:
+        result = parse_events(documents)
+        for error in result.errors:
+            on_error(EventRecordError(index=lines[error.index], errors=error.errors))
+        documents.clear()
+        lines.clear()
+        return result.events
+
+    async for block in blocks:
+        if skipping:
+            # Fin de la ligne trop longue signalée au bloc précédent
+            newline = block.find(b"\n")
+            if newline < 0:
+                continue
+            block = block[newline + 1:]
+            line_number += 1
+            skipping = False
+        parts = (tail + block if tail else block).split(b"\n")
+        tail = parts.pop()
+        for line in parts:
+            line_number += 1
+            if len(line) > max_line:
+                on_error(_record_error(line_number, f"Line exceeds {max_line} bytes", "line_too_long"))
+            elif line.strip():
+                documents.append(line)
+                lines.append(line_number)
+                if len(documents) >= chunk_size:
+                    events = parse()
+                    if events:
+                        yield events
+        if len(tail) > max_line:
+            on_error(_record_error(line_number + 1, f"Line exceeds {max_line} bytes", "line_too_long"))
+            tail = b""
+            skipping = True
+
+    if tail.strip():
+        documents.append(tail)
+        lines.append(line_number + 1)
+    if documents:
+        events = parse()
+        if events:
+            yield events
+
+
+async def _binary_chunks(
+    blocks: AsyncIterator[bytes], chunk_size: int, on_error: ErrorHandler, validate: bool, max_frame: int
+) -> AsyncIterator[List[Event]]:
+    buffer = bytearray()
+    remaining = 0  # Trames restant à lire dans le lot courant
+    frame_number = 0
+    events: List[Event] = []
+
+    async for block in blocks:
+        buffer += block
+        position = 0
+        with memoryview(buffer) as view:
+            end = len(view)
+            while True:
+                if remaining == 0:
+                    if end - position < _BATCH_HEADER.size:
+                        break
+                    magic, version, remaining = _BATCH_HEADER.unpack_from(view, position)
+                    if magic != BATCH_MAGIC:
+                        raise CodecError(f"Invalid batch magic at frame {frame_number + 1}")
+                    if version != FORMAT_VERSION:
+                        raise CodecError(f"Unsupported batch version: {version}")
+                    position += _BATCH_HEADER.size
+                    continue
+                if end - position < _U32.size:
+                    break
+                (length,) = _U32.unpack_from(view, position)
+                if length > max_frame:
+                    raise CodecError(f"Frame {frame_number + 1} exceeds {max_frame} bytes")
+                if end - position - _U32.size < length:
+                    break
+                start = position + _U32.size
+                position = start + length
+                remaining -= 1
+                frame_number += 1
+                frame = view[start:position]
+                try:
+                    events.append(decode_event(frame, trusted=not validate))
+                except ValidationError as exc:
+                    on_error(EventRecordError(index=frame_number, errors=exc.errors(include_url=False)))
+                except CodecError as exc:
+                    on_error(_record_error(frame_number, str(exc), "codec_error"))
+                finally:
+                    # Une trace d'exception conservée ne doit pas bloquer le tampon
+                    frame.release()
+                if len(events) >= chunk_size:
+                    yield events
+                    events = []
+        # La vue est libérée avant de réduire le tampon
+        del buffer[:position]
+
+    if buffer or remaining:
+        raise CodecError(f"Truncated event stream after frame {frame_number}")
+    if events:
+        yield events
+
+
+async def read_ndjson(
+    file: StreamFile,
+    chunk_size: int = 1000,
+    on_error: Optional[ErrorHandler] = None,
+    block_size: int = BLOCK_SIZE,
+    max_line: int = MAX_RECORD_BYTES,
+) -> AsyncIterator[List[Event]]:
+    """
+    Lit un fichier NDJSON d'événements par morceaux validés.
+
+    Chaque ligne est validée comme par parse_event() : la classe typée est
+    choisie d'après le champ ``type``.
+
+    Args:
+        file: Chemin du fichier ou descripteur ouvert
+        chunk_size: Nombre maximum d'événements par morceau
+        on_error: Appelé pour chaque ligne rejetée (``index`` : numéro de
+            ligne) ; par défaut, les rejets sont journalisés
+        block_size: Taille des blocs lus
+        max_line: Longueur maximale d'une ligne, au-delà de laquelle elle
+            est rejetée sans être conservée en mémoire
+
+    Yields:
+        Morceaux d'événements valides, dans l'ordre du fichier
+    """
+    async for chunk in _ndjson_chunks(_read_blocks(file, block_size), chunk_size, on_error or _log_error, max_line):
+        yield chunk
+
+
+async def read_binary(
+    file: StreamFile,
+    chunk_size: int = 1000,
+    on_error: Optional[ErrorHandler] = None,
+    validate: bool = True,
+    block_size: int = BLOCK_SIZE,
+    max_frame: int = MAX_RECORD_BYTES,
+) -> AsyncIterator[List[Event]]:
+    """
+    Lit un fichier binaire d'événements (suite de lots) par morceaux.
+
+    Args:
+        file: Chemin du fichier ou descripteur ouvert
+        chunk_size: Nombre maximum d'événements par morceau
+        on_error: Appelé pour chaque trame rejetée (``index`` : numéro de
+            trame) ; par défaut, les rejets sont journalisés
+        validate: Si False, les trames sont reconstruites sans validation
+            (fichiers produits par Nexus)
+        block_size: Taille des blocs lus
+        max_frame: Taille maximale d'une trame
+
+    Yields:
+        Morceaux d'événements valides, dans l'ordre du fichier
+
+    Raises:
+        CodecError: Si un en-tête de lot ou une longueur de trame est
+            invalide, ou si le fichier est tronqué
+    """
+    blocks = _read_blocks(file, block_size)
+    async for chunk in _binary_chunks(blocks, chunk_size, on_error or _log_error, validate, max_frame):
+        yield chunk
+
+
+async def read_events(
+    file: StreamFile,
+    format: Optional[StreamFormat] = None,
+    chunk_size: int = 1000,
+    on_error: Optional[ErrorHandler] = None,
+    validate: bool = True,
+    block_size: int = BLOCK_SIZE,
+) -> AsyncIterator[List[Event]]:
+    """
+    Lit un fichier d'événements, au format détecté d'après son contenu.
+
+    Args:
+        file: Chemin du fichier ou descripteur ouvert
+        format: Format imposé ; par défaut, binaire si le fichier commence
+            par la magie des lots, NDJSON sinon
+        chunk_size: Nombre maximum d'événements par morceau
+        on_error: Appelé pour chaque enregistrement rejeté
+        validate: Si False, les trames binaires ne sont pas revalidées
+        block_size: Taille des blocs lus
+
+    Yields:
+        Morceaux d'événements valides, dans l'ordre du fichier
+    """
+    blocks = _read_blocks(file, block_size)
+    first = await anext(blocks, b"")
+
+    async def replay() -> AsyncIterator[bytes]:
+        if first:
+            yield first
+        async for block in blocks:
+            yield block
+
+    if format is None:
+        format = StreamFormat.BINARY if first.startswith(BATCH_MAGIC) else StreamFormat.NDJSON
+    on_error = on_error or _log_error
+    if StreamFormat(format) is StreamFormat.BINARY:
+        chunks = _binary_chunks(replay(), chunk_size, on_error, validate, MAX_RECORD_BYTES)
+    else:
+        chunks = _ndjson_chunks(replay(), chunk_size, on_error, MAX_RECORD_BYTES)
+    async for chunk in chunks:
+        yield chunk
+
+
+async def write_ndjson(file: StreamFile, chunks: Chunks, append: bool = False) -> int:
+    """
+    Écrit des morceaux d'événements en NDJSON, un morceau par écriture.
+
+    Args:
+        file: Chemin du fichier ou descripteur ouvert
+        chunks: Morceaux d'événements (voir chunked()), synchrones ou
+            asynchrones
+        append: Si True, ajoute à la fin d'un fichier existant
+
+    Returns:
+        Nombre d'événements écrits
+    """
+    written = 0
+    async with aiofiles.open(file, "ab" if append else "wb", closefd=not isinstance(file, int)) as handle:
+        async for chunk in _iterate(chunks):
+            if chunk:
+                await handle.write(b"\n".join(map(to_json, chunk)) + b"\n")
+                written += len(chunk)
+    return written
+
+
+async def write_binary(file: StreamFile, chunks: Chunks, append: bool = False) -> int:
+    """
+    Écrit des morceaux d'événements au format binaire, un lot par morceau.
+
+    Args:
+        file: Chemin du fichier ou descripteur ouvert
+        chunks: Morceaux d'événements (voir chunked()), synchrones ou
+            asynchrones
+        append: Si True, ajoute à la fin d'un fichier existant
+
+    Returns:
+        Nombre d'événements écrits
+    """
+    written = 0
+    async with aiofiles.open(file, "ab" if append else "wb", closefd=not isinstance(file, int)) as handle:
+        async for chunk in _iterate(chunks):
+            if chunk:
+                await handle.write(encode_events(chunk))
+                written += len(chunk)
+    return written
+
+
+async def write_events(
+    file: StreamFile, chunks: Chunks, format: StreamFormat = StreamFormat.NDJSON, append: bool = False
+) -> int:
+    """
+    Écrit des morceaux d'événements au format demandé.
+
+    Args:
+        file: Chemin du fichier ou descripteur ouvert
+        chunks: Morceaux d'événements, synchrones ou asynchrones
+        format: Format du fichier
+        append: Si True, ajoute à la fin d'un fichier existant
+
+    Returns:
+        Nombre d'événements écrits
+    """
+    if StreamFormat(format) is StreamFormat.BINARY:
+        return await write_binary(file, chunks, append)
+    return await write_ndjson(file, chunks, append)
@@ -0,0 +1,21 @@
+"""
+Connecteurs vers les systèmes externes et résilience des appels.
+"""
+
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    DeliveryOutcome,
+    ResilientExecutor,
+    RetryPolicy,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "DeliveryOutcome",
+    "ResilientExecutor",
+    "RetryPolicy",
+]
@@ -0,0 +1,450 @@
+"""
+Résilience des appels aux intégrations externes.
+
+Pour chaque intégration enregistrée, le ResilientExecutor combine :
+
+- un circuit breaker dont les échecs sont comptés sur une fenêtre glissante
+  (seuil par défaut : 5 échecs par minute) ;
+- des nouvelles tentatives à backoff exponentiel (1 s, 2 s, 4 s par
+  défaut), rangées dans un tas unique servi par un seul timer de la
+  boucle : un événement en attente n'occupe ni tâche ni coroutine ;
+- un plafond de nouvelles tentatives en cours. Au-delà, comme après la
+  dernière tentative ou une erreur non réessayable, l'événement est remis à
+  la dead letter queue.
+
+Tant que le circuit d'une intégration est ouvert, ses nouvelles tentatives
+sont reportées à la réouverture sans consommer de tentative : pendant une
+panne, les événements s'accumulent jusqu'au plafond, puis débordent vers la
+dead letter queue.
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from ..core.events import BaseEvent
+from ..observability import metrics
+from ..queue.dead_letter import DeadLetter, DeadLetterReason, DeadLetterSink, MemoryDeadLetterSink
+
+IntegrationCall = Callable[[BaseEvent], Awaitable[Any]]
+
+
+class CircuitState(str, Enum):
+    """État d'un circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Appel refusé : le circuit de l'intégration est ouvert."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker à fenêtre glissante.
+
+    Les échecs sont comptés dans ``buckets`` compartiments couvrant
+    ``window`` secondes. Au seuil atteint, le circuit s'ouvre : les appels
+    sont refusés pendant ``reset_timeout`` secondes, puis un unique appel
+    d'essai (semi-ouvert) décide de sa fermeture ou de sa réouverture.
+
+    Args:
+        failure_threshold: Échecs sur la fenêtre ouvrant le circuit
+        window: Durée de la fenêtre glissante en secondes
+        reset_timeout: Durée d'ouverture avant l'appel d'essai
+        buckets: Nombre de compartiments de la fenêtre
+        clock: Horloge monotone en secondes
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: float = 60.0,
+        reset_timeout: float = 30.0,
+        buckets: int = 12,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if window <= 0 or reset_timeout <= 0 or buckets < 1:
+            raise ValueError("window, reset_timeout and buckets must be positive")
+        self._threshold = failure_threshold
+        self._width = window / buckets
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._counts = [0] * buckets
+        self._bucket = 0
+        self._failures = 0
+        self._open = False
+        self._opened_at = 0.0
+        self._probe_at: Optional[float] = None
+
+        self.trips = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """État courant du circuit."""
+        if not self._open:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at < self._reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def failures(self) -> int:
+        """Échecs comptés sur la fenêtre glissante."""
+        self._advance(self._clock())
+        return self._failures
+
+    def retry_after(self) -> float:
+        """Secondes avant qu'un appel puisse être tenté (0 si possible)."""
+        if not self._open:
+            return 0.0
+        now = self._clock()
+        start = self._opened_at if self._probe_at is None else self._probe_at
+        return max(start + self._reset_timeout - now, 0.0)
+
+    def allow(self) -> bool:
+        """
+        Indique si un appel peut être tenté.
+
+        En semi-ouvert, un seul appel d'essai est autorisé ; un essai resté
+        sans résultat pendant reset_timeout est considéré comme perdu.
+        """
+        if not self._open:
+            return True
+        now = self._clock()
+        if now - self._opened_at < self._reset_timeout:
+            return False
+        if self._probe_at is not None and now - self._probe_at < self._reset_timeout:
+            return False
+        self._probe_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Enregistre un appel réussi ; ferme le circuit après un essai."""
+        if self._open:
+            self._open = False
+            self._probe_at = None
+            self._counts = [0] * len(self._counts)
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Enregistre un appel échoué ; ouvre le circuit au seuil atteint."""
+        now = self._clock()
+        if self._open:
+            self._opened_at = now
+            self._probe_at = None
+            return
+        self._advance(now)
+        self._counts[self._bucket % len(self._counts)] += 1
+        self._failures += 1
+        if self._failures >= self._threshold:
+            self._open = True
+            self._opened_at = now
+            self.trips += 1
+
+    def _advance(self, now: float) -> None:
+        bucket = int(now // self._width)
+        if bucket <= self._bucket:
+            return
+        counts = self._counts
+        if bucket - self._bucket >= len(counts):
+            self._counts = [0] * len(counts)
+            self._failures = 0
+        else:
+            for index in range(self._bucket + 1, bucket + 1):
+                slot = index % len(counts)
+                self._failures -= counts[slot]
+                counts[slot] = 0
+        self._bucket = bucket
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Nouvelles tentatives à backoff exponentiel.
+
+    Le délai avant la tentative n est ``base_delay * factor ** (n - 1)``,
+    borné par ``max_delay`` et éventuellement dispersé de ±``jitter``
+    (fraction du délai).
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    factor: float = 2.0
+    max_delay: float = 60.0
+    jitter: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if self.base_delay <= 0:
+            raise ValueError("base_delay must be positive")
+
+    def delay(self, retry: int) -> float:
+        """Délai avant la nouvelle tentative numéro ``retry`` (à partir de 1)."""
+        delay = min(self.base_delay * self.factor ** (retry - 1), self.max_delay)
+        if self.jitter:
+            delay *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        return delay
+
+
+class DeliveryOutcome(str, Enum):
+    """Issue immédiate d'une soumission."""
+
+    DELIVERED = "delivered"
+    RETRYING = "retrying"
+    DEAD_LETTERED = "dead_lettered"
+
+
+@dataclass
+class _Integration:
+    name: str
+    call: IntegrationCall
+    breaker: CircuitBreaker
+    policy: RetryPolicy
+    timeout: Optional[float]
+    retry_on: Tuple[Type[BaseException], ...]
+
+
+class _Retry:
+    __slots__ = ("integration", "event", "attempts", "error")
+
+    def __init__(self, integration: _Integration, event: BaseEvent) -> None:
+        self.integration = integration
+        self.event = event
+        self.attempts = 0
+        self.error: Optional[str] = None
+
+
+class ResilientExecutor:
+    """
+    Exécuteur d'appels aux intégrations : circuit breaker, nouvelles
+    tentatives planifiées et dead letter queue.
+
+    Args:
+        dead_letters: Destination des événements abandonnés (en mémoire
+            par défaut)
+        max_retries_in_flight: Événements en attente de nouvelle tentative,
+            toutes intégrations confondues, au-delà desquels un nouvel échec
+            part directement en dead letter queue
+    """
+
+    def __init__(
+        self,
+        dead_letters: Optional[DeadLetterSink] = None,
+        max_retries_in_flight: int = 10_000,
+    ) -> None:
+        if max_retries_in_flight < 0:
+            raise ValueError("max_retries_in_flight must not be negative")
+        self.dead_letters = dead_letters if dead_letters is not None else MemoryDeadLetterSink()
+        self._max_in_flight = max_retries_in_flight
+        self._integrations: Dict[str, _Integration] = {}
+
+        # Tas unique (échéance, ordre, tentative) servi par un seul timer
+        self._heap: List[Tuple[float, int, _Retry]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_due = float("inf")
+        self._running: Set[asyncio.Task] = set()
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+
+        self.delivered = 0
+        self.retries = 0
+        self.dead_lettered: Counter = Counter()
+
+    def register(
+        self,
+        name: str,
+        call: IntegrationCall,
+        breaker: Optional[CircuitBreaker] = None,
+        policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = 10.0,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:
+        """
+        Enregistre une intégration.
+
+        Args:
+            name: Nom de l'intégration
+            call: Coroutine envoyant un événement ; une exception signale
+                un échec
+            breaker: Circuit breaker dédié (5 échecs par minute par défaut)
+            policy: Politique de nouvelles tentatives (1 s, 2 s, 4 s par défaut)
+            timeout: Durée maximale d'un appel en secondes
+            retry_on: Exceptions réessayables ; les autres envoient
+                l'événement en dead letter queue sans compter comme un
+                échec du circuit
+        """
+        if name in self._integrations:
+            raise ValueError(f"Integration already registered: {name}")
+        self._integrations[name] = _Integration(
+            name=name,
+            call=call,
+            breaker=breaker or CircuitBreaker(),
+            policy=policy or RetryPolicy(),
+            timeout=timeout,
+            retry_on=tuple(retry_on) + (CircuitOpenError, asyncio.TimeoutError),
+        )
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        """Circuit breaker d'une intégration."""
+        return self._integrations[name].breaker
+
+    @property
+    def retries_in_flight(self) -> int:
+        """Événements en attente ou en cours de nouvelle tentative."""
+        return self._in_flight
+
+    async def submit(self, name: str, event: BaseEvent) -> DeliveryOutcome:
+        """
+        Envoie un événement à une intégration.
+
+        La première tentative est faite immédiatement ; en cas d'échec
+        réessayable, les suivantes sont planifiées et la méthode rend la main.
+
+        Raises:
+            KeyError: Si l'intégration n'est pas enregistrée
+            RuntimeError: Si l'exécuteur est fermé
+        """
+        if self._closed:
+            raise RuntimeError("ResilientExecutor is closed")
+        integration = self._integrations[name]
+        return await self._attempt(_Retry(integration, event), scheduled=False)
+
+    async def _attempt(self, retry: _Retry, scheduled: bool, admitted: bool = False) -> DeliveryOutcome:
+        integration = retry.integration
+        breaker = integration.breaker
+        if not admitted and not breaker.allow():
+            # Circuit ouvert : report à la réouverture, sans consommer de tentative
+            retry.error = f"CircuitOpenError: {integration.name} circuit is open"
+            return await self._schedule(retry, max(breaker.retry_after(), integration.policy.base_delay), scheduled)
+
+        retry.attempts += 1
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(integration.timeout):
+                await integration.call(retry.event)
+        except Exception as exc:
+            recorder = metrics.active
+            if recorder is not None:
+                outcome = "timeout" if isinstance(exc, asyncio.TimeoutError) else "error"
+                recorder.integration_call(integration.name, time.perf_counter() - start, outcome)
+            retry.error = f"{type(exc).__name__}: {exc}"
+            if not isinstance(exc, integration.retry_on):
+                return await self._dead_letter(retry, DeadLetterReason.REJECTED)
+            breaker.record_failure()
+            if retry.attempts > integration.policy.max_retries:
+                return await self._dead_letter(retry, DeadLetterReason.EXHAUSTED)
+            return await self._schedule(retry, integration.policy.delay(retry.attempts), scheduled)
+
+        recorder = metrics.active
+        if recorder is not None:
+            recorder.integration_call(integration.name, time.perf_counter() - start, "success")
+        breaker.record_success()
+        self.delivered += 1
+        return DeliveryOutcome.DELIVERED
+
+    async def _schedule(self, retry: _Retry, delay: float, scheduled: bool) -> DeliveryOutcome:
+        # Une tentative déjà planifiée est déjà comptée parmi les tentatives en cours
+        if self._closed:
+            return await self._dead_letter(retry, DeadLetterReason.SHUTDOWN)
+        if not scheduled:
+            if self._in_flight >= self._max_in_flight:
+                return await self._dead_letter(retry, DeadLetterReason.OVERFLOW)
+            self._in_flight += 1
+            self._idle.clear()
+        self._push(retry, asyncio.get_running_loop().time() + delay)
+        return DeliveryOutcome.RETRYING
+
+    def _push(self, retry: _Retry, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._sequence), retry))
+        if due < self._timer_due:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = asyncio.get_running_loop().call_at(due, self._fire)
+            self._timer_due = due
+
+    def _fire(self) -> None:
+        self._timer = None
+        self._timer_due = float("inf")
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        heap = self._heap
+        deferred = []
+        while heap and heap[0][0] <= now:
+            _, _, retry = heapq.heappop(heap)
+            integration = retry.integration
+            if not integration.breaker.allow():
+                # Circuit ouvert : report dans le tas, sans tâche
+                delay = max(integration.breaker.retry_after(), integration.policy.base_delay)
+                deferred.append((retry, now + delay))
+                continue
+            self.retries += 1
+            task = loop.create_task(self._retry(retry))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        for retry, due in deferred:
+            self._push(retry, due)
+        if heap and self._timer is None:
+            self._timer_due = heap[0][0]
+            self._timer = loop.call_at(self._timer_due, self._fire)
+
+    async def _retry(self, retry: _Retry) -> None:
+        outcome = None
+        try:
+            outcome = await self._attempt(retry, scheduled=True, admitted=True)
+        finally:
+            if outcome is not DeliveryOutcome.RETRYING:
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self._idle.set()
+
+    async def _dead_letter(self, retry: _Retry, reason: DeadLetterReason) -> DeliveryOutcome:
+        self.dead_lettered[reason] += 1
+        await self.dead_letters.put(
+            DeadLetter(
+                integration=retry.integration.name,
+                event=retry.event,
+                reason=reason,
+                error=retry.error,
+                attempts=retry.attempts,
+            )
+        )
+        return DeliveryOutcome.DEAD_LETTERED
+
+    async def join(self) -> None:
+        """Attend qu'aucune nouvelle tentative ne reste en attente ou en cours."""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """
+        Arrête les nouvelles tentatives.
+
+        Les tentatives en cours se terminent ; celles encore planifiées sont
+        remises à la dead letter queue (motif SHUTDOWN) pour être rejouées.
+        """
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_due = float("inf")
+        if self._running:
+            await asyncio.gather(*list(self._running), return_exceptions=True)
+        pending, self._heap = self._heap, []
+        for _, _, retry in sorted(pending):
+            self._in_flight -= 1
+            await self._dead_letter(retry, DeadLetterReason.SHUTDOWN)
+        self._idle.set()
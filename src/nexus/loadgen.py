@@ -0,0 +1,475 @@
+"""
+Génération de charge synthétique et rejeu de flux enregistrés.
+
+Un profil décrit des classes de trafic (TrafficClass) : type d'événement,
+débit moyen, rafales périodiques, répartition des priorités et
+distribution de la taille des payloads. LoadGenerator fusionne leurs
+arrivées (processus de Poisson, ou arrivées régulières) et crée chaque
+événement par create_event() à son échéance :
+
+    generator = LoadGenerator(PRODUCTION_MIX, seed=1)
+    async for chunk in generator.chunks(duration=60.0):
+        queue.put_many_nowait(chunk)
+
+replay() rejoue un flux enregistré (par exemple read_events()) en
+conservant les intervalles entre les horodatages, à vitesse 1x ou Nx.
+
+Les deux produisent des morceaux d'événements, directement utilisables par
+write_events(). Le rythme est tenu par morceaux : l'horloge n'est lue que
+lorsqu'une échéance semble future, et le générateur ne dort jamais moins
+de ``tick`` secondes. Les payloads sont précalculés par classe ; le coût
+par événement est dominé par create_event().
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import random
+import string
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import yaml
+
+from .core.codec import datetime_to_seconds
+from .core.events import _EVENT_CLASSES, BaseEvent, Event, EventType, Priority, create_event
+from .core.streaming import Chunks, _iterate
+
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[Any]]
+
+_FILLER = string.ascii_lowercase + " "
+_FILLER_BLOCK = 4096
+
+# Valeurs d'exemple des champs de payload requis par les classes d'événements
+# (required_payload_fields) ; un champ absent de la table reçoit "load"
+_SAMPLE_VALUES: Dict[str, Any] = {
+    "from": "load@example.com",
+    "subject": "Load",
+    "received_at": "2025-01-01T00:00:00Z",
+    "file_path": "/load/file.txt",
+    "task_id": "load",
+    "scheduled_time": "2025-01-01T00:00:00Z",
+    "status": "healthy",
+    "metrics": {"cpu": 0.0},
+    "error_type": "LoadError",
+    "message": "synthetic",
+    "events": [],
+}
+
+
+def _required_payload(event_type: EventType) -> Dict[str, Any]:
+    """Payload minimal du contrat de la classe du type : ses champs requis, en valeurs d'exemple."""
+    event_class = _EVENT_CLASSES.get(event_type, BaseEvent)
+    return {name: _SAMPLE_VALUES.get(name, "load") for name in event_class.required_payload_fields}
+
+
+def _priority(value: Union[Priority, int, str]) -> Priority:
+    """Priorité depuis un membre, une valeur ou un nom (``high``)."""
+    if isinstance(value, str):
+        try:
+            return Priority[value.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown priority: {value}") from None
+    return Priority(value)
+
+
+@dataclass(frozen=True)
+class PayloadSize:
+    """
+    Distribution log-normale de la taille des payloads sérialisés, en octets.
+
+    Args:
+        median: Taille médiane
+        sigma: Écart-type du logarithme (0 : taille fixe) ; 1.5 donne une
+            longue traîne (1 % des payloads au-delà de 30 fois la médiane)
+        maximum: Taille maximale
+    """
+
+    median: int = 256
+    sigma: float = 0.0
+    maximum: int = 1024 * 1024
+
+    def __post_init__(self) -> None:
+        if self.median < 0 or self.sigma < 0:
+            raise ValueError("median and sigma must not be negative")
+        if self.maximum < self.median:
+            raise ValueError("maximum must not be smaller than median")
+
+    def sample(self, rng: random.Random) -> int:
+        """Tire une taille."""
+        if not self.sigma or not self.median:
+            return self.median
+        return min(self.maximum, int(rng.lognormvariate(math.log(self.median), self.sigma)))
+
+
+@dataclass(frozen=True)
+class Burst:
+    """
+    Rafales périodiques : débit multiplié par ``factor`` pendant
+    ``duration`` secondes, toutes les ``every`` secondes à partir de ``offset``.
+    """
+
+    every: float
+    duration: float
+    factor: float
+    offset: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not 0 < self.duration < self.every:
+            raise ValueError("burst duration must be positive and shorter than its period")
+        if self.factor < 0:
+            raise ValueError("burst factor must not be negative")
+
+
+@dataclass(frozen=True)
+class TrafficClass:
+    """
+    Classe de trafic d'un profil de charge.
+
+    Args:
+        type: Type des événements
+        rate: Débit moyen hors rafales, en événements par seconde
+        source: Source des événements ; avec ``sources`` > 1, suffixée
+            par un numéro tiré uniformément (``sync7``)
+        sources: Nombre de sources distinctes
+        priority: Priorité unique, ou poids relatifs par priorité
+        payload_size: Distribution de la taille des payloads (un entier :
+            taille fixe)
+        burst: Rafales périodiques
+        regular: Arrivées à intervalles réguliers plutôt que poissonniennes
+    """
+
+    type: EventType
+    rate: float
+    source: str = "loadgen"
+    sources: int = 1
+    priority: Union[Priority, Mapping[Priority, float]] = Priority.NORMAL
+    payload_size: PayloadSize = field(default_factory=PayloadSize)
+    burst: Optional[Burst] = None
+    regular: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "type", EventType(self.type))
+        if isinstance(self.payload_size, int):
+            object.__setattr__(self, "payload_size", PayloadSize(self.payload_size))
+        if isinstance(self.priority, Mapping):
+            weights = {_priority(key): float(weight) for key, weight in self.priority.items()}
+            if not weights or min(weights.values()) < 0 or not sum(weights.values()):
+                raise ValueError("priority weights must be non-negative and not all zero")
+            object.__setattr__(self, "priority", weights)
+        else:
+            object.__setattr__(self, "priority", _priority(self.priority))
+        if self.rate < 0:
+            raise ValueError("rate must not be negative")
+        if self.sources < 1:
+            raise ValueError("sources must be at least 1")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TrafficClass":
+        """
+        Construit une classe depuis un profil YAML ou JSON.
+
+        ``payload_size`` est un entier ou un objet {median, sigma, maximum},
+        ``burst`` un objet {every, duration, factor, offset}, ``priority``
+        un nom ou un objet {nom: poids}.
+        """
+        data = dict(data)
+        payload_size = data.pop("payload_size", PayloadSize())
+        if isinstance(payload_size, Mapping):
+            payload_size = PayloadSize(**payload_size)
+        burst = data.pop("burst", None)
+        if isinstance(burst, Mapping):
+            burst = Burst(**burst)
+        return cls(payload_size=payload_size, burst=burst, **data)
+
+    def rate_at(self, offset: float) -> Tuple[float, float]:
+        """Débit à l'instant ``offset`` et instant de son prochain changement."""
+        burst = self.burst
+        if burst is None:
+            return self.rate, math.inf
+        phase = (offset - burst.offset) % burst.every
+        period_start = offset - phase
+        if phase < burst.duration:
+            return self.rate * burst.factor, period_start + burst.duration
+        return self.rate, period_start + burst.every
+
+
+# Trafic type : rafales de modifications de fichiers, sondes de santé
+# régulières, longue traîne d'emails volumineux
+PRODUCTION_MIX: Tuple[TrafficClass, ...] = (
+    TrafficClass(
+        EventType.FILE_MODIFIED, rate=200.0, source="sync", sources=20,
+        priority={Priority.NORMAL: 9, Priority.HIGH: 1}, payload_size=PayloadSize(512, 0.5, 8192),
+        burst=Burst(every=30.0, duration=2.0, factor=25.0),
+    ),
+    TrafficClass(
+        EventType.SYSTEM_HEALTH, rate=5.0, source="monitor", sources=5,
+        priority=Priority.LOW, payload_size=200, regular=True,
+    ),
+    TrafficClass(
+        EventType.EMAIL_RECEIVED, rate=20.0, source="imap", sources=50,
+        priority={Priority.NORMAL: 4, Priority.HIGH: 1}, payload_size=PayloadSize(4096, 1.5, 1024 * 1024),
+    ),
+)
+
+
+def load_profile(path: Union[str, Path]) -> List[TrafficClass]:
+    """
+    Lit un profil de charge YAML (ou JSON) : ``classes`` est la liste des
+    classes de trafic (voir TrafficClass.from_dict()).
+
+    Raises:
+        ValueError: Si le profil est invalide
+    """
+    with open(path, encoding="utf-8") as handle:
+        profile = yaml.safe_load(handle)
+    if not isinstance(profile, Mapping) or not isinstance(profile.get("classes"), list):
+        raise ValueError(f"{path}: profile must contain a 'classes' list")
+    try:
+        return [TrafficClass.from_dict(item) for item in profile["classes"]]
+    except (TypeError, KeyError) as exc:
+        raise ValueError(f"{path}: invalid traffic class: {exc}") from exc
+
+
+class _Pacer:
+    """Aligne une chronologie sur l'horloge ; l'horloge n'est lue que si une échéance semble future."""
+
+    def __init__(self, speed: float, tick: float, clock: Clock, sleep: Sleep) -> None:
+        if not speed > 0:
+            raise ValueError("speed must be positive")
+        self._scale = 1.0 / speed
+        self._tick = tick
+        self._clock = clock
+        self._sleep = sleep
+        self._start: Optional[float] = None
+        self._elapsed = 0.0
+
+    def early(self, offset: float) -> bool:
+        """Indique si l'échéance ``offset`` (temps de la chronologie) n'est pas atteinte."""
+        if self._start is None:
+            self._start = self._clock()
+        due = offset * self._scale
+        if due <= self._elapsed:
+            return False
+        self._elapsed = self._clock() - self._start
+        return due > self._elapsed
+
+    async def wait(self, offset: float) -> None:
+        """Attend l'échéance ``offset``, au moins ``tick`` secondes."""
+        self._elapsed = self._clock() - self._start
+        delay = offset * self._scale - self._elapsed
+        if delay > 0:
+            await self._sleep(max(delay, self._tick))
+            self._elapsed = self._clock() - self._start
+
+
+class LoadGenerator:
+    """
+    Trafic synthétique d'un ensemble de classes, reproductible à graine égale.
+
+    Args:
+        classes: Classes de trafic
+        seed: Graine du générateur pseudo-aléatoire (arrivées, priorités,
+            sources et payloads)
+        pool_size: Payloads précalculés par classe, tirés selon sa
+            distribution de taille
+    """
+
+    def __init__(self, classes: Sequence[TrafficClass], seed: Optional[int] = None, pool_size: int = 256) -> None:
+        if not classes:
+            raise ValueError("at least one traffic class is required")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.classes = tuple(classes)
+        self._rng = random.Random(seed)
+        # Par classe : (type, sources, payloads, priorité fixe ou (priorités, poids cumulés))
+        self._plans: List[Tuple[EventType, List[str], List[Dict[str, Any]], Any]] = []
+        for traffic in self.classes:
+            sources = [traffic.source] if traffic.sources == 1 else [
+                f"{traffic.source}{index}" for index in range(traffic.sources)
+            ]
+            priority: Any = traffic.priority
+            if isinstance(priority, Mapping):
+                population = list(priority)
+                cumulative = list(itertools.accumulate(priority.values()))
+                priority = (population, cumulative) if len(population) > 1 else population[0]
+            self._plans.append((traffic.type, sources, self._payloads(traffic, pool_size), priority))
+        self.generated = 0
+
+    def _payloads(self, traffic: TrafficClass, count: int) -> List[Dict[str, Any]]:
+        """Payloads valides pour le type de la classe, de tailles tirées."""
+        required = _required_payload(traffic.type)
+        overhead = len(json.dumps({**required, "body": ""}))
+        sizes = [max(0, traffic.payload_size.sample(self._rng) - overhead) for _ in range(count)]
+        # Corps découpés à une position aléatoire dans un bloc de texte répété
+        block = "".join(self._rng.choices(_FILLER, k=_FILLER_BLOCK))
+        text = block * (max(sizes) // _FILLER_BLOCK + 2)
+        payloads = []
+        for size in sizes:
+            start = self._rng.randrange(_FILLER_BLOCK)
+            payloads.append({**required, "body": text[start:start + size]})
+        return payloads
+
+    def _next_arrival(self, traffic: TrafficClass, offset: float) -> float:
+        """Prochaine arrivée après ``offset`` ; un changement de débit relance le tirage."""
+        while True:
+            rate, until = traffic.rate_at(offset)
+            if rate > 0:
+                step = 1.0 / rate if traffic.regular else self._rng.expovariate(rate)
+                if offset + step < until:
+                    return offset + step
+            if until == math.inf:
+                return math.inf
+            offset = until if until > offset else math.nextafter(offset, math.inf)
+
+    def arrivals(self, duration: Optional[float] = None, count: Optional[int] = None) -> Iterator[Tuple[float, int]]:
+        """
+        Arrivées fusionnées de toutes les classes, dans l'ordre.
+
+        Args:
+            duration: Durée simulée, en secondes
+            count: Nombre maximum d'arrivées
+
+        Yields:
+            (instant en secondes depuis le début, indice de la classe)
+        """
+        heap = [(self._next_arrival(traffic, 0.0), index) for index, traffic in enumerate(self.classes)]
+        heap = [entry for entry in heap if entry[0] != math.inf]
+        heapq.heapify(heap)
+        emitted = 0
+        while heap and (count is None or emitted < count):
+            offset, index = heap[0]
+            if duration is not None and offset >= duration:
+                return
+            yield offset, index
+            emitted += 1
+            following = self._next_arrival(self.classes[index], offset)
+            if following == math.inf:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (following, index))
+
+    def create(self, index: int) -> Event:
+        """Crée un événement de la classe ``index`` par create_event()."""
+        event_type, sources, payloads, priority = self._plans[index]
+        random_ = self._rng.random
+        if not isinstance(priority, Priority):
+            population, cumulative = priority
+            priority = population[bisect_right(cumulative, random_() * cumulative[-1])]
+        source = sources[int(random_() * len(sources))] if len(sources) > 1 else sources[0]
+        self.generated += 1
+        return create_event(event_type, source, payloads[int(random_() * len(payloads))], priority=priority)
+
+    async def chunks(
+        self,
+        duration: Optional[float] = None,
+        count: Optional[int] = None,
+        speed: float = 1.0,
+        max_chunk: int = 1000,
+        tick: float = 0.001,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> AsyncIterator[List[Event]]:
+        """
+        Produit le trafic au rythme des arrivées.
+
+        Args:
+            duration: Durée simulée, en secondes
+            count: Nombre maximum d'événements
+            speed: Accélération (math.inf : sans attente)
+            max_chunk: Taille maximale d'un morceau
+            tick: Attente minimale entre deux morceaux, en secondes
+            clock: Horloge monotone
+            sleep: Attente asynchrone
+
+        Yields:
+            Morceaux d'événements échus, créés à leur échéance
+
+        Raises:
+            ValueError: Si ni ``duration`` ni ``count`` n'est fourni
+        """
+        if duration is None and count is None:
+            raise ValueError("duration or count is required")
+        pacer = _Pacer(speed, tick, clock, sleep)
+        chunk: List[Event] = []
+        for offset, index in self.arrivals(duration, count):
+            if pacer.early(offset):
+                if chunk:
+                    yield chunk
+                    chunk = []
+                await pacer.wait(offset)
+            chunk.append(self.create(index))
+            if len(chunk) >= max_chunk:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+async def replay(
+    chunks: Chunks,
+    speed: float = 1.0,
+    max_chunk: int = 1000,
+    tick: float = 0.001,
+    clock: Clock = time.monotonic,
+    sleep: Sleep = asyncio.sleep,
+) -> AsyncIterator[List[BaseEvent]]:
+    """
+    Rejoue un flux enregistré en conservant les intervalles entre événements.
+
+    Le premier événement est émis immédiatement ; chacun des suivants
+    l'est quand le temps écoulé, multiplié par ``speed``, atteint l'écart
+    entre son horodatage et celui du premier. Un événement antérieur au
+    précédent est émis sans attendre. Les événements ne sont pas modifiés.
+
+    Args:
+        chunks: Morceaux d'événements dans l'ordre d'enregistrement,
+            synchrones ou asynchrones (read_events())
+        speed: Accélération (2.0 : deux fois plus vite ; math.inf : sans attente)
+        max_chunk: Taille maximale d'un morceau
+        tick: Attente minimale entre deux morceaux, en secondes
+        clock: Horloge monotone
+        sleep: Attente asynchrone
+
+    Yields:
+        Morceaux d'événements échus
+    """
+    pacer = _Pacer(speed, tick, clock, sleep)
+    origin: Optional[float] = None
+    pending: List[BaseEvent] = []
+    async for chunk in _iterate(chunks):
+        for event in chunk:
+            stamp = datetime_to_seconds(event.timestamp)
+            if origin is None:
+                origin = stamp
+            offset = stamp - origin
+            if pacer.early(offset):
+                if pending:
+                    yield pending
+                    pending = []
+                await pacer.wait(offset)
+            pending.append(event)
+            if len(pending) >= max_chunk:
+                yield pending
+                pending = []
+    if pending:
+        yield pending
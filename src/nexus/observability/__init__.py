@@ -0,0 +1,12 @@
+"""
+Observabilité : métriques Prometheus du cycle de vie des événements.
+"""
+
+from .metrics import LATENCY_BUCKETS, EventMetrics, disable_metrics, enable_metrics
+
+__all__ = [
+    "EventMetrics",
+    "LATENCY_BUCKETS",
+    "disable_metrics",
+    "enable_metrics",
+]
@@ -0,0 +1,305 @@
+"""
+Métriques Prometheus du cycle de vie des événements.
+
+Points de mesure :
+
+    création      BaseEvent.timestamp (horloge du producteur)
+    mise en file  PriorityEventQueue.put_nowait()
+    sortie        PriorityEventQueue.get_nowait() : attente en file
+    traitement    WorkerPool et BatchingStage : durée par processeur, puis
+                  latence de bout en bout (création -> fin du traitement)
+    intégration   ResilientExecutor : durée de chaque appel
+
+Métriques exportées (préfixe ``nexus_``) :
+
+    events_enqueued_total{type, source}
+    events_processed_total{type, processor, outcome}
+    queue_wait_seconds{type}
+    processing_seconds{type, processor}
+    event_latency_seconds{type, source}
+    integration_call_seconds{integration, outcome}
+    queue_depth{queue, priority}
+
+Le chemin critique n'acquiert aucun verrou : chaque thread écrit dans son
+propre fragment (compteurs et histogrammes dans des dictionnaires simples),
+et le collecteur agrège les fragments au moment du scrape. La profondeur
+des files est lue au scrape uniquement. Les étiquettes de chaque série sont
+converties une seule fois, puis réutilisées d'un scrape à l'autre.
+
+L'instrumentation est désactivée par défaut : les points de mesure ne
+coûtent alors qu'une lecture de ``metrics.active``, faite une seule fois
+par point de mesure (``recorder = metrics.active``). enable_metrics()
+installe un EventMetrics et l'enregistre auprès d'un registre Prometheus ;
+disable_metrics() le retire.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily, Metric
+from prometheus_client.samples import Sample
+
+from ..core.codec import datetime_to_seconds
+from ..core.events import Priority
+
+# Bornes des histogrammes de latence, en secondes (objectif : 100 ms)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_Key = Hashable
+
+# (nom, description, étiquettes)
+_COUNTERS = {
+    "enqueued": ("events_enqueued", "Events put into a queue", ("type", "source")),
+    "processed": ("events_processed", "Events handled by a processor", ("type", "processor", "outcome")),
+}
+_HISTOGRAMS = {
+    "queue_wait": ("queue_wait_seconds", "Time spent waiting in a queue", ("type",)),
+    "processing": ("processing_seconds", "Processor execution time", ("type", "processor")),
+    "latency": ("event_latency_seconds", "Event creation to end of processing", ("type", "source")),
+    "integration": ("integration_call_seconds", "Integration call duration", ("integration", "outcome")),
+}
+
+# Instrumentation en cours, None si désactivée
+active: Optional["EventMetrics"] = None
+
+
+def _labels(key: Any) -> List[str]:
+    """Valeurs d'étiquettes d'une clé (valeur seule ou tuple)."""
+    parts = key if isinstance(key, tuple) else (key,)
+    return [str(getattr(part, "value", part)) for part in parts]
+
+
+class _Shard:
+    """
+    Compteurs et histogrammes écrits par un seul thread.
+
+    Chaque attribut associe aux étiquettes (valeur seule ou tuple) un
+    compteur, ou pour un histogramme la liste des effectifs par intervalle
+    (dernier : +Inf) suivie de la somme des observations.
+    """
+
+    __slots__ = tuple(_COUNTERS) + tuple(_HISTOGRAMS)
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, {})
+
+
+class EventMetrics:
+    """
+    Enregistreur des métriques du cycle de vie, fragmenté par thread.
+
+    S'utilise comme collecteur d'un registre Prometheus (méthode collect()).
+
+    Args:
+        buckets: Bornes supérieures des histogrammes, en secondes
+        namespace: Préfixe des noms de métriques
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS, namespace: str = "nexus") -> None:
+        self._bounds = tuple(sorted(buckets))
+        if not self._bounds:
+            raise ValueError("buckets must not be empty")
+        self._empty = [0] * (len(self._bounds) + 1) + [0.0]
+        self._namespace = namespace
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._queues: Dict[str, Any] = {}
+        self._registry: Optional[CollectorRegistry] = None
+        # Étiquettes rendues par métrique et par clé, réutilisées à chaque scrape
+        self._label_cache: Dict[str, Dict[_Key, Any]] = {name: {} for name in _Shard.__slots__}
+
+    def _new_shard(self) -> _Shard:
+        """Crée le fragment du thread courant (premier point de mesure du thread)."""
+        shard = self._local.shard = _Shard()
+        with self._shards_lock:
+            self._shards.append(shard)
+        return shard
+
+    # Points de mesure : fragment lu une fois par appel et corps des
+    # histogrammes écrits en ligne (chemin critique)
+
+    def enqueued(self, event: Any) -> None:
+        """Événement ajouté à une file."""
+        try:
+            counts = self._local.shard.enqueued
+        except AttributeError:
+            counts = self._new_shard().enqueued
+        key = (event.type, event.source)
+        counts[key] = counts.get(key, 0) + 1
+
+    def dequeued(self, event: Any, waited: float) -> None:
+        """Événement retiré d'une file après ``waited`` secondes d'attente."""
+        try:
+            histogram = self._local.shard.queue_wait
+        except AttributeError:
+            histogram = self._new_shard().queue_wait
+        counts = histogram.get(event.type)
+        if counts is None:
+            counts = histogram[event.type] = self._empty.copy()
+        counts[bisect_left(self._bounds, waited)] += 1
+        counts[-1] += waited
+
+    def processed(self, event: Any, processor: str, seconds: float, success: bool) -> None:
+        """Traitement d'un événement par un processeur."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        key = (event.type, processor)
+        counts = shard.processing.get(key)
+        if counts is None:
+            counts = shard.processing[key] = self._empty.copy()
+        counts[bisect_left(self._bounds, seconds)] += 1
+        counts[-1] += seconds
+        key += ("success" if success else "failure",)
+        shard.processed[key] = shard.processed.get(key, 0) + 1
+
+    def completed(self, event: Any) -> None:
+        """Fin du traitement : latence depuis la création de l'événement."""
+        latency = time.time() - datetime_to_seconds(event.timestamp)
+        if latency < 0.0:
+            latency = 0.0
+        try:
+            histogram = self._local.shard.latency
+        except AttributeError:
+            histogram = self._new_shard().latency
+        key = (event.type, event.source)
+        counts = histogram.get(key)
+        if counts is None:
+            counts = histogram[key] = self._empty.copy()
+        counts[bisect_left(self._bounds, latency)] += 1
+        counts[-1] += latency
+
+    def integration_call(self, integration: str, seconds: float, outcome: str) -> None:
+        """Appel à une intégration (outcome : success, error ou timeout)."""
+        try:
+            histogram = self._local.shard.integration
+        except AttributeError:
+            histogram = self._new_shard().integration
+        key = (integration, outcome)
+        counts = histogram.get(key)
+        if counts is None:
+            counts = histogram[key] = self._empty.copy()
+        counts[bisect_left(self._bounds, seconds)] += 1
+        counts[-1] += seconds
+
+    def watch_queue(self, queue: Any, name: str = "main") -> None:
+        """
+        Exporte la profondeur d'une file, lue au scrape.
+
+        Args:
+            queue: File exposant qsize() (et qsize(priority) pour une
+                PriorityEventQueue)
+            name: Valeur de l'étiquette ``queue``
+        """
+        self._queues[name] = queue
+
+    # Collecteur Prometheus
+
+    def _merged(self) -> Dict[str, Dict[_Key, Any]]:
+        """Agrège les fragments ; les copies sont atomiques sous le GIL."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: Dict[str, Dict[_Key, Any]] = {name: {} for name in _Shard.__slots__}
+        for shard in shards:
+            for name in _COUNTERS:
+                totals = merged[name]
+                for key, value in getattr(shard, name).copy().items():
+                    totals[key] = totals.get(key, 0) + value
+            for name in _HISTOGRAMS:
+                totals = merged[name]
+                for key, counts in getattr(shard, name).copy().items():
+                    counts = list(counts)
+                    total = totals.get(key)
+                    if total is None:
+                        totals[key] = counts
+                    else:
+                        for index, value in enumerate(counts):
+                            total[index] += value
+        return merged
+
+    def collect(self) -> Iterator[Metric]:
+        """Métriques agrégées, au format prometheus_client."""
+        prefix = f"{self._namespace}_" if self._namespace else ""
+        merged = self._merged()
+
+        for name, (metric, documentation, labels) in _COUNTERS.items():
+            family = CounterMetricFamily(prefix + metric, documentation, labels=labels)
+            sample_name = family.name + "_total"
+            cache = self._label_cache[name]
+            samples = family.samples
+            for key, value in merged[name].items():
+                rendered = cache.get(key)
+                if rendered is None:
+                    rendered = cache[key] = dict(zip(labels, _labels(key)))
+                samples.append(Sample(sample_name, rendered, value))
+            yield family
+
+        bounds = [repr(bound) for bound in self._bounds] + ["+Inf"]
+        for name, (metric, documentation, labels) in _HISTOGRAMS.items():
+            # Équivalent de HistogramMetricFamily.add_metric(), avec les
+            # dictionnaires d'étiquettes de chaque intervalle mis en cache
+            family = HistogramMetricFamily(prefix + metric, documentation, labels=labels)
+            bucket_name, count_name, sum_name = (family.name + suffix for suffix in ("_bucket", "_count", "_sum"))
+            cache = self._label_cache[name]
+            samples = family.samples
+            for key, counts in merged[name].items():
+                rendered = cache.get(key)
+                if rendered is None:
+                    series = dict(zip(labels, _labels(key)))
+                    rendered = cache[key] = (series, [{**series, "le": bound} for bound in bounds])
+                series, bucket_labels = rendered
+                cumulative = 0
+                for bucket, count in zip(bucket_labels, counts):
+                    cumulative += count
+                    samples.append(Sample(bucket_name, bucket, cumulative))
+                samples.append(Sample(count_name, series, cumulative))
+                samples.append(Sample(sum_name, series, counts[-1]))
+            yield family
+
+        depth = GaugeMetricFamily(prefix + "queue_depth", "Events waiting in a queue", labels=("queue", "priority"))
+        for queue_name, queue in self._queues.items():
+            try:
+                for priority in Priority:
+                    depth.add_metric([queue_name, priority.name.lower()], queue.qsize(priority))
+            except TypeError:
+                depth.add_metric([queue_name, "all"], queue.qsize())
+        yield depth
+
+
+def enable_metrics(registry: Optional[CollectorRegistry] = REGISTRY, **options: Any) -> EventMetrics:
+    """
+    Active l'instrumentation du cycle de vie des événements.
+
+    Args:
+        registry: Registre Prometheus auquel ajouter le collecteur, None
+            pour n'en utiliser aucun
+        **options: Paramètres d'EventMetrics (buckets, namespace)
+
+    Returns:
+        L'enregistreur installé (remplace le précédent)
+    """
+    global active
+    disable_metrics()
+    recorder = EventMetrics(**options)
+    if registry is not None:
+        registry.register(recorder)
+        recorder._registry = registry
+    active = recorder
+    return recorder
+
+
+def disable_metrics() -> None:
+    """Désactive l'instrumentation et retire le collecteur de son registre."""
+    global active
+    recorder, active = active, None
+    if recorder is not None and recorder._registry is not None:
+        recorder._registry.unregister(recorder)
+        recorder._registry = None
@@ -0,0 +1,25 @@
+"""
+Processeurs d'événements et registre de routage.
+"""
+
+from .base import AbstractProcessor, BlockingProcessor, ProcessingResult
+from .batching import BatchingStage, BatchPolicy
+from .correlation import CorrelationEngine, CorrelationRule, PatternStep
+from .engine import WorkerPool, ordering_key
+from .registry import ProcessorRegistry
+from .sharding import ShardedPipeline
+
+__all__ = [
+    "AbstractProcessor",
+    "BatchPolicy",
+    "BatchingStage",
+    "BlockingProcessor",
+    "CorrelationEngine",
+    "CorrelationRule",
+    "PatternStep",
+    "ProcessingResult",
+    "ProcessorRegistry",
+    "ShardedPipeline",
+    "WorkerPool",
+    "ordering_key",
+]
@@ -0,0 +1,95 @@
+"""
+Interface des processeurs d'événements.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Sequence
+
+from ..core.events import BaseEvent
+
+
+@dataclass
+class ProcessingResult:
+    """Résultat du traitement d'un événement par un processeur."""
+
+    processor: str
+    event_id: str
+    success: bool
+    message: Optional[str] = None
+    error: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def failure(cls, processor: str, event_id: str, exc: BaseException) -> "ProcessingResult":
+        """Construit le résultat d'un traitement interrompu par une exception."""
+        return cls(processor=processor, event_id=event_id, success=False, error=f"{type(exc).__name__}: {exc}")
+
+
+class AbstractProcessor(ABC):
+    """
+    Interface de base pour tous les processeurs d'événements.
+
+    Le registre interroge can_handle() une seule fois par EventType, à
+    l'enregistrement : la réponse ne doit dépendre que du type. Un
+    processeur peut restreindre les sources qu'il traite via ``sources``.
+    """
+
+    # Sources traitées, None pour toutes
+    sources: ClassVar[Optional[FrozenSet[str]]] = None
+
+    @property
+    def name(self) -> str:
+        """Nom du processeur dans les résultats et métriques."""
+        return type(self).__name__
+
+    @abstractmethod
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        """Traite un événement spécifique."""
+        pass
+
+    @abstractmethod
+    def can_handle(self, event_type: str) -> bool:
+        """Détermine si le processeur peut traiter ce type d'événement."""
+        pass
+
+    @abstractmethod
+    async def health_check(self) -> bool:
+        """Vérifie la santé du processeur."""
+        pass
+
+    async def process_batch(self, events: Sequence[BaseEvent]) -> List[ProcessingResult]:
+        """
+        Traite un lot d'événements.
+
+        L'implémentation par défaut traite les événements un à un ; les
+        processeurs capables d'opérations groupées la redéfinissent.
+
+        Args:
+            events: Événements d'un même type
+
+        Returns:
+            Un résultat par événement, dans l'ordre du lot
+        """
+        return [await self.process_event(event) for event in events]
+
+
+class BlockingProcessor(AbstractProcessor):
+    """
+    Processeur dont le traitement est bloquant ou coûteux en CPU.
+
+    Le traitement est implémenté de façon synchrone dans process_blocking()
+    et exécuté hors de la boucle asyncio : dans l'exécuteur par défaut, ou
+    dans celui du WorkerPool (pool de threads ou de processus ; dans ce
+    dernier cas, le processeur et ses résultats doivent être picklables).
+    """
+
+    @abstractmethod
+    def process_blocking(self, event: BaseEvent) -> ProcessingResult:
+        """Traite un événement de façon synchrone."""
+        pass
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        """Exécute process_blocking() dans l'exécuteur par défaut."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.process_blocking, event)
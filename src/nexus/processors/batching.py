@@ -0,0 +1,213 @@
+"""
+Étage de micro-batching entre la file et les processeurs.
+
+Les événements sont regroupés par destination (processeur) et par type,
+puis remis au processeur via process_batch() dès que le lot atteint sa
+taille maximale ou que son plus ancien événement a attendu le délai
+maximal (linger). Les processeurs qui ne redéfinissent pas process_batch()
+reçoivent les événements un à un (implémentation par défaut).
+
+La politique (taille, délai) est configurable par EventType : un délai
+court privilégie la latence, un lot plus grand le débit et le nombre
+d'appels aux intégrations. Les lots d'un même couple (processeur, type)
+sont traités l'un après l'autre, dans l'ordre d'arrivée des événements.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+import structlog
+
+from ..core.events import BaseEvent, EventType
+from ..observability import metrics
+from .base import AbstractProcessor, ProcessingResult
+from .registry import ProcessorRegistry
+
+BatchCallback = Callable[[AbstractProcessor, List[BaseEvent], List[ProcessingResult]], Any]
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchPolicy:
+    """Conditions de remise d'un lot : taille atteinte ou délai écoulé."""
+
+    max_size: int = 100
+    max_linger: float = 0.01
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if self.max_linger < 0:
+            raise ValueError("max_linger must not be negative")
+
+
+class _Completion:
+    """Compte les lots restant à traiter pour un événement."""
+
+    __slots__ = ("remaining", "callback")
+
+    def __init__(self, remaining: int, callback: Callable[[], None]) -> None:
+        self.remaining = remaining
+        self.callback = callback
+
+    def done(self) -> None:
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.callback()
+
+
+class _Buffer:
+    """Lot en cours de constitution pour un couple (processeur, type)."""
+
+    __slots__ = ("processor", "policy", "events", "completions", "timer", "lock")
+
+    def __init__(self, processor: AbstractProcessor, policy: BatchPolicy) -> None:
+        self.processor = processor
+        self.policy = policy
+        self.events: List[BaseEvent] = []
+        self.completions: List[_Completion] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.lock = asyncio.Lock()
+
+
+class BatchingStage:
+    """
+    Regroupe les événements par processeur et par type avant traitement.
+
+    Args:
+        registry: Registre routant les événements vers les processeurs
+        policies: Politique de regroupement par EventType
+        default_policy: Politique des types sans politique dédiée
+        max_pending: Événements acceptés et non encore traités au-delà
+            desquels put() attend
+        on_result: Fonction (éventuellement asynchrone) appelée avec le
+            processeur, le lot et ses résultats
+    """
+
+    def __init__(
+        self,
+        registry: ProcessorRegistry,
+        policies: Optional[Mapping[EventType, BatchPolicy]] = None,
+        default_policy: BatchPolicy = BatchPolicy(),
+        max_pending: int = 10_000,
+        on_result: Optional[BatchCallback] = None,
+    ) -> None:
+        self._registry = registry
+        self._policies: Dict[str, BatchPolicy] = {
+            EventType(event_type).value: policy for event_type, policy in (policies or {}).items()
+        }
+        self._default_policy = default_policy
+        self._slots = asyncio.Semaphore(max_pending)
+        self._on_result = on_result
+        self._buffers: Dict[Tuple[int, str], _Buffer] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.events = 0
+
+    async def put(self, event: BaseEvent, on_done: Optional[Callable[[], None]] = None) -> None:
+        """
+        Ajoute un événement aux lots de ses processeurs.
+
+        Args:
+            event: Événement à traiter
+            on_done: Fonction appelée quand tous les lots contenant
+                l'événement ont été traités (par exemple queue.task_done)
+        """
+        handlers = self._registry.route(event)
+        if not handlers:
+            if on_done is not None:
+                on_done()
+            return
+
+        await self._slots.acquire()
+        completion = _Completion(len(handlers), self._release_callback(event, on_done))
+        policy = self._policies.get(event.type, self._default_policy)
+        for processor in handlers:
+            key = (id(processor), event.type)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = _Buffer(processor, policy)
+            buffer.events.append(event)
+            buffer.completions.append(completion)
+            if len(buffer.events) >= policy.max_size:
+                self._flush(buffer)
+            elif buffer.timer is None:
+                buffer.timer = asyncio.get_running_loop().call_later(policy.max_linger, self._flush, buffer)
+
+    def _release_callback(self, event: BaseEvent, on_done: Optional[Callable[[], None]]) -> Callable[[], None]:
+        release = self._slots.release
+
+        def done() -> None:
+            release()
+            recorder = metrics.active
+            if recorder is not None:
+                recorder.completed(event)
+            if on_done is not None:
+                on_done()
+
+        return done
+
+    async def consume(self, queue: Any) -> None:
+        """
+        Consomme une file indéfiniment (à lancer dans une tâche).
+
+        Chaque événement est marqué terminé (task_done) une fois traité par
+        tous ses processeurs : queue.join() attend donc la fin des lots.
+        """
+        while True:
+            event = await queue.get()
+            await self.put(event, on_done=queue.task_done)
+
+    def _flush(self, buffer: _Buffer) -> None:
+        if buffer.timer is not None:
+            buffer.timer.cancel()
+            buffer.timer = None
+        if not buffer.events:
+            return
+        events, completions = buffer.events, buffer.completions
+        buffer.events, buffer.completions = [], []
+        task = asyncio.get_running_loop().create_task(self._run_batch(buffer, events, completions))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, buffer: _Buffer, events: List[BaseEvent], completions: List[_Completion]) -> None:
+        processor = buffer.processor
+        try:
+            async with buffer.lock:
+                start = time.perf_counter()
+                try:
+                    results = await processor.process_batch(events)
+                    if len(results) != len(events):
+                        raise ValueError(f"process_batch returned {len(results)} results for {len(events)} events")
+                except Exception as exc:
+                    results = [ProcessingResult.failure(processor.name, event.event_id, exc) for event in events]
+                recorder = metrics.active
+                if recorder is not None:
+                    # Chaque événement du lot compte la durée du lot entier
+                    elapsed = time.perf_counter() - start
+                    for event, result in zip(events, results):
+                        recorder.processed(event, processor.name, elapsed, result.success)
+                self.batches += 1
+                self.events += len(events)
+                if self._on_result is not None:
+                    try:
+                        outcome = self._on_result(processor, events, results)
+                        if inspect.isawaitable(outcome):
+                            await outcome
+                    except Exception:
+                        logger.exception("on_result callback failed", processor=processor.name)
+        finally:
+            for completion in completions:
+                completion.done()
+
+    async def flush(self) -> None:
+        """Remet immédiatement tous les lots en cours et attend leur traitement."""
+        for buffer in list(self._buffers.values()):
+            self._flush(buffer)
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
@@ -0,0 +1,347 @@
+"""
+Corrélation d'événements par règles de séquence sur fenêtre glissante.
+
+Une règle décrit une séquence d'étapes (type d'événement, source et champs
+de payload facultatifs) qui doit être observée, pour une même clé de
+corrélation (correlation_id par défaut, éventuellement complétée par la
+source ou un champ du payload), dans un délai donné à partir de la
+première étape :
+
+    CorrelationRule(
+        "upload_notified",
+        [EventType.FILE_CREATED, EventType.EMAIL_RECEIVED],
+        within=30.0,
+        by=("correlation_id", "source"),
+    )
+
+L'évaluation est incrémentale : chaque couple (règle, clé) ouvert possède
+un état (étape atteinte, échéance, event_id déjà associés) mis à jour à
+l'arrivée de chaque événement, sans relecture de l'historique. Les règles
+sont indexées par (type, source) : un événement ne touche que les étapes
+qui peuvent le reconnaître, et son coût ne dépend pas du nombre total de
+règles. Une règle satisfaite produit un CorrelationEvent, remis à la file
+de sortie.
+
+Les états ouverts sont rangés par durée de fenêtre : à durée égale, l'ordre
+d'insertion est celui des échéances. L'expiration et l'éviction de la
+séquence la plus proche de son échéance (au-delà de max_open) coûtent O(1)
+amorti par durée de fenêtre distincte.
+
+Sémantique : une seule séquence est suivie par couple (règle, clé). Un
+événement de la première étape redémarre la fenêtre tant que la séquence
+n'a pas dépassé cette étape ; il est ignoré ensuite. Un événement qui fait
+progresser une séquence ne démarre pas de nouvelle séquence pour la même
+règle. Les délais sont mesurés à l'arrivée des événements (horloge du
+moteur), pas sur leur horodatage.
+"""
+
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import structlog
+
+from ..core.events import BaseEvent, CorrelationEvent, EventType, Priority
+from .base import AbstractProcessor, ProcessingResult
+
+logger = structlog.get_logger(__name__)
+
+# Au-delà, le cache des routes (type, source) est vidé
+_MAX_ROUTES = 10_000
+
+_MISSING = object()
+
+_Route = Tuple[Tuple[int, int], ...]
+# (règle, valeurs de la clé...) : un seul tuple par séquence ouverte
+_Slot = Tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class PatternStep:
+    """
+    Étape d'une règle de corrélation.
+
+    Args:
+        type: Type d'événement attendu
+        source: Source attendue, None pour toutes
+        where: Valeurs attendues de champs du payload
+    """
+
+    type: EventType
+    source: Optional[str] = None
+    where: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "type", EventType(self.type).value)
+
+    def matches(self, event: BaseEvent) -> bool:
+        """Vérifie les champs du payload (type et source sont résolus par l'index)."""
+        payload = event.payload
+        return all(payload.get(name) == value for name, value in self.where.items())
+
+
+@dataclass(frozen=True)
+class CorrelationRule:
+    """
+    Séquence d'étapes à observer pour une même clé dans un délai donné.
+
+    Args:
+        name: Nom de la règle, repris dans le payload des événements émis
+        steps: Étapes dans l'ordre attendu (EventType ou PatternStep)
+        within: Délai maximal en secondes entre la première et la dernière
+            étape
+        by: Champs formant la clé de corrélation : attributs de l'événement
+            (correlation_id, source) ou champs du payload ("payload.<nom>") ;
+            un événement dont l'un de ces champs est absent est ignoré
+        priority: Priorité des événements émis
+    """
+
+    name: str
+    steps: Sequence[Union[EventType, PatternStep]]
+    within: float
+    by: Tuple[str, ...] = ("correlation_id",)
+    priority: Priority = Priority.NORMAL
+
+    def __post_init__(self) -> None:
+        steps = tuple(step if isinstance(step, PatternStep) else PatternStep(step) for step in self.steps)
+        if len(steps) < 2:
+            raise ValueError("A correlation rule needs at least 2 steps")
+        if self.within <= 0:
+            raise ValueError("within must be positive")
+        if not self.by:
+            raise ValueError("by must name at least one field")
+        object.__setattr__(self, "steps", steps)
+        object.__setattr__(self, "by", tuple(self.by))
+
+
+def _key_getter(fields: Tuple[str, ...]) -> Callable[[BaseEvent], Tuple[Any, ...]]:
+    """Fonction d'extraction de la clé de corrélation."""
+    getters = []
+    for name in fields:
+        if name.startswith("payload."):
+            getters.append(lambda event, _name=name[len("payload."):]: event.payload.get(_name))
+        elif name in BaseEvent.model_fields:
+            getters.append(operator.attrgetter(name))
+        else:
+            raise ValueError(f"Unknown correlation field: {name!r}")
+    return lambda event: tuple(getter(event) for getter in getters)
+
+
+class _Run:
+    """Séquence en cours pour un couple (règle, clé)."""
+
+    __slots__ = ("deadline", "step", "event_ids")
+
+    def __init__(self, deadline: float, event_id: str) -> None:
+        self.deadline = deadline
+        self.step = 1
+        self.event_ids: Tuple[str, ...] = (event_id,)
+
+
+class CorrelationEngine(AbstractProcessor):
+    """
+    Moteur de corrélation incrémental, utilisable comme processeur.
+
+    Args:
+        rules: Règles évaluées
+        sink: File recevant les CorrelationEvent émis (put()), None pour
+            les seuls retourner par offer()
+        max_open: Nombre maximum de séquences ouvertes ; au-delà, la plus
+            proche de son échéance est abandonnée
+        source: Source des événements émis
+        clock: Horloge monotone en secondes
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[CorrelationRule],
+        sink: Any = None,
+        max_open: int = 1_000_000,
+        source: str = "correlation",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self._rules: List[CorrelationRule] = list(rules)
+        names = [rule.name for rule in self._rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Correlation rule names must be unique")
+        self._sink = sink
+        self._max_open = max_open
+        self._source = source
+        self._clock = clock
+
+        # (type, source ou None) -> (règle, étape), étapes décroissantes par règle
+        self._index: Dict[Tuple[str, Optional[str]], List[Tuple[int, int]]] = {}
+        for rule_index, rule in enumerate(self._rules):
+            for step_index in range(len(rule.steps) - 1, -1, -1):
+                step = rule.steps[step_index]
+                self._index.setdefault((step.type, step.source), []).append((rule_index, step_index))
+        self._types = frozenset(event_type for event_type, _ in self._index)
+        self._routes: Dict[Tuple[str, str], _Route] = {}
+
+        getters: Dict[Tuple[str, ...], Callable[[BaseEvent], Tuple[Any, ...]]] = {}
+        self._keys = [getters.setdefault(rule.by, _key_getter(rule.by)) for rule in self._rules]
+
+        # Durée de fenêtre -> séquences ouvertes, par échéance croissante
+        self._windows: Dict[float, "OrderedDict[_Slot, _Run]"] = {}
+        self._runs = [self._windows.setdefault(rule.within, OrderedDict()) for rule in self._rules]
+        self._open = 0
+
+        self.matched = 0
+        self.expired = 0
+        self.evicted = 0
+
+    @property
+    def rules(self) -> List[CorrelationRule]:
+        """Règles évaluées, dans l'ordre de déclaration."""
+        return list(self._rules)
+
+    @property
+    def open(self) -> int:
+        """Nombre de séquences ouvertes."""
+        return self._open
+
+    def _route(self, event_type: str, source: str) -> _Route:
+        """Étapes pouvant reconnaître un événement, groupées par règle."""
+        route = self._routes.get((event_type, source))
+        if route is None:
+            entries = self._index.get((event_type, source), []) + self._index.get((event_type, None), [])
+            route = tuple(sorted(entries, key=lambda entry: (entry[0], -entry[1])))
+            if len(self._routes) >= _MAX_ROUTES:
+                self._routes.clear()
+            self._routes[(event_type, source)] = route
+        return route
+
+    def offer(self, event: BaseEvent) -> List[CorrelationEvent]:
+        """
+        Présente un événement aux règles.
+
+        Args:
+            event: Événement reçu
+
+        Returns:
+            Événements composites des règles satisfaites par cet événement
+        """
+        now = self._clock()
+        self.expire(now)
+        route = self._route(event.type, event.source)
+        if not route:
+            return []
+
+        matches: List[CorrelationEvent] = []
+        keys: Dict[Tuple[str, ...], Any] = {}
+        done = -1
+        for rule_index, step_index in route:
+            if rule_index == done:
+                continue
+            rule = self._rules[rule_index]
+            step = rule.steps[step_index]
+            if step.where and not step.matches(event):
+                continue
+            key = keys.get(rule.by, _MISSING)
+            if key is _MISSING:
+                key = keys[rule.by] = self._keys[rule_index](event)
+                if None in key:
+                    key = keys[rule.by] = None
+            if key is None:
+                continue
+
+            runs = self._runs[rule_index]
+            slot = (rule_index,) + key
+            try:
+                run = runs.get(slot)
+            except TypeError:
+                # Valeur de clé non hachable : événement non corrélable
+                continue
+
+            if run is not None and run.step == step_index:
+                run.event_ids += (event.event_id,)
+                run.step += 1
+                if run.step == len(rule.steps):
+                    del runs[slot]
+                    self._open -= 1
+                    matches.append(self._emit(rule, key, run, event))
+                done = rule_index
+            elif step_index == 0:
+                if run is None:
+                    runs[slot] = _Run(now + rule.within, event.event_id)
+                    self._open += 1
+                    if self._open > self._max_open:
+                        self._evict()
+                elif run.step == 1:
+                    run.deadline = now + rule.within
+                    run.event_ids = (event.event_id,)
+                    runs.move_to_end(slot)
+                done = rule_index
+        return matches
+
+    def _emit(self, rule: CorrelationRule, key: Tuple[Any, ...], run: _Run, event: BaseEvent) -> CorrelationEvent:
+        self.matched += 1
+        return CorrelationEvent(
+            source=self._source,
+            correlation_id=event.correlation_id,
+            priority=rule.priority,
+            payload={"rule": rule.name, "key": dict(zip(rule.by, key)), "events": list(run.event_ids)},
+        )
+
+    def _evict(self) -> None:
+        """Abandonne la séquence ouverte la plus proche de son échéance."""
+        oldest = min(
+            (runs for runs in self._windows.values() if runs),
+            key=lambda runs: next(iter(runs.values())).deadline,
+        )
+        oldest.popitem(last=False)
+        self._open -= 1
+        self.evicted += 1
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Abandonne les séquences dont la fenêtre est écoulée.
+
+        Args:
+            now: Instant de référence (horloge du moteur par défaut)
+
+        Returns:
+            Nombre de séquences abandonnées
+        """
+        if now is None:
+            now = self._clock()
+        expired = 0
+        for runs in self._windows.values():
+            while runs:
+                run = next(iter(runs.values()))
+                if run.deadline >= now:
+                    break
+                runs.popitem(last=False)
+                expired += 1
+        if expired:
+            self._open -= expired
+            self.expired += expired
+        return expired
+
+    # Interface processeur
+
+    def can_handle(self, event_type: str) -> bool:
+        """Types d'événements présents dans au moins une règle."""
+        return EventType(event_type).value in self._types
+
+    async def health_check(self) -> bool:
+        """Le moteur est sain tant qu'il n'abandonne pas de séquences faute de place."""
+        return self._open < self._max_open
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        """Évalue l'événement et remet les événements composites à la file de sortie."""
+        matches = self.offer(event)
+        for match in matches:
+            logger.debug("Correlation matched", rule=match.payload["rule"], event_id=match.event_id)
+            if self._sink is not None:
+                await self._sink.put(match)
+        return ProcessingResult(
+            processor=self.name,
+            event_id=event.event_id,
+            success=True,
+            data={"matched": [match.event_id for match in matches]},
+        )
@@ -0,0 +1,226 @@
+"""
+Moteur de consommation concurrent.
+
+Le WorkerPool consomme une file d'événements avec N workers asyncio. Les
+événements partageant une clé d'ordonnancement (correlation_id, à défaut
+source) sont traités strictement dans l'ordre, un à la fois ; les
+événements sans lien sont traités en parallèle.
+
+Chaque clé active possède un couloir (deque) : le dispatcher y ajoute les
+événements retirés de la file, et un couloir n'est confié qu'à un seul
+worker à la fois. L'événement en cours reste en tête de son couloir
+jusqu'à la fin de son traitement, ce qui garantit l'ordre par clé.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, Dict, Hashable, List, Mapping, Optional
+
+import structlog
+
+from ..core.events import BaseEvent, EventType
+from ..observability import metrics
+from .base import AbstractProcessor, BlockingProcessor, ProcessingResult
+from .registry import ProcessorRegistry
+
+OrderingKey = Callable[[BaseEvent], Optional[Hashable]]
+ResultCallback = Callable[[BaseEvent, List[ProcessingResult]], Any]
+
+_UNLIMITED = contextlib.nullcontext()
+
+logger = structlog.get_logger(__name__)
+
+
+def ordering_key(event: BaseEvent) -> Hashable:
+    """Clé d'ordonnancement par défaut : correlation_id, sinon source."""
+    return event.correlation_id or event.source
+
+
+class WorkerPool:
+    """
+    Consommateur concurrent à ordre garanti par clé.
+
+    Args:
+        queue: File source exposant get() et task_done()
+            (PriorityEventQueue, asyncio.Queue)
+        registry: Registre routant les événements vers les processeurs
+        workers: Nombre de workers asyncio
+        key: Clé d'ordonnancement ; None pour un événement sans contrainte
+        type_limits: Traitements simultanés maximum par EventType
+        processor_limits: Appels simultanés maximum par nom de processeur
+            (intégrations externes)
+        max_pending: Événements retirés de la file et non encore traités
+            au-delà desquels le dispatcher cesse de consommer
+        executor: Exécuteur des BlockingProcessor (pool de threads ou de
+            processus), par défaut celui de la boucle
+        on_result: Fonction (éventuellement asynchrone) appelée avec chaque
+            événement traité et ses résultats
+    """
+
+    def __init__(
+        self,
+        queue: Any,
+        registry: ProcessorRegistry,
+        workers: int = 8,
+        key: OrderingKey = ordering_key,
+        type_limits: Optional[Mapping[EventType, int]] = None,
+        processor_limits: Optional[Mapping[str, int]] = None,
+        max_pending: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._queue = queue
+        self._registry = registry
+        self._workers = workers
+        self._key = key
+        self._type_limits: Dict[str, asyncio.Semaphore] = {
+            EventType(event_type).value: asyncio.Semaphore(limit)
+            for event_type, limit in (type_limits or {}).items()
+        }
+        self._processor_limits: Dict[str, asyncio.Semaphore] = {
+            name: asyncio.Semaphore(limit) for name, limit in (processor_limits or {}).items()
+        }
+        self._max_pending = max_pending or workers * 16
+        self._slots = asyncio.Semaphore(self._max_pending)
+        self._executor = executor
+        self._on_result = on_result
+
+        self._lanes: Dict[Hashable, Deque[BaseEvent]] = {}
+        self._ready: "asyncio.Queue[Hashable]" = asyncio.Queue()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+        self.processed = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Indique si le pool consomme la file."""
+        return self._dispatcher is not None
+
+    @property
+    def pending(self) -> int:
+        """Événements retirés de la file et non encore traités."""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    async def start(self) -> None:
+        """Démarre le dispatcher et les workers."""
+        if self.running:
+            raise RuntimeError("WorkerPool is already running")
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self._workers)]
+
+    async def stop(self, drain: bool = True) -> List[BaseEvent]:
+        """
+        Arrête le pool.
+
+        Args:
+            drain: Si True, attend que la file et les couloirs soient vides ;
+                sinon s'arrête dès les traitements en cours terminés
+
+        Returns:
+            Événements retirés de la file mais non traités (vide si drain),
+            marqués terminés dans la file : à remettre en file si besoin
+        """
+        if not self.running:
+            return []
+        if drain:
+            await self._queue.join()
+        self._dispatcher.cancel()
+        await asyncio.gather(self._dispatcher, return_exceptions=True)
+        self._dispatcher = None
+
+        # Les workers terminent l'événement en cours, puis s'arrêtent
+        self._stopping = True
+        for _ in self._tasks:
+            self._ready.put_nowait(None)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        unprocessed = [event for lane in self._lanes.values() for event in lane]
+        for _ in unprocessed:
+            self._queue.task_done()
+        self._lanes.clear()
+        self._ready = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self._max_pending)
+        self._stopping = False
+        return unprocessed
+
+    async def __aenter__(self) -> "WorkerPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _dispatch(self) -> None:
+        while True:
+            await self._slots.acquire()
+            event = await self._queue.get()
+            key = self._key(event)
+            if key is None:
+                key = object()
+            lane = self._lanes.get(key)
+            if lane is None:
+                self._lanes[key] = deque((event,))
+                self._ready.put_nowait(key)
+            else:
+                lane.append(event)
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._ready.get()
+            if key is None or self._stopping:
+                return
+            lane = self._lanes[key]
+            try:
+                await self._process(lane[0])
+            finally:
+                lane.popleft()
+                if lane:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._lanes[key]
+                self._slots.release()
+                self._queue.task_done()
+
+    async def _process(self, event: BaseEvent) -> None:
+        results = []
+        recorder = metrics.active
+        async with self._type_limits.get(event.type, _UNLIMITED):
+            for processor in self._registry.route(event):
+                async with self._processor_limits.get(processor.name, _UNLIMITED):
+                    start = time.perf_counter()
+                    result = await self._invoke(processor, event)
+                    if recorder is not None:
+                        recorder.processed(event, processor.name, time.perf_counter() - start, result.success)
+                    results.append(result)
+        if recorder is not None:
+            recorder.completed(event)
+
+        self.processed += 1
+        if not all(result.success for result in results):
+            self.failed += 1
+        if self._on_result is not None:
+            try:
+                outcome = self._on_result(event, results)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception:
+                logger.exception("on_result callback failed", event_id=event.event_id)
+
+    async def _invoke(self, processor: AbstractProcessor, event: BaseEvent) -> ProcessingResult:
+        try:
+            if self._executor is not None and isinstance(processor, BlockingProcessor):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, processor.process_blocking, event)
+            return await processor.process_event(event)
+        except Exception as exc:
+            return ProcessingResult.failure(processor.name, event.event_id, exc)
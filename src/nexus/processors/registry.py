@@ -0,0 +1,194 @@
+"""
+Registre des processeurs et routage des événements.
+
+Plutôt que d'interroger chaque processeur (can_handle) pour chaque
+événement, le registre précalcule une table de routage indexée par type
+d'événement, et par couple (type, source) pour les processeurs restreints
+à certaines sources. La table n'est reconstruite qu'à l'enregistrement ou
+au retrait d'un processeur : le routage est une simple recherche dans un
+dictionnaire, quel que soit le nombre de processeurs.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..core.events import BaseEvent, EventType
+from .base import AbstractProcessor, ProcessingResult
+
+Handlers = Tuple[AbstractProcessor, ...]
+
+
+class _Registration:
+    """Processeur enregistré et types/sources résolus."""
+
+    __slots__ = ("processor", "event_types", "sources", "fallback")
+
+    def __init__(
+        self,
+        processor: AbstractProcessor,
+        event_types: Tuple[str, ...],
+        sources: Optional[Tuple[str, ...]],
+        fallback: bool,
+    ) -> None:
+        self.processor = processor
+        self.event_types = event_types
+        self.sources = sources
+        self.fallback = fallback
+
+
+class ProcessorRegistry:
+    """
+    Registre centralisé des processeurs (Strategy Pattern).
+
+    Un événement est routé vers tous les processeurs enregistrés pour son
+    type (et sa source, le cas échéant), dans l'ordre d'enregistrement.
+    Les processeurs de repli ne reçoivent que les événements qu'aucun
+    autre processeur ne traite.
+    """
+
+    def __init__(self) -> None:
+        self._registrations: List[_Registration] = []
+        self._by_type: Dict[str, Handlers] = {}
+        self._by_type_source: Dict[Tuple[str, str], Handlers] = {}
+        self._fallback: Handlers = ()
+
+    def register(
+        self,
+        processor: AbstractProcessor,
+        event_types: Optional[Iterable[EventType]] = None,
+        sources: Optional[Iterable[str]] = None,
+        fallback: bool = False,
+    ) -> None:
+        """
+        Enregistre un processeur et reconstruit la table de routage.
+
+        Args:
+            processor: Processeur à enregistrer
+            event_types: Types traités ; par défaut, ceux pour lesquels
+                can_handle() répond True
+            sources: Sources traitées ; par défaut processor.sources
+                (None : toutes)
+            fallback: Processeur de repli, appelé uniquement pour les
+                événements sans autre processeur
+
+        Raises:
+            ValueError: Si le processeur est déjà enregistré
+        """
+        if processor in self:
+            raise ValueError(f"Processor {processor.name} is already registered")
+        if event_types is None:
+            types = tuple(t.value for t in EventType if processor.can_handle(t))
+        else:
+            types = tuple(EventType(t).value for t in event_types)
+        if sources is None:
+            sources = processor.sources
+        self._registrations.append(_Registration(
+            processor,
+            types,
+            tuple(sources) if sources is not None else None,
+            fallback,
+        ))
+        self._rebuild()
+
+    def unregister(self, processor: AbstractProcessor) -> None:
+        """
+        Retire un processeur et reconstruit la table de routage.
+
+        Raises:
+            KeyError: Si le processeur n'est pas enregistré
+        """
+        remaining = [r for r in self._registrations if r.processor is not processor]
+        if len(remaining) == len(self._registrations):
+            raise KeyError(processor.name)
+        self._registrations = remaining
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        by_type: Dict[str, List[AbstractProcessor]] = {}
+        scoped: Dict[Tuple[str, str], List[AbstractProcessor]] = {}
+        fallback: List[AbstractProcessor] = []
+        for registration in self._registrations:
+            if registration.fallback:
+                fallback.append(registration.processor)
+                continue
+            for event_type in registration.event_types:
+                if registration.sources is None:
+                    by_type.setdefault(event_type, [])
+                for source in registration.sources or ():
+                    scoped.setdefault((event_type, source), [])
+
+        # Chaque entrée liste les processeurs dans l'ordre d'enregistrement :
+        # une entrée (type, source) inclut les processeurs toutes sources.
+        for registration in self._registrations:
+            if registration.fallback:
+                continue
+            for event_type in registration.event_types:
+                if registration.sources is None:
+                    by_type[event_type].append(registration.processor)
+                    for (scoped_type, _), handlers in scoped.items():
+                        if scoped_type == event_type:
+                            handlers.append(registration.processor)
+                else:
+                    for source in registration.sources:
+                        scoped[(event_type, source)].append(registration.processor)
+
+        self._fallback = tuple(fallback)
+        self._by_type = {key: tuple(handlers) for key, handlers in by_type.items()}
+        self._by_type_source = {key: tuple(handlers) for key, handlers in scoped.items()}
+
+    def route(self, event: BaseEvent) -> Handlers:
+        """
+        Retourne les processeurs d'un événement.
+
+        Args:
+            event: Événement à router (BaseEvent ou CompactEvent)
+
+        Returns:
+            Processeurs à appeler, les processeurs de repli si aucun autre
+        """
+        if self._by_type_source:
+            handlers = self._by_type_source.get((event.type, event.source))
+            if handlers is not None:
+                return handlers
+        return self._by_type.get(event.type) or self._fallback
+
+    async def dispatch(self, event: BaseEvent) -> List[ProcessingResult]:
+        """
+        Fait traiter un événement par ses processeurs, dans l'ordre.
+
+        L'échec d'un processeur (exception) est rapporté dans son résultat
+        et n'empêche pas les suivants de traiter l'événement.
+
+        Args:
+            event: Événement à traiter
+
+        Returns:
+            Un résultat par processeur appelé
+        """
+        results = []
+        for processor in self.route(event):
+            try:
+                results.append(await processor.process_event(event))
+            except Exception as exc:
+                results.append(ProcessingResult.failure(processor.name, event.event_id, exc))
+        return results
+
+    async def health_check(self) -> Dict[str, bool]:
+        """Retourne l'état de santé de chaque processeur enregistré."""
+        status = {}
+        for processor in self.processors:
+            try:
+                status[processor.name] = await processor.health_check()
+            except Exception:
+                status[processor.name] = False
+        return status
+
+    @property
+    def processors(self) -> Sequence[AbstractProcessor]:
+        """Processeurs enregistrés, dans l'ordre d'enregistrement."""
+        return [registration.processor for registration in self._registrations]
+
+    def __contains__(self, processor: object) -> bool:
+        return any(registration.processor is processor for registration in self._registrations)
+
+    def __len__(self) -> int:
+        return len(self._registrations)
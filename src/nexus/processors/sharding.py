@@ -0,0 +1,309 @@
+"""
+Pipeline multi-processus partitionné par clé.
+
+Une seule boucle asyncio n'utilise qu'un cœur. ShardedPipeline répartit
+les événements entre N processus (shards) : le processus frontal calcule
+la clé de chaque événement (source, ou correlation_id à défaut source),
+la hache (CRC32, stable d'une exécution à l'autre) et écrit les
+événements de chaque shard en un lot binaire de nexus.core.codec dans un
+anneau en mémoire partagée (ShmRing). Chaque shard relit ses lots sans
+revalidation, les met dans sa propre PriorityEventQueue et les fait
+traiter par un WorkerPool et un registre de processeurs qui lui sont
+propres.
+
+Ordre : tous les événements d'une clé passent par le même shard, dans un
+anneau FIFO, et le WorkerPool du shard ordonne par la même clé.
+
+Arrêt : stop() écrit un marqueur de fin dans chaque anneau ; chaque shard
+lit tout ce qui précède, vide sa file et ses couloirs, renvoie ses
+compteurs et se termine.
+
+Le frontal expose put(), put_many_nowait() et qsize() : il peut remplacer
+la PriorityEventQueue d'un EventReceiver (un lot HTTP est refusé en 429
+si un anneau n'a pas la place).
+
+    async with ShardedPipeline(build_registry, shards=4) as pipeline:
+        await pipeline.put_many(events)
+"""
+
+import asyncio
+import os
+import signal
+import zlib
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import structlog
+
+from ..core.codec import decode_events, encode_events
+from ..core.events import BaseEvent
+from ..observability import disable_metrics
+from ..queue.priority import PriorityEventQueue
+from ..queue.ring import ShmRing
+from .engine import WorkerPool, ordering_key
+from .registry import ProcessorRegistry
+
+RegistryFactory = Callable[[], ProcessorRegistry]
+
+logger = structlog.get_logger(__name__)
+
+# Attente maximale d'un anneau avant de vérifier que le shard est vivant
+_POLL = 0.1
+
+
+def source_key(event: BaseEvent) -> Hashable:
+    """Clé de partition par source."""
+    return event.source
+
+
+PARTITION_KEYS: Dict[str, Callable[[BaseEvent], Hashable]] = {
+    "source": source_key,
+    "correlation_id": ordering_key,
+}
+
+
+def _shard_main(index: int, ring: ShmRing, factory: RegistryFactory, by: str, workers: int,
+                queue_capacity: int, results: Any) -> None:
+    """Point d'entrée d'un processus shard."""
+    # Le frontal décide de l'arrêt (SIGINT du terminal ignoré) ; les
+    # métriques héritées par fork ne seraient jamais exportées
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    disable_metrics()
+    try:
+        stats = asyncio.run(_serve_shard(ring, factory, by, workers, queue_capacity))
+        results.send({"shard": index, **stats})
+    except BaseException as exc:
+        results.send({"shard": index, "error": f"{type(exc).__name__}: {exc}"})
+        raise
+    finally:
+        results.close()
+        ring.close()
+
+
+async def _serve_shard(ring: ShmRing, factory: RegistryFactory, by: str, workers: int,
+                       queue_capacity: int) -> Dict[str, int]:
+    """Relit l'anneau jusqu'au marqueur de fin, puis vide la file du shard."""
+    loop = asyncio.get_running_loop()
+    queue = PriorityEventQueue(capacity=queue_capacity)
+    pool = WorkerPool(queue, factory(), workers=workers, key=PARTITION_KEYS[by])
+    received = 0
+    async with pool:
+        while True:
+            try:
+                record = ring.read()
+            except EOFError:
+                break
+            if record is None:
+                await loop.run_in_executor(None, ring.wait_readable, _POLL)
+                continue
+            for event in decode_events(record, trusted=True):
+                await queue.put(event)
+                received += 1
+    return {"received": received, "processed": pool.processed, "failed": pool.failed}
+
+
+class ShardedPipeline:
+    """
+    Répartiteur d'événements entre processus, à ordre garanti par clé.
+
+    Args:
+        registry_factory: Fonction sans argument construisant le registre
+            de processeurs d'un shard, appelée dans chaque processus (doit
+            être importable si la méthode de démarrage est ``spawn``)
+        shards: Nombre de processus, par défaut le nombre de cœurs
+        by: Clé de partition et d'ordonnancement : ``source`` ou
+            ``correlation_id`` (à défaut source)
+        workers: Workers asyncio du WorkerPool de chaque shard
+        ring_capacity: Taille de chaque anneau, en octets
+        queue_capacity: Capacité par priorité de la file de chaque shard
+        start_method: Méthode de démarrage multiprocessing (fork, spawn,
+            forkserver), par défaut celle de la plateforme
+    """
+
+    def __init__(
+        self,
+        registry_factory: RegistryFactory,
+        shards: Optional[int] = None,
+        by: str = "source",
+        workers: int = 8,
+        ring_capacity: int = 8 * 1024 * 1024,
+        queue_capacity: int = 10_000,
+        start_method: Optional[str] = None,
+    ) -> None:
+        if by not in PARTITION_KEYS:
+            raise ValueError(f"by must be one of {sorted(PARTITION_KEYS)}")
+        self._shards = shards or os.cpu_count() or 1
+        if self._shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._factory = registry_factory
+        self._by = by
+        self._key = PARTITION_KEYS[by]
+        self._workers = workers
+        self._ring_capacity = ring_capacity
+        self._queue_capacity = queue_capacity
+        self._context = get_context(start_method)
+
+        self._rings: List[ShmRing] = []
+        self._processes: List[Any] = []
+        self._results: List[Any] = []
+        self._closed = False
+
+        self.submitted = 0
+        self.stats: List[Dict[str, Any]] = []
+
+    @property
+    def shards(self) -> int:
+        """Nombre de processus shards."""
+        return self._shards
+
+    @property
+    def running(self) -> bool:
+        """Indique si les shards sont démarrés et non arrêtés."""
+        return bool(self._processes) and not self._closed
+
+    def shard_of(self, event: BaseEvent) -> int:
+        """Indice du shard d'un événement."""
+        return zlib.crc32(str(self._key(event)).encode()) % self._shards
+
+    def qsize(self) -> int:
+        """Événements écrits dans les anneaux et pas encore relus par les shards."""
+        return sum(ring.backlog() for ring in self._rings)
+
+    # Cycle de vie
+
+    async def start(self) -> None:
+        """Crée les anneaux et démarre les processus shards."""
+        if self._processes:
+            raise RuntimeError("ShardedPipeline is already started")
+        for index in range(self._shards):
+            ring = ShmRing(self._ring_capacity, self._context)
+            receiver, sender = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_shard_main,
+                args=(index, ring, self._factory, self._by, self._workers, self._queue_capacity, sender),
+                name=f"nexus-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            self._rings.append(ring)
+            self._processes.append(process)
+            self._results.append(receiver)
+        logger.info("Sharded pipeline started", shards=self._shards, by=self._by)
+
+    async def stop(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Arrête les shards après traitement de tous les événements soumis.
+
+        Args:
+            timeout: Attente maximale de chaque shard, en secondes ; au-delà
+                le processus est terminé de force
+
+        Returns:
+            Compteurs de chaque shard (received, processed, failed, ou error)
+        """
+        if not self._processes or self._closed:
+            return self.stats
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        for ring in self._rings:
+            ring.close_writer()
+        for index, (process, results) in enumerate(zip(self._processes, self._results)):
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                process.terminate()
+                await loop.run_in_executor(None, process.join)
+            stats = results.recv() if results.poll() else {"shard": index, "error": f"exit code {process.exitcode}"}
+            results.close()
+            if "error" in stats:
+                logger.error("Shard failed", **stats)
+            self.stats.append(stats)
+        for ring in self._rings:
+            ring.close()
+        return self.stats
+
+    async def __aenter__(self) -> "ShardedPipeline":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    # Soumission
+
+    def _encode(self, events: Sequence[BaseEvent]) -> List[Tuple[int, bytes, int]]:
+        """Lots (shard, octets, nombre d'événements), dans l'ordre des shards."""
+        if self._closed or not self._processes:
+            raise RuntimeError("ShardedPipeline is not running")
+        groups: List[List[BaseEvent]] = [[] for _ in range(self._shards)]
+        key, shards = self._key, self._shards
+        for event in events:
+            groups[zlib.crc32(str(key(event)).encode()) % shards].append(event)
+        batches = []
+        for index, group in enumerate(groups):
+            if group:
+                batches.extend((index, data, count) for data, count in self._split(group, self._rings[index]))
+        return batches
+
+    def _split(self, group: List[BaseEvent], ring: ShmRing) -> List[Tuple[bytes, int]]:
+        """Encode un groupe en lots ne dépassant pas la taille maximale d'un enregistrement."""
+        data = encode_events(group)
+        if len(data) <= ring.max_record:
+            return [(data, len(group))]
+        if len(group) == 1:
+            raise ValueError(f"Event {group[0].event_id} exceeds ring record maximum of {ring.max_record} bytes")
+        middle = len(group) // 2
+        return self._split(group[:middle], ring) + self._split(group[middle:], ring)
+
+    def put_many_nowait(self, events: Sequence[BaseEvent]) -> None:
+        """
+        Soumet des événements en entier ou pas du tout.
+
+        Raises:
+            asyncio.QueueFull: Si un des anneaux concernés n'a pas la place
+            RuntimeError: Si le pipeline n'est pas démarré ou est arrêté
+        """
+        batches = self._encode(events)
+        sizes: Dict[int, List[int]] = {}
+        for index, data, _ in batches:
+            sizes.setdefault(index, []).append(len(data))
+        if not all(self._rings[index].fits(*record_sizes) for index, record_sizes in sizes.items()):
+            raise asyncio.QueueFull
+        for index, data, count in batches:
+            self._rings[index].try_write(data, count)
+        self.submitted += len(events)
+
+    def put_nowait(self, event: BaseEvent) -> None:
+        """Soumet un événement ; asyncio.QueueFull si son anneau est plein."""
+        self.put_many_nowait((event,))
+
+    async def put_many(self, events: Sequence[BaseEvent]) -> None:
+        """
+        Soumet des événements, en attendant la place dans les anneaux.
+
+        Raises:
+            RuntimeError: Si le pipeline n'est pas démarré, est arrêté, ou
+                si un shard s'est terminé
+        """
+        loop = asyncio.get_running_loop()
+        for index, data, count in self._encode(events):
+            ring = self._rings[index]
+            while not ring.try_write(data, count):
+                if not self._processes[index].is_alive():
+                    raise RuntimeError(f"Shard {index} exited with code {self._processes[index].exitcode}")
+                await loop.run_in_executor(None, ring.wait_writable, len(data), _POLL)
+        self.submitted += len(events)
+
+    async def put(self, event: BaseEvent) -> None:
+        """Soumet un événement, en attendant la place dans son anneau."""
+        await self.put_many((event,))
+
+    @property
+    def processed(self) -> int:
+        """Événements traités par les shards arrêtés."""
+        return sum(stats.get("processed", 0) for stats in self.stats)
+
+    @property
+    def failed(self) -> int:
+        """Événements en échec dans les shards arrêtés."""
+        return sum(stats.get("failed", 0) for stats in self.stats)
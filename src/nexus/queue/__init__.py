@@ -0,0 +1,30 @@
+"""
+Files d'attente des événements Nexus.
+"""
+
+from .dead_letter import (
+    DeadLetter,
+    DeadLetterReason,
+    DeadLetterSink,
+    DeadLetterStore,
+    MemoryDeadLetterSink,
+)
+from .dedup import CoalescingStage
+from .log import EventLog, LogCorruptionError, LogRecord
+from .priority import OverflowPolicy, PriorityEventQueue
+from .ring import ShmRing
+
+__all__ = [
+    "CoalescingStage",
+    "DeadLetter",
+    "DeadLetterReason",
+    "DeadLetterSink",
+    "DeadLetterStore",
+    "EventLog",
+    "LogCorruptionError",
+    "LogRecord",
+    "MemoryDeadLetterSink",
+    "OverflowPolicy",
+    "PriorityEventQueue",
+    "ShmRing",
+]
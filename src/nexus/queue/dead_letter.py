@@ -0,0 +1,327 @@
+"""
+Dead letter queue : événements dont le traitement a définitivement échoué.
+
+Les composants qui abandonnent un événement (nouvelles tentatives épuisées,
+erreur non réessayable, plafond atteint, arrêt) le remettent à un
+DeadLetterSink sous forme de DeadLetter, pour analyse et rejeu.
+
+Le DeadLetterStore persiste les entrées dans SQLite (trame binaire de
+l'événement et métadonnées d'échec), avec des index par type, source,
+classe d'erreur et date d'échec. Les requêtes sont paginées par curseur
+(identifiant de la dernière entrée lue) : une panne de plusieurs heures
+peut laisser des millions d'entrées, qui ne sont jamais chargées en bloc.
+"""
+
+import asyncio
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..core.codec import datetime_to_micros, decode_event, encode_event, micros_to_datetime
+from ..core.events import BaseEvent, EventType
+
+
+class DeadLetterReason(str, Enum):
+    """Motif d'abandon d'un événement."""
+
+    EXHAUSTED = "exhausted"
+    REJECTED = "rejected"
+    OVERFLOW = "overflow"
+    SHUTDOWN = "shutdown"
+
+
+@dataclass
+class DeadLetter:
+    """Événement abandonné et contexte de l'échec."""
+
+    integration: str
+    event: BaseEvent
+    reason: DeadLetterReason
+    error: Optional[str] = None
+    attempts: int = 0
+    failed_at: datetime = field(default_factory=datetime.utcnow)
+    letter_id: Optional[int] = None
+
+    @property
+    def error_class(self) -> Optional[str]:
+        """Classe de l'erreur, lue dans le message « Classe: détail »."""
+        if not self.error:
+            return None
+        name = self.error.split(":", 1)[0]
+        return name if name.isidentifier() else None
+
+
+class DeadLetterSink(ABC):
+    """Destination des événements abandonnés."""
+
+    @abstractmethod
+    async def put(self, letter: DeadLetter) -> None:
+        """Enregistre un événement abandonné."""
+        pass
+
+
+class MemoryDeadLetterSink(DeadLetterSink):
+    """
+    Dead letter queue en mémoire, bornée.
+
+    Args:
+        maxlen: Nombre maximum d'entrées conservées (les plus anciennes
+            sont oubliées), None pour ne pas borner
+    """
+
+    def __init__(self, maxlen: Optional[int] = 10_000) -> None:
+        self.letters: Deque[DeadLetter] = deque(maxlen=maxlen)
+
+    async def put(self, letter: DeadLetter) -> None:
+        self.letters.append(letter)
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    source TEXT NOT NULL,
+    integration TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    error_class TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL,
+    failed_at INTEGER NOT NULL,
+    frame BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dead_letters_type ON dead_letters (type, id);
+CREATE INDEX IF NOT EXISTS dead_letters_source ON dead_letters (source, id);
+CREATE INDEX IF NOT EXISTS dead_letters_error_class ON dead_letters (error_class, id);
+CREATE INDEX IF NOT EXISTS dead_letters_failed_at ON dead_letters (failed_at);
+"""
+
+_COLUMNS = "id, integration, reason, error, attempts, failed_at, frame"
+
+# Filtre -> (condition SQL, conversion de la valeur)
+_FILTERS = {
+    "type": ("type = ?", lambda value: EventType(value).value),
+    "source": ("source = ?", str),
+    "error_class": ("error_class = ?", str),
+    "integration": ("integration = ?", str),
+    "reason": ("reason = ?", lambda value: DeadLetterReason(value).value),
+    "since": ("failed_at >= ?", lambda value: datetime_to_micros(value)[0]),
+    "until": ("failed_at < ?", lambda value: datetime_to_micros(value)[0]),
+}
+
+
+class DeadLetterStore(DeadLetterSink):
+    """
+    Dead letter queue persistante (SQLite), indexée et paginée.
+
+    Les opérations s'exécutent dans le thread appelant (boucle asyncio
+    comprise) : chaque écriture est une transaction courte, sans fsync en
+    mode WAL.
+
+    Args:
+        path: Fichier de la base, ":memory:" pour une base en mémoire
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Ferme la base."""
+        self._db.close()
+
+    def __enter__(self) -> "DeadLetterStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def put(self, letter: DeadLetter) -> None:
+        self.add((letter,))
+
+    def add(self, letters: Iterable[DeadLetter]) -> int:
+        """
+        Enregistre des entrées en une seule transaction.
+
+        Returns:
+            Nombre d'entrées enregistrées
+        """
+        rows = (
+            (
+                letter.event.event_id,
+                EventType(letter.event.type).value,
+                letter.event.source,
+                letter.integration,
+                DeadLetterReason(letter.reason).value,
+                letter.error_class,
+                letter.error,
+                letter.attempts,
+                datetime_to_micros(letter.failed_at)[0],
+                encode_event(letter.event),
+            )
+            for letter in letters
+        )
+        with self._db:
+            cursor = self._db.executemany(
+                "INSERT INTO dead_letters (event_id, type, source, integration, reason, error_class, error,"
+                " attempts, failed_at, frame) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _where(filters: Dict[str, Any], after: int = 0, up_to: Optional[int] = None) -> Tuple[str, List[Any]]:
+        conditions = ["id > ?"]
+        params: List[Any] = [after]
+        if up_to is not None:
+            conditions.append("id <= ?")
+            params.append(up_to)
+        for name, value in filters.items():
+            if name not in _FILTERS:
+                raise TypeError(f"Unknown dead letter filter: {name}")
+            if value is None:
+                continue
+            condition, convert = _FILTERS[name]
+            conditions.append(condition)
+            params.append(convert(value))
+        return " AND ".join(conditions), params
+
+    @staticmethod
+    def _letter(row: Tuple[Any, ...]) -> DeadLetter:
+        letter_id, integration, reason, error, attempts, failed_at, frame = row
+        return DeadLetter(
+            integration=integration,
+            event=decode_event(frame, trusted=True),
+            reason=DeadLetterReason(reason),
+            error=error,
+            attempts=attempts,
+            failed_at=micros_to_datetime(failed_at),
+            letter_id=letter_id,
+        )
+
+    def query(self, after: int = 0, limit: int = 100, **filters: Any) -> List[DeadLetter]:
+        """
+        Lit une page d'entrées, de la plus ancienne à la plus récente.
+
+        Args:
+            after: Curseur : letter_id de la dernière entrée de la page
+                précédente (0 pour la première page)
+            limit: Taille de la page
+            **filters: type, source, error_class, integration, reason,
+                since et until (datetime UTC, bornes de failed_at)
+
+        Returns:
+            Entrées de la page ; vide après la dernière page
+        """
+        where, params = self._where(filters, after)
+        rows = self._db.execute(
+            f"SELECT {_COLUMNS} FROM dead_letters WHERE {where} ORDER BY id LIMIT ?", (*params, limit)
+        ).fetchall()
+        return [self._letter(row) for row in rows]
+
+    def scan(self, page_size: int = 1000, up_to: Optional[int] = None, **filters: Any) -> Iterator[DeadLetter]:
+        """
+        Parcourt les entrées correspondant aux filtres, page par page.
+
+        Args:
+            page_size: Entrées lues par requête
+            up_to: letter_id maximal parcouru (entrées ajoutées ensuite ignorées)
+            **filters: Filtres de query()
+        """
+        after = 0
+        while True:
+            where, params = self._where(filters, after, up_to)
+            rows = self._db.execute(
+                f"SELECT {_COLUMNS} FROM dead_letters WHERE {where} ORDER BY id LIMIT ?", (*params, page_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._letter(row)
+            after = rows[-1][0]
+
+    def count(self, **filters: Any) -> int:
+        """Nombre d'entrées correspondant aux filtres de query()."""
+        where, params = self._where(filters)
+        return self._db.execute(f"SELECT COUNT(*) FROM dead_letters WHERE {where}", params).fetchone()[0]
+
+    def delete(self, letter_ids: Iterable[int]) -> int:
+        """
+        Supprime des entrées.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        with self._db:
+            cursor = self._db.executemany("DELETE FROM dead_letters WHERE id = ?", ((i,) for i in letter_ids))
+        return cursor.rowcount
+
+    async def reprocess(
+        self,
+        queue: Any,
+        rate: Optional[float] = None,
+        page_size: int = 500,
+        delete: bool = True,
+        checkpoint: Optional[Callable[[], Awaitable[Any]]] = None,
+        **filters: Any,
+    ) -> int:
+        """
+        Remet en file les événements correspondant aux filtres.
+
+        Les entrées sont lues page par page et remises via ``queue.put``
+        (la back-pressure de la file s'applique), au plus ``rate`` par
+        seconde. Chaque page est supprimée une fois remise en file : un
+        arrêt en cours de route peut rejouer au plus une page. Les entrées
+        ajoutées pendant le rejeu (nouveaux échecs) ne sont pas reprises.
+
+        Args:
+            queue: File de destination exposant une coroutine put()
+            rate: Événements par seconde au maximum, None pour ne pas limiter
+            page_size: Entrées lues et supprimées par transaction
+            delete: Si False, les entrées sont conservées
+            checkpoint: Coroutine attendue avant chaque suppression de page,
+                pour une destination qui doit d'abord rendre les événements
+                durables (ex. synchronisation d'un EventLog)
+            **filters: Filtres de query()
+
+        Returns:
+            Nombre d'événements remis en file
+        """
+        up_to = self._db.execute("SELECT COALESCE(MAX(id), 0) FROM dead_letters").fetchone()[0]
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / rate if rate else 0.0
+        next_at = loop.time()
+        reprocessed = 0
+        page: List[int] = []
+        for letter in self.scan(page_size, up_to=up_to, **filters):
+            if interval:
+                # Attente groupée : pas de sommeil pour chaque événement
+                next_at = max(next_at + interval, loop.time() - 1.0)
+                delay = next_at - loop.time()
+                if delay > 0.005:
+                    await asyncio.sleep(delay)
+            await queue.put(letter.event)
+            reprocessed += 1
+            page.append(letter.letter_id)
+            if len(page) >= page_size:
+                if delete:
+                    await self._delete_page(page, checkpoint)
+                page = []
+        if delete and page:
+            await self._delete_page(page, checkpoint)
+        return reprocessed
+
+    async def _delete_page(self, page: List[int], checkpoint: Optional[Callable[[], Awaitable[Any]]]) -> None:
+        if checkpoint is not None:
+            await checkpoint()
+        self.delete(page)
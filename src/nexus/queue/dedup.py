@@ -0,0 +1,215 @@
+"""
+Déduplication et coalescence des rafales d'événements.
+
+Les éditeurs et clients de synchronisation émettent des dizaines de
+FILE_MODIFIED par seconde pour un même fichier. Pour chaque clé
+(type, source, payload[key_field]), le CoalescingStage ne conserve que le
+dernier événement reçu pendant une fenêtre ouverte par le premier ; il le
+remet à l'échéance et supprime les précédents. La latence ajoutée est donc
+bornée par la fenêtre, même sous un flux continu.
+
+Un événement d'un autre type pour la même ressource (FILE_DELETED après des
+FILE_MODIFIED, par exemple) fait d'abord remettre l'événement retenu : l'ordre
+par ressource est préservé.
+
+Indépendamment, les répétitions d'un même event_id sont écartées grâce à un
+ensemble borné en taille et en durée de rétention.
+
+Toutes les opérations sont en O(1) amorti : les fenêtres ayant la même durée,
+l'ordre d'insertion des clés est aussi celui de leurs échéances.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from ..core.events import BaseEvent, EventType
+
+_Key = Tuple[str, Any]
+
+
+class CoalescingStage:
+    """
+    Fusionne les rafales d'événements et écarte les doublons d'event_id.
+
+    Args:
+        window: Durée en secondes d'une fenêtre de coalescence
+        key_field: Champ du payload identifiant la ressource
+        event_types: Types d'événements fusionnés ; les autres sont
+            seulement dédupliqués
+        max_pending: Nombre maximum de clés retenues ; au-delà, la plus
+            ancienne est remise avant son échéance
+        id_ttl: Durée en secondes pendant laquelle un event_id reste connu
+        max_ids: Nombre maximum d'event_id mémorisés
+        clock: Horloge monotone en secondes
+    """
+
+    def __init__(
+        self,
+        window: float = 0.5,
+        key_field: str = "file_path",
+        event_types: Iterable[EventType] = (EventType.FILE_MODIFIED,),
+        max_pending: int = 10_000,
+        id_ttl: float = 300.0,
+        max_ids: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if max_ids < 1:
+            raise ValueError("max_ids must be at least 1")
+        self._window = window
+        self._key_field = key_field
+        self._event_types = frozenset(EventType(event_type).value for event_type in event_types)
+        self._max_pending = max_pending
+        self._id_ttl = id_ttl
+        self._max_ids = max_ids
+        self._clock = clock
+
+        # (source, valeur) -> [échéance, événement retenu]
+        self._pending: "OrderedDict[_Key, List[Any]]" = OrderedDict()
+        # event_id -> instant de première réception
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+        self.duplicates = 0
+        self.coalesced = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Nombre total d'événements supprimés (doublons et fusions)."""
+        return self.duplicates + self.coalesced
+
+    @property
+    def pending(self) -> int:
+        """Nombre d'événements retenus en attente de leur échéance."""
+        return len(self._pending)
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """Échéance la plus proche, ou None si aucun événement n'est retenu."""
+        if not self._pending:
+            return None
+        return next(iter(self._pending.values()))[0]
+
+    def offer(self, event: BaseEvent) -> List[BaseEvent]:
+        """
+        Présente un événement au stage.
+
+        Args:
+            event: Événement reçu
+
+        Returns:
+            Événements à transmettre maintenant, dans l'ordre : retenus
+            arrivés à échéance, puis éventuellement l'événement lui-même
+        """
+        now = self._clock()
+        released = self.expire(now)
+        if self._is_duplicate(event.event_id, now):
+            self.duplicates += 1
+            return released
+
+        value = event.payload.get(self._key_field)
+        if value is None:
+            released.append(event)
+            return released
+        key = (event.source, value)
+        try:
+            held = self._pending.get(key)
+        except TypeError:
+            # Valeur non hachable : l'événement n'est pas fusionnable
+            released.append(event)
+            return released
+
+        if event.type in self._event_types:
+            if held is not None:
+                if held[1].type == event.type:
+                    held[1] = event
+                    self.coalesced += 1
+                    return released
+                released.append(self._pending.pop(key)[1])
+            self._pending[key] = [now + self._window, event]
+            if len(self._pending) > self._max_pending:
+                released.append(self._pending.popitem(last=False)[1][1])
+        else:
+            if held is not None:
+                released.append(self._pending.pop(key)[1])
+            released.append(event)
+        return released
+
+    def expire(self, now: Optional[float] = None) -> List[BaseEvent]:
+        """
+        Remet les événements retenus dont la fenêtre est écoulée.
+
+        Args:
+            now: Instant de référence (horloge du stage par défaut)
+
+        Returns:
+            Événements arrivés à échéance, du plus ancien au plus récent
+        """
+        if now is None:
+            now = self._clock()
+        released = []
+        pending = self._pending
+        while pending:
+            key, (deadline, event) = next(iter(pending.items()))
+            if deadline > now:
+                break
+            del pending[key]
+            released.append(event)
+        return released
+
+    def drain(self) -> List[BaseEvent]:
+        """Remet immédiatement tous les événements retenus."""
+        released = [event for _, event in self._pending.values()]
+        self._pending.clear()
+        return released
+
+    def _is_duplicate(self, event_id: str, now: float) -> bool:
+        seen = self._seen
+        horizon = now - self._id_ttl
+        while seen and next(iter(seen.values())) <= horizon:
+            seen.popitem(last=False)
+        if event_id in seen:
+            return True
+        seen[event_id] = now
+        if len(seen) > self._max_ids:
+            seen.popitem(last=False)
+        return False
+
+    async def consume(self, source: Any, sink: Any) -> None:
+        """
+        Transfère les événements d'une file vers une autre (à lancer dans une tâche).
+
+        Chaque événement de la source est marqué terminé (task_done) une fois
+        supprimé ou remis à la file de sortie : source.join() attend donc la
+        fin des fenêtres en cours. Après annulation, drain() rend les
+        événements retenus, non encore marqués terminés.
+
+        Args:
+            source: File d'entrée exposant get(), get_nowait() et task_done()
+            sink: File de sortie exposant put()
+        """
+        while True:
+            try:
+                event = source.get_nowait()
+            except asyncio.QueueEmpty:
+                deadline = self.next_deadline
+                timeout = None if deadline is None else max(deadline - self._clock(), 0.0)
+                try:
+                    event = await asyncio.wait_for(source.get(), timeout)
+                except asyncio.TimeoutError:
+                    event = None
+
+            if event is None:
+                released = self.expire()
+            else:
+                suppressed = self.suppressed
+                released = self.offer(event)
+                for _ in range(self.suppressed - suppressed):
+                    source.task_done()
+            for item in released:
+                await sink.put(item)
+                source.task_done()
@@ -0,0 +1,543 @@
+"""
+Journal d'événements durable, en ajout seul.
+
+Le journal est une suite de segments ``<séquence de base>.log`` dans un
+répertoire. Chaque segment commence par un en-tête (magie, version) suivi
+d'enregistrements :
+
+    <II   longueur de la trame, CRC32 de la trame
+    trame d'événement de nexus.core.codec
+
+Chaque événement reçoit un numéro de séquence global. Les ajouts sont
+tamponnés en mémoire puis écrits et synchronisés (fsync) par lots : les
+appels concurrents à append() partagent un même fsync (group commit).
+
+Un index creux (une entrée tous les ``index_interval`` octets) associe
+séquence, position et maxima courants de event_id et d'horodatage ; il
+permet de retrouver un événement ou de rejouer depuis un instant sans lire
+tout le journal, que les identifiants soient monotones ou non. Les lectures
+passent par mmap et exposent les trames sans copie.
+
+À l'ouverture, les segments sont relus et vérifiés ; un enregistrement
+tronqué ou corrompu en fin de journal (arrêt brutal) est supprimé.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ..core.codec import HEADER_SIZE, CodecError, datetime_to_micros, decode_event, decode_header, encode_event
+from ..core.compact import CompactEvent
+from ..core.events import BaseEvent, Event
+
+SEGMENT_MAGIC = b"NXLG"
+LOG_VERSION = 1
+CHECKPOINT_FILE = "checkpoints.json"
+
+_SEGMENT_HEADER = struct.Struct("<4sBxxx")
+_RECORD_HEADER = struct.Struct("<II")
+_MIN_MICROS = -(1 << 63)
+
+LoggableEvent = Union[BaseEvent, CompactEvent]
+
+
+class LogCorruptionError(ValueError):
+    """Segment de journal illisible ailleurs qu'en fin de journal."""
+
+
+class LogRecord(NamedTuple):
+    """Enregistrement lu dans le journal ; la trame est une vue sur le mmap."""
+
+    sequence: int
+    frame: memoryview
+
+
+@dataclass
+class _Segment:
+    """Segment du journal et son index creux."""
+
+    base: int
+    path: Path
+    size: int = _SEGMENT_HEADER.size
+    count: int = 0
+    max_id: str = ""
+    max_micros: int = _MIN_MICROS
+    ordered: bool = True
+    # Entrées d'index : séquence, position, et maxima des enregistrements
+    # qui précèdent l'entrée
+    index_sequences: List[int] = field(default_factory=list)
+    index_positions: List[int] = field(default_factory=list)
+    index_max_ids: List[str] = field(default_factory=list)
+    index_max_micros: List[int] = field(default_factory=list)
+
+    def add(self, length: int, event_id: str, micros: int, interval: int) -> None:
+        """Enregistre un ajout de ``length`` octets à la fin du segment."""
+        if not self.index_positions or self.size - self.index_positions[-1] >= interval:
+            self.index_sequences.append(self.base + self.count)
+            self.index_positions.append(self.size)
+            self.index_max_ids.append(self.max_id)
+            self.index_max_micros.append(self.max_micros)
+        if event_id < self.max_id:
+            self.ordered = False
+        else:
+            self.max_id = event_id
+        if micros > self.max_micros:
+            self.max_micros = micros
+        self.size += length
+        self.count += 1
+
+    def seek_sequence(self, sequence: int) -> Tuple[int, int]:
+        """Retourne l'entrée d'index (séquence, position) précédant une séquence."""
+        index = max(bisect_right(self.index_sequences, sequence) - 1, 0)
+        return self.index_sequences[index], self.index_positions[index]
+
+    def seek_bound(self, keys: List[Any], bound: Any) -> Tuple[int, int]:
+        """Retourne la dernière entrée dont tous les prédécesseurs sont < bound."""
+        index = max(bisect_left(keys, bound) - 1, 0)
+        return self.index_sequences[index], self.index_positions[index]
+
+
+def _identity(event: LoggableEvent) -> Tuple[bytes, str, int]:
+    if isinstance(event, CompactEvent):
+        return event.frame, event.event_id, event.timestamp_us
+    return encode_event(event), event.event_id, datetime_to_micros(event.timestamp)[0]
+
+
+def _frame_identity(frame: memoryview) -> Tuple[str, int]:
+    header = decode_header(frame)
+    return str(frame[HEADER_SIZE:HEADER_SIZE + header.id_length], "utf-8"), header.micros
+
+
+class EventLog:
+    """
+    Journal segmenté d'événements, durable par fsync groupé.
+
+    Args:
+        directory: Répertoire des segments (créé au besoin)
+        segment_bytes: Taille au-delà de laquelle un nouveau segment est ouvert
+        index_interval: Écart en octets entre deux entrées de l'index creux
+        sync_interval: Délai en secondes pendant lequel append() regroupe les
+            écritures avant le fsync
+        fsync: Si False, les écritures ne sont pas synchronisées sur disque
+            (tests, données reproductibles)
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_bytes: int = 64 * 1024 * 1024,
+        index_interval: int = 4096,
+        sync_interval: float = 0.002,
+        fsync: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        self._index_interval = index_interval
+        self._sync_interval = sync_interval
+        self._fsync = fsync
+
+        self._lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._next_sequence = 0
+        self._durable_sequence = -1
+        self._commit_task: Optional[asyncio.Task] = None
+        self._file: Any = None
+        self._checkpoints: Dict[str, int] = {}
+
+        self._recover()
+
+    # Ouverture et récupération
+
+    def _recover(self) -> None:
+        paths = sorted(self.directory.glob("*.log"))
+        for position, path in enumerate(paths):
+            segment = _Segment(base=int(path.stem), path=path)
+            self._load_segment(segment, last=position == len(paths) - 1)
+            if self._segments and segment.base != self._segments[-1].base + self._segments[-1].count:
+                raise LogCorruptionError(f"Missing records before segment {path.name}")
+            self._segments.append(segment)
+
+        if self._segments:
+            active = self._segments[-1]
+            self._file = open(active.path, "ab", buffering=0)
+            self._next_sequence = active.base + active.count
+        else:
+            self._open_segment(0)
+        self._durable_sequence = self._next_sequence - 1
+
+        checkpoint_path = self.directory / CHECKPOINT_FILE
+        if checkpoint_path.exists():
+            self._checkpoints = json.loads(checkpoint_path.read_text())
+
+    def _load_segment(self, segment: _Segment, last: bool) -> None:
+        file_size = segment.path.stat().st_size
+        with open(segment.path, "r+b") as file:
+            valid = 0
+            if file_size >= _SEGMENT_HEADER.size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    magic, version = _SEGMENT_HEADER.unpack_from(data, 0)
+                    if magic != SEGMENT_MAGIC or version != LOG_VERSION:
+                        raise LogCorruptionError(f"Not an event log segment: {segment.path.name}")
+                    valid = self._index_segment(segment, data, file_size)
+            if valid == file_size:
+                return
+            if not last:
+                raise LogCorruptionError(f"Corrupted record in segment {segment.path.name} at {valid}")
+            # Fin de journal tronquée par un arrêt brutal
+            if valid == 0:
+                file.write(_SEGMENT_HEADER.pack(SEGMENT_MAGIC, LOG_VERSION))
+                valid = _SEGMENT_HEADER.size
+            file.truncate(valid)
+            if self._fsync:
+                os.fsync(file.fileno())
+
+    def _index_segment(self, segment: _Segment, data: mmap.mmap, end: int) -> int:
+        view = memoryview(data)
+        position = _SEGMENT_HEADER.size
+        try:
+            while position + _RECORD_HEADER.size <= end:
+                length, crc = _RECORD_HEADER.unpack_from(view, position)
+                start = position + _RECORD_HEADER.size
+                if length < HEADER_SIZE or start + length > end:
+                    break
+                with view[start:start + length] as frame:
+                    if zlib.crc32(frame) != crc:
+                        break
+                    # Un enregistrement au CRC valide n'est jamais une fin tronquée
+                    try:
+                        event_id, micros = _frame_identity(frame)
+                    except (CodecError, UnicodeDecodeError) as error:
+                        raise LogCorruptionError(
+                            f"Undecodable record in segment {segment.path.name} at {position}: {error}"
+                        ) from error
+                segment.add(_RECORD_HEADER.size + length, event_id, micros, self._index_interval)
+                position = start + length
+        finally:
+            view.release()
+        return position
+
+    def _open_segment(self, base: int) -> None:
+        segment = _Segment(base=base, path=self.directory / f"{base:020d}.log")
+        self._file = open(segment.path, "xb", buffering=0)
+        self._file.write(_SEGMENT_HEADER.pack(SEGMENT_MAGIC, LOG_VERSION))
+        if self._fsync:
+            os.fsync(self._file.fileno())
+            self._fsync_directory()
+        self._segments.append(segment)
+
+    def _fsync_directory(self) -> None:
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # Écriture
+
+    @property
+    def next_sequence(self) -> int:
+        """Séquence qui sera attribuée au prochain événement."""
+        return self._next_sequence
+
+    @property
+    def durable_sequence(self) -> int:
+        """Dernière séquence synchronisée sur disque (-1 si aucune)."""
+        return self._durable_sequence
+
+    @property
+    def first_sequence(self) -> int:
+        """Plus ancienne séquence encore présente dans le journal."""
+        return self._segments[0].base
+
+    def __len__(self) -> int:
+        return self._next_sequence - self.first_sequence
+
+    def append_nowait(self, event: LoggableEvent) -> int:
+        """
+        Ajoute un événement au tampon d'écriture, sans attendre sa durabilité.
+
+        Args:
+            event: Événement à journaliser
+
+        Returns:
+            Séquence attribuée à l'événement
+        """
+        frame, event_id, micros = _identity(event)
+        header = _RECORD_HEADER.pack(len(frame), zlib.crc32(frame))
+        length = len(header) + len(frame)
+        with self._lock:
+            segment = self._segments[-1]
+            if segment.count and segment.size + length > self._segment_bytes:
+                self._roll_locked()
+                segment = self._segments[-1]
+            sequence = self._next_sequence
+            segment.add(length, event_id, micros, self._index_interval)
+            self._pending.append(header)
+            self._pending.append(frame)
+            self._pending_bytes += length
+            self._next_sequence = sequence + 1
+            if self._pending_bytes >= 1024 * 1024:
+                self._write_locked()
+        return sequence
+
+    def _write_locked(self) -> None:
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._pending.clear()
+            self._pending_bytes = 0
+
+    def _roll_locked(self) -> None:
+        self._write_locked()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._durable_sequence = self._next_sequence - 1
+        self._open_segment(self._next_sequence)
+
+    def sync(self) -> int:
+        """
+        Écrit le tampon et le synchronise sur disque (bloquant).
+
+        Returns:
+            Dernière séquence durable
+        """
+        with self._lock:
+            self._write_locked()
+            sequence = self._next_sequence - 1
+            # Copie du descripteur : un changement de segment concurrent peut
+            # fermer le fichier pendant le fsync
+            fd = os.dup(self._file.fileno()) if self._fsync else -1
+        if fd >= 0:
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        with self._lock:
+            self._durable_sequence = max(self._durable_sequence, sequence)
+        return sequence
+
+    async def wait_durable(self, sequence: int) -> None:
+        """Attend qu'une séquence soit synchronisée, en groupant les fsync."""
+        while self._durable_sequence < sequence:
+            task = self._commit_task
+            if task is None or task.done():
+                task = self._commit_task = asyncio.get_running_loop().create_task(self._group_commit())
+            await asyncio.shield(task)
+
+    async def _group_commit(self) -> None:
+        if self._sync_interval > 0:
+            await asyncio.sleep(self._sync_interval)
+        await asyncio.get_running_loop().run_in_executor(None, self.sync)
+
+    async def append(self, event: LoggableEvent) -> int:
+        """
+        Ajoute un événement et attend qu'il soit durable.
+
+        Args:
+            event: Événement à journaliser
+
+        Returns:
+            Séquence attribuée à l'événement
+        """
+        sequence = self.append_nowait(event)
+        await self.wait_durable(sequence)
+        return sequence
+
+    async def append_many(self, events: Iterable[LoggableEvent]) -> List[int]:
+        """
+        Ajoute des événements et attend qu'ils soient durables (un seul fsync).
+
+        Args:
+            events: Événements à journaliser
+
+        Returns:
+            Séquences attribuées, dans l'ordre des événements
+        """
+        sequences = [self.append_nowait(event) for event in events]
+        if sequences:
+            await self.wait_durable(sequences[-1])
+        return sequences
+
+    # Lecture
+
+    def _snapshot(self) -> List[Tuple[_Segment, int, int]]:
+        # Rend visible le tampon aux lecteurs et fige l'étendue de chaque segment
+        with self._lock:
+            self._write_locked()
+            return [(segment, segment.size, segment.base + segment.count) for segment in self._segments]
+
+    def _read_segment(self, segment: _Segment, position: int, sequence: int, end: int) -> Iterator[LogRecord]:
+        with open(segment.path, "rb") as file:
+            data = mmap.mmap(file.fileno(), end, access=mmap.ACCESS_READ)
+        view = memoryview(data)
+        try:
+            while position < end:
+                length, _ = _RECORD_HEADER.unpack_from(view, position)
+                position += _RECORD_HEADER.size
+                yield LogRecord(sequence, view[position:position + length])
+                position += length
+                sequence += 1
+        finally:
+            # Les trames encore référencées maintiennent le mmap ouvert
+            try:
+                view.release()
+                data.close()
+            except BufferError:
+                pass
+
+    def records(self, start: int = 0) -> Iterator[LogRecord]:
+        """
+        Parcourt les enregistrements à partir d'une séquence, sans copie.
+
+        Les trames sont des vues sur le fichier projeté en mémoire : les
+        copier (bytes(record.frame)) pour les conserver au-delà du parcours.
+
+        Args:
+            start: Première séquence à lire
+
+        Yields:
+            Enregistrements dans l'ordre du journal
+        """
+        for segment, size, end_sequence in self._snapshot():
+            if end_sequence <= start or size <= _SEGMENT_HEADER.size:
+                continue
+            sequence, position = segment.seek_sequence(start)
+            for record in self._read_segment(segment, position, sequence, size):
+                if record.sequence >= start:
+                    yield record
+
+    def replay(self, start: int = 0, since: Optional[datetime] = None) -> Iterator[Event]:
+        """
+        Rejoue les événements du journal.
+
+        Args:
+            start: Première séquence à rejouer
+            since: Si fourni, ignore les événements antérieurs à cet instant
+
+        Yields:
+            Événements reconstruits (sans revalidation : CRC vérifié)
+        """
+        if since is None:
+            for record in self.records(start):
+                yield decode_event(record.frame, trusted=True)
+            return
+
+        bound = datetime_to_micros(since)[0]
+        for segment, size, end_sequence in self._snapshot():
+            if end_sequence <= start or segment.max_micros < bound:
+                continue
+            sequence, position = segment.seek_bound(segment.index_max_micros, bound)
+            for record in self._read_segment(segment, position, sequence, size):
+                if record.sequence >= start and decode_header(record.frame).micros >= bound:
+                    yield decode_event(record.frame, trusted=True)
+
+    def find(self, event_id: str) -> Optional[Event]:
+        """
+        Recherche un événement par identifiant via l'index creux.
+
+        Avec des identifiants journalisés dans leur ordre de génération
+        (générateur monotone par défaut), seul un intervalle d'index est lu ;
+        sinon le segment est parcouru depuis la borne donnée par l'index.
+
+        Args:
+            event_id: Identifiant recherché
+
+        Returns:
+            L'événement, None s'il est absent du journal
+        """
+        for segment, size, _ in self._snapshot():
+            if segment.max_id < event_id:
+                continue
+            sequence, position = segment.seek_bound(segment.index_max_ids, event_id)
+            for record in self._read_segment(segment, position, sequence, size):
+                record_id, _ = _frame_identity(record.frame)
+                if record_id == event_id:
+                    return decode_event(record.frame, trusted=True)
+                if segment.ordered and record_id > event_id:
+                    return None
+        return None
+
+    # Points de reprise et rétention
+
+    def committed(self, consumer: str = "default") -> int:
+        """Retourne la prochaine séquence à traiter pour un consommateur."""
+        return self._checkpoints.get(consumer, self.first_sequence)
+
+    def checkpoint(self, sequence: int, consumer: str = "default") -> None:
+        """
+        Enregistre qu'un consommateur a traité les événements jusqu'à une
+        séquence incluse (écriture atomique).
+
+        Args:
+            sequence: Dernière séquence traitée
+            consumer: Nom du consommateur
+        """
+        self._checkpoints[consumer] = sequence + 1
+        path = self.directory / CHECKPOINT_FILE
+        temporary = path.with_suffix(".tmp")
+        with open(temporary, "w") as file:
+            json.dump(self._checkpoints, file)
+            file.flush()
+            if self._fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    async def recover(self, queue: Any, consumer: str = "default") -> int:
+        """
+        Remet en file les événements non traités d'un consommateur.
+
+        Args:
+            queue: File exposant une coroutine put() (PriorityEventQueue,
+                asyncio.Queue)
+            consumer: Nom du consommateur
+
+        Returns:
+            Nombre d'événements remis en file
+        """
+        count = 0
+        for event in self.replay(self.committed(consumer)):
+            await queue.put(event)
+            count += 1
+        return count
+
+    def delete_before(self, sequence: int) -> int:
+        """
+        Supprime les segments fermés dont tous les événements précèdent une
+        séquence.
+
+        Args:
+            sequence: Première séquence à conserver
+
+        Returns:
+            Nombre de segments supprimés
+        """
+        removed = 0
+        with self._lock:
+            while len(self._segments) > 1 and self._segments[1].base <= sequence:
+                self._segments.pop(0).path.unlink()
+                removed += 1
+        return removed
+
+    def close(self) -> None:
+        """Synchronise le tampon et ferme le segment actif."""
+        if self._file is not None and not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,278 @@
+"""
+File d'attente asyncio bornée, ordonnée par priorité d'événement.
+
+Chaque niveau de Priority dispose de sa propre file FIFO et de sa propre
+capacité : un afflux d'événements BACKGROUND ne peut ni retarder ni
+évincer les événements CRITICAL. Le vieillissement (aging) fait remonter
+progressivement les événements qui attendent, jusqu'au rang plancher
+(HIGH par défaut), afin qu'aucun niveau ne soit affamé ; seuls les niveaux
+plus urgents que ce plancher gardent une préséance absolue.
+
+L'interface suit celle d'asyncio.Queue (put, get, task_done, join...).
+Les éléments sont lus par leur attribut ``priority`` : BaseEvent comme
+CompactEvent sont acceptés.
+"""
+
+import asyncio
+import sys
+import time
+from collections import Counter, deque
+from enum import Enum
+from typing import Any, Callable, Deque, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ..core.events import BaseEvent, Priority
+from ..observability import metrics
+
+_LEVELS = tuple(Priority)
+
+
+class OverflowPolicy(str, Enum):
+    """Comportement d'un niveau de priorité plein."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+
+def _per_level(value: Any, name: str) -> List[Any]:
+    if isinstance(value, Mapping):
+        missing = [level.name for level in _LEVELS if level not in value]
+        if missing:
+            raise ValueError(f"{name} missing for priorities: {', '.join(missing)}")
+        return [value[level] for level in _LEVELS]
+    return [value] * len(_LEVELS)
+
+
+class PriorityEventQueue:
+    """
+    File asyncio à niveaux de priorité, FIFO au sein de chaque niveau.
+
+    Args:
+        capacity: Capacité de chaque niveau, ou capacité par Priority
+            (0 pour un niveau non borné)
+        policy: Comportement d'un niveau plein (global ou par Priority)
+        aging_interval: Secondes d'attente faisant gagner un rang, None
+            pour une priorité stricte sans vieillissement
+        aging_floor: Rang le plus urgent atteignable par vieillissement
+        on_drop: Fonction appelée avec chaque événement évincé
+        clock: Horloge monotone en secondes
+    """
+
+    def __init__(
+        self,
+        capacity: Union[int, Mapping[Priority, int]] = 1000,
+        policy: Union[OverflowPolicy, Mapping[Priority, OverflowPolicy]] = OverflowPolicy.BLOCK,
+        aging_interval: Optional[float] = 5.0,
+        aging_floor: Priority = Priority.HIGH,
+        on_drop: Optional[Callable[[BaseEvent], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError("aging_interval must be positive")
+        # Capacité 0 : niveau non borné
+        self._limits: List[int] = [limit or sys.maxsize for limit in _per_level(capacity, "capacity")]
+        self._policies: List[OverflowPolicy] = [OverflowPolicy(p) for p in _per_level(policy, "policy")]
+        self._aging_interval = aging_interval
+        self._aging_floor = int(aging_floor)
+        self._on_drop = on_drop
+        self._clock = clock
+
+        self._levels: List[Deque[Tuple[float, BaseEvent]]] = [deque() for _ in _LEVELS]
+        self._size = 0
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: List[Deque[asyncio.Future]] = [deque() for _ in _LEVELS]
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+        self.dropped: Counter = Counter()
+        self.rejected: Counter = Counter()
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(f"{level.name}={len(items)}" for level, items in zip(_LEVELS, self._levels))
+        return f"<PriorityEventQueue {sizes} tasks={self._unfinished_tasks}>"
+
+    @staticmethod
+    def _index(event: BaseEvent) -> int:
+        index = event.priority - 1
+        if not 0 <= index < len(_LEVELS):
+            raise ValueError(f"Unknown event priority: {event.priority!r}")
+        return index
+
+    def qsize(self, priority: Optional[Priority] = None) -> int:
+        """Nombre d'événements en attente, au total ou pour un niveau."""
+        if priority is None:
+            return self._size
+        return len(self._levels[int(priority) - 1])
+
+    def empty(self) -> bool:
+        """Retourne True si aucun événement n'est en attente."""
+        return self._size == 0
+
+    def full(self, priority: Priority) -> bool:
+        """Retourne True si le niveau de priorité a atteint sa capacité."""
+        index = int(priority) - 1
+        return len(self._levels[index]) >= self._limits[index]
+
+    async def put(self, event: BaseEvent) -> None:
+        """
+        Ajoute un événement, en attendant une place si le niveau est plein
+        et que sa politique est BLOCK.
+
+        Raises:
+            asyncio.QueueFull: Si le niveau est plein et la politique REJECT
+        """
+        index = self._index(event)
+        putters = self._putters[index]
+        items = self._levels[index]
+        limit = self._limits[index]
+        while self._policies[index] is OverflowPolicy.BLOCK and len(items) >= limit:
+            putter = asyncio.get_running_loop().create_future()
+            putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                try:
+                    putters.remove(putter)
+                except ValueError:
+                    pass
+                if len(items) < limit and not putter.cancelled():
+                    self._wakeup_next(putters)
+                raise
+        self.put_nowait(event)
+
+    def put_nowait(self, event: BaseEvent) -> None:
+        """
+        Ajoute un événement sans attendre.
+
+        Si le niveau est plein, la politique DROP_OLDEST évince l'événement
+        le plus ancien du même niveau ; BLOCK et REJECT lèvent QueueFull.
+
+        Raises:
+            asyncio.QueueFull: Si le niveau est plein et ne peut être libéré
+        """
+        index = self._index(event)
+        items = self._levels[index]
+        if len(items) >= self._limits[index]:
+            if self._policies[index] is not OverflowPolicy.DROP_OLDEST:
+                self.rejected[_LEVELS[index]] += 1
+                raise asyncio.QueueFull
+            _, dropped = items.popleft()
+            self._size -= 1
+            self.dropped[_LEVELS[index]] += 1
+            self.task_done()
+            if self._on_drop is not None:
+                self._on_drop(dropped)
+        items.append((self._clock(), event))
+        self._size += 1
+        self._unfinished_tasks += 1
+        if self._unfinished_tasks == 1:
+            self._finished.clear()
+        if self._getters:
+            self._wakeup_next(self._getters)
+        recorder = metrics.active
+        if recorder is not None:
+            recorder.enqueued(event)
+
+    def put_many_nowait(self, events: Sequence[BaseEvent]) -> None:
+        """
+        Ajoute un lot d'événements sans attendre, en entier ou pas du tout.
+
+        Raises:
+            asyncio.QueueFull: Si un niveau BLOCK ou REJECT n'a pas la place
+                pour les événements du lot ; aucun n'est alors ajouté
+        """
+        counts = Counter(self._index(event) for event in events)
+        for index, count in counts.items():
+            if (self._policies[index] is not OverflowPolicy.DROP_OLDEST
+                    and len(self._levels[index]) + count > self._limits[index]):
+                self.rejected[_LEVELS[index]] += count
+                raise asyncio.QueueFull
+        for event in events:
+            self.put_nowait(event)
+
+    async def get(self) -> BaseEvent:
+        """Retire l'événement le plus prioritaire, en attendant s'il le faut."""
+        while not self._size:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if self._size and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def get_nowait(self) -> BaseEvent:
+        """
+        Retire l'événement le plus prioritaire sans attendre.
+
+        Raises:
+            asyncio.QueueEmpty: Si la file est vide
+        """
+        if not self._size:
+            raise asyncio.QueueEmpty
+        index = self._select()
+        enqueued_at, event = self._levels[index].popleft()
+        self._size -= 1
+        if self._putters[index]:
+            self._wakeup_next(self._putters[index])
+        recorder = metrics.active
+        if recorder is not None:
+            recorder.dequeued(event, self._clock() - enqueued_at)
+        return event
+
+    def _select(self) -> int:
+        # Rang effectif d'une tête de file : niveau moins le nombre
+        # d'intervalles d'attente, sans dépasser le plancher ; à rang égal,
+        # la plus ancienne passe. Les niveaux plus urgents que le plancher
+        # ne sont jamais devancés.
+        interval = self._aging_interval
+        floor = self._aging_floor
+        now = self._clock() if interval is not None else 0.0
+        best_index = -1
+        best_key: Tuple[float, float] = (0.0, 0.0)
+        for index, items in enumerate(self._levels):
+            if not items:
+                continue
+            level = index + 1
+            if interval is None or level < floor:
+                return index
+            enqueued_at = items[0][0]
+            key = (max(level - (now - enqueued_at) / interval, floor), enqueued_at)
+            if best_index < 0 or key < best_key:
+                best_index, best_key = index, key
+        return best_index
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def task_done(self) -> None:
+        """
+        Signale la fin du traitement d'un événement retiré par get().
+
+        Raises:
+            ValueError: Si appelé plus de fois qu'il n'y a eu d'événements
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Attend que tous les événements ajoutés aient été traités."""
+        if self._unfinished_tasks > 0:
+            await self._finished.wait()
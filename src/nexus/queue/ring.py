@@ -0,0 +1,229 @@
+"""
+Tampon circulaire en mémoire partagée entre deux processus.
+
+Un seul producteur et un seul consommateur (SPSC) échangent des
+enregistrements d'octets (typiquement un lot de nexus.core.codec) par un
+segment multiprocessing.shared_memory, sans sérialisation pickle ni copie
+par un tube. Disposition du segment :
+
+    0     head   (u64) octets écrits depuis l'origine   } producteur
+    8     items  (u64) éléments écrits                  }
+    64    tail   (u64) octets lus depuis l'origine      } consommateur
+    72    items  (u64) éléments lus                     }
+    128   données : <II longueur, éléments ; enregistrement ; bourrage à 8 octets
+
+Chaque compteur n'est écrit que par un seul côté, après les données qu'il
+publie (alignés sur 8 octets : écriture atomique sur x86-64). Un
+enregistrement qui ne tient pas avant la fin du tampon est précédé d'un
+marqueur de retour au début ; un marqueur de fin signale la fermeture par
+le producteur. Les attentes passent par deux multiprocessing.Event
+(données disponibles, place libérée) : l'anneau se transmet à un processus
+enfant comme argument de multiprocessing.Process.
+"""
+
+import os
+import struct
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional
+
+_COUNTERS = struct.Struct("<QQ")
+_RECORD = struct.Struct("<II")
+_PRODUCER = 0
+_CONSUMER = 64
+_DATA = 128
+_ALIGN = 8
+
+_WRAP = 0xFFFFFFFE
+_END = 0xFFFFFFFF
+
+
+def _padded(size: int) -> int:
+    return (size + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+class ShmRing:
+    """
+    Anneau SPSC d'enregistrements d'octets en mémoire partagée.
+
+    Args:
+        capacity: Taille de la zone de données, en octets (arrondie à 8)
+        context: Contexte multiprocessing des événements d'attente
+
+    Raises:
+        ValueError: Si la capacité est inférieure à 64 octets
+    """
+
+    def __init__(self, capacity: int = 4 * 1024 * 1024, context: Any = None) -> None:
+        capacity = _padded(capacity)
+        if capacity < 64:
+            raise ValueError("capacity must be at least 64 bytes")
+        context = context or get_context()
+        self.capacity = capacity
+        self._shm = SharedMemory(create=True, size=_DATA + capacity)
+        self._readable = context.Event()
+        self._writable = context.Event()
+        # Un processus enfant créé par fork hérite de l'objet sans en être le créateur
+        self._owner = os.getpid()
+        self._attach()
+
+    def _attach(self) -> None:
+        self._buf = self._shm.buf
+        self._data = self._buf[_DATA:_DATA + self.capacity]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "name": self._shm.name,
+            "readable": self._readable,
+            "writable": self._writable,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.capacity = state["capacity"]
+        self._shm = SharedMemory(name=state["name"])
+        self._readable = state["readable"]
+        self._writable = state["writable"]
+        self._owner = None
+        self._attach()
+
+    @property
+    def name(self) -> str:
+        """Nom du segment de mémoire partagée."""
+        return self._shm.name
+
+    @property
+    def max_record(self) -> int:
+        """Taille maximale d'un enregistrement."""
+        # Place pour un marqueur de retour, l'en-tête et le marqueur de fin
+        return self.capacity // 2 - 3 * _RECORD.size
+
+    def backlog(self) -> int:
+        """Éléments écrits et pas encore lus."""
+        written = _COUNTERS.unpack_from(self._buf, _PRODUCER)[1]
+        read = _COUNTERS.unpack_from(self._buf, _CONSUMER)[1]
+        return written - read
+
+    def empty(self) -> bool:
+        """Indique si aucun enregistrement n'attend d'être lu."""
+        return _COUNTERS.unpack_from(self._buf, _PRODUCER)[0] == _COUNTERS.unpack_from(self._buf, _CONSUMER)[0]
+
+    # Producteur
+
+    def _reserve(self, size: int) -> Optional[int]:
+        """Octets à avancer pour écrire ``size`` octets, None si la place manque."""
+        head, _ = _COUNTERS.unpack_from(self._buf, _PRODUCER)
+        tail, _ = _COUNTERS.unpack_from(self._buf, _CONSUMER)
+        position = head % self.capacity
+        needed = _padded(_RECORD.size + size)
+        if position + needed > self.capacity:
+            needed += self.capacity - position
+        # Toujours garder la place du marqueur de fin
+        if head - tail + needed + _RECORD.size > self.capacity:
+            return None
+        return needed
+
+    def fits(self, *sizes: int) -> bool:
+        """Indique si des enregistrements de ces tailles peuvent être écrits à la suite."""
+        if len(sizes) == 1:
+            return self._reserve(sizes[0]) is not None
+        spans = [_padded(_RECORD.size + size) for size in sizes]
+        head, _ = _COUNTERS.unpack_from(self._buf, _PRODUCER)
+        tail, _ = _COUNTERS.unpack_from(self._buf, _CONSUMER)
+        # Un retour au début au plus, qui perd moins que l'enregistrement concerné
+        return head - tail + sum(spans) + max(spans) + _RECORD.size <= self.capacity
+
+    def try_write(self, record: bytes, items: int = 1) -> bool:
+        """
+        Ajoute un enregistrement s'il y a la place.
+
+        Args:
+            record: Octets de l'enregistrement
+            items: Nombre d'éléments qu'il contient (voir backlog())
+
+        Returns:
+            True si l'enregistrement a été écrit, False si la place manque
+
+        Raises:
+            ValueError: Si l'enregistrement dépasse max_record
+        """
+        size = len(record)
+        if size > self.max_record:
+            raise ValueError(f"Record of {size} bytes exceeds ring maximum of {self.max_record}")
+        needed = self._reserve(size)
+        if needed is None:
+            return False
+        head, written = _COUNTERS.unpack_from(self._buf, _PRODUCER)
+        position = head % self.capacity
+        if position + _padded(_RECORD.size + size) > self.capacity:
+            _RECORD.pack_into(self._data, position, _WRAP, 0)
+            position = 0
+        _RECORD.pack_into(self._data, position, size, items)
+        start = position + _RECORD.size
+        self._data[start:start + size] = record
+        _COUNTERS.pack_into(self._buf, _PRODUCER, head + needed, written + items)
+        self._readable.set()
+        return True
+
+    def close_writer(self) -> None:
+        """Ajoute le marqueur de fin (toujours possible : sa place est réservée)."""
+        head, written = _COUNTERS.unpack_from(self._buf, _PRODUCER)
+        _RECORD.pack_into(self._data, head % self.capacity, _END, 0)
+        _COUNTERS.pack_into(self._buf, _PRODUCER, head + _RECORD.size, written)
+        self._readable.set()
+
+    def wait_writable(self, size: int, timeout: Optional[float] = None) -> bool:
+        """Attend la place d'un enregistrement de ``size`` octets (bloquant) ; False à l'expiration."""
+        self._writable.clear()
+        if self._reserve(size) is not None:
+            return True
+        return self._writable.wait(timeout)
+
+    # Consommateur
+
+    def read(self) -> Optional[bytes]:
+        """
+        Retire le prochain enregistrement.
+
+        Returns:
+            Copie de l'enregistrement, None si l'anneau est vide
+
+        Raises:
+            EOFError: Si le producteur a fermé l'anneau et tout a été lu
+        """
+        tail, read = _COUNTERS.unpack_from(self._buf, _CONSUMER)
+        head, _ = _COUNTERS.unpack_from(self._buf, _PRODUCER)
+        if tail == head:
+            return None
+        position = tail % self.capacity
+        size, items = _RECORD.unpack_from(self._data, position)
+        if size == _END:
+            raise EOFError("ring closed by producer")
+        advance = 0
+        if size == _WRAP:
+            advance = self.capacity - position
+            position = 0
+            size, items = _RECORD.unpack_from(self._data, 0)
+        start = position + _RECORD.size
+        record = bytes(self._data[start:start + size])
+        advance += _padded(_RECORD.size + size)
+        _COUNTERS.pack_into(self._buf, _CONSUMER, tail + advance, read + items)
+        self._writable.set()
+        return record
+
+    def wait_readable(self, timeout: Optional[float] = None) -> bool:
+        """Attend un enregistrement (appel bloquant) ; False à l'expiration."""
+        self._readable.clear()
+        if not self.empty():
+            return True
+        return self._readable.wait(timeout)
+
+    # Cycle de vie
+
+    def close(self) -> None:
+        """Détache le segment ; le créateur le supprime."""
+        self._data.release()
+        self._buf = self._data = None
+        self._shm.close()
+        if self._owner == os.getpid():
+            self._shm.unlink()
@@ -0,0 +1,160 @@
+"""
+Tests unitaires pour la limitation de débit partagée.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from nexus.api import RateLimit, RateLimitAction, RateLimiter
+from nexus.core.events import BaseEvent, EventType, Priority
+
+
+def make_event(source: str = "imap", event_type=EventType.EMAIL_RECEIVED, priority=Priority.NORMAL) -> BaseEvent:
+    """Événement minimal d'une source."""
+    return BaseEvent.from_trusted(type=event_type, source=source, priority=priority, payload={})
+
+
+class FakeClock:
+    """Horloge manuelle."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def admit_many(limiter: RateLimiter, count: int, results) -> None:
+    """Processus de travail : tente d'admettre ``count`` événements."""
+    event = make_event()
+    admitted = sum(limiter.admit_nowait(event) is not None for _ in range(count))
+    limiter.close()
+    results.put(admitted)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestTokenBucket:
+    """Tests du seau à jetons."""
+
+    def test_burst_then_refill(self, clock):
+        """Test rafale autorisée puis recharge au débit configuré."""
+        with RateLimiter(default=RateLimit(rate=10, burst=5), clock=clock) as limiter:
+            event = make_event()
+
+            assert [limiter.admit_nowait(event) is event for _ in range(6)] == [True] * 5 + [False]
+            clock.now += 0.15
+            assert limiter.admit_nowait(event) is event
+            assert limiter.admit_nowait(event) is None
+            assert limiter.admitted == 6
+            assert limiter.dropped == 2
+
+    def test_per_source_limits(self, clock):
+        """Test limites par source ; sources sans limite non contrôlées."""
+        with RateLimiter(limits={"imap": RateLimit(rate=1)}, clock=clock) as limiter:
+            assert limiter.admit_nowait(make_event("imap")) is not None
+            assert limiter.admit_nowait(make_event("imap")) is None
+            assert all(limiter.admit_nowait(make_event("calendar")) is not None for _ in range(100))
+            assert limiter.tokens(make_event("calendar")) is None
+
+    def test_composite_key(self, clock):
+        """Test seau distinct par couple (source, type)."""
+        limiter = RateLimiter(default=RateLimit(rate=1), keys=("source", "type"), clock=clock)
+        try:
+            assert limiter.admit_nowait(make_event()) is not None
+            assert limiter.admit_nowait(make_event(event_type=EventType.ERROR_OCCURRED)) is not None
+            assert limiter.admit_nowait(make_event()) is None
+            assert limiter.key(make_event()) == "imap\x1femail_received"
+        finally:
+            limiter.close()
+
+    def test_single_non_string_key(self, clock):
+        """Test clé simple hors source : priorité ou champ absent."""
+        with RateLimiter(default=RateLimit(rate=1), keys=("priority",), clock=clock) as limiter:
+            assert limiter.admit_nowait(make_event()) is not None
+            assert limiter.admit_nowait(make_event("calendar", priority=Priority.HIGH)) is not None
+            assert limiter.admit_nowait(make_event("calendar")) is None
+            assert limiter.key(make_event()) == str(Priority.NORMAL.value)
+
+        with RateLimiter(default=RateLimit(rate=1), keys=("correlation_id",), clock=clock) as limiter:
+            assert limiter.admit_nowait(make_event()) is not None
+            assert limiter.admit_nowait(make_event("calendar")) is None
+
+    def test_full_table_uses_overflow_bucket(self, clock):
+        """Test table pleine : seau de débordement commun."""
+        with RateLimiter(default=RateLimit(rate=1, burst=2), slots=2, clock=clock) as limiter:
+            for source in ("a", "b"):
+                assert limiter.admit_nowait(make_event(source)) is not None
+
+            assert limiter.admit_nowait(make_event("c")) is not None
+            assert limiter.admit_nowait(make_event("d")) is not None
+            assert limiter.admit_nowait(make_event("e")) is None
+
+    def test_invalid_limit(self):
+        """Test limite invalide."""
+        with pytest.raises(ValueError):
+            RateLimit(rate=0)
+
+
+class TestActions:
+    """Tests des actions hors limite."""
+
+    def test_downgrade(self, clock):
+        """Test rétrogradation en BACKGROUND au-delà de la limite."""
+        with RateLimiter(default=RateLimit(rate=1), action=RateLimitAction.DOWNGRADE, clock=clock) as limiter:
+            event = make_event(priority=Priority.HIGH)
+
+            assert limiter.admit_nowait(event) is event
+            downgraded = limiter.admit_nowait(event)
+
+            assert downgraded.priority == Priority.BACKGROUND
+            assert downgraded.event_id == event.event_id
+            assert event.priority == Priority.HIGH
+            assert limiter.downgraded == 1
+
+    async def test_delay(self):
+        """Test attente d'un jeton avec DELAY."""
+        with RateLimiter(default=RateLimit(rate=50), action=RateLimitAction.DELAY, max_delay=1.0) as limiter:
+            event = make_event()
+            start = time.monotonic()
+
+            for _ in range(4):
+                assert await limiter.admit(event) is event
+
+            assert time.monotonic() - start >= 0.05
+            assert limiter.delayed == 3
+
+    async def test_delay_beyond_max_drops(self, clock):
+        """Test abandon si l'attente dépasse max_delay."""
+        with RateLimiter(
+            default=RateLimit(rate=1), action=RateLimitAction.DELAY, max_delay=0.5, clock=clock
+        ) as limiter:
+            assert await limiter.admit(make_event()) is not None
+            assert await limiter.admit(make_event()) is None
+            assert limiter.dropped == 1
+            with pytest.raises(ValueError):
+                limiter.admit_nowait(make_event())
+
+
+class TestSharedState:
+    """Tests du budget global entre processus."""
+
+    def test_global_budget_across_processes(self):
+        """Test budget commun à plusieurs processus."""
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        with RateLimiter(default=RateLimit(rate=0.001, burst=100), context=context) as limiter:
+            workers = [context.Process(target=admit_many, args=(limiter, 80, results)) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            admitted = [results.get(timeout=30) for _ in workers]
+            for worker in workers:
+                worker.join(timeout=30)
+
+            assert sum(admitted) == 100
+            assert limiter.tokens(make_event()) < 1
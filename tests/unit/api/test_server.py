@@ -0,0 +1,206 @@
+"""
+Tests unitaires pour le récepteur HTTP/WebSocket.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from prometheus_client import CollectorRegistry
+
+from nexus.api import EventReceiver, RateLimit, RateLimiter
+from nexus.core.codec import encode_events
+from nexus.core.events import EventType, FileEvent, Priority, create_event
+from nexus.observability import disable_metrics, enable_metrics
+from nexus.queue import PriorityEventQueue
+
+
+def file_event(index: int = 0, priority: Priority = Priority.NORMAL) -> dict:
+    """Document JSON d'un événement fichier numéroté."""
+    return {"type": "file_modified", "source": "sync", "priority": priority, "payload": {"file_path": f"/{index}"}}
+
+
+def drain(queue: PriorityEventQueue) -> list:
+    """Vide la file."""
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+@pytest.fixture
+async def connect():
+    clients = []
+
+    async def connect(receiver: EventReceiver) -> TestClient:
+        client = TestClient(TestServer(receiver.app))
+        await client.start_server()
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        await client.close()
+
+
+class TestHttpIngress:
+    """Tests des routes HTTP."""
+
+    async def test_single_event(self, connect):
+        """Test événement unique décodé vers sa classe typée."""
+        queue = PriorityEventQueue()
+        client = await connect(EventReceiver(queue))
+
+        response = await client.post("/events", json=file_event())
+
+        assert response.status == 202
+        assert (await response.json())["accepted"] == 1
+        assert isinstance(queue.get_nowait(), FileEvent)
+
+    async def test_single_invalid_event(self, connect):
+        """Test événement non conforme : 400 et détail de l'erreur."""
+        client = await connect(EventReceiver(PriorityEventQueue()))
+
+        response = await client.post("/events", json={"type": "file_modified", "source": "sync", "payload": {}})
+
+        assert response.status == 400
+        assert "file_path" in (await response.json())["errors"][0]["message"]
+
+    async def test_batch_array_with_invalid_element(self, connect):
+        """Test tableau : éléments invalides rejetés, les autres acceptés."""
+        queue = PriorityEventQueue()
+        receiver = EventReceiver(queue)
+        client = await connect(receiver)
+        batch = [file_event(0), {"type": "email_received", "source": "imap", "payload": {}}, file_event(2)]
+
+        response = await client.post("/events/batch", json=batch)
+
+        body = await response.json()
+        assert response.status == 202
+        assert body["accepted"] == 2
+        assert [error["index"] for error in body["errors"]] == [1]
+        assert [event.payload["file_path"] for event in drain(queue)] == ["/0", "/2"]
+        assert receiver.invalid == 1
+
+    async def test_batch_ndjson_and_binary(self, connect):
+        """Test lots NDJSON et binaires."""
+        queue = PriorityEventQueue()
+        client = await connect(EventReceiver(queue))
+        ndjson = "\n".join(json.dumps(file_event(i)) for i in range(3)) + "\n"
+        binary = encode_events([create_event(EventType.FILE_CREATED, "sync", {"file_path": "/b"})])
+
+        ndjson_response = await client.post("/events/batch", data=ndjson,
+                                             headers={"Content-Type": "application/x-ndjson"})
+        binary_response = await client.post("/events/batch", data=binary,
+                                             headers={"Content-Type": "application/octet-stream"})
+
+        assert (await ndjson_response.json())["accepted"] == 3
+        assert (await binary_response.json())["accepted"] == 1
+        assert queue.qsize() == 4
+
+    async def test_malformed_batch(self, connect):
+        """Test corps illisible : 400."""
+        client = await connect(EventReceiver(PriorityEventQueue()))
+
+        response = await client.post("/events/batch", data=b"{not json", headers={"Content-Type": "application/json"})
+
+        assert response.status == 400
+
+    async def test_queue_full_is_429_without_partial_enqueue(self, connect):
+        """Test file pleine : 429 avec Retry-After, lot refusé en entier."""
+        queue = PriorityEventQueue(capacity=3)
+        receiver = EventReceiver(queue, retry_after=2)
+        client = await connect(receiver)
+        await client.post("/events/batch", json=[file_event(i) for i in range(2)])
+
+        response = await client.post("/events/batch", json=[file_event(i) for i in range(2)])
+
+        assert response.status == 429
+        assert response.headers["Retry-After"] == "2"
+        assert queue.qsize() == 2
+        assert receiver.throttled == 2
+
+    async def test_batch_too_large(self, connect):
+        """Test lot trop grand : 413."""
+        client = await connect(EventReceiver(PriorityEventQueue(), max_batch=2))
+
+        response = await client.post("/events/batch", json=[file_event(i) for i in range(3)])
+
+        assert response.status == 413
+
+    async def test_rate_limited_events(self, connect):
+        """Test événements hors limite de débit écartés et comptés."""
+        queue = PriorityEventQueue()
+        with RateLimiter(default=RateLimit(rate=0.001, burst=2)) as limiter:
+            client = await connect(EventReceiver(queue, limiter=limiter))
+
+            response = await client.post("/events/batch", json=[file_event(i) for i in range(5)])
+
+            body = await response.json()
+            assert (body["accepted"], body["throttled"]) == (2, 3)
+            assert queue.qsize() == 2
+
+    async def test_metrics_route(self, connect):
+        """Test route /metrics : événements reçus comptés par type et source."""
+        registry = CollectorRegistry()
+        enable_metrics(registry)
+        try:
+            client = await connect(EventReceiver(PriorityEventQueue(), metrics=registry))
+            await client.post("/events/batch", json=[file_event(i) for i in range(2)])
+
+            response = await client.get("/metrics")
+
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert 'nexus_events_enqueued_total{source="sync",type="file_modified"} 2.0' in await response.text()
+        finally:
+            disable_metrics()
+
+    async def test_start_and_health(self):
+        """Test démarrage sur un port libre et route de santé."""
+        receiver = EventReceiver(PriorityEventQueue())
+        await receiver.start(port=0)
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"http://127.0.0.1:{receiver.port}/health") as response:
+                    assert await response.json() == {"status": "ok", "queued": 0}
+        finally:
+            await receiver.stop()
+
+
+class TestWebSocketIngress:
+    """Tests du canal WebSocket."""
+
+    async def test_stream_with_acks(self, connect):
+        """Test messages texte et binaires, accusé par message."""
+        queue = PriorityEventQueue()
+        client = await connect(EventReceiver(queue))
+
+        async with client.ws_connect("/events/ws") as ws:
+            await ws.send_json(file_event(0))
+            await ws.send_json([file_event(1), file_event(2)])
+            await ws.send_bytes(encode_events([create_event(EventType.FILE_DELETED, "sync", {"file_path": "/3"})]))
+            await ws.send_str("{not json")
+            acks = [await ws.receive_json() for _ in range(4)]
+
+        assert [(ack["seq"], ack["accepted"]) for ack in acks] == [(1, 1), (2, 2), (3, 1), (4, 0)]
+        assert acks[3]["errors"][0]["index"] == 0
+        assert queue.qsize() == 4
+
+    async def test_back_pressure_pauses_reading(self, connect):
+        """Test file pleine : lecture suspendue, reprise quand la file se vide."""
+        queue = PriorityEventQueue(capacity=2)
+        client = await connect(EventReceiver(queue))
+
+        async with client.ws_connect("/events/ws") as ws:
+            for index in range(6):
+                await ws.send_json(file_event(index))
+            await asyncio.sleep(0.05)
+
+            assert queue.qsize() == 2
+            assert [(await ws.receive_json())["seq"] for _ in range(2)] == [1, 2]
+            with pytest.raises(asyncio.TimeoutError):
+                await ws.receive_json(timeout=0.05)
+
+            received = [await queue.get() for _ in range(6)]
+            assert [(await ws.receive_json())["seq"] for _ in range(4)] == [3, 4, 5, 6]
+
+        assert [event.payload["file_path"] for event in received] == [f"/{i}" for i in range(6)]
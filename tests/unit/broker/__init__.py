@@ -0,0 +1 @@
+# Broker tests package
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Tests unitaires pour le broker local et son client.
+"""
+
+import asyncio
+
+import pytest
+
+from nexus.broker import BrokerClient, BrokerError, LocalBroker
+from nexus.broker.protocol import COUNT, Connection, Op
+from nexus.core.events import BaseEvent, EventType
+
+
+def make_events(count: int, sources: int = 10, start: int = 0):
+    """Événements numérotés répartis entre plusieurs sources."""
+    return [
+        BaseEvent.from_trusted(type=EventType.FILE_MODIFIED, source=f"src{i % sources}", payload={"index": i})
+        for i in range(start, start + count)
+    ]
+
+
+async def eventually(condition, timeout: float = 5.0) -> None:
+    """Attend qu'une condition devienne vraie."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def receive(subscription, count: int, ack: bool = True):
+    """Reçoit ``count`` événements, acquittés ou non."""
+    events = []
+    while len(events) < count:
+        batch = await asyncio.wait_for(subscription.get(), 5.0)
+        events.extend(batch)
+        if ack:
+            for event in batch:
+                subscription.ack(event)
+    return events
+
+
+async def consume_all(subscriptions, total: int):
+    """Consomme et acquitte en parallèle jusqu'à ``total`` événements reçus au total."""
+    received = [[] for _ in subscriptions]
+
+    async def consume(subscription, events):
+        while sum(map(len, received)) < total:
+            try:
+                batch = await asyncio.wait_for(subscription.get(), 0.05)
+            except asyncio.TimeoutError:
+                continue
+            events.extend(batch)
+            for event in batch:
+                subscription.ack(event)
+
+    await asyncio.wait_for(asyncio.gather(*map(consume, subscriptions, received)), 10.0)
+    return received
+
+
+@pytest.fixture
+async def broker():
+    async with LocalBroker(partitions=8) as broker:
+        yield broker
+
+
+class TestLocalBroker:
+    """Tests de publication, groupes et acquittements."""
+
+    async def test_group_splits_partitions(self, broker):
+        """Test partitions réparties entre deux nœuds, chaque événement livré une fois."""
+        async with BrokerClient(broker.address) as first, BrokerClient(broker.address) as second:
+            subscriptions = [await first.subscribe("nexus", "node-a"), await second.subscribe("nexus", "node-b")]
+            await eventually(lambda: all(len(s.partitions) == 4 for s in subscriptions))
+
+            published = await asyncio.gather(*(first.publish(make_events(100, start=i * 100)) for i in range(10)))
+            received = await consume_all(subscriptions, 1000)
+            await eventually(lambda: broker.lag("nexus") == 0)
+
+        assert sum(published) == broker.published == broker.delivered == 1000
+        assert all(received) and sum(map(len, received)) == 1000
+        assert set(subscriptions[0].partitions).isdisjoint(subscriptions[1].partitions)
+
+    async def test_per_source_order(self, broker):
+        """Test chaque source livrée dans l'ordre de publication, à un seul nœud."""
+        async with BrokerClient(broker.address) as node_a, BrokerClient(broker.address) as node_b:
+            subscriptions = [await node_a.subscribe("nexus", "a"), await node_b.subscribe("nexus", "b")]
+            await eventually(lambda: all(s.partitions for s in subscriptions))
+            for start in range(0, 600, 60):
+                await node_a.publish(make_events(60, start=start))
+
+            received = await consume_all(subscriptions, 600)
+
+        seen = {}
+        for node, events in enumerate(received):
+            for event in events:
+                seen.setdefault(event.source, []).append((node, event.payload["index"]))
+        for deliveries in seen.values():
+            assert len({node for node, _ in deliveries}) == 1
+            assert [index for _, index in deliveries] == sorted(index for _, index in deliveries)
+
+    async def test_prefetch_bounds_unacked(self, broker):
+        """Test livraisons limitées aux événements non acquittés autorisés."""
+        async with BrokerClient(broker.address) as client:
+            subscription = await client.subscribe("nexus", prefetch=10)
+            await client.publish(make_events(50))
+
+            first = await receive(subscription, 10, ack=False)
+            await asyncio.sleep(0.05)
+            assert broker.delivered == 10 and subscription.unacked == 10
+
+            for event in first:
+                subscription.ack(event)
+            await receive(subscription, 10, ack=False)
+            assert broker.delivered == 20
+
+    async def test_unacked_redelivered_to_next_member(self, broker):
+        """Test événements non acquittés relivrés au nœud qui reprend la partition."""
+        async with BrokerClient(broker.address) as publisher:
+            await publisher.publish(make_events(30))
+            async with BrokerClient(broker.address) as crashing:
+                subscription = await crashing.subscribe("nexus", "a")
+                events = await receive(subscription, 30, ack=False)
+                for event in events[:10]:
+                    subscription.ack(event)
+
+            async with BrokerClient(broker.address) as survivor:
+                subscription = await survivor.subscribe("nexus", "b")
+                redelivered = await receive(subscription, 20)
+                await eventually(lambda: broker.lag("nexus") == 0)
+
+        assert {event.event_id for event in redelivered} == {event.event_id for event in events[10:]}
+
+    async def test_groups_are_independent(self, broker):
+        """Test chaque groupe reçoit tous les événements, y compris publiés avant son arrivée."""
+        async with BrokerClient(broker.address) as first, BrokerClient(broker.address) as second:
+            journal = await first.subscribe("journal")
+            await first.publish(make_events(40))
+            assert len(await receive(journal, 40)) == 40
+
+            analytics = await second.subscribe("analytics")
+            assert len(await receive(analytics, 40)) == 40
+            await eventually(lambda: broker.lag("journal") == broker.lag("analytics") == 0)
+
+    async def test_more_consumers_than_partitions(self):
+        """Test nœud surnuméraire notifié d'une assignation vide."""
+        async with LocalBroker(partitions=2) as broker:
+            clients = [BrokerClient(broker.address) for _ in range(3)]
+            for client in clients:
+                await client.connect()
+            subscriptions = [await client.subscribe("nexus", f"c{index}") for index, client in enumerate(clients)]
+            for subscription in subscriptions:
+                await asyncio.wait_for(subscription.wait_assigned(), 2.0)
+
+            assert [subscription.partitions for subscription in subscriptions] == [[0], [1], []]
+            for client in clients:
+                await client.close()
+
+    async def test_retention_drops_oldest(self):
+        """Test trames au-delà de la rétention abandonnées et comptées."""
+        async with LocalBroker(partitions=1, retention=25) as broker, BrokerClient(broker.address) as client:
+            await client.publish(make_events(40))
+            subscription = await client.subscribe("late")
+
+            events = await receive(subscription, 25)
+
+        assert broker.dropped == 15
+        assert [event.payload["index"] for event in events] == list(range(15, 40))
+
+    async def test_invalid_batch_rejected(self, broker):
+        """Test lot illisible refusé sans fermer la connexion."""
+        async with BrokerClient(broker.address) as client:
+            connection = client._connection
+            future = asyncio.get_running_loop().create_future()
+            client._requests[99] = future
+            connection.send(Op.PUBLISH, (99).to_bytes(4, "little"), b"garbage")
+
+            with pytest.raises(BrokerError):
+                await asyncio.wait_for(future, 5.0)
+            assert await client.publish(make_events(3)) == 3
+
+    async def test_truncated_publish_closes_connection(self, broker):
+        """Test PUBLISH trop court : connexion fermée, broker toujours disponible."""
+        client = BrokerClient(broker.address)
+        await client.connect()
+        client._connection.send(Op.PUBLISH, b"\x01\x02")
+
+        await eventually(lambda: client.closed)
+        async with BrokerClient(broker.address) as other:
+            assert await other.publish(make_events(2)) == 2
+        await client.close()
+
+    @pytest.mark.parametrize("body", [b"\x01", COUNT.pack(3) + b"\x00" * 4, COUNT.pack(0) + b"NXEB"])
+    async def test_malformed_delivery_ends_subscription(self, body):
+        """Test DELIVER tronqué ou illisible : abonnement terminé, sans exception non gérée."""
+        async def serve(reader, writer):
+            connection = Connection(reader, writer)
+            await connection.receive()
+            connection.send(Op.DELIVER, body)
+            await connection.drain()
+            await reader.read()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server, BrokerClient(f"tcp://127.0.0.1:{port}") as client:
+            subscription = await client.subscribe("nexus")
+            assert [batch async for batch in subscription] == []
+            assert client.closed
+
+    async def test_unix_socket(self, tmp_path):
+        """Test broker sur socket Unix."""
+        address = f"unix://{tmp_path / 'broker.sock'}"
+        broker = LocalBroker()
+        await broker.start(address)
+        async with broker, BrokerClient(broker.address) as client:
+            subscription = await client.subscribe("nexus")
+            await client.publish(make_events(5))
+            assert len(await receive(subscription, 5)) == 5
+
+    async def test_broker_shutdown_ends_subscription(self, broker):
+        """Test arrêt du broker : fin de l'itération, publication en erreur."""
+        client = BrokerClient(broker.address)
+        await client.connect()
+        subscription = await client.subscribe("nexus")
+        await subscription.wait_assigned()
+
+        await broker.stop()
+
+        assert [batch async for batch in subscription] == []
+        with pytest.raises((ConnectionError, RuntimeError)):
+            await client.publish(make_events(1))
+        await client.close()
@@ -0,0 +1,35 @@
+"""
+Tests unitaires pour le protocole du broker local.
+"""
+
+import pytest
+
+from nexus.broker import partition_of
+from nexus.broker.protocol import decode_runs, encode_runs, merge_runs, parse_address
+
+
+class TestProtocol:
+    """Tests des adresses et des plages de positions."""
+
+    def test_parse_address(self):
+        """Test adresses TCP et Unix, schémas invalides refusés."""
+        assert parse_address("tcp://127.0.0.1:7400") == ("tcp", ("127.0.0.1", 7400))
+        assert parse_address("tcp://[::1]:7400") == ("tcp", ("::1", 7400))
+        assert parse_address("unix:///tmp/nexus.sock") == ("unix", "/tmp/nexus.sock")
+        for address in ("127.0.0.1:7400", "tcp://localhost", "http://host:80", "unix://"):
+            with pytest.raises(ValueError):
+                parse_address(address)
+
+    def test_runs(self):
+        """Test positions regroupées en plages contiguës, aller-retour binaire."""
+        positions = [(1, 5), (0, 3), (1, 6), (0, 4), (1, 8), (0, 2)]
+
+        runs = merge_runs(positions)
+
+        assert runs == [(0, 2, 3), (1, 5, 2), (1, 8, 1)]
+        assert decode_runs(encode_runs(runs)) == runs
+
+    def test_partition_of_is_stable(self):
+        """Test partition d'une source identique d'un appel à l'autre."""
+        assert partition_of("imap", 16) == partition_of("imap", 16)
+        assert {partition_of(f"src{i}", 4) for i in range(100)} == {0, 1, 2, 3}
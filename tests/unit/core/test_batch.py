@@ -0,0 +1,156 @@
+"""
+Tests unitaires pour le lot d'événements en colonnes.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nexus.core.batch import EventBatch  # noqa: E402
+from nexus.core.events import (  # noqa: E402
+    BaseEvent,
+    EmailEvent,
+    EventType,
+    FileEvent,
+    Priority,
+)
+
+START = datetime(2024, 1, 1, 12, 0)
+
+
+@pytest.fixture
+def events():
+    """Événements variés : types, priorités, sources et corrélations."""
+    return [
+        BaseEvent.from_trusted(
+            type=EventType.FILE_CREATED, source="fs", timestamp=START,
+            priority=Priority.LOW, payload={"file_path": "/a"},
+        ),
+        BaseEvent.from_trusted(
+            type=EventType.EMAIL_RECEIVED, source="imap", timestamp=START + timedelta(seconds=90),
+            correlation_id="c1", priority=Priority.HIGH,
+            payload={"from": "a@example.com", "subject": "s", "received_at": "2024-01-01T12:00:00Z"},
+        ),
+        BaseEvent.from_trusted(
+            type=EventType.FILE_MODIFIED, source="fs", timestamp=START + timedelta(seconds=30),
+            correlation_id="c1", priority=Priority.CRITICAL, payload={"file_path": "/b"},
+        ),
+        BaseEvent.from_trusted(
+            type=EventType.CALENDAR_EVENT, source="calendar",
+            timestamp=datetime(2024, 1, 1, 14, 1, tzinfo=timezone(timedelta(hours=2))),
+            priority=Priority.NORMAL,
+        ),
+    ]
+
+
+@pytest.fixture
+def batch(events):
+    """Lot construit à partir des événements."""
+    return EventBatch.from_events(events)
+
+
+class TestEventBatchConversion:
+    """Tests de conversion entre événements et colonnes."""
+
+    def test_columns(self, batch):
+        """Test types et encodage des colonnes."""
+        assert len(batch) == 4
+        assert batch.priorities.dtype == np.uint8
+        assert batch.timestamps.dtype == np.int64
+        assert batch.sources == ["fs", "imap", "calendar"]
+        assert batch.source_codes.tolist() == [0, 1, 0, 2]
+        assert batch.correlations == ["c1"]
+        assert batch.correlation_codes.tolist() == [-1, 0, 0, -1]
+
+    def test_round_trip(self, events, batch):
+        """Test conversion sans perte, fuseaux compris."""
+        restored = batch.to_events()
+
+        assert restored == events
+        assert isinstance(restored[0], FileEvent)
+        assert isinstance(restored[1], EmailEvent)
+        assert restored[3].timestamp.utcoffset() == timedelta(hours=2)
+
+    def test_validated_round_trip(self, events, batch):
+        """Test reconstruction avec validation (horodatages naïfs)."""
+        naive = events[:3]
+        assert EventBatch.from_events(naive).to_events(trusted=False) == naive
+
+    def test_empty(self):
+        """Test lot vide."""
+        batch = EventBatch.from_events([])
+
+        assert len(batch) == 0
+        assert batch.to_events() == []
+        assert batch.count_by("type") == {}
+        assert batch.group_by("source") == {}
+
+
+class TestEventBatchOperations:
+    """Tests des opérations vectorisées."""
+
+    def test_filter_by_type_and_priority(self, batch):
+        """Test filtrage combiné."""
+        files = batch.filter(type=[EventType.FILE_CREATED, EventType.FILE_MODIFIED])
+        urgent = batch.filter(max_priority=Priority.HIGH)
+
+        assert [e.payload["file_path"] for e in files.to_events()] == ["/a", "/b"]
+        assert sorted(urgent.priorities.tolist()) == [1, 2]
+        assert len(batch.filter(type=EventType.FILE_CREATED, priority=Priority.CRITICAL)) == 0
+
+    def test_filter_by_source_and_time(self, batch):
+        """Test filtrage par source et plage horaire."""
+        assert len(batch.filter(source="fs")) == 2
+        assert len(batch.filter(source=["imap", "unknown"])) == 1
+        window = batch.filter(since=START + timedelta(seconds=30), until=START + timedelta(minutes=2))
+        assert len(window) == 3
+
+    def test_filter_aware_bound(self, batch):
+        """Test borne avec fuseau comparée en UTC."""
+        since = datetime(2024, 1, 1, 13, 1, tzinfo=timezone(timedelta(hours=1)))
+        selected = batch.filter(since=since, until=since + timedelta(seconds=1))
+
+        assert [e.type for e in selected.to_events()] == [EventType.CALENDAR_EVENT]
+
+    def test_count_by(self, batch):
+        """Test comptages par colonne."""
+        assert batch.count_by("source") == {"fs": 2, "imap": 1, "calendar": 1}
+        assert batch.count_by("correlation_id") == {None: 2, "c1": 2}
+        assert batch.count_by("type")[EventType.FILE_MODIFIED] == 1
+        assert batch.count_by("priority") == {
+            Priority.CRITICAL: 1, Priority.HIGH: 1, Priority.NORMAL: 1, Priority.LOW: 1,
+        }
+
+    def test_group_by_preserves_order(self, batch):
+        """Test regroupement stable par source."""
+        groups = batch.group_by("source")
+
+        assert set(groups) == {"fs", "imap", "calendar"}
+        assert [e.payload["file_path"] for e in groups["fs"].to_events()] == ["/a", "/b"]
+
+    def test_sort_by(self, batch):
+        """Test tris par horodatage, priorité et source."""
+        by_time = batch.sort_by("timestamp").to_events()
+        by_priority = batch.sort_by("priority", descending=True)
+
+        assert [e.type for e in by_time] == [
+            EventType.FILE_CREATED, EventType.FILE_MODIFIED, EventType.CALENDAR_EVENT, EventType.EMAIL_RECEIVED,
+        ]
+        assert by_priority.priorities.tolist() == [4, 3, 2, 1]
+        assert [batch.sources[c] for c in batch.sort_by("source").source_codes] == [
+            "calendar", "fs", "fs", "imap",
+        ]
+
+    def test_bucket_counts(self, batch):
+        """Test histogramme par minute."""
+        # L'événement calendrier (14:01 UTC+2) tombe dans l'intervalle 12:01 UTC
+        assert batch.bucket_counts(timedelta(minutes=1)) == {START: 2, START + timedelta(minutes=1): 2}
+
+    def test_invalid_column(self, batch):
+        """Test colonne inconnue."""
+        with pytest.raises(ValueError):
+            batch.group_by("payload")
+        with pytest.raises(ValueError):
+            batch.sort_by("event_id")
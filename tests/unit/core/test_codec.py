@@ -0,0 +1,217 @@
+"""
+Tests unitaires pour le format binaire compact des événements.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from nexus.core.codec import (
+    MAX_STRING_LENGTHS,
+    TYPE_CODES,
+    CodecError,
+    batch_frames,
+    datetime_to_micros,
+    datetime_to_seconds,
+    decode_event,
+    decode_events,
+    decode_source,
+    encode_event,
+    encode_events,
+    encode_frames,
+    iter_frames,
+    micros_to_datetime,
+)
+from nexus.core.events import (
+    BaseEvent,
+    EmailEvent,
+    EventType,
+    FileEvent,
+    Priority,
+    create_event,
+    parse_event,
+)
+
+
+def sample_events():
+    """Construit un événement de chaque type."""
+    return [
+        create_event(
+            EventType.EMAIL_RECEIVED,
+            "imap_producer",
+            {"from": "a@example.com", "subject": "Été", "received_at": "2023-10-24T10:00:00Z"},
+            correlation_id="corr-1",
+            priority=Priority.HIGH,
+        ),
+        create_event(EventType.FILE_CREATED, "file_watcher", {"file_path": "/a", "size": 12}),
+        create_event(EventType.FILE_MODIFIED, "file_watcher", {"file_path": "/b"}),
+        create_event(EventType.FILE_DELETED, "file_watcher", {"file_path": "/c"}),
+        create_event(EventType.SCHEDULED_TASK, "scheduler", {"task_id": "t", "scheduled_time": "x"}),
+        create_event(EventType.SYSTEM_HEALTH, "monitor", {"component": "db", "status": "ok", "metrics": {"cpu": 1.5}}),
+        create_event(EventType.ERROR_OCCURRED, "handler", {"error_type": "E", "message": "m", "component": "c"}),
+        create_event(EventType.CALENDAR_EVENT, "calendar_sync", {"nested": [1, None, True, {"k": "v"}]}),
+    ]
+
+
+class TestEventFrames:
+    """Tests d'encodage et de décodage d'une trame."""
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_round_trip_all_types(self, trusted):
+        """Test aller-retour exact pour chaque type d'événement."""
+        for event in sample_events():
+            decoded = decode_event(encode_event(event), trusted=trusted)
+
+            assert type(decoded) is type(event)
+            assert decoded == event
+            assert decoded.model_dump_json() == event.model_dump_json()
+
+    def test_matches_json_form(self):
+        """Test que le binaire décode vers le même événement que le JSON."""
+        event = create_event(
+            EventType.CALENDAR_EVENT,
+            "calendar_sync",
+            {"when": datetime(2024, 1, 1, 12, 30), "tags": {"a"}},
+        )
+
+        assert decode_event(encode_event(event)) == parse_event(event.model_dump_json())
+
+    def test_methods_on_event(self):
+        """Test des méthodes to_bytes / from_bytes."""
+        event = sample_events()[1]
+        frame = event.to_bytes()
+
+        assert isinstance(BaseEvent.from_bytes(frame), FileEvent)
+        assert FileEvent.from_bytes(frame, trusted=True) == event
+        with pytest.raises(TypeError, match="not a EmailEvent"):
+            EmailEvent.from_bytes(frame)
+
+    def test_compact_size(self):
+        """Test que la trame est plus compacte que le JSON."""
+        for event in sample_events():
+            assert len(encode_event(event)) < len(event.model_dump_json())
+
+    def test_free_form_ids(self):
+        """Test des identifiants libres, y compris UUID en majuscules."""
+        for event_id in ["custom-id", "550E8400-E29B-41D4-A716-446655440000", "é" * 20]:
+            event = BaseEvent(type=EventType.CALENDAR_EVENT, source="test", event_id=event_id)
+            assert decode_event(encode_event(event)).event_id == event_id
+
+    @pytest.mark.parametrize("field", ["event_id", "source", "correlation_id"])
+    def test_oversized_strings(self, field):
+        """Test rejet des chaînes trop longues pour l'en-tête."""
+        limit = MAX_STRING_LENGTHS[field]
+        fields = {"type": EventType.CALENDAR_EVENT, "source": "test", "correlation_id": "corr"}
+
+        event = BaseEvent.from_trusted(**{**fields, field: "é" * limit})
+        with pytest.raises(CodecError, match=f"{field} of {2 * limit} bytes"):
+            encode_event(event)
+
+        event = BaseEvent.from_trusted(**{**fields, field: "x" * limit})
+        assert getattr(decode_event(encode_event(event)), field) == "x" * limit
+
+    def test_aware_timestamp(self):
+        """Test conservation du fuseau horaire."""
+        tz = timezone(timedelta(hours=-5))
+        timestamp = datetime(2023, 10, 24, 5, 0, 0, 123456, tzinfo=tz)
+        event = BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source="test", timestamp=timestamp)
+        decoded = decode_event(encode_event(event), trusted=True)
+
+        assert decoded.timestamp == timestamp
+        assert decoded.timestamp.utcoffset() == timedelta(hours=-5)
+        assert decoded.model_dump_json() == event.model_dump_json()
+
+    def test_validation_on_decode(self):
+        """Test que le décodage non fiable applique le contrat."""
+        event = BaseEvent.from_trusted(type=EventType.EMAIL_RECEIVED, source="imap", payload={})
+        frame = encode_event(event)
+
+        with pytest.raises(ValidationError, match="Email event must contain 'from'"):
+            decode_event(frame)
+        assert isinstance(decode_event(frame, trusted=True), EmailEvent)
+
+    def test_invalid_frames(self):
+        """Test rejet de trames invalides."""
+        frame = encode_event(sample_events()[0])
+
+        with pytest.raises(CodecError, match="version"):
+            decode_event(b"\x02" + frame[1:])
+        with pytest.raises(CodecError):
+            decode_event(frame[:10])
+        with pytest.raises(CodecError):
+            decode_event(frame[:4] + b"\x00" * 8)
+        with pytest.raises(CodecError):
+            decode_event(frame[:20])
+        with pytest.raises(CodecError):
+            decode_event(frame[:1] + b"\xff" + frame[2:])
+
+    def test_stable_type_codes(self):
+        """Test que chaque type possède un code unique."""
+        assert set(TYPE_CODES) == set(EventType)
+        assert len(set(TYPE_CODES.values())) == len(TYPE_CODES)
+
+    def test_micros_conversion(self):
+        """Test conversion horodatage / microsecondes."""
+        naive = datetime(2024, 2, 29, 23, 59, 59, 999999)
+        micros, offset = datetime_to_micros(naive)
+
+        assert offset is None
+        assert micros_to_datetime(micros) == naive
+        aware = naive.replace(tzinfo=timezone.utc)
+        assert datetime_to_micros(aware) == (micros, 0)
+
+    def test_seconds_conversion(self):
+        """Test conversion horodatage / secondes : naïf en UTC."""
+        naive = datetime(2024, 2, 29, 23, 59, 59)
+        paris = timezone(timedelta(hours=1))
+
+        assert datetime_to_seconds(naive) == naive.replace(tzinfo=timezone.utc).timestamp()
+        assert datetime_to_seconds((naive + timedelta(hours=1)).replace(tzinfo=paris)) == datetime_to_seconds(naive)
+
+
+class TestEventBatches:
+    """Tests d'encodage et de décodage par lot."""
+
+    def test_batch_round_trip(self):
+        """Test aller-retour d'un lot."""
+        events = sample_events()
+        decoded = decode_events(encode_events(events), trusted=True)
+
+        assert decoded == events
+        assert [type(event) for event in decoded] == [type(event) for event in events]
+
+    def test_empty_batch(self):
+        """Test lot vide."""
+        assert decode_events(encode_events([])) == []
+
+    def test_iter_frames(self):
+        """Test parcours des trames sans copie."""
+        events = sample_events()
+        body = memoryview(encode_events(events))[9:]
+        frames = list(iter_frames(body))
+
+        assert len(frames) == len(events)
+        assert all(isinstance(frame, memoryview) for frame in frames)
+        assert [decode_event(frame, trusted=True) for frame in frames] == events
+
+    def test_frames_without_decoding(self):
+        """Test trames d'un lot, source lue seule, lot réassemblé à l'identique."""
+        events = sample_events()
+        data = encode_events(events)
+        frames = batch_frames(data)
+
+        assert [decode_source(frame) for frame in frames] == [event.source for event in events]
+        assert encode_frames(frames) == data
+        assert encode_frames(frames[1:]) == encode_events(events[1:])
+
+    def test_invalid_batches(self):
+        """Test rejet de lots invalides ou tronqués."""
+        data = encode_events(sample_events())
+
+        with pytest.raises(CodecError, match="Not an event batch"):
+            decode_events(b"XXXX" + data[4:])
+        with pytest.raises(CodecError):
+            decode_events(data[:-3])
+        with pytest.raises(CodecError):
+            decode_events(data[:5])
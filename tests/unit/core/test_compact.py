@@ -0,0 +1,107 @@
+"""
+Tests unitaires pour la représentation compacte des événements.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nexus.core.codec import CodecError, encode_event
+from nexus.core.compact import CompactEvent
+from nexus.core.events import (
+    BaseEvent,
+    EmailEvent,
+    EventType,
+    FileEvent,
+    Priority,
+    create_event,
+)
+
+
+@pytest.fixture
+def email_event():
+    """Événement email avec corrélation."""
+    return create_event(
+        EventType.EMAIL_RECEIVED,
+        "imap_producer",
+        {"from": "a@example.com", "subject": "Test", "received_at": "2023-10-24T10:00:00Z"},
+        correlation_id="corr-1",
+        priority=Priority.HIGH,
+    )
+
+
+class TestCompactEvent:
+    """Tests pour la classe CompactEvent."""
+
+    def test_round_trip(self, email_event):
+        """Test conversion sans perte vers et depuis BaseEvent."""
+        compact = CompactEvent.from_event(email_event)
+        restored = compact.to_event()
+
+        assert isinstance(restored, EmailEvent)
+        assert restored == email_event
+        assert restored.model_dump_json() == email_event.model_dump_json()
+
+    def test_validated_round_trip(self):
+        """Test reconstruction avec validation."""
+        event = create_event(EventType.FILE_MODIFIED, "file_watcher", {"file_path": "/a"})
+        restored = CompactEvent.from_event(event).to_event(trusted=False)
+
+        assert isinstance(restored, FileEvent)
+        assert restored == event
+
+    def test_field_accessors(self, email_event):
+        """Test lecture des champs sans reconstruction."""
+        compact = CompactEvent.from_event(email_event)
+
+        assert compact.priority == Priority.HIGH
+        assert compact.type == EventType.EMAIL_RECEIVED
+        assert compact.event_id == email_event.event_id
+        assert compact.source == "imap_producer"
+        assert compact.correlation_id == "corr-1"
+        assert compact.timestamp == email_event.timestamp
+
+    def test_accessors_without_correlation(self):
+        """Test accesseurs quand la corrélation est absente."""
+        event = create_event(EventType.CALENDAR_EVENT, "calendar_sync", {})
+        compact = CompactEvent.from_event(event)
+
+        assert compact.correlation_id is None
+        assert compact.source == "calendar_sync"
+
+    def test_aware_timestamp(self):
+        """Test horodatage avec fuseau."""
+        timestamp = datetime(2023, 10, 24, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+        event = BaseEvent.from_trusted(
+            type=EventType.CALENDAR_EVENT, source="calendar_sync", timestamp=timestamp, correlation_id="c"
+        )
+        compact = CompactEvent.from_event(event)
+
+        assert compact.timestamp == timestamp
+        assert compact.timestamp.utcoffset() == timedelta(hours=2)
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert compact.timestamp_us == (timestamp - epoch) // timedelta(microseconds=1)
+
+    def test_from_frame(self, email_event):
+        """Test construction depuis une trame ou une vue mémoire."""
+        frame = encode_event(email_event)
+
+        assert CompactEvent.from_frame(memoryview(frame)) == CompactEvent(frame)
+        with pytest.raises(CodecError):
+            CompactEvent(b"\x09" + frame[1:])
+
+    def test_slots(self, email_event):
+        """Test que l'objet n'a pas de dictionnaire d'instance."""
+        compact = CompactEvent.from_event(email_event)
+
+        assert not hasattr(compact, "__dict__")
+        assert len(compact) == len(compact.frame)
+
+    def test_equality_and_hash(self, email_event):
+        """Test égalité et hachage par trame."""
+        first = CompactEvent.from_event(email_event)
+        second = CompactEvent.from_event(email_event)
+
+        assert first == second
+        assert len({first, second}) == 1
+        assert "email_received" in repr(first)
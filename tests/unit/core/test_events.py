@@ -2,8 +2,9 @@
 Tests unitaires pour les schémas d'événements Nexus.
 """
 
+import gc
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
@@ -11,6 +12,7 @@ from pydantic import ValidationError
 
 from nexus.core.events import (
     BaseEvent,
+    CorrelationEvent,
     EmailEvent,
     ErrorEvent,
     Event,
@@ -20,6 +22,10 @@ from nexus.core.events import (
     ScheduledEvent,
     SystemHealthEvent,
     create_event,
+    create_events,
+    parse_event,
+    parse_event_array,
+    parse_events,
 )
 
 
@@ -95,6 +101,19 @@ class TestBaseEvent:
                 timestamp=future_time
             )
 
+    def test_timestamp_validation_aware(self):
+        """Test validation d'un timestamp avec fuseau horaire."""
+        past_time = datetime.now(timezone.utc) - timedelta(minutes=1)
+        event = BaseEvent(type=EventType.EMAIL_RECEIVED, source="test", timestamp=past_time)
+        assert event.timestamp == past_time
+
+        with pytest.raises(ValidationError, match="Timestamp cannot be in the future"):
+            BaseEvent(
+                type=EventType.EMAIL_RECEIVED,
+                source="test",
+                timestamp=datetime.now(timezone.utc) + timedelta(hours=1),
+            )
+
     def test_json_serialization(self):
         """Test sérialisation JSON."""
         event = BaseEvent(
@@ -301,6 +320,115 @@ class TestErrorEvent:
             )
 
 
+class TestCorrelationEvent:
+    """Tests pour la classe CorrelationEvent."""
+
+    def test_correlation_event_round_trip(self):
+        """Test création, contrat et décodage typé."""
+        payload = {"rule": "upload_notified", "events": ["a", "b"]}
+
+        event = CorrelationEvent(source="correlation", payload=payload)
+
+        assert event.type == EventType.CORRELATION_MATCHED
+        assert isinstance(parse_event(event.model_dump_json()), CorrelationEvent)
+        assert isinstance(BaseEvent.from_bytes(event.to_bytes()), CorrelationEvent)
+        with pytest.raises(ValueError, match="Correlation event must contain 'events' in payload"):
+            CorrelationEvent(source="correlation", payload={"rule": "upload_notified"})
+
+
+class TestPayloadContracts:
+    """Tests des contrats de payload sur tous les points d'entrée Pydantic."""
+
+    @pytest.mark.parametrize("event_class, data, message", [
+        (EmailEvent, {"source": "imap", "payload": {"from": "a", "subject": "b"}}, "'received_at'"),
+        (FileEvent, {"type": "file_created", "source": "fs", "payload": {}}, "'file_path'"),
+        (ScheduledEvent, {"source": "scheduler", "payload": {"task_id": "t"}}, "'scheduled_time'"),
+        (SystemHealthEvent, {"source": "monitor", "payload": {"component": "db", "status": "ok"}}, "'metrics'"),
+        (ErrorEvent, {"source": "handler", "payload": {"error_type": "E", "message": "m"}}, "'component'"),
+    ])
+    def test_rules_enforced_by_every_entry_point(self, event_class, data, message):
+        """Test que constructeur, model_validate et model_validate_json appliquent les règles."""
+        with pytest.raises(ValidationError, match=message):
+            event_class(**data)
+        with pytest.raises(ValidationError, match=message):
+            event_class.model_validate(data)
+        with pytest.raises(ValidationError, match=message):
+            event_class.model_validate_json(json.dumps(data))
+
+    def test_missing_payload_uses_default(self):
+        """Test qu'un payload absent est validé contre le contrat."""
+        with pytest.raises(ValidationError, match="Email event must contain 'from' in payload"):
+            EmailEvent(source="imap_producer")
+
+    def test_file_type_rule_on_validate(self):
+        """Test que la règle de type fichier s'applique à model_validate."""
+        with pytest.raises(ValidationError, match="FileEvent type must be one of"):
+            FileEvent.model_validate({"type": "email_received", "source": "fs", "payload": {"file_path": "/a"}})
+
+    def test_required_payload_fields_declared(self):
+        """Test que les champs requis sont exposés par classe."""
+        assert BaseEvent.required_payload_fields == ()
+        assert EmailEvent.required_payload_fields == ("from", "subject", "received_at")
+        assert FileEvent.required_payload_fields == ("file_path",)
+
+
+class TestTrustedConstruction:
+    """Tests pour le chemin de construction de confiance from_trusted."""
+
+    def _validated_events(self):
+        return [
+            create_event(
+                EventType.EMAIL_RECEIVED,
+                "imap_producer",
+                {"from": "a@example.com", "subject": "Test", "received_at": "2023-10-24T10:00:00Z"},
+                correlation_id="corr-1",
+            ),
+            create_event(EventType.FILE_MODIFIED, "file_watcher", {"file_path": "/a"}, priority=Priority.HIGH),
+            create_event(EventType.SCHEDULED_TASK, "scheduler", {"task_id": "t", "scheduled_time": "x"}),
+            create_event(EventType.SYSTEM_HEALTH, "monitor", {"component": "db", "status": "ok", "metrics": {}}),
+            create_event(EventType.ERROR_OCCURRED, "handler", {"error_type": "E", "message": "m", "component": "c"}),
+            create_event(EventType.CALENDAR_EVENT, "calendar_sync", {"event_id": "cal_1"}),
+        ]
+
+    def test_from_trusted_identical_to_validated(self):
+        """Test que from_trusted reproduit exactement l'événement validé."""
+        for event in self._validated_events():
+            trusted = BaseEvent.from_trusted(**event.model_dump())
+
+            assert type(trusted) is type(event)
+            assert trusted == event
+            assert trusted.model_dump() == event.model_dump()
+            assert trusted.model_dump_json() == event.model_dump_json()
+
+    def test_from_trusted_on_subclass(self):
+        """Test appel direct sur une classe spécialisée."""
+        event = self._validated_events()[1]
+        trusted = FileEvent.from_trusted(**event.model_dump())
+
+        assert isinstance(trusted, FileEvent)
+        assert trusted == event
+
+    def test_from_trusted_fills_defaults(self):
+        """Test que les valeurs par défaut de la classe sont appliquées."""
+        trusted = BaseEvent.from_trusted(
+            type=EventType.SYSTEM_HEALTH,
+            source="monitor",
+            payload={"component": "db", "status": "ok", "metrics": {}},
+        )
+
+        assert isinstance(trusted, SystemHealthEvent)
+        assert trusted.priority == Priority.BACKGROUND
+        assert isinstance(trusted.event_id, str)
+        assert isinstance(trusted.timestamp, datetime)
+
+    def test_from_trusted_skips_validation(self):
+        """Test que les validateurs ne sont pas exécutés."""
+        trusted = BaseEvent.from_trusted(type=EventType.EMAIL_RECEIVED, source="imap_producer", payload={})
+
+        assert isinstance(trusted, EmailEvent)
+        assert trusted.payload == {}
+
+
 class TestCreateEventFactory:
     """Tests pour la fonction factory create_event."""
 
@@ -359,6 +487,177 @@ class TestCreateEventFactory:
         assert event.priority == Priority.LOW
 
 
+class TestCreateEventsBulk:
+    """Tests pour la création d'événements en lot create_events."""
+
+    def test_create_events_mixed_types(self):
+        """Test création d'un lot mélangeant plusieurs types."""
+        records = [
+            {"type": EventType.FILE_CREATED, "source": "file_watcher", "payload": {"file_path": "/a"}},
+            {
+                "type": "email_received",
+                "source": "imap_producer",
+                "payload": {"from": "a@example.com", "subject": "Test", "received_at": "2023-10-24T10:00:00Z"},
+            },
+            {"type": EventType.CALENDAR_EVENT, "source": "calendar_sync", "priority": Priority.LOW},
+            {"type": EventType.FILE_DELETED, "source": "file_watcher", "payload": {"file_path": "/b"}},
+        ]
+
+        result = create_events(records)
+
+        assert result.ok
+        assert [type(event) for event in result.events] == [FileEvent, EmailEvent, BaseEvent, FileEvent]
+        assert [event.payload.get("file_path") for event in result.events] == ["/a", None, None, "/b"]
+        assert result.events[2].priority == Priority.LOW
+
+    def test_create_events_reports_invalid_records(self):
+        """Test que les enregistrements invalides sont rapportés sans interrompre le lot."""
+        records = [
+            {"type": EventType.FILE_CREATED, "source": "file_watcher", "payload": {"file_path": "/a"}},
+            {"type": EventType.FILE_CREATED, "source": "file_watcher", "payload": {}},
+            {"type": EventType.SCHEDULED_TASK, "source": "scheduler", "payload": {"task_id": "t1"}},
+            {"type": EventType.CALENDAR_EVENT, "source": ""},
+            {"type": EventType.FILE_MODIFIED, "source": "file_watcher", "payload": {"file_path": "/b"}},
+        ]
+
+        result = create_events(records)
+
+        assert not result.ok
+        assert [event.payload["file_path"] for event in result.events] == ["/a", "/b"]
+        assert [error.index for error in result.errors] == [1, 2, 3]
+        assert "file_path" in result.errors[0].message
+        assert "scheduled_time" in result.errors[1].message
+        assert "Source cannot be empty" in result.errors[2].message
+
+    def test_create_events_payload_error_matches_create_event(self):
+        """Test que le contrat de payload vérifié par lot produit l'erreur de create_event."""
+        record = {"type": EventType.EMAIL_RECEIVED, "source": "imap_producer", "payload": {"from": "a@example.com"}}
+        result = create_events([record])
+        with pytest.raises(ValidationError) as exc_info:
+            create_event(record["type"], record["source"], record["payload"])
+
+        expected = exc_info.value.errors(include_url=False)[0]
+        error = result.errors[0].errors[0]
+        assert (error["type"], error["loc"], error["msg"]) == (expected["type"], expected["loc"], expected["msg"])
+        assert error["msg"] == "Value error, Email event must contain 'subject' in payload"
+
+    def test_create_events_restores_gc(self):
+        """Test que le ramasse-miettes retrouve son état après un lot."""
+        records = [{"type": EventType.CALENDAR_EVENT, "source": "calendar_sync"}, {"type": "unknown_type"}]
+        assert gc.isenabled()
+        create_events(records)
+        assert gc.isenabled()
+
+        gc.disable()
+        try:
+            create_events(records)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_create_events_unknown_type(self):
+        """Test qu'un type inconnu ou un enregistrement non dictionnaire est rejeté."""
+        result = create_events([
+            {"type": "unknown_type", "source": "test"},
+            "not a record",
+            {"type": ["unhashable"], "source": "test"},
+        ])
+
+        assert result.events == []
+        assert [error.index for error in result.errors] == [0, 1, 2]
+
+    def test_create_events_matches_create_event(self):
+        """Test que le lot produit les mêmes événements que la factory unitaire."""
+        payload = {"component": "db", "status": "healthy", "metrics": {}}
+        result = create_events([
+            {"type": EventType.SYSTEM_HEALTH, "source": "health_monitor", "payload": payload, "event_id": "id-1"}
+        ])
+        expected = create_event(EventType.SYSTEM_HEALTH, "health_monitor", payload, event_id="id-1")
+
+        assert result.events[0].model_dump(exclude={"timestamp"}) == expected.model_dump(exclude={"timestamp"})
+
+    def test_create_events_empty(self):
+        """Test lot vide."""
+        result = create_events([])
+        assert result.ok
+        assert result.events == []
+
+
+class TestParseEvent:
+    """Tests pour le décodage JSON discriminé parse_event / parse_events."""
+
+    def test_parse_event_selects_subclass(self):
+        """Test que le champ type sélectionne la classe spécialisée."""
+        email = create_event(
+            event_type=EventType.EMAIL_RECEIVED,
+            source="imap_producer",
+            payload={"from": "a@example.com", "subject": "Test", "received_at": "2023-10-24T10:00:00Z"},
+        )
+        file_event = create_event(EventType.FILE_DELETED, "file_watcher", {"file_path": "/a"})
+        calendar = create_event(EventType.CALENDAR_EVENT, "calendar_sync", {"event_id": "cal_1"})
+
+        for event in (email, file_event, calendar):
+            parsed = parse_event(event.model_dump_json().encode())
+            assert type(parsed) is type(event)
+            assert parsed == event
+
+    def test_parse_event_accepts_str(self):
+        """Test décodage depuis une chaîne."""
+        parsed = parse_event('{"type": "file_created", "source": "file_watcher", "payload": {"file_path": "/a"}}')
+        assert isinstance(parsed, FileEvent)
+        assert parsed.type == EventType.FILE_CREATED
+
+    def test_parse_event_enforces_contract(self):
+        """Test que les règles de payload s'appliquent au décodage."""
+        with pytest.raises(ValidationError, match="File event must contain 'file_path' in payload"):
+            parse_event(b'{"type": "file_modified", "source": "file_watcher", "payload": {}}')
+
+    def test_parse_event_invalid_tag(self):
+        """Test rejet d'un type inconnu ou absent."""
+        with pytest.raises(ValidationError, match="union_tag_invalid"):
+            parse_event(b'{"type": "unknown", "source": "test"}')
+        with pytest.raises(ValidationError, match="union_tag_not_found"):
+            parse_event(b'{"source": "test"}')
+
+    def test_parse_events_reports_errors(self):
+        """Test décodage d'une suite avec documents invalides."""
+        result = parse_events([
+            b'{"type": "calendar_event", "source": "calendar_sync"}',
+            b'not json',
+            b'{"type": "scheduled_task", "source": "scheduler", "payload": {"task_id": "t", "scheduled_time": "x"}}',
+        ])
+
+        assert [type(event) for event in result.events] == [BaseEvent, ScheduledEvent]
+        assert [error.index for error in result.errors] == [1]
+        assert result.errors[0].errors[0]["type"] == "json_invalid"
+
+
+    def test_parse_event_array(self):
+        """Test tableau décodé en une passe vers les classes typées."""
+        result = parse_event_array(
+            b'[{"type": "file_created", "source": "file_watcher", "payload": {"file_path": "/a"}},'
+            b' {"type": "calendar_event", "source": "calendar_sync"}]'
+        )
+
+        assert result.ok
+        assert [type(event) for event in result.events] == [FileEvent, BaseEvent]
+
+    def test_parse_event_array_reports_errors(self):
+        """Test éléments invalides isolés, les autres conservés."""
+        result = parse_event_array(
+            b'[{"type": "file_created", "source": "file_watcher", "payload": {}},'
+            b' {"type": "calendar_event", "source": "calendar_sync"}]'
+        )
+
+        assert len(result.events) == 1
+        assert [error.index for error in result.errors] == [0]
+
+    def test_parse_event_array_rejects_other_documents(self):
+        """Test document qui n'est pas un tableau ou pas du JSON."""
+        for document in (b'{"type": "calendar_event", "source": "calendar_sync"}', b"not json"):
+            with pytest.raises(ValueError):
+                parse_event_array(document)
+
 class TestEnumValues:
     """Tests pour les énumérations."""
 
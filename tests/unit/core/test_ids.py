@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour la génération des identifiants d'événements.
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+
+from nexus.core import ids
+from nexus.core.events import BaseEvent, EventType
+from nexus.core.ids import (
+    MonotonicIdGenerator,
+    event_id_floor,
+    get_id_generator,
+    new_event_id,
+    set_id_generator,
+    uuid4_id,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_generator():
+    """Restaure le générateur par défaut après chaque test."""
+    yield
+    set_id_generator(None)
+
+
+class TestMonotonicIdGenerator:
+    """Tests pour le générateur UUIDv7 monotone."""
+
+    def test_uuid_v7_format(self):
+        """Test que l'identifiant est un UUID version 7 valide."""
+        event_id = MonotonicIdGenerator()()
+        parsed = UUID(event_id)
+
+        assert parsed.version == 7
+        assert parsed.variant == "specified in RFC 4122"
+        assert str(parsed) == event_id
+
+    def test_ids_sorted_and_unique(self):
+        """Test que les identifiants successifs sont strictement croissants."""
+        generator = MonotonicIdGenerator()
+        generated = [generator() for _ in range(20_000)]
+
+        assert generated == sorted(generated)
+        assert len(set(generated)) == len(generated)
+
+    def test_timestamp_prefix(self, monkeypatch):
+        """Test que le préfixe encode l'horodatage en millisecondes."""
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+        event_id = MonotonicIdGenerator()()
+
+        assert int(event_id[:8] + event_id[9:13], 16) == 1_700_000_000_123
+
+    def test_clock_going_backwards(self, monkeypatch):
+        """Test que l'ordre est préservé si l'horloge recule."""
+        generator = MonotonicIdGenerator()
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 2_000_000_000_000_000)
+        first = generator()
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 1_000_000_000_000_000)
+        second = generator()
+
+        assert second > first
+
+    def test_counter_overflow_advances_time(self, monkeypatch):
+        """Test que le débordement du compteur avance l'horodatage interne."""
+        generator = MonotonicIdGenerator()
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 1_000_000_000_000_000)
+        first = generator()
+        generator._counter = ids._COUNTER_MAX
+        second = generator()
+
+        assert second > first
+        assert second[:13] != first[:13]
+
+    def test_counter_high_bits(self, monkeypatch):
+        """Test le report du compteur dans le groupe rand_a."""
+        generator = MonotonicIdGenerator()
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 1_000_000_000_000_000)
+        generator()
+        generator._counter = 0x3FFF
+        event_id = generator()
+
+        assert event_id[14:19] == "7001-"
+        assert event_id[19:23] == "8000"
+        assert UUID(event_id).version == 7
+
+    def test_reseed_changes_node(self):
+        """Test que le nœud est renouvelé (utilisé après fork)."""
+        generator = MonotonicIdGenerator()
+        before = generator()[-12:]
+        generator.reseed()
+
+        assert generator()[-12:] != before
+
+
+class TestIdGeneratorConfiguration:
+    """Tests pour la configuration du générateur d'identifiants."""
+
+    def test_events_use_monotonic_ids(self):
+        """Test que les événements reçoivent des identifiants triés."""
+        events = [BaseEvent(type=EventType.CALENDAR_EVENT, source="test") for _ in range(100)]
+        event_ids = [event.event_id for event in events]
+
+        assert event_ids == sorted(event_ids)
+        assert UUID(event_ids[0]).version == 7
+
+    def test_uuid4_opt_out(self):
+        """Test le retour aux identifiants UUID4."""
+        set_id_generator(uuid4_id)
+        event = BaseEvent(type=EventType.CALENDAR_EVENT, source="test")
+
+        assert get_id_generator() is uuid4_id
+        assert UUID(event.event_id).version == 4
+
+    def test_custom_generator(self):
+        """Test un générateur personnalisé."""
+        set_id_generator(lambda: "custom-id")
+
+        assert new_event_id() == "custom-id"
+        assert BaseEvent(type=EventType.CALENDAR_EVENT, source="test").event_id == "custom-id"
+
+    def test_event_id_floor(self):
+        """Test la borne inférieure pour les parcours par plage."""
+        now = datetime.utcnow()
+        floor = event_id_floor(now - timedelta(milliseconds=1))
+        event_id = new_event_id()
+
+        assert floor < event_id
+        assert event_id_floor(now + timedelta(seconds=1)) > event_id
+        assert UUID(floor).version == 7
@@ -0,0 +1,157 @@
+"""
+Tests unitaires pour la lecture et l'écriture d'événements en flux.
+"""
+
+import pytest
+
+from nexus.core.codec import CodecError, encode_events
+from nexus.core.events import BaseEvent, EventType, create_event
+from nexus.core.streaming import (
+    StreamFormat,
+    chunked,
+    read_binary,
+    read_events,
+    read_ndjson,
+    write_binary,
+    write_events,
+    write_ndjson,
+)
+
+
+def make_events(count: int):
+    """Événements numérotés."""
+    return [create_event(EventType.FILE_MODIFIED, "sync", {"file_path": f"/tmp/{i}.txt"}) for i in range(count)]
+
+
+async def collect(chunks):
+    """Morceaux lus."""
+    return [chunk async for chunk in chunks]
+
+
+class TestNdjson:
+    """Tests du format NDJSON."""
+
+    async def test_round_trip_in_chunks(self, tmp_path):
+        """Test écriture puis relecture par morceaux de taille fixe."""
+        events = make_events(25)
+        path = tmp_path / "events.ndjson"
+
+        assert await write_ndjson(path, chunked(events, 7)) == 25
+        chunks = await collect(read_ndjson(path, chunk_size=10, block_size=64))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert sum(chunks, []) == events
+
+    async def test_bad_lines_reported(self, tmp_path):
+        """Test lignes invalides signalées avec leur numéro, lecture poursuivie."""
+        good = make_events(2)
+        path = tmp_path / "events.ndjson"
+        path.write_bytes(
+            good[0].model_dump_json().encode() + b"\n"
+            + b"{not json\n"
+            + b"\n"
+            + b'{"type": "email_received", "source": "imap", "payload": {}}\n'
+            + good[1].model_dump_json().encode()
+        )
+        errors = []
+
+        chunks = await collect(read_ndjson(path, on_error=errors.append))
+
+        assert sum(chunks, []) == good
+        assert [error.index for error in errors] == [2, 4]
+        assert "from" in errors[1].message
+
+    async def test_typed_validation(self, tmp_path):
+        """Test classe typée choisie d'après le champ type, comme create_event()."""
+        path = tmp_path / "events.ndjson"
+        path.write_text('{"type": "file_created", "source": "sync", "payload": {"file_path": "/a"}}\n')
+
+        (chunk,) = await collect(read_ndjson(path))
+
+        assert type(chunk[0]).__name__ == "FileEvent"
+
+    async def test_long_line_not_buffered(self, tmp_path):
+        """Test ligne trop longue rejetée sans être conservée en mémoire."""
+        events = make_events(2)
+        path = tmp_path / "events.ndjson"
+        path.write_bytes(
+            events[0].model_dump_json().encode() + b"\n"
+            + b"x" * 5000 + b"\n"
+            + events[1].model_dump_json().encode() + b"\n"
+        )
+        errors = []
+
+        chunks = await collect(read_ndjson(path, on_error=errors.append, block_size=256, max_line=1000))
+
+        assert sum(chunks, []) == events
+        assert [error.index for error in errors] == [2]
+
+
+class TestBinary:
+    """Tests du format binaire."""
+
+    async def test_round_trip_batches(self, tmp_path):
+        """Test fichier formé d'un lot par morceau écrit."""
+        events = make_events(25)
+        path = tmp_path / "events.nxb"
+
+        await write_binary(path, chunked(events, 10))
+        chunks = await collect(read_binary(path, chunk_size=8, block_size=100))
+
+        assert [len(chunk) for chunk in chunks] == [8, 8, 8, 1]
+        assert sum(chunks, []) == events
+
+    async def test_invalid_frame_reported(self, tmp_path):
+        """Test trame non conforme au contrat signalée, lecture poursuivie."""
+        events = make_events(2)
+        bad = BaseEvent.from_trusted(type=EventType.EMAIL_RECEIVED, source="imap", payload={})
+        path = tmp_path / "events.nxb"
+        path.write_bytes(encode_events([events[0], bad, events[1]]))
+        errors = []
+
+        chunks = await collect(read_binary(path, on_error=errors.append))
+
+        assert sum(chunks, []) == events
+        assert [error.index for error in errors] == [2]
+
+    async def test_truncated_file(self, tmp_path):
+        """Test fichier tronqué : CodecError après les événements lisibles."""
+        path = tmp_path / "events.nxb"
+        path.write_bytes(encode_events(make_events(3))[:-10])
+        read = []
+
+        with pytest.raises(CodecError):
+            async for chunk in read_binary(path, chunk_size=1):
+                read.extend(chunk)
+        assert len(read) == 2
+
+
+class TestFormats:
+    """Tests de détection et de choix du format."""
+
+    @pytest.mark.parametrize("format", list(StreamFormat))
+    async def test_detected_format(self, tmp_path, format):
+        """Test format reconnu d'après le contenu du fichier."""
+        events = make_events(5)
+        path = tmp_path / "events"
+
+        await write_events(path, [events[:3], events[3:]], format)
+
+        assert sum(await collect(read_events(path)), []) == events
+
+    async def test_append(self, tmp_path):
+        """Test ajout à un fichier existant."""
+        events = make_events(4)
+        path = tmp_path / "events.nxb"
+
+        await write_binary(path, [events[:2]])
+        await write_binary(path, [events[2:]], append=True)
+
+        assert sum(await collect(read_events(path)), []) == events
+
+    async def test_empty_file(self, tmp_path):
+        """Test fichier vide."""
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+
+        assert await collect(read_events(path)) == []
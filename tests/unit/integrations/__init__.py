@@ -0,0 +1 @@
+# Integrations tests package
\ No newline at end of file
@@ -0,0 +1,284 @@
+"""
+Tests unitaires pour le circuit breaker et l'exécuteur résilient.
+"""
+
+import asyncio
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.integrations import (
+    CircuitBreaker,
+    CircuitState,
+    DeliveryOutcome,
+    ResilientExecutor,
+    RetryPolicy,
+)
+from nexus.queue import DeadLetterReason, MemoryDeadLetterSink
+
+FAST = RetryPolicy(max_retries=3, base_delay=0.01)
+
+
+def make_event(index: int = 0) -> BaseEvent:
+    """Événement numéroté."""
+    return BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source="s", payload={"index": index})
+
+
+class FakeClock:
+    """Horloge manuelle."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyIntegration:
+    """Intégration locale simulée, en panne tant que ``down`` est vrai."""
+
+    def __init__(self, failures: int = 0, down: bool = False, error: type = ConnectionError) -> None:
+        self.failures = failures
+        self.down = down
+        self.error = error
+        self.calls = 0
+        self.received = []
+
+    async def send(self, event: BaseEvent) -> None:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.down or self.failures > 0:
+            self.failures -= 1
+            raise self.error("integration unavailable")
+        self.received.append(event)
+
+
+class TestCircuitBreaker:
+    """Tests du circuit breaker à fenêtre glissante."""
+
+    def test_opens_at_threshold(self):
+        """Test ouverture au 5e échec dans la fenêtre."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, window=60, clock=clock)
+
+        for _ in range(4):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.trips == 1
+
+    def test_old_failures_leave_window(self):
+        """Test échecs sortis de la fenêtre glissante oubliés."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, window=60, buckets=12, clock=clock)
+
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now += 61
+        breaker.record_failure()
+
+        assert breaker.failures == 1
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_single_probe(self):
+        """Test un seul essai en semi-ouvert ; succès : fermeture."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 30
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failures == 0
+
+    def test_failed_probe_reopens(self):
+        """Test échec de l'essai : nouvelle période d'ouverture."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 30
+
+
+class TestRetryPolicy:
+    """Tests du backoff exponentiel."""
+
+    def test_default_delays(self):
+        """Test délais 1 s, 2 s, 4 s par défaut."""
+        policy = RetryPolicy()
+
+        assert [policy.delay(retry) for retry in (1, 2, 3)] == [1.0, 2.0, 4.0]
+
+    def test_max_delay_and_jitter(self):
+        """Test plafond et dispersion du délai."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5)
+
+        assert all(2.5 <= policy.delay(10) <= 7.5 for _ in range(100))
+
+
+class TestResilientExecutor:
+    """Tests de l'exécuteur résilient."""
+
+    async def test_delivered_first_try(self):
+        """Test livraison immédiate."""
+        integration = FlakyIntegration()
+        executor = ResilientExecutor()
+        executor.register("toasty", integration.send, policy=FAST)
+
+        assert await executor.submit("toasty", make_event()) is DeliveryOutcome.DELIVERED
+        assert executor.delivered == 1
+
+    async def test_retried_until_success(self):
+        """Test livraison après nouvelles tentatives planifiées."""
+        integration = FlakyIntegration(failures=2)
+        executor = ResilientExecutor()
+        executor.register("toasty", integration.send, policy=FAST)
+
+        assert await executor.submit("toasty", make_event()) is DeliveryOutcome.RETRYING
+        await asyncio.wait_for(executor.join(), 1)
+
+        assert len(integration.received) == 1
+        assert integration.calls == 3
+        assert executor.retries == 2
+
+    async def test_exhausted_to_dead_letter(self):
+        """Test dead letter après la dernière tentative."""
+        sink = MemoryDeadLetterSink()
+        executor = ResilientExecutor(dead_letters=sink)
+        executor.register("toasty", FlakyIntegration(down=True).send, policy=FAST,
+                          breaker=CircuitBreaker(failure_threshold=100))
+
+        await executor.submit("toasty", make_event())
+        await asyncio.wait_for(executor.join(), 1)
+
+        letter = sink.letters[0]
+        assert letter.reason is DeadLetterReason.EXHAUSTED
+        assert letter.attempts == 4
+        assert letter.error == "ConnectionError: integration unavailable"
+
+    async def test_non_retryable_error(self):
+        """Test erreur non réessayable : dead letter sans compter d'échec."""
+        executor = ResilientExecutor()
+        executor.register("toasty", FlakyIntegration(down=True, error=ValueError).send,
+                          policy=FAST, retry_on=(ConnectionError,))
+
+        outcome = await executor.submit("toasty", make_event())
+
+        assert outcome is DeliveryOutcome.DEAD_LETTERED
+        assert executor.dead_lettered[DeadLetterReason.REJECTED] == 1
+        assert executor.breaker("toasty").failures == 0
+
+    async def test_timeout_is_retryable(self):
+        """Test appel trop long interrompu puis réessayé."""
+        calls = []
+
+        async def slow(event):
+            calls.append(event)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+
+        executor = ResilientExecutor()
+        executor.register("slow", slow, policy=FAST, timeout=0.01)
+
+        assert await executor.submit("slow", make_event()) is DeliveryOutcome.RETRYING
+        await asyncio.wait_for(executor.join(), 1)
+        assert executor.delivered == 1
+
+    async def test_overflow_spills_to_dead_letter(self):
+        """Test plafond de nouvelles tentatives en cours."""
+        executor = ResilientExecutor(max_retries_in_flight=3)
+        executor.register("toasty", FlakyIntegration(down=True).send,
+                          policy=RetryPolicy(base_delay=10), breaker=CircuitBreaker(failure_threshold=100))
+
+        outcomes = [await executor.submit("toasty", make_event(i)) for i in range(5)]
+
+        assert outcomes.count(DeliveryOutcome.RETRYING) == 3
+        assert executor.dead_lettered[DeadLetterReason.OVERFLOW] == 2
+        assert executor.retries_in_flight == 3
+        await executor.close()
+        assert executor.dead_lettered[DeadLetterReason.SHUTDOWN] == 3
+
+    async def test_open_circuit_defers_without_attempt(self):
+        """Test circuit ouvert : report sans appel ni tentative consommée."""
+        integration = FlakyIntegration(down=True)
+        executor = ResilientExecutor()
+        executor.register("toasty", integration.send, policy=FAST,
+                          breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.05))
+
+        await executor.submit("toasty", make_event(0))
+        calls = integration.calls
+        for i in range(1, 10):
+            assert await executor.submit("toasty", make_event(i)) is DeliveryOutcome.RETRYING
+
+        assert integration.calls == calls
+        integration.down = False
+        await asyncio.wait_for(executor.join(), 2)
+        assert len(integration.received) == 10
+
+    async def test_single_timer_no_parked_tasks(self):
+        """Test aucune tâche ne dort pour un événement en attente."""
+        executor = ResilientExecutor()
+        executor.register("toasty", FlakyIntegration(down=True).send,
+                          policy=RetryPolicy(base_delay=10), breaker=CircuitBreaker(failure_threshold=10_000))
+        tasks_before = len(asyncio.all_tasks())
+
+        for i in range(500):
+            await executor.submit("toasty", make_event(i))
+
+        assert executor.retries_in_flight == 500
+        assert len(asyncio.all_tasks()) == tasks_before
+        await executor.close()
+
+
+class TestFailingIntegrationUnderLoad:
+    """Test de charge : intégration locale en panne à 1000 événements/s."""
+
+    @pytest.mark.slow
+    async def test_outage_at_1000_events_per_second(self):
+        """Test panne puis rétablissement : aucun événement perdu, mémoire bornée."""
+        integration = FlakyIntegration(down=True)
+        sink = MemoryDeadLetterSink(maxlen=None)
+        executor = ResilientExecutor(dead_letters=sink, max_retries_in_flight=200)
+        executor.register(
+            "toasty",
+            integration.send,
+            breaker=CircuitBreaker(failure_threshold=5, window=1.0, reset_timeout=0.1),
+            policy=RetryPolicy(max_retries=3, base_delay=0.05),
+        )
+        peak_in_flight = 0
+        peak_tasks = 0
+
+        # 1000 événements en 1 s, par paquets de 10 toutes les 10 ms ;
+        # l'intégration revient après 0,4 s
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for tick in range(100):
+            if loop.time() - start >= 0.4:
+                integration.down = False
+            for i in range(10):
+                await executor.submit("toasty", make_event(tick * 10 + i))
+            peak_in_flight = max(peak_in_flight, executor.retries_in_flight)
+            peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+            await asyncio.sleep(start + (tick + 1) * 0.01 - loop.time())
+        await asyncio.wait_for(executor.join(), 5)
+
+        delivered = {event.payload["index"] for event in integration.received}
+        dead = {letter.event.payload["index"] for letter in sink.letters}
+        assert delivered | dead == set(range(1000))
+        assert not delivered & dead
+        assert peak_in_flight <= 200
+        assert peak_tasks < 10
+        assert executor.dead_lettered[DeadLetterReason.OVERFLOW] > 0
+        assert len(delivered) > 500
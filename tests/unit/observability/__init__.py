@@ -0,0 +1 @@
+# Observability tests package
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Tests unitaires pour les métriques du cycle de vie des événements.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from nexus.core.events import BaseEvent, EventType, Priority
+from nexus.integrations import ResilientExecutor
+from nexus.observability import EventMetrics, disable_metrics, enable_metrics, metrics
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry, WorkerPool
+from nexus.queue import PriorityEventQueue
+
+
+def file_event(source: str = "sync", **fields) -> BaseEvent:
+    """Événement fichier."""
+    return BaseEvent.from_trusted(type=EventType.FILE_MODIFIED, source=source, payload={"file_path": "/a"}, **fields)
+
+
+class EchoProcessor(AbstractProcessor):
+    """Processeur sans effet, en échec sur demande."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    async def process_event(self, event):
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=not self.fail)
+
+    def can_handle(self, event_type):
+        return True
+
+    async def health_check(self):
+        return True
+
+
+class FailingProcessor(EchoProcessor):
+    """Processeur toujours en échec."""
+
+    def __init__(self) -> None:
+        super().__init__(fail=True)
+
+
+@pytest.fixture
+def registry():
+    registry = CollectorRegistry()
+    yield registry
+    disable_metrics()
+
+
+class TestSwitch:
+    """Tests de l'activation de l'instrumentation."""
+
+    def test_disabled_by_default(self, registry):
+        """Test aucune mesure sans enable_metrics()."""
+        queue = PriorityEventQueue()
+        queue.put_nowait(file_event())
+        queue.get_nowait()
+
+        assert metrics.active is None
+        assert registry.get_sample_value("nexus_events_enqueued_total", {"type": "file_modified", "source": "sync"}) is None
+
+    def test_disable_unregisters(self, registry):
+        """Test désactivation : collecteur retiré du registre."""
+        enable_metrics(registry)
+        PriorityEventQueue().put_nowait(file_event())
+        disable_metrics()
+
+        assert metrics.active is None
+        assert registry.get_sample_value("nexus_events_enqueued_total", {"type": "file_modified", "source": "sync"}) is None
+
+
+class TestLifecycle:
+    """Tests des points de mesure."""
+
+    def test_queue_counters_wait_and_depth(self, registry):
+        """Test mises en file, attente en file et profondeur par priorité."""
+        recorder = enable_metrics(registry)
+        queue = PriorityEventQueue()
+        recorder.watch_queue(queue)
+        for _ in range(3):
+            queue.put_nowait(file_event())
+        queue.put_nowait(file_event(source="imap", priority=Priority.HIGH))
+        queue.get_nowait()
+
+        labels = {"type": "file_modified", "source": "sync"}
+        assert registry.get_sample_value("nexus_events_enqueued_total", labels) == 3
+        assert registry.get_sample_value("nexus_queue_wait_seconds_count", {"type": "file_modified"}) == 1
+        assert registry.get_sample_value("nexus_queue_depth", {"queue": "main", "priority": "normal"}) == 3
+        assert registry.get_sample_value("nexus_queue_depth", {"queue": "main", "priority": "high"}) == 0
+
+    async def test_processing_and_end_to_end_latency(self, registry):
+        """Test durée par processeur, issue et latence depuis la création."""
+        enable_metrics(registry)
+        queue = PriorityEventQueue()
+        processors = ProcessorRegistry()
+        processors.register(EchoProcessor())
+        processors.register(FailingProcessor())
+        queue.put_nowait(file_event(timestamp=datetime.utcnow() - timedelta(seconds=0.2)))
+
+        async with WorkerPool(queue, processors, workers=1):
+            await queue.join()
+
+        def sample(name, **labels):
+            return registry.get_sample_value(name, {"type": "file_modified", **labels})
+
+        assert sample("nexus_processing_seconds_count", processor="EchoProcessor") == 1
+        assert sample("nexus_events_processed_total", processor="EchoProcessor", outcome="success") == 1
+        assert sample("nexus_events_processed_total", processor="FailingProcessor", outcome="failure") == 1
+        assert sample("nexus_event_latency_seconds_count", source="sync") == 1
+        assert sample("nexus_event_latency_seconds_bucket", source="sync", le="0.1") == 0
+        assert sample("nexus_event_latency_seconds_bucket", source="sync", le="0.25") == 1
+
+    async def test_integration_calls(self, registry):
+        """Test durée des appels aux intégrations par issue."""
+        enable_metrics(registry)
+        executor = ResilientExecutor()
+
+        async def send(event):
+            if event.source == "broken":
+                raise ConnectionError("down")
+
+        executor.register("toasty", send)
+        await executor.submit("toasty", file_event())
+        await executor.submit("toasty", file_event(source="broken"))
+        await executor.close()
+
+        assert registry.get_sample_value(
+            "nexus_integration_call_seconds_count", {"integration": "toasty", "outcome": "success"}) == 1
+        assert registry.get_sample_value(
+            "nexus_integration_call_seconds_count", {"integration": "toasty", "outcome": "error"}) == 1
+
+
+class TestAggregation:
+    """Tests de l'agrégation des fragments."""
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        """Test bornes inclusives et cumul des intervalles."""
+        recorder = EventMetrics(buckets=(0.1, 1.0))
+        registry.register(recorder)
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            recorder.integration_call("toasty", seconds, "success")
+
+        labels = {"integration": "toasty", "outcome": "success"}
+        buckets = [registry.get_sample_value("nexus_integration_call_seconds_bucket", {**labels, "le": le})
+                   for le in ("0.1", "1.0", "+Inf")]
+        assert buckets == [2, 3, 4]
+        assert registry.get_sample_value("nexus_integration_call_seconds_sum", labels) == pytest.approx(3.65)
+
+    def test_per_thread_shards_merged_on_scrape(self, registry):
+        """Test observations de plusieurs threads additionnées au scrape."""
+        recorder = EventMetrics()
+        registry.register(recorder)
+
+        def work():
+            for _ in range(1000):
+                recorder.enqueued(file_event())
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        work()
+
+        labels = {"type": "file_modified", "source": "sync"}
+        assert registry.get_sample_value("nexus_events_enqueued_total", labels) == 5000
+        assert len(recorder._shards) == 5
+
+    def test_repeated_scrapes_follow_new_observations(self, registry):
+        """Test scrapes successifs : étiquettes réutilisées, valeurs et séries à jour."""
+        recorder = EventMetrics(buckets=(0.1, 1.0))
+        registry.register(recorder)
+        recorder.integration_call("toasty", 0.05, "success")
+        recorder.enqueued(file_event())
+        first = {"integration": "toasty", "outcome": "success", "le": "+Inf"}
+        assert registry.get_sample_value("nexus_integration_call_seconds_bucket", first) == 1
+
+        recorder.integration_call("toasty", 0.5, "success")
+        recorder.integration_call("toasty", 0.5, "error")
+        recorder.enqueued(file_event())
+        recorder.enqueued(file_event(source="imap"))
+
+        assert registry.get_sample_value("nexus_integration_call_seconds_bucket", first) == 2
+        assert registry.get_sample_value(
+            "nexus_integration_call_seconds_count", {"integration": "toasty", "outcome": "error"}
+        ) == 1
+        enqueued = {"type": "file_modified", "source": "sync"}
+        assert registry.get_sample_value("nexus_events_enqueued_total", enqueued) == 2
+        assert registry.get_sample_value("nexus_events_enqueued_total", {**enqueued, "source": "imap"}) == 1
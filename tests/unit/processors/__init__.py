@@ -0,0 +1 @@
+# Processors tests package
\ No newline at end of file
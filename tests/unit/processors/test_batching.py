@@ -0,0 +1,183 @@
+"""
+Tests unitaires pour l'étage de micro-batching.
+"""
+
+import asyncio
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import (
+    AbstractProcessor,
+    BatchingStage,
+    BatchPolicy,
+    ProcessingResult,
+    ProcessorRegistry,
+)
+from nexus.queue import PriorityEventQueue
+
+
+def make_event(index: int, event_type=EventType.CALENDAR_EVENT) -> BaseEvent:
+    """Événement numéroté."""
+    return BaseEvent.from_trusted(type=event_type, source="s", payload={"index": index})
+
+
+class BatchProcessor(AbstractProcessor):
+    """Processeur qui enregistre la composition des lots."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches = []
+        self.singles = 0
+        self.fail = fail
+
+    async def process_event(self, event):
+        self.singles += 1
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+
+    async def process_batch(self, events):
+        if self.fail:
+            raise ConnectionError("down")
+        self.batches.append([e.payload["index"] for e in events])
+        await asyncio.sleep(0)
+        return [ProcessingResult(processor=self.name, event_id=e.event_id, success=True) for e in events]
+
+    def can_handle(self, event_type):
+        return True
+
+    async def health_check(self):
+        return True
+
+
+class PerEventProcessor(BatchProcessor):
+    """Processeur sans process_batch() dédié."""
+
+    process_batch = AbstractProcessor.process_batch
+
+
+def stage_for(processor, **options) -> BatchingStage:
+    """Étage de batching avec un seul processeur."""
+    registry = ProcessorRegistry()
+    registry.register(processor)
+    return BatchingStage(registry, **options)
+
+
+class TestBatchPolicy:
+    """Tests des politiques de regroupement."""
+
+    async def test_flush_on_max_size(self):
+        """Test remise d'un lot plein sans attendre le délai."""
+        processor = BatchProcessor()
+        stage = stage_for(processor, default_policy=BatchPolicy(max_size=3, max_linger=60))
+
+        for i in range(7):
+            await stage.put(make_event(i))
+        await asyncio.sleep(0.01)
+
+        assert processor.batches == [[0, 1, 2], [3, 4, 5]]
+        await stage.flush()
+        assert processor.batches[-1] == [6]
+
+    async def test_flush_on_linger(self):
+        """Test remise d'un lot incomplet après le délai."""
+        processor = BatchProcessor()
+        stage = stage_for(processor, default_policy=BatchPolicy(max_size=100, max_linger=0.01))
+
+        await stage.put(make_event(0))
+        await stage.put(make_event(1))
+        await asyncio.sleep(0.05)
+
+        assert processor.batches == [[0, 1]]
+
+    async def test_policies_per_type(self):
+        """Test politique propre à un type et lots séparés par type."""
+        processor = BatchProcessor()
+        stage = stage_for(
+            processor,
+            policies={EventType.ERROR_OCCURRED: BatchPolicy(max_size=1)},
+            default_policy=BatchPolicy(max_size=100, max_linger=60),
+        )
+
+        await stage.put(make_event(0))
+        await stage.put(make_event(1, EventType.ERROR_OCCURRED))
+        await asyncio.sleep(0.01)
+
+        assert processor.batches == [[1]]
+        await stage.flush()
+        assert processor.batches == [[1], [0]]
+
+    def test_invalid_policy(self):
+        """Test politique invalide."""
+        with pytest.raises(ValueError):
+            BatchPolicy(max_size=0)
+
+
+class TestBatchExecution:
+    """Tests de l'exécution des lots."""
+
+    async def test_fallback_to_per_event(self):
+        """Test appels unitaires sans process_batch() dédié."""
+        processor = PerEventProcessor()
+        stage = stage_for(processor, default_policy=BatchPolicy(max_size=5))
+
+        for i in range(5):
+            await stage.put(make_event(i))
+        await stage.flush()
+
+        assert processor.singles == 5
+        assert processor.batches == []
+
+    async def test_batch_failure_reported_per_event(self):
+        """Test échec d'un lot rapporté pour chaque événement."""
+        collected = []
+        stage = stage_for(
+            BatchProcessor(fail=True),
+            default_policy=BatchPolicy(max_size=2),
+            on_result=lambda processor, events, results: collected.extend(results),
+        )
+
+        await stage.put(make_event(0))
+        await stage.put(make_event(1))
+        await stage.flush()
+
+        assert [r.success for r in collected] == [False, False]
+        assert collected[0].error == "ConnectionError: down"
+
+    async def test_order_preserved_across_batches(self):
+        """Test lots d'un même processeur traités dans l'ordre."""
+        processor = BatchProcessor()
+        stage = stage_for(processor, default_policy=BatchPolicy(max_size=4, max_linger=0.001))
+
+        for i in range(50):
+            await stage.put(make_event(i))
+            if i % 7 == 0:
+                await asyncio.sleep(0)
+        await stage.flush()
+
+        flattened = [index for batch in processor.batches for index in batch]
+        assert flattened == list(range(50))
+        assert stage.batches == len(processor.batches)
+        assert stage.events == 50
+
+    async def test_consume_queue_and_join(self):
+        """Test consommation d'une file : join() attend la fin des lots."""
+        processor = BatchProcessor()
+        stage = stage_for(processor, default_policy=BatchPolicy(max_size=10, max_linger=0.005))
+        queue = PriorityEventQueue(capacity=0)
+        for i in range(25):
+            queue.put_nowait(make_event(i))
+
+        consumer = asyncio.create_task(stage.consume(queue))
+        await asyncio.wait_for(queue.join(), 1)
+        consumer.cancel()
+
+        assert sum(len(batch) for batch in processor.batches) == 25
+        assert len(processor.batches) == 3
+
+    async def test_unrouted_event_completes(self):
+        """Test événement sans processeur marqué terminé."""
+        done = []
+        stage = BatchingStage(ProcessorRegistry())
+
+        await stage.put(make_event(0), on_done=lambda: done.append(True))
+
+        assert done == [True]
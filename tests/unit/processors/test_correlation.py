@@ -0,0 +1,182 @@
+"""
+Tests unitaires pour le moteur de corrélation.
+"""
+
+import pytest
+
+from nexus.core.events import BaseEvent, CorrelationEvent, EventType, Priority
+from nexus.processors import CorrelationEngine, CorrelationRule, PatternStep, ProcessorRegistry
+from nexus.queue import PriorityEventQueue
+
+UPLOAD_THEN_MAIL = CorrelationRule(
+    "upload_notified",
+    [EventType.FILE_CREATED, EventType.EMAIL_RECEIVED],
+    within=30.0,
+    by=("correlation_id", "source"),
+)
+
+
+class FakeClock:
+    """Horloge manuelle."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def event(event_type: EventType, correlation_id="c1", source="sync", **payload) -> BaseEvent:
+    """Événement corrélé."""
+    return BaseEvent.from_trusted(type=event_type, source=source, correlation_id=correlation_id, payload=payload)
+
+
+class TestSequenceMatching:
+    """Tests de la reconnaissance des séquences."""
+
+    def test_sequence_within_window(self):
+        """Test séquence complète dans la fenêtre : événement composite."""
+        clock = FakeClock()
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], clock=clock)
+        created = event(EventType.FILE_CREATED)
+        clock.now = 10.0
+        mail = event(EventType.EMAIL_RECEIVED)
+
+        assert engine.offer(created) == []
+        [match] = engine.offer(mail)
+
+        assert isinstance(match, CorrelationEvent)
+        assert match.correlation_id == "c1"
+        assert match.payload == {
+            "rule": "upload_notified",
+            "key": {"correlation_id": "c1", "source": "sync"},
+            "events": [created.event_id, mail.event_id],
+        }
+        assert engine.open == 0
+        assert engine.matched == 1
+
+    def test_window_expired(self):
+        """Test étape suivante hors délai : séquence abandonnée."""
+        clock = FakeClock()
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], clock=clock)
+        engine.offer(event(EventType.FILE_CREATED))
+        clock.now = 30.5
+
+        assert engine.offer(event(EventType.EMAIL_RECEIVED)) == []
+        assert engine.expired == 1
+        assert engine.open == 0
+
+    def test_keys_are_isolated(self):
+        """Test autre correlation_id ou autre source : pas de corrélation."""
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], clock=FakeClock())
+        engine.offer(event(EventType.FILE_CREATED, correlation_id="c1"))
+
+        assert engine.offer(event(EventType.EMAIL_RECEIVED, correlation_id="c2")) == []
+        assert engine.offer(event(EventType.EMAIL_RECEIVED, source="imap")) == []
+        assert engine.offer(event(EventType.EMAIL_RECEIVED, correlation_id=None)) == []
+        assert len(engine.offer(event(EventType.EMAIL_RECEIVED))) == 1
+
+    def test_out_of_order_steps_ignored(self):
+        """Test étape suivante reçue avant la première : ignorée."""
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], clock=FakeClock())
+
+        assert engine.offer(event(EventType.EMAIL_RECEIVED)) == []
+        assert engine.open == 0
+
+    def test_first_step_restarts_window(self):
+        """Test nouvelle première étape : la fenêtre repart de celle-ci."""
+        clock = FakeClock()
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], clock=clock)
+        engine.offer(event(EventType.FILE_CREATED))
+        clock.now = 20.0
+        latest = event(EventType.FILE_CREATED)
+        engine.offer(latest)
+        clock.now = 40.0
+
+        [match] = engine.offer(event(EventType.EMAIL_RECEIVED))
+        assert match.payload["events"][0] == latest.event_id
+
+    def test_repeated_type_and_filters(self):
+        """Test étapes du même type, filtrées par source et payload."""
+        rule = CorrelationRule(
+            "repeated_failure",
+            [
+                PatternStep(EventType.ERROR_OCCURRED, where={"component": "imap"}),
+                PatternStep(EventType.ERROR_OCCURRED, where={"component": "imap"}),
+                PatternStep(EventType.SYSTEM_HEALTH, source="monitor"),
+            ],
+            within=60.0,
+            by=("payload.account",),
+            priority=Priority.HIGH,
+        )
+        engine = CorrelationEngine([rule], clock=FakeClock())
+
+        assert engine.offer(event(EventType.ERROR_OCCURRED, component="smtp", account="a")) == []
+        assert engine.offer(event(EventType.ERROR_OCCURRED, component="imap", account="a")) == []
+        assert engine.offer(event(EventType.ERROR_OCCURRED, component="imap", account="a")) == []
+        assert engine.offer(event(EventType.SYSTEM_HEALTH, source="sync", account="a")) == []
+        [match] = engine.offer(event(EventType.SYSTEM_HEALTH, source="monitor", account="a"))
+
+        assert len(match.payload["events"]) == 3
+        assert match.priority == Priority.HIGH
+
+    def test_rule_validation(self):
+        """Test règles invalides refusées."""
+        with pytest.raises(ValueError):
+            CorrelationRule("single", [EventType.FILE_CREATED], within=1.0)
+        with pytest.raises(ValueError):
+            CorrelationEngine([CorrelationRule("bad", [EventType.FILE_CREATED] * 2, within=1.0, by=("nope",))])
+        with pytest.raises(ValueError):
+            CorrelationEngine([UPLOAD_THEN_MAIL, UPLOAD_THEN_MAIL])
+
+
+class TestBoundedState:
+    """Tests de la mémoire bornée."""
+
+    def test_expire_releases_open_runs(self):
+        """Test expiration sans nouvel événement."""
+        clock = FakeClock()
+        short = CorrelationRule("short", [EventType.FILE_CREATED, EventType.FILE_DELETED], within=5.0)
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL, short], clock=clock)
+        for i in range(10):
+            engine.offer(event(EventType.FILE_CREATED, correlation_id=f"c{i}"))
+        assert engine.open == 20
+
+        clock.now = 6.0
+        assert engine.expire() == 10
+        clock.now = 31.0
+        assert engine.expire() == 10
+        assert engine.open == 0
+
+    def test_max_open_evicts_oldest(self):
+        """Test plafond de séquences ouvertes : la plus ancienne est abandonnée."""
+        clock = FakeClock()
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], max_open=3, clock=clock)
+        for i in range(5):
+            clock.now = i
+            engine.offer(event(EventType.FILE_CREATED, correlation_id=f"c{i}"))
+
+        assert engine.open == 3
+        assert engine.evicted == 2
+        assert engine.offer(event(EventType.EMAIL_RECEIVED, correlation_id="c0")) == []
+        assert len(engine.offer(event(EventType.EMAIL_RECEIVED, correlation_id="c4"))) == 1
+
+
+class TestProcessor:
+    """Tests de l'intégration comme processeur."""
+
+    async def test_composites_reach_the_queue(self):
+        """Test routage par le registre et émission dans la file."""
+        queue = PriorityEventQueue()
+        engine = CorrelationEngine([UPLOAD_THEN_MAIL], sink=queue)
+        registry = ProcessorRegistry()
+        registry.register(engine)
+
+        assert not registry.route(event(EventType.FILE_DELETED))
+        for item in (event(EventType.FILE_CREATED), event(EventType.EMAIL_RECEIVED)):
+            for processor in registry.route(item):
+                result = await processor.process_event(item)
+
+        assert queue.get_nowait().type == EventType.CORRELATION_MATCHED
+        assert result.data["matched"]
+        assert await engine.health_check()
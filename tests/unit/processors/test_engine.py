@@ -0,0 +1,233 @@
+"""
+Tests unitaires pour le moteur de consommation concurrent.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import (
+    AbstractProcessor,
+    BlockingProcessor,
+    ProcessingResult,
+    ProcessorRegistry,
+    WorkerPool,
+)
+from nexus.queue import PriorityEventQueue
+
+
+def make_event(index: int, source: str = "s", correlation_id=None, event_type=EventType.CALENDAR_EVENT):
+    """Événement numéroté."""
+    return BaseEvent.from_trusted(
+        type=event_type, source=source, correlation_id=correlation_id, payload={"index": index}
+    )
+
+
+class SleepingProcessor(AbstractProcessor):
+    """Processeur asynchrone qui mesure sa concurrence."""
+
+    def __init__(self, delay=0.01, jitter=False, label="sleeper"):
+        self.delay = delay
+        self.jitter = jitter
+        self.label = label
+        self.seen = []
+        self.active = 0
+        self.max_active = 0
+
+    @property
+    def name(self):
+        return self.label
+
+    async def process_event(self, event):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay * random.random() if self.jitter else self.delay)
+            self.seen.append(event)
+            return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+        finally:
+            self.active -= 1
+
+    def can_handle(self, event_type):
+        return True
+
+    async def health_check(self):
+        return True
+
+
+class ThreadProcessor(BlockingProcessor):
+    """Processeur bloquant qui note le thread d'exécution."""
+
+    def __init__(self):
+        self.threads = set()
+
+    def process_blocking(self, event):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.001)
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+
+    def can_handle(self, event_type):
+        return True
+
+    async def health_check(self):
+        return True
+
+
+async def run_pool(events, processor, **options):
+    """Fait traiter des événements par un WorkerPool et attend la fin."""
+    queue = PriorityEventQueue(capacity=0)
+    registry = ProcessorRegistry()
+    registry.register(processor)
+    pool = WorkerPool(queue, registry, **options)
+    async with pool:
+        for event in events:
+            await queue.put(event)
+    return pool
+
+
+class TestOrdering:
+    """Tests de l'ordre par clé."""
+
+    async def test_same_correlation_in_order(self):
+        """Test ordre préservé par correlation_id, concurrence entre clés."""
+        events = [make_event(i, correlation_id=f"c{i % 5}") for i in range(100)]
+        processor = SleepingProcessor(delay=0.002, jitter=True)
+
+        await run_pool(events, processor, workers=8)
+
+        for key in range(5):
+            seen = [e.payload["index"] for e in processor.seen if e.correlation_id == f"c{key}"]
+            assert seen == sorted(seen)
+            assert len(seen) == 20
+        assert 1 < processor.max_active <= 5
+
+    async def test_source_is_default_key(self):
+        """Test ordre par source sans correlation_id."""
+        events = [make_event(i, source=f"src{i % 3}") for i in range(30)]
+        processor = SleepingProcessor(delay=0.002, jitter=True)
+
+        await run_pool(events, processor, workers=4)
+
+        for source in ("src0", "src1", "src2"):
+            seen = [e.payload["index"] for e in processor.seen if e.source == source]
+            assert seen == sorted(seen)
+
+    async def test_none_key_is_unordered(self):
+        """Test clé None : aucune contrainte d'ordre."""
+        events = [make_event(i) for i in range(16)]
+        processor = SleepingProcessor(delay=0.01)
+
+        await run_pool(events, processor, workers=8, key=lambda event: None)
+
+        assert processor.max_active == 8
+
+
+class TestConcurrency:
+    """Tests de concurrence et de limites."""
+
+    async def test_throughput_scales_with_workers(self):
+        """Test débit proportionnel au nombre de workers."""
+        events = [make_event(i, source=f"src{i}") for i in range(40)]
+
+        start = time.perf_counter()
+        await run_pool(events, SleepingProcessor(delay=0.01), workers=1)
+        sequential = time.perf_counter() - start
+        start = time.perf_counter()
+        await run_pool(events, SleepingProcessor(delay=0.01), workers=10)
+        parallel = time.perf_counter() - start
+
+        assert parallel < sequential / 4
+
+    async def test_type_limit(self):
+        """Test limite de concurrence par EventType."""
+        events = [make_event(i, source=f"src{i}") for i in range(20)]
+        processor = SleepingProcessor(delay=0.005)
+
+        await run_pool(events, processor, workers=8, type_limits={EventType.CALENDAR_EVENT: 2})
+
+        assert processor.max_active == 2
+
+    async def test_processor_limit(self):
+        """Test limite de concurrence par processeur (intégration)."""
+        events = [make_event(i, source=f"src{i}") for i in range(20)]
+        processor = SleepingProcessor(delay=0.005, label="toasty")
+
+        await run_pool(events, processor, workers=8, processor_limits={"toasty": 3})
+
+        assert processor.max_active == 3
+
+    async def test_blocking_processor_in_executor(self):
+        """Test exécution d'un BlockingProcessor dans un pool de threads."""
+        processor = ThreadProcessor()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pool = await run_pool(
+                [make_event(i, source=f"src{i}") for i in range(20)], processor, workers=4, executor=executor
+            )
+
+        assert pool.processed == 20
+        assert threading.get_ident() not in processor.threads
+
+
+class TestLifecycle:
+    """Tests de démarrage, d'arrêt et de résultats."""
+
+    async def test_results_and_failures(self):
+        """Test callback de résultats et comptage des échecs."""
+
+        class Failing(SleepingProcessor):
+            async def process_event(self, event):
+                raise ValueError("bad")
+
+        collected = []
+        pool = await run_pool(
+            [make_event(0), make_event(1)],
+            Failing(),
+            workers=2,
+            on_result=lambda event, results: collected.append(results[0]),
+        )
+
+        assert pool.processed == 2
+        assert pool.failed == 2
+        assert collected[0].error == "ValueError: bad"
+
+    async def test_callback_error_keeps_worker_alive(self):
+        """Test une erreur du callback n'arrête pas le worker."""
+
+        def explode(event, results):
+            raise RuntimeError("callback")
+
+        pool = await run_pool([make_event(i) for i in range(5)], SleepingProcessor(0), workers=1, on_result=explode)
+
+        assert pool.processed == 5
+
+    async def test_stop_without_drain_returns_pending(self):
+        """Test arrêt immédiat : les événements non traités sont rendus."""
+        queue = PriorityEventQueue(capacity=0)
+        registry = ProcessorRegistry()
+        processor = SleepingProcessor(delay=0.05)
+        registry.register(processor)
+        pool = WorkerPool(queue, registry, workers=1)
+        for i in range(5):
+            queue.put_nowait(make_event(i))
+        await pool.start()
+        await asyncio.sleep(0.01)
+
+        unprocessed = await pool.stop(drain=False)
+
+        assert len(processor.seen) == 1
+        assert [e.payload["index"] for e in unprocessed] == [1, 2, 3, 4]
+        assert not pool.running
+        await asyncio.wait_for(queue.join(), 1)
+
+    async def test_double_start(self):
+        """Test démarrage d'un pool déjà actif."""
+        pool = WorkerPool(PriorityEventQueue(), ProcessorRegistry(), workers=1)
+        await pool.start()
+        with pytest.raises(RuntimeError):
+            await pool.start()
+        await pool.stop()
@@ -0,0 +1,170 @@
+"""
+Tests unitaires pour le registre des processeurs.
+"""
+
+from typing import Iterable, Optional
+
+import pytest
+
+from nexus.core.compact import CompactEvent
+from nexus.core.events import BaseEvent, EventType, create_event
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry
+
+
+class RecordingProcessor(AbstractProcessor):
+    """Processeur de test qui mémorise les événements reçus."""
+
+    def __init__(self, label: str, types: Optional[Iterable[EventType]] = None, fail: bool = False) -> None:
+        self.label = label
+        self.types = None if types is None else set(types)
+        self.fail = fail
+        self.seen = []
+        self.probes = 0
+
+    @property
+    def name(self) -> str:
+        return self.label
+
+    async def process_event(self, event: BaseEvent) -> ProcessingResult:
+        if self.fail:
+            raise RuntimeError("boom")
+        self.seen.append(event)
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+
+    def can_handle(self, event_type: str) -> bool:
+        self.probes += 1
+        return self.types is None or event_type in self.types
+
+    async def health_check(self) -> bool:
+        return not self.fail
+
+
+def file_event(source: str = "file_watcher") -> BaseEvent:
+    """Événement de création de fichier."""
+    return create_event(EventType.FILE_CREATED, source, {"file_path": "/tmp/a"})
+
+
+class TestRouting:
+    """Tests de la table de routage."""
+
+    def test_routes_by_type(self):
+        """Test routage par type, dans l'ordre d'enregistrement."""
+        registry = ProcessorRegistry()
+        files = RecordingProcessor("files", [EventType.FILE_CREATED, EventType.FILE_DELETED])
+        emails = RecordingProcessor("emails", [EventType.EMAIL_RECEIVED])
+        audit = RecordingProcessor("audit")
+        for processor in (files, emails, audit):
+            registry.register(processor)
+
+        assert registry.route(file_event()) == (files, audit)
+        assert registry.route(create_event(EventType.CALENDAR_EVENT, "cal", {})) == (audit,)
+
+    def test_can_handle_probed_once_per_type(self):
+        """Test can_handle interrogé à l'enregistrement uniquement."""
+        registry = ProcessorRegistry()
+        processor = RecordingProcessor("files", [EventType.FILE_CREATED])
+        registry.register(processor)
+        probes = processor.probes
+
+        for _ in range(10):
+            registry.route(file_event())
+
+        assert probes == len(EventType)
+        assert processor.probes == probes
+
+    def test_explicit_types(self):
+        """Test types déclarés à l'enregistrement."""
+        registry = ProcessorRegistry()
+        processor = RecordingProcessor("any")
+        registry.register(processor, event_types=[EventType.ERROR_OCCURRED])
+
+        assert registry.route(file_event()) == ()
+        assert processor.probes == 0
+
+    def test_source_specific_handlers(self):
+        """Test processeurs restreints à des sources."""
+        registry = ProcessorRegistry()
+        generic = RecordingProcessor("generic", [EventType.FILE_CREATED])
+        dropbox = RecordingProcessor("dropbox", [EventType.FILE_CREATED])
+        registry.register(dropbox, sources=["dropbox"])
+        registry.register(generic)
+
+        assert registry.route(file_event("dropbox")) == (dropbox, generic)
+        assert registry.route(file_event("file_watcher")) == (generic,)
+
+    def test_fallback_only_when_unhandled(self):
+        """Test processeurs de repli."""
+        registry = ProcessorRegistry()
+        files = RecordingProcessor("files", [EventType.FILE_CREATED])
+        dead_letter = RecordingProcessor("dead_letter")
+        registry.register(files)
+        registry.register(dead_letter, fallback=True)
+
+        assert registry.route(file_event()) == (files,)
+        assert registry.route(create_event(EventType.CALENDAR_EVENT, "cal", {})) == (dead_letter,)
+
+    def test_unregister_rebuilds(self):
+        """Test retrait d'un processeur."""
+        registry = ProcessorRegistry()
+        files = RecordingProcessor("files", [EventType.FILE_CREATED])
+        registry.register(files)
+        registry.unregister(files)
+
+        assert registry.route(file_event()) == ()
+        assert files not in registry
+        with pytest.raises(KeyError):
+            registry.unregister(files)
+
+    def test_duplicate_registration(self):
+        """Test double enregistrement refusé."""
+        registry = ProcessorRegistry()
+        processor = RecordingProcessor("files")
+        registry.register(processor)
+
+        with pytest.raises(ValueError):
+            registry.register(processor)
+
+    def test_routes_compact_events(self):
+        """Test routage d'un CompactEvent."""
+        registry = ProcessorRegistry()
+        files = RecordingProcessor("files", [EventType.FILE_CREATED])
+        registry.register(files, sources=["file_watcher"])
+
+        assert registry.route(CompactEvent.from_event(file_event())) == (files,)
+
+
+class TestDispatch:
+    """Tests de l'exécution des processeurs."""
+
+    async def test_dispatch_isolates_failures(self):
+        """Test un échec n'empêche pas les processeurs suivants."""
+        registry = ProcessorRegistry()
+        failing = RecordingProcessor("failing", fail=True)
+        audit = RecordingProcessor("audit")
+        registry.register(failing)
+        registry.register(audit)
+        event = file_event()
+
+        results = await registry.dispatch(event)
+
+        assert [result.success for result in results] == [False, True]
+        assert results[0].error == "RuntimeError: boom"
+        assert audit.seen == [event]
+
+    async def test_health_check(self):
+        """Test santé agrégée."""
+        registry = ProcessorRegistry()
+        registry.register(RecordingProcessor("ok"))
+        registry.register(RecordingProcessor("ko", fail=True))
+
+        assert await registry.health_check() == {"ok": True, "ko": False}
+
+    async def test_default_process_batch(self):
+        """Test traitement par lot par défaut."""
+        processor = RecordingProcessor("files")
+        events = [file_event(), file_event()]
+
+        results = await processor.process_batch(events)
+
+        assert len(results) == 2
+        assert processor.seen == events
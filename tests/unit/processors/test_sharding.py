@@ -0,0 +1,135 @@
+"""
+Tests unitaires pour le pipeline multi-processus partitionné.
+"""
+
+import asyncio
+import os
+import random
+from functools import partial
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.processors import AbstractProcessor, ProcessingResult, ProcessorRegistry, ShardedPipeline
+
+
+def make_event(index: int, source: str = "s", correlation_id=None):
+    """Événement numéroté."""
+    return BaseEvent.from_trusted(
+        type=EventType.FILE_MODIFIED, source=source, correlation_id=correlation_id, payload={"index": index}
+    )
+
+
+class RecordingProcessor(AbstractProcessor):
+    """Processeur qui journalise (pid, source, index) dans un fichier par processus."""
+
+    def __init__(self, directory, delay=0.0, fail_odd=False):
+        self.path = os.path.join(directory, f"{os.getpid()}.log")
+        self.delay = delay
+        self.fail_odd = fail_odd
+
+    async def process_event(self, event):
+        await asyncio.sleep(self.delay * random.random())
+        with open(self.path, "a") as log:
+            log.write(f"{event.source} {event.payload['index']}\n")
+        if self.fail_odd and event.payload["index"] % 2:
+            raise RuntimeError("odd event")
+        return ProcessingResult(processor=self.name, event_id=event.event_id, success=True)
+
+    def can_handle(self, event_type):
+        return True
+
+    async def health_check(self):
+        return True
+
+
+def recording_registry(directory, **options):
+    """Registre d'un shard ; module-level pour rester picklable."""
+    registry = ProcessorRegistry()
+    registry.register(RecordingProcessor(directory, **options))
+    return registry
+
+
+def broken_registry():
+    raise RuntimeError("no registry")
+
+
+def read_logs(directory):
+    """Lignes journalisées par chaque processus shard."""
+    logs = {}
+    for name in os.listdir(directory):
+        with open(os.path.join(directory, name)) as log:
+            logs[name] = [(source, int(index)) for source, index in (line.split() for line in log)]
+    return logs
+
+
+class TestShardedPipeline:
+    """Tests de la répartition entre processus."""
+
+    async def test_per_key_order_across_shards(self, tmp_path):
+        """Test une source par shard, ordre conservé, tout traité à l'arrêt."""
+        events = [make_event(i, source=f"src{i % 12}") for i in range(600)]
+        factory = partial(recording_registry, str(tmp_path), delay=0.002)
+
+        async with ShardedPipeline(factory, shards=2, workers=4) as pipeline:
+            for start in range(0, len(events), 50):
+                await pipeline.put_many(events[start:start + 50])
+
+        logs = read_logs(tmp_path)
+        assert len(logs) == 2
+        assert sum(map(len, logs.values())) == 600
+        assert pipeline.processed == pipeline.submitted == 600
+        for entries in logs.values():
+            for source in {source for source, _ in entries}:
+                indexes = [index for key, index in entries if key == source]
+                assert indexes == sorted(indexes) and len(indexes) == 50
+                assert all(pipeline.shard_of(make_event(0, source=source)) == pipeline.shard_of(events[index])
+                           for index in indexes)
+        first, second = ({source for source, _ in entries} for entries in logs.values())
+        assert first and second and first.isdisjoint(second)
+
+    async def test_partition_by_correlation_id(self, tmp_path):
+        """Test partition par correlation_id, source à défaut."""
+        pipeline = ShardedPipeline(partial(recording_registry, str(tmp_path)), shards=8, by="correlation_id")
+
+        keyed = [make_event(i, source=f"src{i}", correlation_id="flow") for i in range(20)]
+        assert len({pipeline.shard_of(event) for event in keyed}) == 1
+        assert pipeline.shard_of(make_event(0, source="flow")) == pipeline.shard_of(keyed[0])
+        with pytest.raises(ValueError):
+            ShardedPipeline(broken_registry, by="priority")
+
+    async def test_backpressure_then_drain(self, tmp_path):
+        """Test anneau plein : QueueFull, puis arrêt après traitement de tout."""
+        factory = partial(recording_registry, str(tmp_path), delay=0.02)
+        pipeline = ShardedPipeline(factory, shards=1, workers=1, ring_capacity=4096, queue_capacity=1)
+
+        with pytest.raises(RuntimeError):
+            pipeline.put_nowait(make_event(0))
+        await pipeline.start()
+        with pytest.raises(asyncio.QueueFull):
+            for index in range(1000):
+                pipeline.put_nowait(make_event(index))
+        stats = await pipeline.stop()
+
+        assert 0 < pipeline.submitted < 1000
+        assert stats == [{"shard": 0, "received": pipeline.submitted, "processed": pipeline.submitted, "failed": 0}]
+        with pytest.raises(RuntimeError):
+            await pipeline.put(make_event(0))
+
+    async def test_failures_counted(self, tmp_path):
+        """Test échecs de traitement remontés dans les compteurs."""
+        factory = partial(recording_registry, str(tmp_path), fail_odd=True)
+
+        async with ShardedPipeline(factory, shards=2) as pipeline:
+            await pipeline.put_many([make_event(i, source=f"src{i % 4}") for i in range(40)])
+
+        assert pipeline.processed == 40
+        assert pipeline.failed == 20
+
+    async def test_broken_shard_reported(self):
+        """Test shard incapable de démarrer : erreur dans ses compteurs."""
+        async with ShardedPipeline(broken_registry, shards=1) as pipeline:
+            await asyncio.sleep(0.2)
+
+        [stats] = pipeline.stats
+        assert "no registry" in stats["error"]
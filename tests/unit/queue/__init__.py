@@ -0,0 +1 @@
+# Queue tests package
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Tests unitaires pour la dead letter queue persistante.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.queue import DeadLetter, DeadLetterReason, DeadLetterStore, PriorityEventQueue
+
+T0 = datetime(2024, 10, 28, 12, 0, 0)
+
+
+def make_letter(index: int, event_type=EventType.EMAIL_RECEIVED, source="imap", error="ConnectionError: down",
+                reason=DeadLetterReason.EXHAUSTED, minutes: int = 0) -> DeadLetter:
+    """Entrée numérotée."""
+    event = BaseEvent.from_trusted(type=event_type, source=source, payload={"index": index})
+    return DeadLetter(integration="toasty", event=event, reason=reason, error=error, attempts=4,
+                      failed_at=T0 + timedelta(minutes=minutes))
+
+
+def indexes(letters):
+    """Indices des événements des entrées."""
+    return [letter.event.payload["index"] for letter in letters]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with DeadLetterStore(tmp_path / "dlq.sqlite") as store:
+        yield store
+
+
+class TestStorage:
+    """Tests d'enregistrement et de relecture."""
+
+    async def test_round_trip(self, store):
+        """Test relecture de l'événement et des métadonnées."""
+        letter = make_letter(0)
+        await store.put(letter)
+
+        (stored,) = store.query()
+
+        assert stored.event == letter.event
+        assert stored.reason is DeadLetterReason.EXHAUSTED
+        assert stored.error_class == "ConnectionError"
+        assert stored.attempts == 4
+        assert stored.failed_at == T0
+        assert stored.letter_id == 1
+
+    def test_persistent(self, tmp_path):
+        """Test entrées conservées après réouverture."""
+        path = tmp_path / "dlq.sqlite"
+        with DeadLetterStore(path) as store:
+            store.add(make_letter(i) for i in range(3))
+
+        with DeadLetterStore(path) as store:
+            assert store.count() == 3
+
+    def test_error_class(self):
+        """Test classe d'erreur extraite du message."""
+        assert make_letter(0, error="TimeoutError: ").error_class == "TimeoutError"
+        assert make_letter(0, error="circuit open").error_class is None
+        assert make_letter(0, error=None).error_class is None
+
+
+class TestQueries:
+    """Tests des requêtes indexées et paginées."""
+
+    def test_filters(self, store):
+        """Test filtres par type, source, classe d'erreur, motif et date."""
+        store.add([
+            make_letter(0),
+            make_letter(1, event_type=EventType.FILE_MODIFIED, source="sync"),
+            make_letter(2, error="ValueError: bad", reason=DeadLetterReason.REJECTED, minutes=10),
+            make_letter(3, source="sync", minutes=20),
+        ])
+
+        assert indexes(store.query(type=EventType.FILE_MODIFIED)) == [1]
+        assert indexes(store.query(type="email_received", source="sync")) == [3]
+        assert indexes(store.query(error_class="ValueError")) == [2]
+        assert indexes(store.query(reason="rejected")) == [2]
+        assert indexes(store.query(since=T0 + timedelta(minutes=5), until=T0 + timedelta(minutes=15))) == [2]
+        assert store.count(source="sync") == 2
+
+    def test_unknown_filter(self, store):
+        """Test filtre inconnu."""
+        with pytest.raises(TypeError):
+            store.query(colour="red")
+
+    def test_cursor_pagination(self, store):
+        """Test pagination par curseur."""
+        store.add(make_letter(i, source=f"s{i % 2}") for i in range(25))
+
+        pages = []
+        after = 0
+        while True:
+            page = store.query(after=after, limit=5, source="s1")
+            if not page:
+                break
+            pages.append(indexes(page))
+            after = page[-1].letter_id
+
+        assert [len(page) for page in pages] == [5, 5, 2]
+        assert sum(pages, []) == list(range(1, 25, 2))
+
+    def test_scan_streams_pages(self, store):
+        """Test parcours complet page par page."""
+        store.add(make_letter(i) for i in range(10))
+
+        assert indexes(store.scan(page_size=3)) == list(range(10))
+
+    def test_delete(self, store):
+        """Test suppression d'entrées."""
+        store.add(make_letter(i) for i in range(3))
+
+        assert store.delete([1, 3]) == 2
+        assert indexes(store.query()) == [1]
+
+
+class TestReprocess:
+    """Tests du rejeu vers la file principale."""
+
+    async def test_reprocess_matching(self, store):
+        """Test rejeu des entrées filtrées, supprimées une fois en file."""
+        store.add(make_letter(i, source="sync" if i % 3 == 0 else "imap") for i in range(10))
+        queue = PriorityEventQueue(capacity=0)
+
+        count = await store.reprocess(queue, page_size=2, source="sync")
+
+        assert count == 4
+        assert [queue.get_nowait().payload["index"] for _ in range(4)] == [0, 3, 6, 9]
+        assert store.count() == 6
+        assert store.count(source="sync") == 0
+
+    async def test_reprocess_keep(self, store):
+        """Test rejeu sans suppression."""
+        store.add(make_letter(i) for i in range(3))
+
+        await store.reprocess(PriorityEventQueue(capacity=0), delete=False)
+
+        assert store.count() == 3
+
+    async def test_reprocess_rate(self, store):
+        """Test débit de rejeu limité."""
+        store.add(make_letter(i) for i in range(30))
+        start = time.monotonic()
+
+        await store.reprocess(PriorityEventQueue(capacity=0), rate=200)
+
+        assert time.monotonic() - start >= 0.1
+
+    async def test_new_failures_not_reprocessed(self, store):
+        """Test entrées ajoutées pendant le rejeu ignorées."""
+        store.add(make_letter(i) for i in range(3))
+
+        class FailingAgain:
+            async def put(self, event):
+                await store.put(make_letter(100 + event.payload["index"]))
+
+        count = await asyncio.wait_for(store.reprocess(FailingAgain()), 1)
+
+        assert count == 3
+        assert indexes(store.query()) == [100, 101, 102]
+
+    async def test_back_pressure(self, store):
+        """Test rejeu bloqué par une file pleine."""
+        store.add(make_letter(i) for i in range(5))
+        queue = PriorityEventQueue(capacity=2)
+
+        task = asyncio.create_task(store.reprocess(queue))
+        await asyncio.sleep(0.01)
+
+        assert not task.done()
+        assert queue.qsize() == 2
+        for _ in range(5):
+            await queue.get()
+        assert await task == 5
+
+    async def test_checkpoint_before_delete(self, store):
+        """Test checkpoint attendu avant la suppression de chaque page."""
+        store.add(make_letter(i) for i in range(5))
+        remaining = []
+
+        async def checkpoint():
+            remaining.append(store.count())
+
+        await store.reprocess(PriorityEventQueue(capacity=0), page_size=2, checkpoint=checkpoint)
+
+        assert remaining == [5, 3, 1]
@@ -0,0 +1,179 @@
+"""
+Tests unitaires pour la déduplication et la coalescence d'événements.
+"""
+
+import asyncio
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType
+from nexus.queue import CoalescingStage, PriorityEventQueue
+
+
+def file_event(path: str, index: int = 0, event_type=EventType.FILE_MODIFIED, source="sync") -> BaseEvent:
+    """Événement fichier numéroté."""
+    return BaseEvent.from_trusted(type=event_type, source=source, payload={"file_path": path, "index": index})
+
+
+class FakeClock:
+    """Horloge manuelle."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def indexes(events):
+    """Indices des événements remis."""
+    return [event.payload["index"] for event in events]
+
+
+class TestCoalescing:
+    """Tests de la fenêtre de coalescence."""
+
+    def test_burst_collapses_to_latest(self):
+        """Test rafale réduite au dernier événement à l'échéance."""
+        clock = FakeClock()
+        stage = CoalescingStage(window=1.0, clock=clock)
+
+        for i in range(10):
+            assert stage.offer(file_event("/a", i)) == []
+            clock.now += 0.05
+
+        assert stage.expire() == []
+        clock.now = 1.0
+        assert indexes(stage.expire()) == [9]
+        assert stage.coalesced == 9
+        assert stage.suppressed == 9
+        assert stage.pending == 0
+
+    def test_window_bounded_under_continuous_stream(self):
+        """Test la fenêtre part du premier événement : latence bornée."""
+        clock = FakeClock()
+        stage = CoalescingStage(window=1.0, clock=clock)
+        released = []
+
+        for i in range(25):
+            clock.now = i / 10
+            released += stage.offer(file_event("/a", i))
+
+        # Fenêtres successives [0, 1), [1, 2), [2, 3)
+        assert indexes(released) == [9, 19]
+        assert indexes(stage.drain()) == [24]
+
+    def test_keys_are_independent(self):
+        """Test clés distinctes par chemin et par source."""
+        clock = FakeClock()
+        stage = CoalescingStage(window=1.0, clock=clock)
+
+        stage.offer(file_event("/a", 0))
+        stage.offer(file_event("/b", 1))
+        stage.offer(file_event("/a", 2, source="editor"))
+        stage.offer(file_event("/a", 3))
+        clock.now = 1.0
+
+        assert indexes(stage.expire()) == [3, 1, 2]
+
+    def test_other_types_pass_through(self):
+        """Test types non fusionnés transmis immédiatement."""
+        stage = CoalescingStage(window=1.0, clock=FakeClock())
+
+        assert indexes(stage.offer(file_event("/a", 0, EventType.FILE_CREATED))) == [0]
+        assert indexes(stage.offer(file_event("/a", 1, EventType.FILE_CREATED))) == [1]
+
+    def test_other_type_releases_held_event_first(self):
+        """Test ordre préservé par ressource : modification puis suppression."""
+        stage = CoalescingStage(window=1.0, clock=FakeClock())
+
+        stage.offer(file_event("/a", 0))
+        stage.offer(file_event("/a", 1))
+        released = stage.offer(file_event("/a", 2, EventType.FILE_DELETED))
+
+        assert indexes(released) == [1, 2]
+        assert stage.pending == 0
+
+    def test_custom_key_and_missing_field(self):
+        """Test champ de clé configurable ; événement sans clé transmis."""
+        stage = CoalescingStage(window=1.0, key_field="url", clock=FakeClock())
+
+        assert indexes(stage.offer(file_event("/a", 0))) == [0]
+        assert stage.pending == 0
+
+    def test_max_pending_releases_oldest(self):
+        """Test mémoire bornée : la clé la plus ancienne est remise."""
+        stage = CoalescingStage(window=10.0, max_pending=2, clock=FakeClock())
+
+        stage.offer(file_event("/a", 0))
+        stage.offer(file_event("/b", 1))
+        released = stage.offer(file_event("/c", 2))
+
+        assert indexes(released) == [0]
+        assert stage.pending == 2
+        assert indexes(stage.drain()) == [1, 2]
+
+    def test_invalid_configuration(self):
+        """Test paramètres invalides."""
+        with pytest.raises(ValueError):
+            CoalescingStage(window=-1)
+        with pytest.raises(ValueError):
+            CoalescingStage(max_ids=0)
+
+
+class TestDeduplication:
+    """Tests de la suppression des event_id répétés."""
+
+    def test_duplicate_id_dropped(self):
+        """Test même event_id transmis une seule fois."""
+        stage = CoalescingStage(clock=FakeClock())
+        event = file_event("/a", 0, EventType.FILE_CREATED)
+
+        assert stage.offer(event) == [event]
+        assert stage.offer(event) == []
+        assert stage.duplicates == 1
+
+    def test_ttl_expiry(self):
+        """Test event_id oublié après la durée de rétention."""
+        clock = FakeClock()
+        stage = CoalescingStage(id_ttl=5.0, clock=clock)
+        event = file_event("/a", 0, EventType.FILE_CREATED)
+
+        stage.offer(event)
+        clock.now = 5.0
+
+        assert stage.offer(event) == [event]
+
+    def test_bounded_id_set(self):
+        """Test ensemble d'event_id borné : les plus anciens sont oubliés."""
+        stage = CoalescingStage(max_ids=2, clock=FakeClock())
+        events = [file_event("/a", i, EventType.FILE_CREATED) for i in range(3)]
+
+        for event in events:
+            stage.offer(event)
+
+        assert stage.offer(events[0]) == [events[0]]
+        assert stage.offer(events[2]) == []
+
+
+class TestConsume:
+    """Tests du transfert entre files."""
+
+    async def test_consume_between_queues(self):
+        """Test transfert avec fusion et join() sur la source."""
+        source = PriorityEventQueue(capacity=0)
+        sink = asyncio.Queue()
+        stage = CoalescingStage(window=0.02)
+        duplicate = file_event("/c", 99, EventType.FILE_CREATED)
+        for i in range(20):
+            source.put_nowait(file_event(f"/{'ab'[i % 2]}", i))
+        source.put_nowait(duplicate)
+        source.put_nowait(duplicate)
+
+        consumer = asyncio.create_task(stage.consume(source, sink))
+        await asyncio.wait_for(source.join(), 1)
+        consumer.cancel()
+
+        delivered = [sink.get_nowait() for _ in range(sink.qsize())]
+        assert sorted(indexes(delivered)) == [18, 19, 99]
+        assert stage.suppressed == 19
@@ -0,0 +1,211 @@
+"""
+Tests unitaires pour le journal d'événements durable.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from nexus.core.compact import CompactEvent
+from nexus.core.events import BaseEvent, EventType, FileEvent, Priority
+from nexus.queue import EventLog, LogCorruptionError, PriorityEventQueue
+
+START = datetime(2024, 1, 1, 12, 0)
+
+
+def make_event(index: int, **fields) -> BaseEvent:
+    """Événement fichier numéroté, horodaté une seconde après le précédent."""
+    fields.setdefault("timestamp", START + timedelta(seconds=index))
+    return BaseEvent.from_trusted(
+        type=EventType.FILE_CREATED,
+        source="file_watcher",
+        payload={"file_path": f"/data/{index}.txt"},
+        **fields,
+    )
+
+
+def open_log(path, **options) -> EventLog:
+    """Journal de test : petits segments, index dense, sans fsync."""
+    options.setdefault("segment_bytes", 2048)
+    options.setdefault("index_interval", 256)
+    options.setdefault("fsync", False)
+    return EventLog(path, **options)
+
+
+class TestAppendAndReplay:
+    """Tests d'ajout et de relecture."""
+
+    def test_replay_round_trip(self, tmp_path):
+        """Test relecture dans l'ordre, sur plusieurs segments."""
+        events = [make_event(i) for i in range(50)]
+        with open_log(tmp_path) as log:
+            sequences = [log.append_nowait(event) for event in events]
+            replayed = list(log.replay())
+
+        assert sequences == list(range(50))
+        assert replayed == events
+        assert isinstance(replayed[0], FileEvent)
+        assert len(list(tmp_path.glob("*.log"))) > 1
+
+    def test_replay_after_reopen(self, tmp_path):
+        """Test persistance entre deux ouvertures."""
+        events = [make_event(i) for i in range(30)]
+        with open_log(tmp_path) as log:
+            for event in events:
+                log.append_nowait(event)
+
+        with open_log(tmp_path) as log:
+            assert log.next_sequence == 30
+            assert list(log.replay(start=25)) == events[25:]
+            assert log.append_nowait(make_event(30)) == 30
+
+    def test_records_are_zero_copy_views(self, tmp_path):
+        """Test trames exposées en memoryview."""
+        with open_log(tmp_path) as log:
+            log.append_nowait(make_event(0))
+            record = next(log.records())
+
+        assert record.sequence == 0
+        assert isinstance(record.frame, memoryview)
+
+    def test_accepts_compact_events(self, tmp_path):
+        """Test journalisation d'un CompactEvent."""
+        event = make_event(0)
+        with open_log(tmp_path) as log:
+            log.append_nowait(CompactEvent.from_event(event))
+            assert list(log.replay()) == [event]
+
+    async def test_group_commit(self, tmp_path):
+        """Test appends concurrents durables avec fsync groupé."""
+        log = open_log(tmp_path, fsync=True)
+        sequences = await asyncio.gather(*(log.append(make_event(i)) for i in range(20)))
+
+        assert sorted(sequences) == list(range(20))
+        assert log.durable_sequence == 19
+        assert await log.append_many([make_event(20), make_event(21)]) == [20, 21]
+        assert log.durable_sequence == 21
+        log.close()
+
+
+class TestIndexLookups:
+    """Tests de l'index creux."""
+
+    def test_find_by_event_id(self, tmp_path):
+        """Test recherche d'identifiants monotones."""
+        events = [make_event(i) for i in range(100)]
+        with open_log(tmp_path) as log:
+            for event in events:
+                log.append_nowait(event)
+
+            assert log.find(events[0].event_id) == events[0]
+            assert log.find(events[73].event_id) == events[73]
+            assert log.find("ffffffff-0000-7000-8000-000000000000") is None
+
+    def test_find_with_unordered_ids(self, tmp_path):
+        """Test recherche quand les identifiants ne sont pas triés."""
+        events = [make_event(i, event_id=f"id-{(i * 37) % 100:03d}") for i in range(100)]
+        with open_log(tmp_path) as log:
+            for event in events:
+                log.append_nowait(event)
+
+            for event in events[::7]:
+                assert log.find(event.event_id) == event
+            assert log.find("id-999") is None
+
+    def test_replay_since(self, tmp_path):
+        """Test relecture à partir d'un instant."""
+        events = [make_event(i) for i in range(100)]
+        with open_log(tmp_path) as log:
+            for event in events:
+                log.append_nowait(event)
+
+            replayed = list(log.replay(since=START + timedelta(seconds=60)))
+        assert replayed == events[60:]
+
+
+class TestRecovery:
+    """Tests de récupération après arrêt brutal."""
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        """Test suppression d'un enregistrement incomplet en fin de journal."""
+        events = [make_event(i) for i in range(5)]
+        with open_log(tmp_path, segment_bytes=1 << 20) as log:
+            for event in events:
+                log.append_nowait(event)
+        segment = next(tmp_path.glob("*.log"))
+        size = segment.stat().st_size
+        with open(segment, "r+b") as file:
+            file.truncate(size - 10)
+
+        with open_log(tmp_path, segment_bytes=1 << 20) as log:
+            assert list(log.replay()) == events[:4]
+            assert log.append_nowait(make_event(5)) == 4
+
+    def test_corrupted_tail_record(self, tmp_path):
+        """Test enregistrement final au CRC invalide."""
+        with open_log(tmp_path, segment_bytes=1 << 20) as log:
+            for i in range(3):
+                log.append_nowait(make_event(i))
+        segment = next(tmp_path.glob("*.log"))
+        data = bytearray(segment.read_bytes())
+        data[-3] ^= 0xFF
+        segment.write_bytes(bytes(data))
+
+        with open_log(tmp_path, segment_bytes=1 << 20) as log:
+            assert log.next_sequence == 2
+
+    def test_reopen_with_non_ascii_event_id(self, tmp_path):
+        """Test réindexation d'identifiants UTF-8 sans troncature."""
+        events = [make_event(i, event_id=event_id) for i, event_id in enumerate(["a1", "évt-2", "a3"])]
+        with open_log(tmp_path, segment_bytes=1 << 20) as log:
+            for event in events:
+                log.append_nowait(event)
+
+        with open_log(tmp_path, segment_bytes=1 << 20) as log:
+            assert len(log) == 3
+            assert [event.event_id for event in log.replay()] == ["a1", "évt-2", "a3"]
+            assert log.find("évt-2") == events[1]
+
+    def test_corruption_in_sealed_segment(self, tmp_path):
+        """Test corruption hors fin de journal."""
+        with open_log(tmp_path) as log:
+            for i in range(50):
+                log.append_nowait(make_event(i))
+        first = sorted(tmp_path.glob("*.log"))[0]
+        data = bytearray(first.read_bytes())
+        data[40] ^= 0xFF
+        first.write_bytes(bytes(data))
+
+        with pytest.raises(LogCorruptionError):
+            open_log(tmp_path)
+
+    async def test_recover_into_queue(self, tmp_path):
+        """Test remise en file des événements après le point de reprise."""
+        events = [make_event(i, priority=Priority.LOW if i % 2 else Priority.HIGH) for i in range(10)]
+        with open_log(tmp_path) as log:
+            for event in events:
+                log.append_nowait(event)
+            log.checkpoint(5)
+
+        queue = PriorityEventQueue()
+        with open_log(tmp_path) as log:
+            assert log.committed() == 6
+            assert await log.recover(queue) == 4
+
+        recovered = [queue.get_nowait() for _ in range(4)]
+        assert recovered == [events[6], events[8], events[7], events[9]]
+
+    def test_delete_before(self, tmp_path):
+        """Test suppression des segments entièrement traités."""
+        with open_log(tmp_path) as log:
+            for i in range(50):
+                log.append_nowait(make_event(i))
+            segments = len(list(tmp_path.glob("*.log")))
+
+            removed = log.delete_before(40)
+
+            assert removed > 0
+            assert len(list(tmp_path.glob("*.log"))) == segments - removed
+            assert log.first_sequence <= 40
+            assert [event.payload["file_path"] for event in log.replay(start=40)][0] == "/data/40.txt"
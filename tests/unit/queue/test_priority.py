@@ -0,0 +1,313 @@
+"""
+Tests unitaires pour la file d'attente à priorités.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from nexus.core.compact import CompactEvent
+from nexus.core.events import BaseEvent, EventType, Priority
+from nexus.queue import OverflowPolicy, PriorityEventQueue
+
+
+def make_event(priority: Priority, index: int = 0) -> BaseEvent:
+    """Événement minimal de la priorité donnée."""
+    return BaseEvent.from_trusted(
+        type=EventType.SYSTEM_HEALTH,
+        source="monitor",
+        priority=priority,
+        payload={"component": "db", "status": "ok", "metrics": {}, "index": index},
+    )
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests de vieillissement."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPriorityOrdering:
+    """Tests d'ordonnancement."""
+
+    def test_priority_then_fifo(self):
+        """Test ordre par priorité puis FIFO au sein d'un niveau."""
+        queue = PriorityEventQueue(aging_interval=None)
+        events = [
+            make_event(Priority.BACKGROUND, 0),
+            make_event(Priority.NORMAL, 1),
+            make_event(Priority.CRITICAL, 2),
+            make_event(Priority.NORMAL, 3),
+            make_event(Priority.CRITICAL, 4),
+        ]
+        for event in events:
+            queue.put_nowait(event)
+
+        order = [queue.get_nowait().payload["index"] for _ in events]
+
+        assert order == [2, 4, 1, 3, 0]
+        assert queue.empty()
+
+    def test_qsize_per_priority(self):
+        """Test tailles globale et par niveau."""
+        queue = PriorityEventQueue()
+        queue.put_nowait(make_event(Priority.LOW))
+        queue.put_nowait(make_event(Priority.LOW))
+        queue.put_nowait(make_event(Priority.HIGH))
+
+        assert queue.qsize() == 3
+        assert queue.qsize(Priority.LOW) == 2
+        assert queue.qsize(Priority.CRITICAL) == 0
+
+    def test_accepts_compact_events(self):
+        """Test compatibilité avec CompactEvent."""
+        queue = PriorityEventQueue()
+        queue.put_nowait(CompactEvent.from_event(make_event(Priority.LOW)))
+        queue.put_nowait(CompactEvent.from_event(make_event(Priority.CRITICAL)))
+
+        assert queue.get_nowait().priority == Priority.CRITICAL
+
+    def test_get_nowait_empty(self):
+        """Test file vide."""
+        with pytest.raises(asyncio.QueueEmpty):
+            PriorityEventQueue().get_nowait()
+
+
+class TestAging:
+    """Tests du vieillissement."""
+
+    def test_waiting_event_overtakes_fresher_higher_priority(self):
+        """Test remontée d'un événement BACKGROUND qui attend."""
+        clock = FakeClock()
+        queue = PriorityEventQueue(aging_interval=1.0, clock=clock)
+        queue.put_nowait(make_event(Priority.BACKGROUND, 0))
+        clock.now = 2.5
+        queue.put_nowait(make_event(Priority.NORMAL, 1))
+
+        # BACKGROUND : 5 - 2.5 = 2.5 < NORMAL : 3
+        assert queue.get_nowait().payload["index"] == 0
+
+    def test_aging_never_overtakes_critical(self):
+        """Test préséance absolue des niveaux sous le plancher."""
+        clock = FakeClock()
+        queue = PriorityEventQueue(aging_interval=1.0, clock=clock)
+        queue.put_nowait(make_event(Priority.BACKGROUND, 0))
+        clock.now = 1000.0
+        queue.put_nowait(make_event(Priority.CRITICAL, 1))
+
+        assert queue.get_nowait().payload["index"] == 1
+
+    def test_no_starvation_under_high_flood(self):
+        """Test un événement au plancher passe avant les HIGH plus récents."""
+        clock = FakeClock()
+        queue = PriorityEventQueue(aging_interval=1.0, clock=clock)
+        queue.put_nowait(make_event(Priority.LOW, 0))
+        clock.now = 10.0
+        for index in range(1, 4):
+            queue.put_nowait(make_event(Priority.HIGH, index))
+
+        assert queue.get_nowait().payload["index"] == 0
+
+    def test_strict_priority_without_aging(self):
+        """Test priorité stricte quand le vieillissement est désactivé."""
+        clock = FakeClock()
+        queue = PriorityEventQueue(aging_interval=None, clock=clock)
+        queue.put_nowait(make_event(Priority.BACKGROUND, 0))
+        clock.now = 1000.0
+        queue.put_nowait(make_event(Priority.NORMAL, 1))
+
+        assert queue.get_nowait().payload["index"] == 1
+
+
+class TestBackPressure:
+    """Tests des capacités et politiques de débordement."""
+
+    def test_drop_oldest(self):
+        """Test éviction du plus ancien du même niveau."""
+        dropped = []
+        queue = PriorityEventQueue(
+            capacity=2, policy=OverflowPolicy.DROP_OLDEST, on_drop=dropped.append
+        )
+        for index in range(4):
+            queue.put_nowait(make_event(Priority.BACKGROUND, index))
+        queue.put_nowait(make_event(Priority.CRITICAL, 9))
+
+        assert [event.payload["index"] for event in dropped] == [0, 1]
+        assert queue.dropped[Priority.BACKGROUND] == 2
+        assert queue.qsize() == 3
+        assert [queue.get_nowait().payload["index"] for _ in range(3)] == [9, 2, 3]
+
+    def test_reject(self):
+        """Test rejet quand le niveau est plein."""
+        queue = PriorityEventQueue(capacity=1, policy=OverflowPolicy.REJECT)
+        queue.put_nowait(make_event(Priority.LOW))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(make_event(Priority.LOW))
+        queue.put_nowait(make_event(Priority.HIGH))
+        assert queue.rejected[Priority.LOW] == 1
+
+    def test_put_many_all_or_nothing(self):
+        """Test lot ajouté en entier ou refusé sans ajout partiel."""
+        queue = PriorityEventQueue(capacity=3)
+        queue.put_many_nowait([make_event(Priority.LOW, i) for i in range(2)])
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_many_nowait([make_event(Priority.HIGH), make_event(Priority.LOW), make_event(Priority.LOW)])
+        assert queue.qsize() == 2
+        assert queue.rejected[Priority.LOW] == 2
+        queue.put_many_nowait([make_event(Priority.HIGH), make_event(Priority.LOW)])
+        assert queue.qsize() == 4
+
+    def test_per_priority_capacity_and_policy(self):
+        """Test configuration par niveau."""
+        capacity = {level: 1 for level in Priority}
+        capacity[Priority.CRITICAL] = 0
+        policy = {level: OverflowPolicy.DROP_OLDEST for level in Priority}
+        policy[Priority.HIGH] = OverflowPolicy.REJECT
+        queue = PriorityEventQueue(capacity=capacity, policy=policy)
+
+        for _ in range(100):
+            queue.put_nowait(make_event(Priority.CRITICAL))
+        queue.put_nowait(make_event(Priority.HIGH))
+
+        assert queue.qsize(Priority.CRITICAL) == 100
+        assert queue.full(Priority.HIGH)
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(make_event(Priority.HIGH))
+
+    def test_incomplete_mapping(self):
+        """Test configuration par niveau incomplète."""
+        with pytest.raises(ValueError):
+            PriorityEventQueue(capacity={Priority.CRITICAL: 10})
+
+    async def test_block_waits_for_room(self):
+        """Test attente d'une place avec la politique BLOCK."""
+        queue = PriorityEventQueue(capacity=1)
+        queue.put_nowait(make_event(Priority.LOW, 0))
+        putter = asyncio.create_task(queue.put(make_event(Priority.LOW, 1)))
+        await asyncio.sleep(0)
+
+        assert not putter.done()
+        # Un autre niveau reste disponible
+        await asyncio.wait_for(queue.put(make_event(Priority.HIGH, 2)), 1)
+        assert queue.get_nowait().payload["index"] == 2
+        assert queue.get_nowait().payload["index"] == 0
+        await asyncio.wait_for(putter, 1)
+        assert queue.get_nowait().payload["index"] == 1
+
+    async def test_cancelled_putter(self):
+        """Test annulation d'un producteur en attente."""
+        queue = PriorityEventQueue(capacity=1)
+        queue.put_nowait(make_event(Priority.LOW))
+        putter = asyncio.create_task(queue.put(make_event(Priority.LOW)))
+        await asyncio.sleep(0)
+        putter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await putter
+        assert queue.qsize() == 1
+
+
+class TestConsumers:
+    """Tests consommateurs, task_done et join."""
+
+    async def test_get_waits(self):
+        """Test attente d'un consommateur sur file vide."""
+        queue = PriorityEventQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait(make_event(Priority.NORMAL, 7))
+
+        event = await asyncio.wait_for(getter, 1)
+        assert event.payload["index"] == 7
+
+    async def test_join(self):
+        """Test join après traitement de tous les événements."""
+        queue = PriorityEventQueue()
+        for index in range(3):
+            queue.put_nowait(make_event(Priority.NORMAL, index))
+
+        async def consume():
+            while True:
+                await queue.get()
+                queue.task_done()
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.wait_for(queue.join(), 1)
+        consumer.cancel()
+        assert queue.empty()
+
+    def test_task_done_too_many_times(self):
+        """Test task_done sans événement en cours."""
+        with pytest.raises(ValueError):
+            PriorityEventQueue().task_done()
+
+
+async def critical_latency_p99(queue, flood: bool, criticals: int = 200) -> float:
+    """
+    Mesure le p99 de latence (mise en file → retrait) des événements
+    CRITICAL, avec ou sans flot continu d'événements BACKGROUND.
+    """
+    background = [make_event(Priority.BACKGROUND, index) for index in range(100)]
+    enqueued = {}
+    latencies = []
+    done = asyncio.Event()
+
+    async def consume():
+        while True:
+            event = await queue.get()
+            if event.priority == Priority.CRITICAL:
+                latencies.append(time.perf_counter() - enqueued[event.event_id])
+                if len(latencies) == criticals:
+                    done.set()
+            queue.task_done()
+            await asyncio.sleep(0)  # coût de traitement
+
+    async def flood_background():
+        while True:
+            for event in background:
+                await queue.put(event)
+            await asyncio.sleep(0)
+
+    async def inject_critical():
+        for index in range(criticals):
+            event = make_event(Priority.CRITICAL, index)
+            enqueued[event.event_id] = time.perf_counter()
+            await queue.put(event)
+            await asyncio.sleep(0.001)
+
+    tasks = [asyncio.create_task(consume())]
+    if flood:
+        tasks.append(asyncio.create_task(flood_background()))
+        # Laisse le flot remplir la file avant de mesurer
+        while queue.qsize() < 4000:
+            await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(inject_critical()))
+    await asyncio.wait_for(done.wait(), 60)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    latencies.sort()
+    return latencies[int(len(latencies) * 0.99) - 1]
+
+
+@pytest.mark.slow
+class TestCriticalLatencyUnderLoad:
+    """Test de charge : latence CRITICAL sous un flot BACKGROUND."""
+
+    async def test_p99_stays_flat(self):
+        """Test p99 CRITICAL stable sous flot, contrairement à une FIFO."""
+        idle = await critical_latency_p99(PriorityEventQueue(capacity=5000), flood=False)
+        flooded = await critical_latency_p99(PriorityEventQueue(capacity=5000), flood=True)
+        fifo = await critical_latency_p99(asyncio.Queue(maxsize=5000), flood=True)
+
+        figures = f"p99 CRITICAL: idle={idle * 1e3:.2f}ms flood={flooded * 1e3:.2f}ms fifo={fifo * 1e3:.2f}ms"
+        assert flooded < 0.02, figures
+        assert flooded < idle + 0.01, figures
+        assert fifo > 10 * flooded, figures
@@ -0,0 +1,116 @@
+"""
+Tests unitaires pour l'anneau en mémoire partagée.
+"""
+
+from multiprocessing import get_context
+
+import pytest
+
+from nexus.queue import ShmRing
+
+
+@pytest.fixture
+def ring():
+    ring = ShmRing(capacity=256)
+    yield ring
+    ring.close()
+
+
+def drain(ring):
+    """Enregistrements jusqu'au marqueur de fin, en attendant le producteur."""
+    records = []
+    while True:
+        try:
+            record = ring.read()
+        except EOFError:
+            return records
+        if record is None:
+            ring.wait_readable(1.0)
+        else:
+            records.append(record)
+
+
+def consume(ring, results):
+    """Consommateur d'un processus enfant."""
+    results.send(drain(ring))
+    results.close()
+    ring.close()
+
+
+class TestShmRing:
+    """Tests de l'anneau SPSC."""
+
+    def test_fifo_and_backlog(self, ring):
+        """Test ordre FIFO et compte des éléments en attente."""
+        assert ring.read() is None and ring.empty()
+
+        assert ring.try_write(b"first", items=3)
+        assert ring.try_write(b"second")
+
+        assert ring.backlog() == 4
+        assert ring.read() == b"first"
+        assert ring.backlog() == 1
+        assert ring.read() == b"second"
+        assert ring.read() is None and ring.backlog() == 0
+
+    def test_full_and_wrap_around(self, ring):
+        """Test anneau plein, puis enregistrements repliés au début."""
+        record = bytes(range(50))
+        written = 0
+        while ring.try_write(record):
+            written += 1
+        assert written == 3
+        assert not ring.fits(len(record))
+        assert not ring.wait_writable(len(record), timeout=0)
+
+        for _ in range(200):
+            assert ring.read() == record
+            assert ring.try_write(record)
+
+        assert ring.backlog() == written
+
+    def test_fits_several_records(self, ring):
+        """Test place de plusieurs enregistrements, retour au début compris."""
+        assert ring.fits(40, 40)
+        assert not ring.fits(100, 100)
+        assert ring.try_write(bytes(60))
+        assert ring.read() == bytes(60)
+        # Deux enregistrements de 60 octets tiennent malgré le retour au début
+        assert ring.fits(60, 60)
+        assert ring.try_write(bytes(60)) and ring.try_write(bytes(60))
+
+    def test_record_too_large(self, ring):
+        """Test enregistrement plus grand que max_record refusé."""
+        with pytest.raises(ValueError):
+            ring.try_write(bytes(ring.max_record + 1))
+
+    def test_end_marker(self, ring):
+        """Test marqueur de fin lu après les enregistrements, même anneau plein."""
+        while ring.try_write(b"x" * 40):
+            pass
+
+        ring.close_writer()
+
+        assert len(drain(ring)) == 5
+        with pytest.raises(EOFError):
+            ring.read()
+
+    def test_across_processes(self):
+        """Test producteur et consommateur dans deux processus."""
+        context = get_context("spawn")
+        ring = ShmRing(capacity=1024, context=context)
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=consume, args=(ring, sender))
+        process.start()
+        sender.close()
+        records = [str(index).encode() * (index % 40 + 1) for index in range(500)]
+
+        for record in records:
+            while not ring.try_write(record):
+                ring.wait_writable(len(record), timeout=1.0)
+        ring.close_writer()
+
+        assert receiver.recv() == records
+        process.join(10)
+        assert process.exitcode == 0
+        ring.close()
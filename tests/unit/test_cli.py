@@ -0,0 +1,200 @@
+"""
+Tests unitaires pour l'interface en ligne de commande.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+from click.testing import CliRunner
+
+from nexus.api import EventReceiver
+from nexus.broker import BrokerClient, LocalBroker
+from nexus.cli import _ingest, _post_chunks, _publish_chunks, main
+from nexus.core.codec import BATCH_MAGIC
+from nexus.core.events import BaseEvent, EventType, create_event
+from nexus.queue import DeadLetter, DeadLetterReason, DeadLetterStore, EventLog, PriorityEventQueue
+
+
+def write_ndjson(path, count: int, bad_lines=()) -> None:
+    """Fichier NDJSON d'événements numérotés, avec des lignes invalides."""
+    lines = [
+        create_event(EventType.FILE_MODIFIED, "sync", {"file_path": f"/tmp/{i}.txt"}).model_dump_json()
+        for i in range(count)
+    ]
+    for position, line in bad_lines:
+        lines.insert(position, line)
+    path.write_text("\n".join(lines) + "\n")
+
+
+def run(*args: str):
+    """Exécute la commande nexus."""
+    return CliRunner().invoke(main, [str(arg) for arg in args], catch_exceptions=False)
+
+
+class TestFileCommands:
+    """Tests des commandes de conversion et de validation."""
+
+    def test_convert_round_trip(self, tmp_path):
+        """Test NDJSON -> binaire -> NDJSON."""
+        write_ndjson(tmp_path / "in.ndjson", 30)
+
+        assert run("convert", tmp_path / "in.ndjson", tmp_path / "events.nxb", "--chunk-size", "7").exit_code == 0
+        assert (tmp_path / "events.nxb").read_bytes().startswith(BATCH_MAGIC)
+        assert run("convert", tmp_path / "events.nxb", tmp_path / "out.jsonl").exit_code == 0
+
+        assert (tmp_path / "out.jsonl").read_text() == (tmp_path / "in.ndjson").read_text()
+
+    def test_bad_lines_reported(self, tmp_path):
+        """Test lignes rejetées signalées, conversion poursuivie, code 1."""
+        source = tmp_path / "in.ndjson"
+        write_ndjson(source, 5, bad_lines=[(1, "{oops"), (4, '{"type": "file_created"}')])
+
+        result = run("convert", source, tmp_path / "out.ndjson")
+
+        assert result.exit_code == 1
+        assert f"{source}:2: Invalid JSON" in result.output
+        assert f"{source}:5: " in result.output
+        assert "Wrote 5 events, 2 rejected" in result.output
+        assert len((tmp_path / "out.ndjson").read_text().splitlines()) == 5
+
+    def test_validate(self, tmp_path):
+        """Test validation seule."""
+        write_ndjson(tmp_path / "in.ndjson", 3)
+
+        result = run("validate", tmp_path / "in.ndjson")
+
+        assert result.exit_code == 0
+        assert "Validated 3 events, 0 rejected" in result.output
+
+
+class TestLogCommands:
+    """Tests de l'import et de l'export du journal."""
+
+    def test_import_then_export(self, tmp_path):
+        """Test import dans le journal puis export au format NDJSON."""
+        write_ndjson(tmp_path / "in.ndjson", 12)
+
+        assert run("import", tmp_path / "in.ndjson", tmp_path / "log", "--chunk-size", "5").exit_code == 0
+        assert run("export", tmp_path / "log", tmp_path / "out.ndjson", "--start", "10").exit_code == 0
+
+        exported = [json.loads(line) for line in (tmp_path / "out.ndjson").read_text().splitlines()]
+        assert [event["payload"]["file_path"] for event in exported] == ["/tmp/10.txt", "/tmp/11.txt"]
+
+
+class TestDeadLetterCommands:
+    """Tests des commandes de dead letter queue."""
+
+    def test_count_and_reprocess(self, tmp_path):
+        """Test comptage filtré puis rejeu vers le journal."""
+        database = tmp_path / "dlq.sqlite"
+        with DeadLetterStore(database) as store:
+            store.add(
+                DeadLetter(
+                    integration="toasty",
+                    event=BaseEvent.from_trusted(type=EventType.CALENDAR_EVENT, source=source, payload={"index": i}),
+                    reason=DeadLetterReason.EXHAUSTED,
+                    error="TimeoutError: ",
+                )
+                for i, source in enumerate(["imap", "sync", "imap"])
+            )
+
+        assert run("dlq", "count", database, "--source", "imap").output.strip() == "2"
+        result = run("dlq", "reprocess", database, tmp_path / "log", "--source", "imap", "--page-size", "1")
+
+        assert "Reprocessed 2 events" in result.output
+        with EventLog(tmp_path / "log") as log:
+            assert [event.payload["index"] for event in log.replay()] == [0, 2]
+        assert run("dlq", "count", database).output.strip() == "1"
+
+
+class TestLoadCommands:
+    """Tests de la génération de charge et du rejeu."""
+
+    def test_generate_then_replay(self, tmp_path):
+        """Test profil YAML généré dans un fichier, puis rejoué sans attente."""
+        profile = tmp_path / "profile.yaml"
+        profile.write_text("classes:\n  - {type: file_modified, rate: 1000, payload_size: 300}\n")
+
+        result = run("generate", tmp_path / "load.ndjson", "--profile", profile, "--count", "50", "--seed", "1",
+                     "--speed", "inf")
+        assert result.exit_code == 0
+        assert "Generated 50 events" in result.output
+        result = run("replay", tmp_path / "load.ndjson", tmp_path / "copy.ndjson", "--speed", "inf")
+
+        assert "Replayed 50 events" in result.output
+        assert (tmp_path / "copy.ndjson").read_text() == (tmp_path / "load.ndjson").read_text()
+        assert run("generate", tmp_path / "none.ndjson").exit_code == 2
+
+    async def test_post_to_receiver(self):
+        """Test envoi par lots binaires : acceptés puis limités (429)."""
+        receiver = EventReceiver(PriorityEventQueue(capacity=3))
+        await receiver.start(port=0)
+
+        async def chunks():
+            for _ in range(2):
+                yield [create_event(EventType.FILE_MODIFIED, "load", {"file_path": f"/{i}"}) for i in range(3)]
+
+        try:
+            assert await _post_chunks(f"http://127.0.0.1:{receiver.port}", chunks()) == (6, 3, 3)
+        finally:
+            await receiver.stop()
+
+    async def test_publish_to_broker(self):
+        """Test morceaux publiés sur un broker, reçus par un abonné."""
+        async def chunks():
+            for chunk in (range(3), range(3, 6)):
+                yield [create_event(EventType.FILE_MODIFIED, "load", {"file_path": f"/{i}"}) for i in chunk]
+
+        async with LocalBroker() as broker, BrokerClient(broker.address) as client:
+            subscription = await client.subscribe("nexus")
+            assert await _publish_chunks(broker.address, chunks()) == 6
+            received = []
+            while len(received) < 6:
+                received.extend(await asyncio.wait_for(subscription.get(), 1))
+
+        assert [event.payload["file_path"] for event in received] == [f"/{i}" for i in range(6)]
+
+    async def test_publish_while_reading(self):
+        """Test publication commencée avant la fin de la source, publications en vol bornées."""
+        async with LocalBroker() as broker:
+            published_before = []
+
+            async def chunks():
+                for start in range(0, 200, 10):
+                    published_before.append(broker.published)
+                    yield [create_event(EventType.FILE_MODIFIED, "load", {"file_path": f"/{i}"})
+                           for i in range(start, start + 10)]
+
+            assert await _publish_chunks(broker.address, chunks(), max_in_flight=2) == 200
+
+        assert published_before[-1] > 0
+        # Jamais plus de deux morceaux lus et non confirmés
+        assert all(read * 10 - published <= 20 for read, published in enumerate(published_before))
+
+    def test_broker_address_validated(self):
+        """Test adresse d'écoute invalide refusée."""
+        assert run("broker", "--listen", "localhost:7400").exit_code == 2
+
+
+class TestServe:
+    """Tests du récepteur journalisé."""
+
+    async def test_received_events_reach_the_log(self, tmp_path):
+        """Test événements reçus journalisés, file vidée à l'arrêt."""
+        queue = PriorityEventQueue(capacity=100)
+        receiver = EventReceiver(queue)
+        stop = asyncio.Event()
+        batch = [{"type": "file_modified", "source": "sync", "payload": {"file_path": f"/{i}"}} for i in range(5)]
+
+        with EventLog(tmp_path / "log") as log:
+            await receiver.start(port=0)
+            ingest = asyncio.create_task(_ingest(receiver, queue, log, stop))
+            async with aiohttp.ClientSession() as session:
+                async with session.post(f"http://127.0.0.1:{receiver.port}/events/batch", json=batch) as response:
+                    assert response.status == 202
+            stop.set()
+            await asyncio.wait_for(ingest, 1)
+
+            assert [event.payload["file_path"] for event in log.replay()] == [f"/{i}" for i in range(5)]
+            assert queue.empty()
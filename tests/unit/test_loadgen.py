@@ -0,0 +1,187 @@
+"""
+Tests unitaires pour le générateur de charge et le rejeu.
+"""
+
+import json
+import math
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from nexus.core.events import BaseEvent, EventType, Priority, create_event
+from nexus.loadgen import Burst, LoadGenerator, PayloadSize, TrafficClass, load_profile, replay
+
+
+class FakeTime:
+    """Horloge manuelle avancée par les attentes."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+async def collect(chunks):
+    """Morceaux produits par un itérateur asynchrone."""
+    return [chunk async for chunk in chunks]
+
+
+class TestTrafficClass:
+    """Tests de la description du trafic."""
+
+    def test_from_dict(self):
+        """Test profil YAML : noms de priorités, distribution, rafales."""
+        traffic = TrafficClass.from_dict({
+            "type": "email_received",
+            "rate": 20,
+            "priority": {"normal": 4, "high": 1},
+            "payload_size": {"median": 4096, "sigma": 1.5},
+            "burst": {"every": 10, "duration": 1, "factor": 5},
+        })
+
+        assert traffic.type is EventType.EMAIL_RECEIVED
+        assert traffic.priority == {Priority.NORMAL: 4.0, Priority.HIGH: 1.0}
+        assert traffic.payload_size == PayloadSize(4096, 1.5)
+        assert traffic.rate_at(0.5) == (100.0, 1.0)
+        assert traffic.rate_at(3.0) == (20.0, 10.0)
+
+    def test_validation(self):
+        """Test paramètres invalides refusés."""
+        with pytest.raises(ValueError):
+            TrafficClass(EventType.FILE_MODIFIED, rate=-1.0)
+        with pytest.raises(ValueError):
+            TrafficClass(EventType.FILE_MODIFIED, rate=1.0, priority="urgent")
+        with pytest.raises(ValueError):
+            Burst(every=1.0, duration=2.0, factor=10.0)
+
+    def test_load_profile(self, tmp_path):
+        """Test lecture d'un profil YAML."""
+        path = tmp_path / "profile.yaml"
+        path.write_text("classes:\n  - {type: system_health, rate: 5, regular: true, priority: low}\n")
+
+        [traffic] = load_profile(path)
+
+        assert traffic.regular and traffic.priority is Priority.LOW
+        (tmp_path / "bad.yaml").write_text("- type: system_health\n")
+        with pytest.raises(ValueError):
+            load_profile(tmp_path / "bad.yaml")
+
+
+class TestLoadGenerator:
+    """Tests du générateur de trafic."""
+
+    def test_rates_and_bursts(self):
+        """Test débit moyen, arrivées régulières et rafales."""
+        generator = LoadGenerator([
+            TrafficClass(EventType.SYSTEM_HEALTH, rate=10.0, regular=True),
+            TrafficClass(EventType.FILE_MODIFIED, rate=100.0, burst=Burst(every=10.0, duration=1.0, factor=20.0)),
+        ], seed=1)
+
+        arrivals = list(generator.arrivals(duration=100.0))
+        per_class = Counter(index for _, index in arrivals)
+        in_bursts = sum(1 for offset, index in arrivals if index == 1 and offset % 10.0 < 1.0)
+
+        assert [offset for offset, _ in arrivals] == sorted(offset for offset, _ in arrivals)
+        assert per_class[0] in (999, 1000)
+        # 90 s à 100/s puis 10 s de rafales à 2000/s
+        assert per_class[1] == pytest.approx(9000 + 20_000, rel=0.05)
+        assert in_bursts == pytest.approx(20_000, rel=0.05)
+
+    def test_events_follow_the_mix(self):
+        """Test types, sources, priorités et tailles de payload."""
+        generator = LoadGenerator([
+            TrafficClass(EventType.EMAIL_RECEIVED, rate=1.0, source="imap", sources=3,
+                         priority={Priority.NORMAL: 3, Priority.HIGH: 1}, payload_size=2048),
+        ], seed=7)
+
+        events = [generator.create(0) for _ in range(2000)]
+        priorities = Counter(event.priority for event in events)
+
+        assert {event.source for event in events} == {"imap0", "imap1", "imap2"}
+        assert priorities[Priority.HIGH] / len(events) == pytest.approx(0.25, abs=0.05)
+        assert all(2000 <= len(json.dumps(event.payload)) <= 2100 for event in events)
+        assert generator.generated == 2000
+
+    @pytest.mark.parametrize("event_type", list(EventType))
+    def test_payloads_satisfy_every_type_contract(self, event_type):
+        """Test payloads générés valides pour chaque type d'événement."""
+        generator = LoadGenerator([TrafficClass(event_type, rate=1.0, payload_size=64)], seed=1)
+        event = generator.create(0)
+
+        assert create_event(event_type, event.source, event.payload).type == event_type
+
+    def test_seed_is_reproducible(self):
+        """Test même graine : mêmes arrivées et mêmes payloads."""
+        def sample(seed):
+            generator = LoadGenerator([TrafficClass(EventType.FILE_MODIFIED, rate=50.0,
+                                                    payload_size=PayloadSize(512, 1.0))], seed=seed)
+            return list(generator.arrivals(count=100)), [generator.create(0).payload for _ in range(10)]
+
+        assert sample(3) == sample(3)
+        assert sample(3) != sample(4)
+
+    async def test_chunks_are_paced(self):
+        """Test émission au rythme des arrivées, accélérée par speed."""
+        clock = FakeTime()
+        traffic = [TrafficClass(EventType.SYSTEM_HEALTH, rate=10.0, regular=True)]
+
+        chunks = await collect(LoadGenerator(traffic).chunks(duration=2.0, clock=clock.clock, sleep=clock.sleep))
+
+        assert sum(map(len, chunks)) in (19, 20)
+        assert clock.now == pytest.approx(1.9, abs=0.01)
+        fast = FakeTime()
+        await collect(LoadGenerator(traffic).chunks(duration=2.0, speed=4.0, clock=fast.clock, sleep=fast.sleep))
+        assert fast.now == pytest.approx(clock.now / 4)
+
+    async def test_unpaced_chunks(self):
+        """Test sans attente : morceaux pleins, count respecté."""
+        clock = FakeTime()
+        generator = LoadGenerator([TrafficClass(EventType.FILE_MODIFIED, rate=1.0)])
+
+        chunks = await collect(generator.chunks(count=2500, speed=math.inf, max_chunk=1000, sleep=clock.sleep))
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+        assert clock.sleeps == []
+
+    async def test_duration_or_count_required(self):
+        """Test génération sans borne refusée."""
+        with pytest.raises(ValueError):
+            await collect(LoadGenerator([TrafficClass(EventType.FILE_MODIFIED, rate=1.0)]).chunks())
+
+
+class TestReplay:
+    """Tests du rejeu de flux enregistrés."""
+
+    @staticmethod
+    def recording(*seconds):
+        start = datetime(2025, 1, 1)
+        return [[
+            BaseEvent.from_trusted(type=EventType.FILE_MODIFIED, source="sync", timestamp=start + timedelta(seconds=s))
+            for s in seconds
+        ]]
+
+    async def test_inter_arrival_times_kept(self):
+        """Test intervalles conservés à 1x, divisés à 2x."""
+        clock = FakeTime()
+        chunks = await collect(replay(self.recording(0, 0, 1.5, 4), clock=clock.clock, sleep=clock.sleep))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1, 1]
+        assert clock.now == pytest.approx(4.0)
+        fast = FakeTime()
+        await collect(replay(self.recording(0, 0, 1.5, 4), speed=2.0, clock=fast.clock, sleep=fast.sleep))
+        assert fast.now == pytest.approx(2.0)
+
+    async def test_out_of_order_emitted_immediately(self):
+        """Test événement antérieur au précédent : émis sans attendre."""
+        clock = FakeTime()
+        chunks = await collect(replay(self.recording(0, 2, 1, 3), clock=clock.clock, sleep=clock.sleep))
+
+        assert [len(chunk) for chunk in chunks] == [1, 2, 1]
+        assert clock.now == pytest.approx(3.0)